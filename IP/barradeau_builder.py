@@ -8,9 +8,24 @@ Reference: Barradeau/void-phase0-buildings.html
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Any, Optional
+from typing import List, Dict, Tuple, Any, Optional, Sequence, Union
+import base64
 import math
 import random
+import zlib
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from IP.executor_pool import ExecutorMode, parallel_map
+except ImportError:
+    from executor_pool import ExecutorMode, parallel_map
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -110,10 +125,26 @@ class BuildingData:
     edges: List[Dict[str, Any]]  # All edges with a, b points
     line_count: int  # Source file lines
     export_count: int  # Source file exports
+    # Vectorized path: (N, 5) float32 [x, y, z, opacity, size] and (M, 6)
+    # float32 [ax, ay, az, bx, by, bz]; particles/edges stay empty
+    particle_array: Any = None
+    edge_array: Any = None
+
+    @property
+    def particle_count(self) -> int:
+        if self.particle_array is not None:
+            return len(self.particle_array)
+        return len(self.particles)
+
+    @property
+    def edge_count(self) -> int:
+        if self.edge_array is not None:
+            return len(self.edge_array)
+        return len(self.edges)
 
     def to_json(self) -> Dict[str, Any]:
         """Serialize for JavaScript consumption."""
-        return {
+        data = {
             "path": self.path,
             "status": self.status,
             "position": self.position,
@@ -123,9 +154,25 @@ class BuildingData:
             "edges": self.edges,
             "lineCount": self.line_count,
             "exportCount": self.export_count,
-            "particleCount": len(self.particles),
-            "edgeCount": len(self.edges),
+            "particleCount": self.particle_count,
+            "edgeCount": self.edge_count,
         }
+        # Packed arrays ship as base64 little-endian Float32 rows
+        if self.particle_array is not None:
+            data["particleData"] = _pack_rows(self.particle_array)
+        if self.edge_array is not None:
+            data["edgeData"] = _pack_rows(self.edge_array)
+        return data
+
+
+def _pack_rows(rows: Any) -> Dict[str, Any]:
+    """{"type", "stride", "data"} for a 2D float array."""
+    packed = np.ascontiguousarray(rows, dtype="<f4")
+    return {
+        "type": "f32",
+        "stride": packed.shape[1],
+        "data": base64.b64encode(packed.tobytes()).decode("ascii"),
+    }
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -133,18 +180,349 @@ class BuildingData:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+# Flip stack depth for legalization; only extremely degenerate input hits it
+_EDGE_STACK_SIZE = 512
+_EPSILON = 2.0**-52
+
+
+def _orient(px: float, py: float, qx: float, qy: float, rx: float, ry: float) -> bool:
+    return (qy - py) * (rx - qx) - (qx - px) * (ry - qy) < 0
+
+
+def _in_circle(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float, px: float, py: float
+) -> bool:
+    dx, dy = ax - px, ay - py
+    ex, ey = bx - px, by - py
+    fx, fy = cx - px, cy - py
+    ap = dx * dx + dy * dy
+    bp = ex * ex + ey * ey
+    cp = fx * fx + fy * fy
+    return (
+        dx * (ey * cp - bp * fy) - dy * (ex * cp - bp * fx) + ap * (ex * fy - ey * fx)
+    ) < 0
+
+
+def _circumcenter_offset(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+) -> Optional[Tuple[float, float]]:
+    """Circumcenter relative to a, or None for collinear points."""
+    dx, dy = bx - ax, by - ay
+    ex, ey = cx - ax, cy - ay
+    denominator = dx * ey - dy * ex
+    if denominator == 0:
+        return None
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    d = 0.5 / denominator
+    return (ey * bl - dy * cl) * d, (dx * cl - ex * bl) * d
+
+
+def _pseudo_angle(dx: float, dy: float) -> float:
+    """Monotonic in the real angle, in [0, 1), without trigonometry."""
+    total = abs(dx) + abs(dy)
+    p = dx / total if total else 0.0
+    return (3 - p if dy > 0 else 1 + p) / 4
+
+
+class _SweepHull:
+    """
+    Sweep-hull Delaunay triangulation (Delaunator's algorithm).
+
+    Points are added in order of distance from a seed triangle, each one
+    attached to the visible part of a convex hull that is looked up through
+    an angular hash. Triangles live in flat index/half-edge arrays and are
+    made Delaunay by edge flips as they are created, so the whole run is
+    O(n log n) (dominated by the sort).
+    """
+
+    def __init__(self, coords: List[float]):
+        self.coords = coords
+        n = len(coords) // 2
+        max_triangles = max(2 * n - 5, 0)
+        self.triangles = [0] * (max_triangles * 3)
+        self.halfedges = [-1] * (max_triangles * 3)
+        self.triangles_len = 0
+        self.hash_size = max(1, math.ceil(math.sqrt(n)))
+        self.hull_prev = [0] * n
+        self.hull_next = [0] * n
+        self.hull_tri = [0] * n
+        self.hull_hash = [-1] * self.hash_size
+        self.hull_start = 0
+        self.edge_stack = [0] * _EDGE_STACK_SIZE
+        self.cx = 0.0
+        self.cy = 0.0
+        if n >= 3:
+            self._run(n)
+
+    def _hash_key(self, x: float, y: float) -> int:
+        angle = _pseudo_angle(x - self.cx, y - self.cy)
+        return int(angle * self.hash_size) % self.hash_size
+
+    def _link(self, a: int, b: int) -> None:
+        self.halfedges[a] = b
+        if b != -1:
+            self.halfedges[b] = a
+
+    def _add_triangle(self, i0: int, i1: int, i2: int, a: int, b: int, c: int) -> int:
+        t = self.triangles_len
+        self.triangles[t] = i0
+        self.triangles[t + 1] = i1
+        self.triangles[t + 2] = i2
+        self._link(t, a)
+        self._link(t + 1, b)
+        self._link(t + 2, c)
+        self.triangles_len += 3
+        return t
+
+    def _legalize(self, a: int) -> int:
+        """Flip edges from half-edge a until the Delaunay condition holds."""
+        triangles, halfedges, coords = self.triangles, self.halfedges, self.coords
+        stack = self.edge_stack
+        i = 0
+        ar = 0
+        while True:
+            b = halfedges[a]
+            a0 = a - a % 3
+            ar = a0 + (a + 2) % 3
+
+            if b == -1:  # Convex hull edge
+                if i == 0:
+                    break
+                i -= 1
+                a = stack[i]
+                continue
+
+            b0 = b - b % 3
+            al = a0 + (a + 1) % 3
+            bl = b0 + (b + 2) % 3
+            p0 = triangles[ar]
+            pr = triangles[a]
+            pl = triangles[al]
+            p1 = triangles[bl]
+
+            illegal = _in_circle(
+                coords[2 * p0], coords[2 * p0 + 1],
+                coords[2 * pr], coords[2 * pr + 1],
+                coords[2 * pl], coords[2 * pl + 1],
+                coords[2 * p1], coords[2 * p1 + 1],
+            )
+            if illegal:
+                triangles[a] = p1
+                triangles[b] = p0
+                hbl = halfedges[bl]
+
+                # Edge swapped on the other side of the hull (rare)
+                if hbl == -1:
+                    e = self.hull_start
+                    while True:
+                        if self.hull_tri[e] == bl:
+                            self.hull_tri[e] = a
+                            break
+                        e = self.hull_prev[e]
+                        if e == self.hull_start:
+                            break
+
+                self._link(a, hbl)
+                self._link(b, halfedges[ar])
+                self._link(ar, bl)
+
+                br = b0 + (b + 1) % 3
+                if i < _EDGE_STACK_SIZE:
+                    stack[i] = br
+                    i += 1
+            else:
+                if i == 0:
+                    break
+                i -= 1
+                a = stack[i]
+        return ar
+
+    def _run(self, n: int) -> None:
+        coords = self.coords
+        hull_prev, hull_next, hull_tri, hull_hash = (
+            self.hull_prev, self.hull_next, self.hull_tri, self.hull_hash
+        )
+        xs = coords[0::2]
+        ys = coords[1::2]
+        cx = (min(xs) + max(xs)) / 2
+        cy = (min(ys) + max(ys)) / 2
+
+        def dist(ax: float, ay: float, bx: float, by: float) -> float:
+            return (ax - bx) ** 2 + (ay - by) ** 2
+
+        # Seed: point nearest the center, its nearest neighbour, and the
+        # third point forming the smallest circumcircle with them
+        i0 = min(range(n), key=lambda i: dist(cx, cy, xs[i], ys[i]))
+        i0x, i0y = xs[i0], ys[i0]
+
+        i1, min_dist = -1, math.inf
+        for i in range(n):
+            if i == i0:
+                continue
+            d = dist(i0x, i0y, xs[i], ys[i])
+            if 0 < d < min_dist:
+                i1, min_dist = i, d
+        if i1 == -1:
+            return  # All points coincide
+        i1x, i1y = xs[i1], ys[i1]
+
+        i2, min_radius = -1, math.inf
+        for i in range(n):
+            if i == i0 or i == i1:
+                continue
+            offset = _circumcenter_offset(i0x, i0y, i1x, i1y, xs[i], ys[i])
+            if offset is not None:
+                r = offset[0] ** 2 + offset[1] ** 2
+                if r < min_radius:
+                    i2, min_radius = i, r
+        if i2 == -1:
+            return  # Collinear: no triangles
+        i2x, i2y = xs[i2], ys[i2]
+
+        if _orient(i0x, i0y, i1x, i1y, i2x, i2y):
+            i1, i2 = i2, i1
+            i1x, i1y, i2x, i2y = i2x, i2y, i1x, i1y
+
+        ox, oy = _circumcenter_offset(i0x, i0y, i1x, i1y, i2x, i2y)
+        self.cx, self.cy = i0x + ox, i0y + oy
+
+        # Sweep in order of distance from the seed circumcenter
+        dists = [dist(xs[i], ys[i], self.cx, self.cy) for i in range(n)]
+        ids = sorted(range(n), key=dists.__getitem__)
+
+        self.hull_start = i0
+        hull_next[i0] = hull_prev[i2] = i1
+        hull_next[i1] = hull_prev[i0] = i2
+        hull_next[i2] = hull_prev[i1] = i0
+        hull_tri[i0], hull_tri[i1], hull_tri[i2] = 0, 1, 2
+        hull_hash[self._hash_key(i0x, i0y)] = i0
+        hull_hash[self._hash_key(i1x, i1y)] = i1
+        hull_hash[self._hash_key(i2x, i2y)] = i2
+
+        self._add_triangle(i0, i1, i2, -1, -1, -1)
+
+        xp = yp = 0.0
+        for k, i in enumerate(ids):
+            x, y = xs[i], ys[i]
+
+            # Skip near-duplicate points
+            if k > 0 and abs(x - xp) <= _EPSILON and abs(y - yp) <= _EPSILON:
+                continue
+            xp, yp = x, y
+
+            if i == i0 or i == i1 or i == i2:
+                continue
+
+            # Find a visible hull edge via the angular hash
+            start = 0
+            key = self._hash_key(x, y)
+            for j in range(self.hash_size):
+                start = hull_hash[(key + j) % self.hash_size]
+                if start != -1 and start != hull_next[start]:
+                    break
+
+            start = hull_prev[start]
+            e = start
+            while True:
+                q = hull_next[e]
+                if _orient(x, y, xs[e], ys[e], xs[q], ys[q]):
+                    break
+                e = q
+                if e == start:
+                    e = -1
+                    break
+            if e == -1:
+                continue  # Likely a near-duplicate point
+
+            # First triangle from the point, then flip to Delaunay
+            t = self._add_triangle(e, i, hull_next[e], -1, -1, hull_tri[e])
+            hull_tri[i] = self._legalize(t + 2)
+            hull_tri[e] = t
+
+            # Walk forward through the hull adding triangles
+            nxt = hull_next[e]
+            while True:
+                q = hull_next[nxt]
+                if not _orient(x, y, xs[nxt], ys[nxt], xs[q], ys[q]):
+                    break
+                t = self._add_triangle(nxt, i, q, hull_tri[i], -1, hull_tri[nxt])
+                hull_tri[i] = self._legalize(t + 2)
+                hull_next[nxt] = nxt  # Mark as removed
+                nxt = q
+
+            # Walk backward from the other side
+            if e == start:
+                while True:
+                    q = hull_prev[e]
+                    if not _orient(x, y, xs[q], ys[q], xs[e], ys[e]):
+                        break
+                    t = self._add_triangle(q, i, e, -1, hull_tri[e], hull_tri[q])
+                    self._legalize(t + 2)
+                    hull_tri[q] = t
+                    hull_next[e] = e  # Mark as removed
+                    e = q
+
+            # Update the hull
+            self.hull_start = hull_prev[i] = e
+            hull_next[e] = hull_prev[nxt] = i
+            hull_next[i] = nxt
+
+            hull_hash[self._hash_key(x, y)] = i
+            hull_hash[self._hash_key(xs[e], ys[e])] = e
+
+
 class Delaunay:
     """
-    Delaunay triangulation using Bowyer-Watson algorithm.
+    Delaunay triangulation.
 
-    Ported from Barradeau/void-phase0-buildings.html lines 727-803
+    triangulate_indices() is an O(n log n) sweep-hull triangulator returning
+    index triples. triangulate() wraps it for Point2D/Triangle callers;
+    triangulate_bowyer_watson() is the original O(n^2) port from
+    Barradeau/void-phase0-buildings.html lines 727-803, kept as the
+    benchmark baseline (scripts/bench_delaunay.py).
     """
 
+    @staticmethod
+    def triangulate_indices(points: Any) -> List[Tuple[int, int, int]]:
+        """
+        Triangulate 2D points.
+
+        Args:
+            points: (N, 2) NumPy array or sequence of (x, y) pairs
+
+        Returns:
+            List of (i, j, k) index triples into points
+        """
+        if hasattr(points, "tolist"):
+            points = points.tolist()
+        coords = [float(v) for point in points for v in point[:2]]
+        hull = _SweepHull(coords)
+        triangles = hull.triangles
+        return [
+            (triangles[t], triangles[t + 1], triangles[t + 2])
+            for t in range(0, hull.triangles_len, 3)
+        ]
+
     @staticmethod
     def triangulate(points: List[Point2D]) -> List[Triangle]:
         """
         Generate Delaunay triangulation from a set of 2D points.
 
+        Args:
+            points: List of Point2D objects
+
+        Returns:
+            List of Triangle objects
+        """
+        triples = Delaunay.triangulate_indices([(p.x, p.y) for p in points])
+        return [Triangle(points[a], points[b], points[c]) for a, b, c in triples]
+
+    @staticmethod
+    def triangulate_bowyer_watson(points: List[Point2D]) -> List[Triangle]:
+        """
+        Bowyer-Watson triangulation (original port, O(n^2)).
+
         Args:
             points: List of Point2D objects
 
@@ -271,6 +649,8 @@ class BarradeauBuilding:
         export_count: int,
         status: str = "working",
         position: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+        vectorized: bool = False,
     ):
         """
         Initialize building generator.
@@ -281,6 +661,11 @@ class BarradeauBuilding:
             export_count: Number of exports from file
             status: "working" | "broken" | "combat"
             position: {x, z} position in scene (default: origin)
+            seed: Seed for footprint variance and particle jitter, so the
+                same file always yields the same building (default: unseeded)
+            vectorized: Generate particles/edges as NumPy arrays
+                (particle_array / edge_array) instead of Point3D/Edge3D
+                lists. Ignored when NumPy is not installed.
         """
         self.path = path
         self.line_count = line_count
@@ -290,13 +675,20 @@ class BarradeauBuilding:
 
         self.particles: List[Point3D] = []
         self.edges: List[Edge3D] = []
+        self.particle_array: Any = None
+        self.edge_array: Any = None
         self.footprint_radius: float = 0
         self.height: float = 0
         self.footprint_points: List[Point2D] = []
+        self._random = random.Random(seed) if seed is not None else random
+        self._seed = seed
 
         self._calculate_dimensions()
         self._generate_footprint()
-        self._extrude_building()
+        if vectorized and NUMPY_AVAILABLE:
+            self._extrude_building_vectorized()
+        else:
+            self._extrude_building()
 
     def _calculate_dimensions(self) -> None:
         """Calculate building footprint and height from file metrics."""
@@ -315,11 +707,12 @@ class BarradeauBuilding:
         # Complexity based on file size (more lines = more detail)
         complexity = min(12, 6 + self.line_count // 100)
         points = []
+        rand = self._random.random
 
         # Main perimeter (slightly irregular for organic feel)
         for i in range(complexity):
             angle = (i / complexity) * math.pi * 2
-            variance = 0.85 + random.random() * 0.3
+            variance = 0.85 + rand() * 0.3
             r = self.footprint_radius * variance
             points.append(Point2D(x=math.cos(angle) * r, y=math.sin(angle) * r))
 
@@ -333,8 +726,8 @@ class BarradeauBuilding:
                 angle = (i / ring_points) * math.pi * 2 + (ring * 0.3)
                 points.append(
                     Point2D(
-                        x=math.cos(angle) * ring_radius + (random.random() - 0.5) * 0.3,
-                        y=math.sin(angle) * ring_radius + (random.random() - 0.5) * 0.3,
+                        x=math.cos(angle) * ring_radius + (rand() - 0.5) * 0.3,
+                        y=math.sin(angle) * ring_radius + (rand() - 0.5) * 0.3,
                     )
                 )
 
@@ -343,6 +736,22 @@ class BarradeauBuilding:
 
         self.footprint_points = points
 
+    def _footprint_edges(self) -> List[Edge2D]:
+        """Triangulate the footprint and return its unique edges with lengths."""
+        points = self.footprint_points
+        triangles = Delaunay.triangulate_indices([(p.x, p.y) for p in points])
+
+        edge_map: Dict[Tuple[int, int], Edge2D] = {}
+        for i, j, k in triangles:
+            for a, b in ((i, j), (j, k), (k, i)):
+                key = (a, b) if a < b else (b, a)
+                if key not in edge_map:
+                    pa, pb = points[a], points[b]
+                    length = math.hypot(pb.x - pa.x, pb.y - pa.y)
+                    edge_map[key] = Edge2D(a=pa, b=pb, length=length)
+
+        return list(edge_map.values())
+
     def _extrude_building(self) -> None:
         """
         Extrude footprint into 3D particles using Barradeau technique.
@@ -353,26 +762,7 @@ class BarradeauBuilding:
         - Particle density inversely proportional to edge length
         - Taper at higher layers
         """
-        # Triangulate footprint
-        triangles = Delaunay.triangulate(self.footprint_points)
-
-        # Extract unique edges with lengths
-        edge_map: Dict[str, Edge2D] = {}
-        for tri in triangles:
-            tri_edges = [(tri.p1, tri.p2), (tri.p2, tri.p3), (tri.p3, tri.p1)]
-
-            for a, b in tri_edges:
-                # Create consistent key for edge
-                if a.x < b.x or (a.x == b.x and a.y < b.y):
-                    key = f"{a.x:.4f},{a.y:.4f}-{b.x:.4f},{b.y:.4f}"
-                else:
-                    key = f"{b.x:.4f},{b.y:.4f}-{a.x:.4f},{a.y:.4f}"
-
-                if key not in edge_map:
-                    length = math.hypot(b.x - a.x, b.y - a.y)
-                    edge_map[key] = Edge2D(a=a, b=b, length=length)
-
-        edges_2d = list(edge_map.values())
+        edges_2d = self._footprint_edges()
         max_edge_length = max(e.length for e in edges_2d) if edges_2d else 1
 
         self.particles = []
@@ -382,6 +772,7 @@ class BarradeauBuilding:
         layer_count = CONFIG["LAYER_COUNT"]
         taper = CONFIG["TAPER"]
         particles_per_unit = CONFIG["PARTICLES_PER_UNIT"]
+        rand = self._random.random
 
         for layer in range(layer_count):
             t = layer / layer_count
@@ -425,18 +816,98 @@ class BarradeauBuilding:
                         Point3D(
                             x=a_3d["x"]
                             + (b_3d["x"] - a_3d["x"]) * pt
-                            + (random.random() - 0.5) * 0.08,
-                            y=a_3d["y"] + (random.random() - 0.5) * 0.08,
+                            + (rand() - 0.5) * 0.08,
+                            y=a_3d["y"] + (rand() - 0.5) * 0.08,
                             z=a_3d["z"]
                             + (b_3d["z"] - a_3d["z"]) * pt
-                            + (random.random() - 0.5) * 0.08,
+                            + (rand() - 0.5) * 0.08,
                             opacity=layer_opacity,
                             size=0.3 + layer_opacity * 0.4,
                         )
                     )
 
+    def _extrude_building_vectorized(self) -> None:
+        """
+        NumPy version of _extrude_building().
+
+        Same layers, length filter, taper, density and jitter, computed for
+        every (layer, edge) pair at once. Rows come out in the same
+        layer -> edge -> step order as the loop version.
+        """
+        edges_2d = self._footprint_edges()
+        rng = np.random.default_rng(self._seed)
+        px, pz = self.position["x"], self.position["z"]
+
+        if not edges_2d:
+            self.particle_array = np.empty((0, 5), dtype=np.float32)
+            self.edge_array = np.empty((0, 6), dtype=np.float32)
+            return
+
+        ends = np.array([(e.a.x, e.a.y, e.b.x, e.b.y) for e in edges_2d], dtype=np.float64)
+        ax, ay, bx, by = ends.T
+        length = np.array([e.length for e in edges_2d], dtype=np.float64)
+        max_edge_length = length.max()
+
+        layer_count = CONFIG["LAYER_COUNT"]
+        layers = np.arange(layer_count)
+        t = layers / layer_count
+        layer_y = t * self.height
+        layer_scale = 1 - layers * CONFIG["TAPER"]
+        layer_opacity = 1 - t * 0.5
+        length_threshold = max_edge_length * (1 - t * 0.5)
+
+        # Kept (layer, edge) pairs, row-major = loop order
+        layer_idx, edge_idx = np.nonzero(length[None, :] <= length_threshold[:, None])
+
+        density = 1 + (1 - length / max_edge_length) * 2
+        num_particles = np.maximum(
+            2, (length * CONFIG["PARTICLES_PER_UNIT"] * density).astype(np.int64)
+        )
+
+        scale = layer_scale[layer_idx]
+        y = layer_y[layer_idx]
+        seg_ax = ax[edge_idx] * scale + px
+        seg_az = ay[edge_idx] * scale + pz
+        seg_bx = bx[edge_idx] * scale + px
+        seg_bz = by[edge_idx] * scale + pz
+        self.edge_array = np.column_stack((seg_ax, y, seg_az, seg_bx, y, seg_bz)).astype(
+            np.float32
+        )
+
+        # Expand each kept segment into num_particles + 1 evenly spaced steps
+        steps = num_particles[edge_idx]
+        counts = steps + 1
+        starts = np.cumsum(counts) - counts
+        seg = np.repeat(np.arange(len(counts)), counts)
+        pt = (np.arange(counts.sum()) - starts[seg]) / steps[seg]
+
+        jitter = (rng.random((len(seg), 3)) - 0.5) * 0.08
+        opacity = layer_opacity[layer_idx][seg]
+
+        particles = np.empty((len(seg), 5), dtype=np.float32)
+        particles[:, 0] = seg_ax[seg] + (seg_bx[seg] - seg_ax[seg]) * pt + jitter[:, 0]
+        particles[:, 1] = y[seg] + jitter[:, 1]
+        particles[:, 2] = seg_az[seg] + (seg_bz[seg] - seg_az[seg]) * pt + jitter[:, 2]
+        particles[:, 3] = opacity
+        particles[:, 4] = 0.3 + opacity * 0.4
+        self.particle_array = particles
+
     def get_building_data(self) -> BuildingData:
         """Get BuildingData for JavaScript consumption."""
+        if self.particle_array is not None:
+            return BuildingData(
+                path=self.path,
+                status=self.status,
+                position=self.position,
+                footprint_radius=self.footprint_radius,
+                height=self.height,
+                particles=[],
+                edges=[],
+                line_count=self.line_count,
+                export_count=self.export_count,
+                particle_array=self.particle_array,
+                edge_array=self.edge_array,
+            )
         return BuildingData(
             path=self.path,
             status=self.status,
@@ -453,6 +924,137 @@ class BarradeauBuilding:
         )
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# BATCH GENERATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# (path, line_count, export_count, status, x, z)
+BuildingSpec = Tuple[str, int, int, str, float, float]
+
+
+def path_seed(path: str) -> int:
+    """Stable per-file seed, identical across processes and reloads."""
+    return zlib.crc32(path.encode("utf-8"))
+
+
+@dataclass
+class BuildingBatch:
+    """
+    Geometry for many buildings in two contiguous float32 arrays.
+
+    Building i owns particles[particle_offsets[i]:particle_offsets[i + 1]]
+    (rows of x, y, z, opacity, size) and the matching edge_offsets slice of
+    edges (rows of ax, ay, az, bx, by, bz).
+    """
+
+    specs: List[BuildingSpec]
+    footprint_radii: List[float]
+    heights: List[float]
+    particles: Any
+    particle_offsets: Any
+    edges: Any
+    edge_offsets: Any
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def building_data(self, index: int) -> BuildingData:
+        """BuildingData for one building; arrays are views into the batch."""
+        path, line_count, export_count, status, x, z = self.specs[index]
+        p0, p1 = self.particle_offsets[index], self.particle_offsets[index + 1]
+        e0, e1 = self.edge_offsets[index], self.edge_offsets[index + 1]
+        return BuildingData(
+            path=path,
+            status=status,
+            position={"x": x, "z": z},
+            footprint_radius=self.footprint_radii[index],
+            height=self.heights[index],
+            particles=[],
+            edges=[],
+            line_count=line_count,
+            export_count=export_count,
+            particle_array=self.particles[p0:p1],
+            edge_array=self.edges[e0:e1],
+        )
+
+
+def _build_chunk(specs: List[BuildingSpec]) -> List[Tuple[float, float, Any, Any]]:
+    """Worker: generate (footprint, height, particles, edges) per spec."""
+    results = []
+    for path, line_count, export_count, status, x, z in specs:
+        building = BarradeauBuilding(
+            path=path,
+            line_count=line_count,
+            export_count=export_count,
+            status=status,
+            position={"x": x, "z": z},
+            seed=path_seed(path),
+            vectorized=True,
+        )
+        results.append(
+            (
+                building.footprint_radius,
+                building.height,
+                building.particle_array,
+                building.edge_array,
+            )
+        )
+    return results
+
+
+def generate_building_batch(
+    specs: Sequence[BuildingSpec],
+    executor: Union[ExecutorMode, str, None] = None,
+    max_workers: Optional[int] = None,
+) -> BuildingBatch:
+    """
+    Generate many buildings at once, fanned out over the executor pool.
+
+    Each building is seeded from its path (path_seed), so the same file
+    always produces the same geometry no matter which worker builds it or
+    in which order. Requires NumPy.
+
+    Args:
+        specs: (path, line_count, export_count, status, x, z) per building
+        executor: serial/thread/process/auto (see IP/executor_pool.py);
+            auto picks a process pool for large batches
+        max_workers: Worker count (default: usable CPUs)
+
+    Returns:
+        BuildingBatch in spec order
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for batch building generation")
+
+    specs = list(specs)
+    results = parallel_map(
+        _build_chunk, specs, mode=executor, max_workers=max_workers, cpu_bound=True
+    )
+
+    particle_counts = [len(result[2]) for result in results]
+    edge_counts = [len(result[3]) for result in results]
+    particle_offsets = np.zeros(len(results) + 1, dtype=np.int64)
+    edge_offsets = np.zeros(len(results) + 1, dtype=np.int64)
+    np.cumsum(particle_counts, out=particle_offsets[1:])
+    np.cumsum(edge_counts, out=edge_offsets[1:])
+
+    particles = np.empty((particle_offsets[-1], 5), dtype=np.float32)
+    edges = np.empty((edge_offsets[-1], 6), dtype=np.float32)
+    for i, (_, _, particle_array, edge_array) in enumerate(results):
+        particles[particle_offsets[i]:particle_offsets[i + 1]] = particle_array
+        edges[edge_offsets[i]:edge_offsets[i + 1]] = edge_array
+
+    return BuildingBatch(
+        specs=specs,
+        footprint_radii=[result[0] for result in results],
+        heights=[result[1] for result in results],
+        particles=particles,
+        particle_offsets=particle_offsets,
+        edges=edges,
+        edge_offsets=edge_offsets,
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # UTILITY FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,245 @@
+# IP/change_impact.py
+"""
+Change Impact - Pick the tests a change set can affect from the import graph.
+
+A test can only observe a change to file X if it imports X, directly or
+transitively. So the impacted tests are the TEST nodes (detect_node_type)
+among everything that reaches a changed file in the ConnectionGraph:
+
+    impacted = {t in reached_by(changed) : t is a test}
+
+Reverse reachability comes from ConnectionGraph.reachability(), and the graph
+itself from the warm snapshot (IP/graph_snapshot.py), so selection costs far
+less than the tests it skips. Changes the import graph cannot see fall back
+to the whole suite:
+
+- non-source files (configs, fixtures, data) -> run everything
+- conftest.py -> every test under its directory
+- pkg/mod.py -> also importers of pkg/__init__.py, since the graph records
+  `from pkg import mod` as an import of the package
+
+Usage:
+    python -m IP.change_impact                       # git working-tree changes
+    python -m IP.change_impact IP/graph_core.py      # explicit change set
+    python -m IP.change_impact --base main --run -- -q -x
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    from IP.connection_verifier import (
+        ConnectionGraph,
+        ImportType,
+        NodeType,
+        _normalize_rel_path,
+        detect_node_type,
+    )
+    from IP.graph_snapshot import load_connection_graph
+except ImportError:
+    # Fallback for standalone use
+    from connection_verifier import (
+        ConnectionGraph,
+        ImportType,
+        NodeType,
+        _normalize_rel_path,
+        detect_node_type,
+    )
+    from graph_snapshot import load_connection_graph
+
+# Exit code pytest uses when nothing was collected
+PYTEST_NO_TESTS = 5
+
+
+@dataclass
+class ImpactSelection:
+    """Tests affected by a change set."""
+    changed: List[str]
+    tests: List[str] = field(default_factory=list)     # Sorted project-relative paths
+    untracked: List[str] = field(default_factory=list)  # Changes the graph can't map
+    run_all: bool = False  # A change outside the import graph can affect any test
+
+    def pytest_targets(self) -> List[str]:
+        """Python test files to hand to pytest ([] with run_all: run the default suite)."""
+        if self.run_all:
+            return []
+        return [path for path in self.tests if path.endswith(".py")]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "changed": self.changed,
+            "tests": self.tests,
+            "untracked": self.untracked,
+            "runAll": self.run_all,
+        }
+
+
+def _is_conftest(path: str) -> bool:
+    return os.path.basename(path) == "conftest.py"
+
+
+def _package_importers(graph: ConnectionGraph, path: str) -> set:
+    """
+    Files reaching the parent package's __init__.py.
+
+    `from pkg import mod` resolves to pkg/__init__.py in the graph, so a
+    change to pkg/mod.py must also count for importers of the package.
+    """
+    if not path.endswith(".py"):
+        return set()
+    init = os.path.join(os.path.dirname(path), "__init__.py")
+    if init == path or init not in graph.nodes:
+        return set()
+    return graph.reachability().reached_by(init)
+
+
+def select_impacted_tests(graph: ConnectionGraph, changed: Iterable[str]) -> ImpactSelection:
+    """
+    Minimal set of test files transitively affected by changed paths.
+
+    Args:
+        graph: ConnectionGraph for the project (resolved import edges)
+        changed: Project-relative paths that were modified, added or deleted
+    """
+    changed_paths = sorted({_normalize_rel_path(path) for path in changed if path})
+    selection = ImpactSelection(changed=changed_paths)
+    verifier = graph.verifier
+    index = graph.reachability()
+    impacted = set()
+
+    for path in changed_paths:
+        if _is_conftest(path):
+            prefix = os.path.dirname(path)
+            impacted.update(
+                node_id for node_id, node in graph.nodes.items()
+                if node.node_type == NodeType.TEST
+                and not _is_conftest(node_id)
+                and (not prefix or node_id.startswith(prefix + "/"))
+            )
+        elif path in graph.nodes:
+            impacted.update(index.reached_by(path))
+            impacted.update(_package_importers(graph, path))
+        elif detect_node_type(path) == NodeType.TEST:
+            # Deleted test file (new ones are graph nodes): nothing to run
+            selection.untracked.append(path)
+        elif verifier._detect_file_type(path) == ImportType.UNKNOWN:
+            selection.untracked.append(path)
+            selection.run_all = True
+        else:
+            # Deleted module: its importers now hold unresolved imports of it
+            selection.untracked.append(path)
+            for source in graph._sources_resolvable_by({path}):
+                impacted.update(index.reached_by(source))
+            impacted.update(_package_importers(graph, path))
+
+    selection.tests = sorted(
+        node_id for node_id in impacted
+        if detect_node_type(node_id) == NodeType.TEST
+        and not _is_conftest(node_id)
+        and (verifier.project_root / node_id).is_file()
+    )
+    return selection
+
+
+def git_changed_files(project_root: str, base: Optional[str] = None) -> List[str]:
+    """
+    Paths changed in the working tree (vs HEAD, or vs base...HEAD), plus
+    untracked files.
+
+    Raises RuntimeError when git fails (not a checkout, no HEAD, unknown
+    base): selecting nothing would pass a change set that was never tested.
+    """
+    commands = [
+        ["git", "diff", "--name-only", "--relative", base + "...HEAD"] if base else None,
+        ["git", "diff", "--name-only", "--relative", "HEAD"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]
+    paths: List[str] = []
+    for command in commands:
+        if command is None:
+            continue
+        try:
+            output = subprocess.run(
+                command,
+                cwd=project_root,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        except OSError as exc:
+            raise RuntimeError(f"cannot run git: {exc}") from exc
+        except subprocess.CalledProcessError as exc:
+            detail = (exc.stderr.strip().splitlines() or [f"exit status {exc.returncode}"])[0]
+            raise RuntimeError(f"{' '.join(command)} failed: {detail}") from exc
+        paths.extend(line.strip() for line in output.splitlines() if line.strip())
+    return sorted(set(paths))
+
+
+def run_impacted_tests(
+    project_root: str,
+    selection: ImpactSelection,
+    pytest_args: Sequence[str] = (),
+) -> int:
+    """Run the selection with pytest; returns pytest's exit code (0 if nothing to run)."""
+    targets = selection.pytest_targets()
+    if not targets and not selection.run_all:
+        return 0
+    command = [sys.executable, "-m", "pytest", *pytest_args, *targets]
+    code = subprocess.call(command, cwd=project_root)
+    return 0 if code == PYTEST_NO_TESTS else code
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Select (and optionally run) the tests affected by a change set."
+    )
+    parser.add_argument("paths", nargs="*", help="Changed files (default: from git)")
+    parser.add_argument("--root", default=".", help="Project root (default: cwd)")
+    parser.add_argument("--base", help="Also include commits since this git ref")
+    parser.add_argument("--run", action="store_true", help="Run the selected tests with pytest")
+    parser.add_argument("--json", action="store_true", help="Print the selection as JSON")
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Everything after "--" goes to pytest untouched
+    split = argv.index("--") if "--" in argv else len(argv)
+    args = parser.parse_args(argv[:split])
+    pytest_args = argv[split + 1:]
+
+    root = str(Path(args.root).resolve())
+    if args.paths:
+        # Accept absolute or cwd-relative paths
+        changed = [
+            os.path.relpath(os.path.abspath(path), root) if os.path.exists(path) else path
+            for path in args.paths
+        ]
+    else:
+        try:
+            changed = git_changed_files(root, args.base)
+        except RuntimeError as exc:
+            print(f"change_impact: {exc}", file=sys.stderr)
+            return 2
+
+    selection = select_impacted_tests(load_connection_graph(root), changed)
+
+    if args.json:
+        print(json.dumps(selection.to_dict(), indent=2))
+    elif selection.run_all:
+        print(f"# {len(selection.changed)} changed; non-source changes -> full suite")
+    else:
+        print(f"# {len(selection.changed)} changed -> {len(selection.tests)} impacted tests")
+        for path in selection.tests:
+            print(path)
+
+    if args.run:
+        sys.stdout.flush()
+        return run_impacted_tests(root, selection, pytest_args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
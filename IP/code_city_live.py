@@ -0,0 +1,299 @@
+# IP/code_city_live.py
+"""
+Code City Live - Patch a rendered Code City in place.
+
+Without this, every health update makes 06_maestro rebuild the city from
+scratch: rescan, re-verify, re-serialize, and replace the iframe, which
+restarts the emergence animation and resets the camera. A LiveCodeCity
+instead mirrors what one rendered city shows and pushes only the
+differences as JSON patches over its loopback channel
+(/city/<session>/patches, see IP/code_city_stream.py). The template applies
+them in place, and resyncs from snapshot() (/city/<session>/graph) when it
+fell too far behind:
+
+    {"op": "node", "node": {"id", <changed fields>}}   update or add a node
+    {"op": "removeNode", "id": <path>}
+    {"op": "edge", "edge": {...}}                     add an import edge
+    {"op": "removeEdge", "edge": {"source", "target", "lineNumber"}}
+
+Health and combat changes only recompute statuses and health errors. The
+graph is rescanned (with the scan and verifier caches) only when a changed
+fiefdom gained or lost code files.
+
+Disable with ORCHESTR8_CODE_CITY_LIVE=0 (every health update re-renders).
+"""
+
+import os
+import threading
+from dataclasses import replace
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from IP.env_flags import env_flag
+    from IP.woven_maps import (
+        CODE_EXTENSIONS,
+        GraphData,
+        build_from_connection_graph,
+        build_from_health_results,
+        build_graph_data,
+        normalize_health_path,
+    )
+except ImportError:
+    # Fallback for standalone use
+    from env_flags import env_flag
+    from woven_maps import (
+        CODE_EXTENSIONS,
+        GraphData,
+        build_from_connection_graph,
+        build_from_health_results,
+        build_graph_data,
+        normalize_health_path,
+    )
+
+EdgeKey = Tuple[str, str, int]
+
+
+def code_city_live_enabled() -> bool:
+    """Live patching is used unless ORCHESTR8_CODE_CITY_LIVE is set to a falsy value."""
+    return env_flag("ORCHESTR8_CODE_CITY_LIVE")
+
+
+def _edge_key(edge: Dict[str, Any]) -> EdgeKey:
+    return (edge["source"], edge["target"], edge.get("lineNumber") or 0)
+
+
+class LiveCodeCity:
+    """Server-side mirror of one rendered Code City that emits patches."""
+
+    def __init__(
+        self,
+        root: str,
+        graph_data: GraphData,
+        health_results: Optional[Dict[str, Any]] = None,
+        build_options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            root: Project root the city was built from
+            graph_data: The city's graph before health results were merged
+            health_results: Health results the rendered city shows
+            build_options: width/height/max_height/wire_count for rebuilds
+        """
+        self.root = os.path.abspath(root)
+        self.build_options = dict(build_options or {})
+        self.session_id: Optional[str] = None
+        self._server = None
+        self._lock = threading.Lock()
+        self._health: Dict[str, Any] = dict(health_results or {})
+        self._combat: Set[str] = set()
+        self._graph = graph_data
+        self._base_status: Dict[str, str] = {}
+        self._index_base(graph_data)
+        # What the browser has: node dicts by id, edge dicts by key
+        self._sent_nodes: Dict[str, Dict[str, Any]] = {}
+        self._sent_edges: Dict[EdgeKey, Dict[str, Any]] = {}
+        self._snapshot_sent(self._render())
+
+    def _index_base(self, graph_data: GraphData) -> None:
+        """Statuses before health merging; combat is tracked separately."""
+        self._base_status = {}
+        self._dirs: Dict[str, Set[str]] = {}
+        for node in graph_data.nodes:
+            path = normalize_health_path(node.path)
+            if node.status == "combat":
+                self._combat.add(path)
+                self._base_status[path] = "working"
+            else:
+                self._base_status[path] = node.status
+            self._dirs.setdefault(os.path.dirname(path), set()).add(path)
+
+    def _snapshot_sent(self, graph_dict: Dict[str, Any]) -> None:
+        self._sent_nodes = {node["id"]: node for node in graph_dict["nodes"]}
+        self._sent_edges = {_edge_key(edge): edge for edge in graph_dict["edges"]}
+
+    def _render(self) -> Dict[str, Any]:
+        """GraphData.to_dict() of the current graph with health and combat merged."""
+        nodes = []
+        for node in self._graph.nodes:
+            path = normalize_health_path(node.path)
+            status = "combat" if path in self._combat else self._base_status[path]
+            nodes.append(replace(node, status=status, health_errors=[]))
+        build_from_health_results(nodes, self._health)
+        return {
+            "nodes": [node.to_dict() for node in nodes],
+            "edges": [edge.to_dict() for edge in self._graph.edges],
+        }
+
+    # ------------------------------------------------------------------
+    # Channel
+    # ------------------------------------------------------------------
+
+    def attach(self, server, session_id: str) -> None:
+        """Bind to a CodeCityStreamServer session whose page polls for patches."""
+        self._server = server
+        self.session_id = session_id
+        server.set_snapshot(session_id, self.snapshot)
+
+    @property
+    def patches_url(self) -> Optional[str]:
+        if self._server is None or self.session_id is None:
+            return None
+        return self._server.session_url(self.session_id) + "patches"
+
+    @property
+    def graph_url(self) -> Optional[str]:
+        if self._server is None or self.session_id is None:
+            return None
+        return self._server.session_url(self.session_id) + "graph"
+
+    @property
+    def seq(self) -> int:
+        session = self._server.get_session(self.session_id) if self._server else None
+        return session.patches.seq if session else 0
+
+    @property
+    def alive(self) -> bool:
+        return self._server is not None and self._server.get_session(self.session_id) is not None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Everything sent so far and its seq, for clients that missed patches."""
+        with self._lock:
+            return {
+                "seq": self.seq,
+                "nodes": list(self._sent_nodes.values()),
+                "edges": list(self._sent_edges.values()),
+            }
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update(
+        self,
+        health_results: Optional[Dict[str, Any]] = None,
+        combat_files: Optional[Iterable[str]] = None,
+        changed_fiefdoms: Optional[Iterable[str]] = None,
+    ) -> Optional[int]:
+        """
+        Push the differences caused by new health results/combat files.
+
+        health_results replaces the merged results (pass the full current
+        dict); changed_fiefdoms (defaults to the keys of health_results)
+        are checked for added/removed files, which triggers a rescan.
+
+        Returns the number of patches pushed, or None if the page's session
+        is gone (the caller should re-render instead).
+        """
+        if not self.alive:
+            return None
+        with self._lock:
+            if health_results is not None:
+                self._health = dict(health_results)
+            if combat_files is not None:
+                self._combat = {normalize_health_path(p) for p in combat_files}
+            if changed_fiefdoms is None:
+                changed_fiefdoms = list(health_results or ())
+            if self._files_changed(changed_fiefdoms):
+                self._rebuild_locked()
+            patches = self._diff(self._render())
+            if not self._server.push_patches(self.session_id, patches):
+                return None
+            return len(patches)
+
+    def rebuild(self) -> Optional[int]:
+        """Rescan the project and push the structural differences."""
+        if not self.alive:
+            return None
+        with self._lock:
+            self._rebuild_locked()
+            patches = self._diff(self._render())
+            if not self._server.push_patches(self.session_id, patches):
+                return None
+            return len(patches)
+
+    def _rebuild_locked(self) -> None:
+        options = self.build_options
+        try:
+            graph_data = build_from_connection_graph(self.root, **options)
+        except Exception:
+            graph_data = build_graph_data(self.root, **options)
+        self._combat = set()
+        self._graph = graph_data
+        self._index_base(graph_data)
+
+    def _files_changed(self, fiefdoms: Iterable[str]) -> bool:
+        """True if a fiefdom's code files differ from the graph's nodes."""
+        for fiefdom in fiefdoms:
+            rel = normalize_health_path(fiefdom)
+            full = os.path.join(self.root, rel)
+            if os.path.isfile(full) or rel in self._base_status:
+                # Root-level file fiefdom
+                if os.path.isfile(full) != (rel in self._base_status):
+                    return True
+                continue
+            try:
+                names = os.listdir(full)
+            except OSError:
+                # Directory gone: did the graph have files at or under it?
+                prefix = rel + "/"
+                if any(d == rel or d.startswith(prefix) for d in self._dirs):
+                    return True
+                continue
+            on_disk = {
+                f"{rel}/{name}" if rel else name
+                for name in names
+                if os.path.splitext(name)[1].lower() in CODE_EXTENSIONS
+                and os.path.isfile(os.path.join(full, name))
+            }
+            if on_disk != self._dirs.get(rel, set()):
+                return True
+        return False
+
+    def _diff(self, graph_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
+        patches: List[Dict[str, Any]] = []
+        nodes = {node["id"]: node for node in graph_dict["nodes"]}
+        edges = {_edge_key(edge): edge for edge in graph_dict["edges"]}
+
+        # Edges first off, nodes next, new edges last: both ends always exist
+        for key, edge in self._sent_edges.items():
+            if key not in edges:
+                patches.append({
+                    "op": "removeEdge",
+                    "edge": {"source": key[0], "target": key[1], "lineNumber": key[2]},
+                })
+        for node_id in self._sent_nodes:
+            if node_id not in nodes:
+                patches.append({"op": "removeNode", "id": node_id})
+        for node_id, node in nodes.items():
+            sent = self._sent_nodes.get(node_id)
+            if sent is None:
+                patches.append({"op": "node", "node": node})
+                continue
+            changed = {k: v for k, v in node.items() if sent.get(k) != v}
+            if changed:
+                changed["id"] = node_id
+                patches.append({"op": "node", "node": changed})
+        for key, edge in edges.items():
+            if key not in self._sent_edges:
+                patches.append({"op": "edge", "edge": edge})
+
+        self._sent_nodes = nodes
+        self._sent_edges = edges
+        return patches
+
+
+_LIVE_CITIES: Dict[str, LiveCodeCity] = {}
+_LIVE_LOCK = threading.Lock()
+
+
+def register_live_city(city: LiveCodeCity) -> None:
+    """Make city the one patched for its root (the most recent render wins)."""
+    with _LIVE_LOCK:
+        _LIVE_CITIES[city.root] = city
+
+
+def live_city_for(root: str) -> Optional[LiveCodeCity]:
+    """The live city rendered most recently for root, if its page session is alive."""
+    with _LIVE_LOCK:
+        city = _LIVE_CITIES.get(os.path.abspath(root))
+    return city if city is not None and city.alive else None
@@ -0,0 +1,331 @@
+# IP/code_city_stream.py
+"""
+Code City Stream - Loopback HTTP delivery for large Code City graphs.
+
+Inline delivery embeds the whole graph JSON plus woven_maps_3d.js in an
+iframe srcdoc, so marimo serializes one multi-megabyte string per render
+(and 06_maestro has to guard ORCHESTR8_CODE_CITY_MAX_BYTES). Stream delivery
+keeps the notebook output to a single <iframe src=...> and serves the rest
+from a local server:
+
+    /city/<session>/                  shell HTML (template, empty graph)
+    /city/<session>/woven_maps_3d.js  3D renderer script
+    /city/<session>/manifest          chunk index + totals
+    /city/<session>/chunk/<n>         {"key", "nodes", "edges"} (or columnar)
+    /city/<session>/patches?since=<seq>  long poll for live patches
+    /city/<session>/graph             {"seq", "nodes", "edges"} resync snapshot
+
+The patches endpoint is the live channel of a rendered city (see
+IP/code_city_live.py): it answers as soon as patch batches newer than
+<seq> exist, or after PATCH_POLL_TIMEOUT with none. A client that fell
+further behind than the retained batches is told to reset and re-fetches
+the whole graph from /graph before polling on. Inline (srcdoc) cities
+open a channel-only session, so it also sends a CORS header.
+
+Chunks group nodes by top-level directory (fiefdom) and are paged to at most
+ORCHESTR8_CODE_CITY_CHUNK_NODES nodes, so the browser appends and renders the
+city progressively. An edge ships with whichever of its endpoints' chunks
+arrives last, so both ends always exist when it is drawn.
+
+The server binds 127.0.0.1 only and session ids are random tokens. It needs
+the browser on the same machine as the kernel; remote marimo deployments
+should keep inline delivery.
+"""
+
+import json
+import os
+import secrets
+import threading
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from IP.graph_codec import encode_columnar
+
+DEFAULT_CHUNK_NODES = 400
+
+# Each render publishes a session; keep only the most recent ones alive.
+MAX_SESSIONS = 8
+
+# Seconds a patches request waits for news before answering empty
+PATCH_POLL_TIMEOUT = 25.0
+
+# Patch batches kept per session; slower clients are told to resync
+MAX_PATCH_BATCHES = 256
+
+
+def stream_chunk_nodes() -> int:
+    """Nodes per chunk (ORCHESTR8_CODE_CITY_CHUNK_NODES, min 50)."""
+    raw = os.getenv("ORCHESTR8_CODE_CITY_CHUNK_NODES", str(DEFAULT_CHUNK_NODES)).strip()
+    try:
+        return max(50, int(raw))
+    except ValueError:
+        return DEFAULT_CHUNK_NODES
+
+
+def chunk_key(path: str) -> str:
+    """Fiefdom key for a node path: its top-level directory, or "." for root files."""
+    normalized = path.replace("\\", "/")
+    while normalized.startswith("./"):
+        normalized = normalized[2:]
+    head, sep, _ = normalized.partition("/")
+    return head if sep else "."
+
+
+def build_chunks(graph_dict: Dict[str, Any], chunk_nodes: int = DEFAULT_CHUNK_NODES) -> List[Dict[str, Any]]:
+    """
+    Split GraphData.to_dict() output into ordered, directory-grouped chunks.
+
+    Chunks for the same directory are consecutive; larger directories are
+    paged. Returns [{"key", "nodes", "edges"}, ...].
+    """
+    groups: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+    for node in graph_dict.get("nodes", []):
+        groups.setdefault(chunk_key(node.get("path") or node.get("id", "")), []).append(node)
+
+    chunks: List[Dict[str, Any]] = []
+    chunk_of: Dict[str, int] = {}
+    size = max(1, chunk_nodes)
+    for key, members in groups.items():
+        for start in range(0, len(members), size):
+            page = members[start:start + size]
+            for node in page:
+                chunk_of[node["id"]] = len(chunks)
+            chunks.append({"key": key, "nodes": page, "edges": []})
+
+    for edge in graph_dict.get("edges", []):
+        source_chunk = chunk_of.get(edge.get("source"))
+        if source_chunk is None:
+            continue
+        target_chunk = chunk_of.get(edge.get("target"), source_chunk)
+        chunks[max(source_chunk, target_chunk)]["edges"].append(edge)
+
+    return chunks
+
+
+class PatchLog:
+    """Sequenced patch batches of one session, with blocking reads."""
+
+    def __init__(self, max_batches: int = MAX_PATCH_BATCHES):
+        self.seq = 0
+        self._batches: Deque[Tuple[int, List[Dict[str, Any]]]] = deque(maxlen=max_batches)
+        self._changed = threading.Condition()
+
+    def append(self, patches: List[Dict[str, Any]]) -> int:
+        with self._changed:
+            self.seq += 1
+            self._batches.append((self.seq, list(patches)))
+            self._changed.notify_all()
+            return self.seq
+
+    def read(self, since: int, timeout: float = 0.0) -> Dict[str, Any]:
+        """
+        Patches after seq `since`, waiting up to timeout for the first one.
+
+        Returns {"seq", "patches"}, or {"seq", "reset": True} when `since`
+        is older than the retained batches (or from another server run).
+        """
+        with self._changed:
+            if since == self.seq and timeout > 0:
+                self._changed.wait_for(lambda: self.seq != since, timeout)
+            if since > self.seq or (
+                since < self.seq and (not self._batches or since < self._batches[0][0] - 1)
+            ):
+                return {"seq": self.seq, "reset": True}
+            patches: List[Dict[str, Any]] = []
+            for seq, batch in self._batches:
+                if seq > since:
+                    patches.extend(batch)
+            return {"seq": self.seq, "patches": patches}
+
+
+class _StreamSession:
+    """One published Code City: shell, script, encoded chunks and patch log."""
+
+    def __init__(
+        self,
+        shell_html: Optional[str],
+        script: str,
+        chunks: List[Dict[str, Any]],
+        columnar: bool = False,
+    ):
+        self.patches = PatchLog()
+        # Returns the full current graph for clients whose patches were reset
+        self.snapshot: Optional[Callable[[], Dict[str, Any]]] = None
+        # Channel-only sessions (inline delivery) have no shell to serve
+        self.shell = shell_html.encode("utf-8") if shell_html is not None else None
+        self.script = script.encode("utf-8")
+        self.chunks = []
+        for chunk in chunks:
+            body = encode_columnar(chunk) if columnar else chunk
+            self.chunks.append(json.dumps(body, separators=(",", ":")).encode("utf-8"))
+        manifest = {
+            "chunkCount": len(chunks),
+            "nodeCount": sum(len(c["nodes"]) for c in chunks),
+            "edgeCount": sum(len(c["edges"]) for c in chunks),
+            "chunks": [
+                {"key": c["key"], "nodes": len(c["nodes"]), "edges": len(c["edges"])}
+                for c in chunks
+            ],
+        }
+        self.manifest = json.dumps(manifest).encode("utf-8")
+
+
+class CodeCityStreamServer:
+    """Threaded loopback server holding the most recent Code City sessions."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._sessions: "OrderedDict[str, _StreamSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="code-city-stream", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def publish(
+        self,
+        shell_html: str,
+        script: str,
+        chunks: List[Dict[str, Any]],
+        columnar: bool = False,
+    ) -> str:
+        """
+        Register a session and return the URL of its shell page.
+
+        columnar=True serves each chunk in the graph_codec columnar form.
+        """
+        return self.session_url(self.register(shell_html, script, chunks, columnar))
+
+    def register(
+        self,
+        shell_html: Optional[str],
+        script: str = "",
+        chunks: Optional[List[Dict[str, Any]]] = None,
+        columnar: bool = False,
+    ) -> str:
+        """Register a session and return its id; shell_html=None opens a patch channel only."""
+        session_id = secrets.token_urlsafe(16)
+        session = _StreamSession(shell_html, script, chunks or [], columnar)
+        with self._lock:
+            self._sessions[session_id] = session
+            while len(self._sessions) > MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+        return session_id
+
+    def set_shell(self, session_id: str, shell_html: str) -> None:
+        """Attach the shell page to a session registered without one."""
+        session = self.get_session(session_id)
+        if session is not None:
+            session.shell = shell_html.encode("utf-8")
+
+    def set_snapshot(self, session_id: str, snapshot: Callable[[], Dict[str, Any]]) -> None:
+        """Serve snapshot() as the session's /graph resync endpoint."""
+        session = self.get_session(session_id)
+        if session is not None:
+            session.snapshot = snapshot
+
+    def session_url(self, session_id: str) -> str:
+        return f"{self.base_url}/city/{session_id}/"
+
+    def get_session(self, session_id: str) -> Optional[_StreamSession]:
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def push_patches(self, session_id: str, patches: List[Dict[str, Any]]) -> bool:
+        """Queue a patch batch for a session's clients; False if it was evicted."""
+        session = self.get_session(session_id)
+        if session is None:
+            return False
+        if patches:
+            session.patches.append(patches)
+        return True
+
+    def shutdown(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802 - http.server naming
+                path, _, query = self.path.partition("?")
+                parts = path.strip("/").split("/")
+                if len(parts) < 2 or parts[0] != "city":
+                    return self._send(404, b"not found", "text/plain")
+                session = server.get_session(parts[1])
+                if session is None:
+                    return self._send(404, b"unknown session", "text/plain")
+
+                resource = parts[2:]
+                if resource == ["patches"]:
+                    return self._send_patches(session, query)
+                if resource == ["graph"] and session.snapshot is not None:
+                    body = json.dumps(session.snapshot(), separators=(",", ":")).encode("utf-8")
+                    return self._send(200, body, "application/json", {"Access-Control-Allow-Origin": "*"})
+                if not resource and session.shell is not None:
+                    return self._send(200, session.shell, "text/html; charset=utf-8")
+                if resource == ["woven_maps_3d.js"]:
+                    return self._send(200, session.script, "application/javascript")
+                if resource == ["manifest"]:
+                    return self._send(200, session.manifest, "application/json")
+                if len(resource) == 2 and resource[0] == "chunk" and resource[1].isdigit():
+                    index = int(resource[1])
+                    if index < len(session.chunks):
+                        return self._send(200, session.chunks[index], "application/json")
+                return self._send(404, b"not found", "text/plain")
+
+            def _send_patches(self, session: _StreamSession, query: str) -> None:
+                try:
+                    since = int(parse_qs(query).get("since", ["0"])[0])
+                except ValueError:
+                    return self._send(400, b"bad since", "text/plain")
+                reply = session.patches.read(since, PATCH_POLL_TIMEOUT)
+                body = json.dumps(reply, separators=(",", ":")).encode("utf-8")
+                # Inline cities poll from the notebook's origin
+                self._send(200, body, "application/json", {"Access-Control-Allow-Origin": "*"})
+
+            def _send(
+                self,
+                status: int,
+                body: bytes,
+                content_type: str,
+                headers: Optional[Dict[str, str]] = None,
+            ) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Client navigated away during a long poll
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass  # Keep marimo's console quiet
+
+        return Handler
+
+
+_server: Optional[CodeCityStreamServer] = None
+_server_lock = threading.Lock()
+
+
+def get_stream_server() -> CodeCityStreamServer:
+    """Return the process-wide stream server, starting it on first use."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = CodeCityStreamServer()
+        return _server
@@ -10,13 +10,80 @@ Handles:
 - Package imports (from package.submodule import thing)
 """
 
+import functools
 import os
 import re
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Any, List, Dict, Tuple, Optional, Set
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Tuple, Optional, Set, Union
 from enum import Enum
 
+try:
+    from IP.executor_pool import (
+        CHUNKS_PER_WORKER,
+        ExecutorMode,
+        default_worker_count,
+        iter_parallel_map,
+        resolve_executor_mode,
+    )
+    from IP.graph_core import CSRGraph, bfs_depths, pagerank, strongly_connected_components
+    from IP.import_scanner import extract_js_imports, extract_python_imports
+    from IP.reachability import ReachabilityIndex
+    from IP.scan_cache import content_digest
+    from IP.module_index import (
+        JS_EXTENSIONS,
+        PYTHON_EXTENSIONS,
+        ModuleNameIndex,
+        ModuleSuggestion,
+    )
+except ImportError:
+    # Fallback for standalone use
+    from executor_pool import (
+        CHUNKS_PER_WORKER,
+        ExecutorMode,
+        default_worker_count,
+        iter_parallel_map,
+        resolve_executor_mode,
+    )
+    from graph_core import CSRGraph, bfs_depths, pagerank, strongly_connected_components
+    from import_scanner import extract_js_imports, extract_python_imports
+    from reachability import ReachabilityIndex
+    from scan_cache import content_digest
+    from module_index import (
+        JS_EXTENSIONS,
+        PYTHON_EXTENSIONS,
+        ModuleNameIndex,
+        ModuleSuggestion,
+    )
+
+# Upper bound on files per worker chunk, so pooled runs still report
+# progress at a useful granularity on very large trees.
+VERIFY_CHUNK_MAX = 200
+
+# Directories skipped by the project walk (extend via ORCHESTR8_CONN_EXCLUDE_DIRS)
+DEFAULT_EXCLUDED_DIRS = frozenset({
+    "node_modules",
+    ".git",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".env",
+    "dist",
+    "build",
+    # Large/non-runtime trees that only add noise to Code City.
+    "marimo",
+    "vscode-marimo",
+    ".taskmaster",
+    ".planning",
+    "one integration at a time",
+    "GSD + Custom Agents",
+    "SOT",
+    "Barradeau",
+    "effects",
+})
+
 
 class ImportType(Enum):
     PYTHON = "python"
@@ -85,6 +152,24 @@ class FileConnectionResult:
     external_imports: List[ImportResult] = field(default_factory=list)
     local_imports: List[ImportResult] = field(default_factory=list)  # Resolved local imports
     status: str = "working"  # "working" | "broken"
+    # (mtime_ns, size, content hash) of the source as read for verification
+    signature: Optional[Tuple[int, int, str]] = field(default=None, compare=False, repr=False)
+
+
+@dataclass
+class VerifyProgress:
+    """Progress snapshot passed to iter_verify_project callbacks."""
+    completed: int
+    total: int
+    elapsed: float  # Seconds since the run started
+
+    @property
+    def files_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def fraction(self) -> float:
+        return self.completed / self.total if self.total else 1.0
 
 
 @dataclass
@@ -183,6 +268,7 @@ class PatchbayDryRunResult:
     checks: Dict[str, bool] = field(default_factory=dict)
     issues: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    impact: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with camelCase keys for UI payload transport."""
@@ -199,6 +285,7 @@ class PatchbayDryRunResult:
             "checks": self.checks,
             "issues": self.issues,
             "warnings": self.warnings,
+            "impact": self.impact,
         }
 
 
@@ -228,14 +315,75 @@ NODE_BUILTINS = {
 }
 
 
+class _DirectoryIndex:
+    """
+    Lazy directory-listing cache for import resolution.
+
+    Each directory is listed once with os.scandir(); every later is_file /
+    is_dir / exists probe under it is a set lookup instead of a stat call.
+    Listings are valid for one verification run.
+    """
+
+    def __init__(self):
+        self._listings: Dict[str, Optional[Tuple[Set[str], Set[str]]]] = {}
+        self.listed = 0  # Directories actually read (for diagnostics/tests)
+
+    def _listing(self, directory: str) -> Optional[Tuple[Set[str], Set[str]]]:
+        if directory in self._listings:
+            return self._listings[directory]
+
+        listing = None
+        try:
+            files: Set[str] = set()
+            dirs: Set[str] = set()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            dirs.add(entry.name)
+                        elif entry.is_file():
+                            files.add(entry.name)
+                    except OSError:
+                        continue
+            listing = (files, dirs)
+            self.listed += 1
+        except OSError:
+            pass  # Missing or unreadable directory - nothing exists under it
+
+        self._listings[directory] = listing
+        return listing
+
+    def is_file(self, path) -> bool:
+        parent, name = os.path.split(os.fspath(path))
+        listing = self._listing(parent)
+        return listing is not None and name in listing[0]
+
+    def is_dir(self, path) -> bool:
+        parent, name = os.path.split(os.fspath(path))
+        listing = self._listing(parent)
+        return listing is not None and name in listing[1]
+
+    def exists(self, path) -> bool:
+        return self.is_file(path) or self.is_dir(path)
+
+    def clear(self) -> None:
+        self._listings.clear()
+
+
 class ConnectionVerifier:
     """Verifies that imports in source files actually resolve to real files."""
     
     def __init__(self, project_root: str, node_modules_path: Optional[str] = None):
         self.project_root = Path(project_root).resolve()
         self.node_modules = Path(node_modules_path) if node_modules_path else self.project_root / "node_modules"
+
+        # Per-run resolution caches (see reset_caches)
+        self._fs = _DirectoryIndex()
+        self._resolution_memo: Dict[Tuple[str, str, str], Tuple[Optional[str], bool, bool]] = {}
+        self._name_index: Optional[ModuleNameIndex] = None
+        self._run_depth = 0
         
-        # Regex patterns for extracting imports WITH line numbers
+        # Legacy line-based patterns (see _extract_imports_with_lines)
         # Note: Allow optional leading whitespace for imports inside functions (e.g., Marimo cells)
         self.python_patterns = [
             # from package.module import thing (with optional indentation)
@@ -267,6 +415,49 @@ class ConnectionVerifier:
         elif ext in {'.ts', '.tsx'}:
             return ImportType.TYPESCRIPT
         return ImportType.UNKNOWN
+
+    def reset_caches(self) -> None:
+        """Drop the directory index, resolution memo and module name index."""
+        self._fs.clear()
+        self._resolution_memo.clear()
+        self._name_index = None
+
+    @contextmanager
+    def resolution_run(self):
+        """
+        Share one directory index + resolution memo across verify_file calls.
+
+        Outside a run every verify_file() starts from fresh caches, so
+        long-lived verifiers never see a stale tree.
+        """
+        if not self._run_depth:
+            self.reset_caches()
+        self._run_depth += 1
+        try:
+            yield self
+        finally:
+            self._run_depth -= 1
+
+    def _resolve_memoized(
+        self,
+        resolver,
+        import_path: str,
+        source_file: Path
+    ) -> Tuple[Optional[str], bool, bool]:
+        """
+        Resolve an import through the per-run memo.
+
+        Keyed by (resolver, specifier, source directory); only relative
+        specifiers depend on the source directory, so absolute/bare imports
+        share one entry across the whole project.
+        """
+        scope = str(source_file.parent) if import_path.startswith('.') else ""
+        key = (resolver.__name__, import_path, scope)
+        cached = self._resolution_memo.get(key)
+        if cached is None:
+            cached = resolver(import_path, source_file)
+            self._resolution_memo[key] = cached
+        return cached
     
     def _resolve_python_import(
         self, 
@@ -295,8 +486,8 @@ class ConnectionVerifier:
         for part in parts:
             package_path = package_path / part
         
-        if package_path.is_dir() and (package_path / '__init__.py').exists():
-            return (str(package_path / '__init__.py'), False, False)
+        if self._fs.is_file(package_path / '__init__.py'):
+            return (str((package_path / '__init__.py').relative_to(self.project_root)), False, False)
         
         # Try as module file
         module_path = self.project_root
@@ -304,28 +495,28 @@ class ConnectionVerifier:
             module_path = module_path / part
         module_file = module_path / f"{parts[-1]}.py"
         
-        if module_file.exists():
+        if self._fs.is_file(module_file):
             return (str(module_file.relative_to(self.project_root)), False, False)
         
         # Try without subdirectories (flat import)
         flat_path = self.project_root / f"{parts[0]}.py"
-        if flat_path.exists():
+        if self._fs.is_file(flat_path):
             return (str(flat_path.relative_to(self.project_root)), False, False)
         
         # Check common src directories
         for src_dir in ['src', 'lib', 'IP', 'plugins']:
             src_path = self.project_root / src_dir
-            if src_path.exists():
+            if self._fs.is_dir(src_path):
                 # Try package in src
                 pkg_in_src = src_path
                 for part in parts:
                     pkg_in_src = pkg_in_src / part
-                if pkg_in_src.is_dir() and (pkg_in_src / '__init__.py').exists():
+                if self._fs.is_file(pkg_in_src / '__init__.py'):
                     return (str((pkg_in_src / '__init__.py').relative_to(self.project_root)), False, False)
                 
                 # Try module in src
                 mod_in_src = src_path / f"{parts[0]}.py"
-                if mod_in_src.exists():
+                if self._fs.is_file(mod_in_src):
                     return (str(mod_in_src.relative_to(self.project_root)), False, False)
         
         # Unresolved - assume external package
@@ -349,7 +540,7 @@ class ConnectionVerifier:
         if not module_part:
             # from . import X - looking for __init__.py in current
             init_path = current / '__init__.py'
-            if init_path.exists():
+            if self._fs.is_file(init_path):
                 return (str(init_path.relative_to(self.project_root)), False, False)
         else:
             # from .module import X
@@ -359,12 +550,12 @@ class ConnectionVerifier:
             
             # Try as module file
             module_file = current / f"{parts[-1]}.py"
-            if module_file.exists():
+            if self._fs.is_file(module_file):
                 return (str(module_file.relative_to(self.project_root)), False, False)
             
             # Try as package
             pkg_init = current / parts[-1] / '__init__.py'
-            if pkg_init.exists():
+            if self._fs.is_file(pkg_init):
                 return (str(pkg_init.relative_to(self.project_root)), False, False)
         
         return (None, False, False)  # Broken relative import
@@ -398,9 +589,9 @@ class ConnectionVerifier:
             return (None, False, True)
         
         # Check node_modules
-        if self.node_modules.exists():
+        if self._fs.is_dir(self.node_modules):
             pkg_path = self.node_modules / import_path.split('/')[0]
-            if pkg_path.exists():
+            if self._fs.exists(pkg_path):
                 return (None, False, True)  # External package exists
         
         # Unresolved - assume external
@@ -413,7 +604,8 @@ class ConnectionVerifier:
     ) -> Tuple[Optional[str], bool, bool]:
         """Resolve a relative JS/TS import."""
         base_dir = source_file.parent
-        target = (base_dir / import_path).resolve()
+        # Lexical normalization - no filesystem access needed
+        target = Path(os.path.normpath(base_dir / import_path))
         
         return self._try_resolve_js_file(target, source_file)
     
@@ -426,9 +618,10 @@ class ConnectionVerifier:
         # Extensions to try
         extensions = ['', '.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs', '/index.ts', '/index.tsx', '/index.js', '/index.jsx']
         
+        target = os.path.normpath(target)
         for ext in extensions:
-            full_path = Path(str(target) + ext)
-            if full_path.is_file():
+            full_path = Path(target + ext)
+            if self._fs.is_file(full_path):
                 try:
                     return (str(full_path.relative_to(self.project_root)), False, False)
                 except ValueError:
@@ -441,7 +634,12 @@ class ConnectionVerifier:
         content: str, 
         patterns: List[re.Pattern]
     ) -> List[Tuple[str, int]]:
-        """Extract imports with their line numbers."""
+        """
+        Extract imports with their line numbers (legacy per-line regex path).
+
+        verify_file() uses IP.import_scanner; this is kept as the baseline
+        for scripts/bench_import_scanner.py.
+        """
         imports = []
         lines = content.split('\n')
         
@@ -463,6 +661,9 @@ class ConnectionVerifier:
         Returns:
             FileConnectionResult with broken/resolved import details
         """
+        if not self._run_depth:
+            self.reset_caches()
+
         full_path = self.project_root / file_path
         result = FileConnectionResult(file_path=file_path)
         
@@ -475,21 +676,28 @@ class ConnectionVerifier:
             return result
         
         try:
-            content = full_path.read_text(encoding='utf-8', errors='ignore')
+            # Stat before reading: a write racing the read then shows up as
+            # a stat change against the hash of what was actually verified
+            st = full_path.stat()
+            raw = full_path.read_bytes()
         except Exception:
             result.status = "broken"
             return result
+        result.signature = (st.st_mtime_ns, st.st_size, content_digest(raw))
+        content = raw.decode('utf-8', errors='ignore')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
-        # Select patterns based on file type
+        # Select extractor based on file type
         if file_type == ImportType.PYTHON:
-            patterns = self.python_patterns
+            extract = extract_python_imports
             resolver = self._resolve_python_import
         else:
-            patterns = self.js_patterns
+            extract = extract_js_imports
             resolver = self._resolve_js_import
         
         # Extract and verify imports
-        imports = self._extract_imports_with_lines(content, patterns)
+        imports = extract(content)
         seen = set()  # Dedupe
         
         for import_path, line_num in imports:
@@ -497,7 +705,9 @@ class ConnectionVerifier:
                 continue
             seen.add(import_path)
             
-            resolved_path, is_stdlib, is_external = resolver(import_path, full_path)
+            resolved_path, is_stdlib, is_external = self._resolve_memoized(
+                resolver, import_path, full_path
+            )
             
             import_result = ImportResult(
                 source_file=file_path,
@@ -527,10 +737,117 @@ class ConnectionVerifier:
         
         return result
     
+    def project_files(self, extensions: Optional[Set[str]] = None) -> List[str]:
+        """
+        Walk the project for source files (relative paths, walk order).
+
+        Directories in DEFAULT_EXCLUDED_DIRS and ORCHESTR8_CONN_EXCLUDE_DIRS
+        are skipped. The walk is complete unless ORCHESTR8_CONN_MAX_FILES is
+        set, in which case it stops after that many files (minimum 100).
+        """
+        if extensions is None:
+            extensions = {'.py', '.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs'}
+
+        extra_exclusions = {
+            item.strip()
+            for item in os.getenv("ORCHESTR8_CONN_EXCLUDE_DIRS", "").split(",")
+            if item.strip()
+        }
+        exclusions = DEFAULT_EXCLUDED_DIRS | extra_exclusions
+
+        max_files: Optional[int] = None
+        max_files_raw = os.getenv("ORCHESTR8_CONN_MAX_FILES", "").strip()
+        if max_files_raw:
+            try:
+                max_files = max(100, int(max_files_raw))
+            except ValueError:
+                max_files = None
+
+        file_paths: List[str] = []
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = [d for d in dirs if d not in exclusions]
+            rel_root = os.path.relpath(root, self.project_root)
+
+            for file in files:
+                if os.path.splitext(file)[1].lower() in extensions:
+                    file_paths.append(file if rel_root == "." else os.path.join(rel_root, file))
+                    if max_files is not None and len(file_paths) >= max_files:
+                        return file_paths
+        return file_paths
+
+    def _verify_chunk(self, file_paths: List[str]) -> List[FileConnectionResult]:
+        return [self.verify_file(file_path) for file_path in file_paths]
+
+    def iter_verify_project(
+        self,
+        file_paths: Optional[List[str]] = None,
+        extensions: Optional[Set[str]] = None,
+        executor: Union[ExecutorMode, str, None] = None,
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[VerifyProgress], None]] = None,
+    ) -> Iterator[FileConnectionResult]:
+        """
+        Verify files and yield each FileConnectionResult as it completes.
+
+        Serial runs yield in input order; pooled runs yield whole worker
+        chunks in completion order. Thread workers share this verifier's
+        resolution caches; process workers each build their own verifier.
+
+        Args:
+            file_paths: Specific files to check (if None, scans project)
+            extensions: File extensions to include when scanning
+            executor: serial/thread/process/auto (see IP/executor_pool.py)
+            max_workers: Pool size (default: usable CPU count)
+            progress: Called with a VerifyProgress after each file (serial)
+                or chunk (pooled)
+        """
+        if file_paths is None:
+            file_paths = self.project_files(extensions)
+        total = len(file_paths)
+        started = time.perf_counter()
+        completed = 0
+
+        def report(count: int) -> None:
+            if progress is not None:
+                progress(VerifyProgress(count, total, time.perf_counter() - started))
+
+        mode = resolve_executor_mode(total, executor)
+        with self.resolution_run():
+            if mode == ExecutorMode.SERIAL:
+                for file_path in file_paths:
+                    result = self.verify_file(file_path)
+                    completed += 1
+                    report(completed)
+                    yield result
+                return
+
+            if mode == ExecutorMode.PROCESS:
+                chunk_func = functools.partial(
+                    _verify_files_in_worker,
+                    str(self.project_root),
+                    str(self.node_modules),
+                )
+            else:
+                chunk_func = self._verify_chunk
+
+            chunks = iter_parallel_map(
+                chunk_func,
+                file_paths,
+                mode=mode,
+                chunk_size=_verify_chunk_size(total, max_workers),
+                max_workers=max_workers,
+            )
+            for _, results in chunks:
+                completed += len(results)
+                report(completed)
+                yield from results
+
     def verify_project(
         self, 
         file_paths: Optional[List[str]] = None,
-        extensions: Optional[Set[str]] = None
+        extensions: Optional[Set[str]] = None,
+        executor: Union[ExecutorMode, str, None] = None,
+        progress: Optional[Callable[[VerifyProgress], None]] = None,
     ) -> Dict[str, FileConnectionResult]:
         """
         Verify imports across the entire project or specific files.
@@ -538,68 +855,22 @@ class ConnectionVerifier:
         Args:
             file_paths: Specific files to check (if None, scans project)
             extensions: File extensions to include (default: .py, .ts, .tsx, .js, .jsx)
+            executor: serial/thread/process/auto (see iter_verify_project)
+            progress: Optional VerifyProgress callback
             
         Returns:
-            Dict mapping file path to FileConnectionResult
+            Dict mapping file path to FileConnectionResult, in scan order
         """
-        if extensions is None:
-            extensions = {'.py', '.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs'}
-        
         if file_paths is None:
-            file_paths = []
-            default_exclusions = {
-                "node_modules",
-                ".git",
-                "__pycache__",
-                ".venv",
-                "venv",
-                ".env",
-                "dist",
-                "build",
-                # Large/non-runtime trees that can stall Code City startup.
-                "marimo",
-                "vscode-marimo",
-                ".taskmaster",
-                ".planning",
-                "one integration at a time",
-                "GSD + Custom Agents",
-                "SOT",
-                "Barradeau",
-                "effects",
-            }
-            extra_exclusions = {
-                item.strip()
-                for item in os.getenv("ORCHESTR8_CONN_EXCLUDE_DIRS", "").split(",")
-                if item.strip()
-            }
-            exclusions = default_exclusions | extra_exclusions
-
-            max_files_raw = os.getenv("ORCHESTR8_CONN_MAX_FILES", "2500").strip()
-            try:
-                max_files = max(100, int(max_files_raw))
-            except ValueError:
-                max_files = 2500
+            file_paths = self.project_files(extensions)
 
-            stop_scan = False
-            for root, dirs, files in os.walk(self.project_root):
-                dirs[:] = [d for d in dirs if d not in exclusions]
-                
-                for file in files:
-                    if Path(file).suffix.lower() in extensions:
-                        full_path = Path(root) / file
-                        rel_path = full_path.relative_to(self.project_root)
-                        file_paths.append(str(rel_path))
-                        if len(file_paths) >= max_files:
-                            stop_scan = True
-                            break
-                if stop_scan:
-                    break
-        
-        results = {}
-        for file_path in file_paths:
-            results[file_path] = self.verify_file(file_path)
-        
-        return results
+        by_path = {
+            result.file_path: result
+            for result in self.iter_verify_project(
+                file_paths, executor=executor, progress=progress
+            )
+        }
+        return {file_path: by_path[file_path] for file_path in file_paths}
     
     def get_broken_imports_summary(
         self, 
@@ -608,32 +879,71 @@ class ConnectionVerifier:
         """
         Get a summary of all broken imports for display/reporting.
         
-        Returns list of dicts with: file, import, line, suggestion
+        Returns list of dicts with: file, import, line, suggestion, candidates
         """
         broken = []
-        for file_path, result in results.items():
-            for imp in result.broken_imports:
-                broken.append({
-                    "file": file_path,
-                    "import": imp.import_statement,
-                    "line": imp.line_number,
-                    "suggestion": self._suggest_fix(imp)
-                })
+        with self.resolution_run():
+            for file_path, result in results.items():
+                for imp in result.broken_imports:
+                    candidates = self.suggest_modules(imp)
+                    broken.append({
+                        "file": file_path,
+                        "import": imp.import_statement,
+                        "line": imp.line_number,
+                        "suggestion": self._format_suggestion(candidates),
+                        "candidates": [
+                            {"path": c.path, "module": c.module, "score": c.score}
+                            for c in candidates
+                        ],
+                    })
         return broken
-    
+
+    def module_index(self) -> ModuleNameIndex:
+        """
+        Name index of the project's source files.
+
+        Built once per resolution run (one walk for every suggestion);
+        outside a run it is rebuilt per call, like the other caches.
+        """
+        if self._name_index is None or not self._run_depth:
+            self._name_index = ModuleNameIndex.scan(
+                str(self.project_root), exclude_dirs=DEFAULT_EXCLUDED_DIRS
+            )
+        return self._name_index
+
+    def suggest_modules(self, imp: ImportResult, limit: int = 5) -> List[ModuleSuggestion]:
+        """Ranked ModuleSuggestions for a broken import, same language first."""
+        if self._detect_file_type(imp.source_file) == ImportType.PYTHON:
+            extensions = PYTHON_EXTENSIONS
+        else:
+            extensions = JS_EXTENSIONS
+        return self.module_index().suggest(imp.target_module, extensions, limit)
+
+    @staticmethod
+    def _format_suggestion(candidates: List[ModuleSuggestion]) -> str:
+        if candidates:
+            return f"Did you mean: {candidates[0].path}?"
+        return "Module not found in project"
+
     def _suggest_fix(self, imp: ImportResult) -> str:
         """Suggest a fix for a broken import."""
-        target = imp.target_module
-        
-        # Look for similarly named files
-        for root, _, files in os.walk(self.project_root):
-            for f in files:
-                name = Path(f).stem
-                if name.lower() == target.split('.')[-1].lower():
-                    rel = Path(root).relative_to(self.project_root) / f
-                    return f"Did you mean: {rel}?"
-        
-        return "Module not found in project"
+        return self._format_suggestion(self.suggest_modules(imp, limit=1))
+
+
+def _verify_chunk_size(total: int, max_workers: Optional[int]) -> int:
+    """Files per pooled chunk: executor_pool's default, capped at VERIFY_CHUNK_MAX."""
+    workers = max_workers or default_worker_count()
+    per_chunk = -(-total // (workers * CHUNKS_PER_WORKER))
+    return max(1, min(VERIFY_CHUNK_MAX, per_chunk))
+
+
+def _verify_files_in_worker(
+    project_root: str, node_modules_path: str, file_paths: List[str]
+) -> List[FileConnectionResult]:
+    """Process-pool entry point: verify one chunk with a fresh verifier."""
+    verifier = ConnectionVerifier(project_root, node_modules_path)
+    with verifier.resolution_run():
+        return verifier._verify_chunk(file_paths)
 
 
 # Convenience function for orchestr8.py integration
@@ -680,11 +990,14 @@ if __name__ == "__main__":
     root = sys.argv[1] if len(sys.argv) > 1 else "."
     
     verifier = ConnectionVerifier(root)
-    results = verifier.verify_project()
+    last: List[VerifyProgress] = []
+    results = verifier.verify_project(progress=last.append)
     
     print(f"\n=== Connection Verification Report ===")
     print(f"Project: {root}")
     print(f"Files checked: {len(results)}")
+    if last:
+        print(f"Throughput: {last[-1].files_per_second:.0f} files/s")
     
     broken_count = sum(1 for r in results.values() if r.status == "broken")
     print(f"Files with broken imports: {broken_count}")
@@ -759,68 +1072,86 @@ class ConnectionGraph:
     Builds and analyzes a connection graph from verification results.
     Provides data for Woven Maps Code City visualization.
     """
-    
+
+    PAGERANK_ALPHA = 0.85
+
     def __init__(self, verifier: ConnectionVerifier):
         self.verifier = verifier
         self.nodes: Dict[str, GraphNode] = {}
         self.edges: List[GraphEdge] = []
-        self._nx_graph = None  # NetworkX graph for algorithms
-    
+        self.results: Dict[str, FileConnectionResult] = {}
+        self._graph: Optional[CSRGraph] = None  # CSR view for graph algorithms
+        self._reachability: Optional[ReachabilityIndex] = None  # See reachability()
+        # PageRank normalization constant k (score = k * unnormalized rank);
+        # lets apply_changes() rescale untouched components exactly.
+        self._rank_scale: Optional[float] = None
+
+    def _make_node(self, file_path: str, result: FileConnectionResult) -> GraphNode:
+        """Create a graph node (without incoming counts) from a verification result."""
+        metrics = ConnectionMetrics(
+            outgoing_count=result.total_imports,
+            issue_count=len(result.broken_imports),
+            max_severity=IssueSeverity.ERROR if result.broken_imports else None
+        )
+
+        status = "error" if result.broken_imports else "normal"
+
+        return GraphNode(
+            id=file_path,
+            label=Path(file_path).name,
+            file_path=file_path,
+            node_type=detect_node_type(file_path),
+            status=status,
+            metrics=metrics
+        )
+
+    def _make_edges(self, file_path: str, result: FileConnectionResult) -> List[GraphEdge]:
+        """Create import edges (resolved local + broken) for one file."""
+        edges = []
+        # Process resolved local imports
+        for imp in result.local_imports:
+            edges.append(GraphEdge(
+                source=file_path,
+                target=imp.resolved_path,
+                edge_type="import",
+                resolved=True,
+                line_number=imp.line_number
+            ))
+
+        # Process broken imports
+        for imp in result.broken_imports:
+            edges.append(GraphEdge(
+                source=file_path,
+                target=imp.target_module,
+                edge_type="import",
+                resolved=False,
+                line_number=imp.line_number
+            ))
+        return edges
+
     def build_from_results(
         self, 
         results: Dict[str, FileConnectionResult]
     ) -> None:
         """Build the graph from connection verification results."""
+        self.results.update(results)
+        self._reachability = None
+
         # Create nodes for all verified files
         for file_path, result in results.items():
-            node_type = detect_node_type(file_path)
-            
-            metrics = ConnectionMetrics(
-                outgoing_count=result.total_imports,
-                issue_count=len(result.broken_imports),
-                max_severity=IssueSeverity.ERROR if result.broken_imports else None
-            )
-            
-            status = "error" if result.broken_imports else "normal"
-            
-            self.nodes[file_path] = GraphNode(
-                id=file_path,
-                label=Path(file_path).name,
-                file_path=file_path,
-                node_type=node_type,
-                status=status,
-                metrics=metrics
-            )
+            self.nodes[file_path] = self._make_node(file_path, result)
         
         # Create edges from imports
         edge_set = set()  # Track (source, target) for bidirectional detection
         
         for file_path, result in results.items():
-            # Process resolved local imports
-            for imp in result.local_imports:
-                target = imp.resolved_path
-                self.edges.append(GraphEdge(
-                    source=file_path,
-                    target=target,
-                    edge_type="import",
-                    resolved=True,
-                    line_number=imp.line_number
-                ))
-                edge_set.add((file_path, target))
-                
-                # Update incoming count on target
-                if target in self.nodes:
-                    self.nodes[target].metrics.incoming_count += 1
-            
-            # Process broken imports
-            for imp in result.broken_imports:
-                self.edges.append(GraphEdge(
-                    source=file_path,
-                    target=imp.target_module,
-                    edge_type="import",
-                    resolved=False,
-                    line_number=imp.line_number
-                ))
+            for edge in self._make_edges(file_path, result):
+                self.edges.append(edge)
+                if edge.resolved:
+                    edge_set.add((edge.source, edge.target))
+                    # Update incoming count on target
+                    if edge.target in self.nodes:
+                        self.nodes[edge.target].metrics.incoming_count += 1
         
         # Detect bidirectional edges
         for edge in self.edges:
@@ -833,100 +1164,342 @@ class ConnectionGraph:
                 node.metrics.incoming_count + node.metrics.outgoing_count
             )
     
+    def _build_graph(self) -> CSRGraph:
+        """CSR view of resolved edges between known nodes."""
+        return CSRGraph.from_edges(
+            self.nodes,
+            (
+                (edge.source, edge.target)
+                for edge in self.edges
+                if edge.resolved
+            ),
+        )
+
+    def reachability(self) -> ReachabilityIndex:
+        """
+        Transitive reachability over resolved imports (signal paths, impact).
+
+        Built on first use and kept until the graph changes.
+        """
+        if self._reachability is None:
+            graph = self._graph if self._graph is not None else self._build_graph()
+            self._reachability = ReachabilityIndex(graph)
+        return self._reachability
+
     def detect_cycles(self) -> List[List[str]]:
         """
-        Detect circular dependencies using NetworkX.
+        Detect circular dependencies (strongly connected components).
         Returns list of cycles (each cycle is a list of file paths).
         """
-        try:
-            import networkx as nx
-        except ImportError:
-            # Fallback if NetworkX not installed
-            return []
-        
-        # Build NetworkX graph
-        G = nx.DiGraph()
-        
-        for node_id in self.nodes:
-            G.add_node(node_id)
-        
-        for edge in self.edges:
-            if edge.resolved and edge.source in self.nodes and edge.target in self.nodes:
-                G.add_edge(edge.source, edge.target)
-        
-        self._nx_graph = G
-        
-        # Find strongly connected components (cycles)
+        G = self._build_graph()
+        self._graph = G
+
         cycles = []
-        try:
-            sccs = list(nx.strongly_connected_components(G))
-            for scc in sccs:
-                if len(scc) > 1:
-                    cycles.append(list(scc))
-                    # Mark nodes as in cycle
-                    for node_id in scc:
-                        if node_id in self.nodes:
-                            self.nodes[node_id].metrics.in_cycle = True
-                            if not self.nodes[node_id].metrics.max_severity:
-                                self.nodes[node_id].metrics.max_severity = IssueSeverity.INFO
-        except Exception:
-            pass
-        
+        for component in strongly_connected_components(G):
+            if len(component) > 1:
+                cycle = [G.ids[i] for i in component]
+                cycles.append(cycle)
+                # Mark nodes as in cycle
+                for node_id in cycle:
+                    metrics = self.nodes[node_id].metrics
+                    metrics.in_cycle = True
+                    if not metrics.max_severity:
+                        metrics.max_severity = IssueSeverity.INFO
+
         return cycles
     
     def calculate_centrality(self) -> None:
-        """Calculate centrality metrics for all nodes."""
-        try:
-            import networkx as nx
-        except ImportError:
-            return
-        
-        if self._nx_graph is None:
-            self.detect_cycles()  # This builds the NetworkX graph
+        """Calculate PageRank centrality for all nodes."""
+        if self._graph is None:
+            self.detect_cycles()  # This builds the CSR graph
         
-        if self._nx_graph is None or len(self._nx_graph.nodes) == 0:
+        G = self._graph
+        if len(G) == 0:
             return
         
-        try:
-            # PageRank-style centrality
-            centrality = nx.pagerank(self._nx_graph, alpha=0.85)
-            
-            for node_id, score in centrality.items():
-                if node_id in self.nodes:
-                    self.nodes[node_id].metrics.centrality = score
-        except Exception:
-            pass
+        scores = pagerank(G, alpha=self.PAGERANK_ALPHA)
+        if scores is None:
+            return  # Did not converge - leave centrality untouched
+        
+        for node_id, score in zip(G.ids, scores):
+            self.nodes[node_id].metrics.centrality = score
+
+        # score = k * y with y = 1 + alpha * P^T y; keep k for apply_changes()
+        out_degrees = G.out_degrees()
+        dangling = sum(score for score, degree in zip(scores, out_degrees) if not degree)
+        self._rank_scale = (
+            self.PAGERANK_ALPHA * dangling + 1 - self.PAGERANK_ALPHA
+        ) / len(G)
     
     def calculate_depth(self) -> None:
-        """Calculate depth from entry points."""
-        try:
-            import networkx as nx
-        except ImportError:
-            return
-        
-        if self._nx_graph is None:
+        """Calculate depth (hops from the nearest entry point)."""
+        if self._graph is None:
             return
         
-        # Find entry points (nodes with no incoming edges)
+        G = self._graph
+        # Entry points: nothing imports them, or they are entry files
+        in_degrees = G.in_degrees()
         entry_points = [
-            n for n in self._nx_graph.nodes 
-            if self._nx_graph.in_degree(n) == 0 or 
-               (n in self.nodes and self.nodes[n].node_type == NodeType.ENTRY)
+            i for i, node_id in enumerate(G.ids)
+            if in_degrees[i] == 0 or self.nodes[node_id].node_type == NodeType.ENTRY
         ]
         
-        # BFS from entry points
-        for entry in entry_points:
-            try:
-                lengths = nx.single_source_shortest_path_length(self._nx_graph, entry)
-                for node_id, depth in lengths.items():
-                    if node_id in self.nodes:
-                        # Take minimum depth if already set
-                        current = self.nodes[node_id].metrics.depth
-                        if current == 0 or depth < current:
-                            self.nodes[node_id].metrics.depth = depth
-            except Exception:
-                pass
+        # One BFS from all entry points at once
+        for node_id, depth in zip(G.ids, bfs_depths(G, entry_points)):
+            if depth >= 0:
+                self.nodes[node_id].metrics.depth = depth
     
+    def apply_changes(
+        self,
+        changed: Iterable[str] = (),
+        deleted: Iterable[str] = (),
+        added: Iterable[str] = (),
+    ) -> Set[str]:
+        """
+        Incrementally update the graph from file-change events.
+
+        Only touched files are re-verified, plus importers of deleted files
+        and files whose unresolved/external imports an added file may now
+        satisfy. Edges and incoming counts are patched in place; cycles,
+        depth and centrality are recomputed only for the weakly connected
+        component(s) around the touched files. PageRank scores elsewhere are
+        rescaled rather than recomputed (a component's ranks only change by a
+        global normalization factor when another component changes).
+
+        Args:
+            changed: Project-relative paths whose content changed
+            deleted: Project-relative paths that were removed
+            added: Project-relative paths that were created
+
+        Returns:
+            Set of node IDs whose cycle/depth/centrality were recomputed
+        """
+        root = self.verifier.project_root
+        touched = {_normalize_rel_path(p) for p in (*changed, *deleted, *added)}
+
+        # Events can race the filesystem (and an atomic save reports a
+        # delete plus an add), so the disk decides: a missing file is a
+        # delete, an existing one is a change if the graph has it, else an add.
+        changed_set: Set[str] = set()
+        added_set: Set[str] = set()
+        deleted_set: Set[str] = set()
+        for path in touched:
+            if not (root / path).is_file():
+                if path in self.nodes:
+                    deleted_set.add(path)
+            elif path in self.nodes:
+                changed_set.add(path)
+            else:
+                added_set.add(path)
+        added_set = {
+            p for p in added_set
+            if self.verifier._detect_file_type(p) != ImportType.UNKNOWN
+        }
+
+        reverify = changed_set | added_set
+        for edge in self.edges:
+            if edge.resolved and edge.target in deleted_set:
+                reverify.add(edge.source)
+        if added_set:
+            reverify |= self._sources_resolvable_by(added_set)
+        reverify -= deleted_set
+        if not reverify and not deleted_set:
+            return set()
+
+        seeds = reverify | deleted_set
+        before = self._weak_component(seeds, self._successors())
+
+        with self.verifier.resolution_run():
+            fresh = {path: self.verifier.verify_file(path) for path in sorted(reverify)}
+
+        # Drop outgoing edges of re-verified/deleted files
+        kept = []
+        for edge in self.edges:
+            if edge.source in seeds:
+                if edge.resolved and edge.target in self.nodes:
+                    self.nodes[edge.target].metrics.incoming_count -= 1
+            else:
+                kept.append(edge)
+        self.edges = kept
+
+        for path in deleted_set:
+            del self.nodes[path]
+            self.results.pop(path, None)
+
+        for path, result in fresh.items():
+            node = self._make_node(path, result)
+            previous = self.nodes.get(path)
+            if previous is not None:
+                node.metrics.incoming_count = previous.metrics.incoming_count
+                node.metrics.centrality = previous.metrics.centrality
+            self.nodes[path] = node
+            self.results[path] = result
+
+        for path, result in fresh.items():
+            for edge in self._make_edges(path, result):
+                self.edges.append(edge)
+                if edge.resolved and edge.target in self.nodes:
+                    self.nodes[edge.target].metrics.incoming_count += 1
+
+        # Bidirectional flags can only change on edges touching a seed
+        pairs = {(e.source, e.target) for e in self.edges if e.resolved}
+        for edge in self.edges:
+            if edge.source in seeds or edge.target in seeds:
+                edge.bidirectional = (edge.target, edge.source) in pairs
+
+        for node in self.nodes.values():
+            node.metrics.connection_count = (
+                node.metrics.incoming_count + node.metrics.outgoing_count
+            )
+
+        successors = self._successors()
+        after = self._weak_component(reverify, successors)
+        affected = (before | after) & set(self.nodes)
+
+        self._reachability = None
+        if self._graph is not None:
+            self._graph = self._build_graph()
+            self._recompute_component(affected, successors)
+        return affected
+
+    def _successors(self) -> Dict[str, Set[str]]:
+        """Adjacency of resolved edges between known nodes (graph algorithm view)."""
+        successors: Dict[str, Set[str]] = {}
+        for edge in self.edges:
+            if edge.resolved and edge.source in self.nodes and edge.target in self.nodes:
+                successors.setdefault(edge.source, set()).add(edge.target)
+        return successors
+
+    def _weak_component(
+        self, seeds: Iterable[str], successors: Dict[str, Set[str]]
+    ) -> Set[str]:
+        """All nodes weakly connected to any seed."""
+        neighbors: Dict[str, Set[str]] = {}
+        for source, targets in successors.items():
+            neighbors.setdefault(source, set()).update(targets)
+            for target in targets:
+                neighbors.setdefault(target, set()).add(source)
+
+        component = {s for s in seeds if s in self.nodes}
+        stack = list(component)
+        while stack:
+            for other in neighbors.get(stack.pop(), ()):
+                if other not in component:
+                    component.add(other)
+                    stack.append(other)
+        return component
+
+    def _sources_resolvable_by(self, added: Set[str]) -> Set[str]:
+        """Files with broken/external imports that may resolve to an added file."""
+        names = set()
+        for path in added:
+            stem = Path(path).stem
+            if stem in ("__init__", "index"):
+                stem = Path(path).parent.name
+            if stem:
+                names.add(stem)
+
+        sources = set()
+        for source, result in self.results.items():
+            for imp in result.broken_imports + result.external_imports:
+                if any(name in imp.target_module for name in names):
+                    sources.add(source)
+                    break
+        return sources
+
+    def _recompute_component(
+        self, component: Set[str], successors: Dict[str, Set[str]]
+    ) -> None:
+        """Recompute cycles, depth and centrality for one closed component."""
+        has_predecessor = set()
+        for source in component:
+            has_predecessor.update(successors.get(source, ()))
+
+        for node_id in component:
+            metrics = self.nodes[node_id].metrics
+            if metrics.in_cycle and metrics.max_severity == IssueSeverity.INFO:
+                metrics.max_severity = None
+            metrics.in_cycle = False
+            metrics.depth = 0
+
+        ordered = [n for n in self.nodes if n in component]
+        sub = CSRGraph.from_edges(
+            ordered,
+            ((source, target) for source in ordered for target in successors.get(source, ())),
+        )
+
+        for scc in strongly_connected_components(sub):
+            if len(scc) > 1:
+                for i in scc:
+                    metrics = self.nodes[sub.ids[i]].metrics
+                    metrics.in_cycle = True
+                    if not metrics.max_severity:
+                        metrics.max_severity = IssueSeverity.INFO
+
+        # Same entry rules as calculate_depth(), restricted to the component
+        # (nothing outside it can reach in).
+        entry_points = [
+            i for i, node_id in enumerate(ordered)
+            if node_id not in has_predecessor
+            or self.nodes[node_id].node_type == NodeType.ENTRY
+        ]
+        for node_id, depth in zip(ordered, bfs_depths(sub, entry_points)):
+            if depth >= 0:
+                self.nodes[node_id].metrics.depth = depth
+
+        if self._rank_scale is not None:
+            self._rerank_component(component, successors)
+
+    def _rerank_component(
+        self, component: Set[str], successors: Dict[str, Set[str]]
+    ) -> None:
+        """
+        Update PageRank for one component and rescale everything else.
+
+        With uniform teleport and dangling redistribution, every component's
+        scores are k * y where y solves y = 1 + alpha * P^T y on that component
+        alone and k is a single global constant (1 / sum of all y). So the
+        changed component is solved locally (warm-started from its previous
+        scores) and the rest of the graph only needs the new k.
+        """
+        alpha = self.PAGERANK_ALPHA
+        old_scale = self._rank_scale
+        outside_mass = sum(
+            node.metrics.centrality
+            for node_id, node in self.nodes.items()
+            if node_id not in component
+        ) / old_scale
+
+        rank = {
+            n: (self.nodes[n].metrics.centrality / old_scale) or 1.0
+            for n in component
+        }
+        tolerance = 1e-9 * max(1, len(self.nodes))
+        for _ in range(1000):
+            next_rank = dict.fromkeys(rank, 1.0)
+            for node_id, score in rank.items():
+                targets = successors.get(node_id)
+                if targets:
+                    share = alpha * score / len(targets)
+                    for target in targets:
+                        next_rank[target] += share
+            delta = sum(abs(next_rank[n] - rank[n]) for n in rank)
+            rank = next_rank
+            if delta * old_scale < tolerance:
+                break
+
+        total = outside_mass + sum(rank.values())
+        if total <= 0:
+            return
+        new_scale = 1.0 / total
+        factor = new_scale / old_scale
+        for node_id, node in self.nodes.items():
+            if node_id in component:
+                node.metrics.centrality = rank[node_id] * new_scale
+            else:
+                node.metrics.centrality *= factor
+        self._rank_scale = new_scale
+
     def to_dict(self) -> Dict:
         """
         Export graph as dictionary for JSON serialization.
@@ -953,7 +1526,11 @@ class ConnectionGraph:
         return json.dumps(self.to_dict(), indent=2)
 
 
-def build_connection_graph(project_root: str) -> ConnectionGraph:
+def build_connection_graph(
+    project_root: str,
+    executor: Union[ExecutorMode, str, None] = None,
+    progress: Optional[Callable[[VerifyProgress], None]] = None,
+) -> ConnectionGraph:
     """
     Convenience function to build a complete connection graph.
     
@@ -962,7 +1539,7 @@ def build_connection_graph(project_root: str) -> ConnectionGraph:
         print(graph.to_json())
     """
     verifier = ConnectionVerifier(project_root)
-    results = verifier.verify_project()
+    results = verifier.verify_project(executor=executor, progress=progress)
     
     graph = ConnectionGraph(verifier)
     graph.build_from_results(results)
@@ -1060,6 +1637,7 @@ def dry_run_patchbay_rewire(
     source_file: str,
     current_target: str,
     proposed_target: str,
+    graph: Optional["ConnectionGraph"] = None,
 ) -> Dict[str, Any]:
     """
     Validate a patchbay rewire request without writing files.
@@ -1067,6 +1645,9 @@ def dry_run_patchbay_rewire(
     This is the first safe step toward drag-to-rewire behavior:
     it verifies the requested source/target relationship, checks compatibility,
     and returns a deterministic preview payload for UI/logging.
+
+    With a ConnectionGraph for the project, the preview also carries an
+    impact summary from its reachability index (see _rewire_impact).
     """
     verifier = ConnectionVerifier(project_root)
     source_norm = _normalize_rel_path(source_file)
@@ -1181,10 +1762,32 @@ def dry_run_patchbay_rewire(
             "Current target path does not exist on disk; edge may come from unresolved import."
         )
 
+    if graph is not None and source_norm in graph.nodes and proposed_norm in graph.nodes:
+        result.impact = _rewire_impact(graph, source_norm, current_norm, proposed_norm)
+        if result.impact["createsCycle"]:
+            result.warnings.append(
+                f"Rewire creates an import cycle: {proposed_norm} already reaches {source_norm}."
+            )
+
     result.can_apply = True
     return result.to_dict()
 
 
+def _rewire_impact(
+    graph: "ConnectionGraph", source: str, current: str, proposed: str
+) -> Dict[str, Any]:
+    """Transitive effect of pointing source at proposed instead of current."""
+    index = graph.reachability()
+    dependents = index.reached_by(source)
+    newly_reachable = index.reaches(proposed) - index.reaches(source)
+    return {
+        "dependentCount": len(dependents) - 1,
+        "createsCycle": index.can_reach(proposed, source),
+        "newlyReachableCount": len(newly_reachable),
+        "currentTargetInGraph": current in graph.nodes,
+    }
+
+
 def apply_patchbay_rewire(
     project_root: str,
     source_file: str,
@@ -0,0 +1,71 @@
+"""Tests for the NumPy building particle generator."""
+
+import base64
+
+import pytest
+
+import IP.barradeau_builder as barradeau
+from IP.barradeau_builder import BarradeauBuilding
+
+np = pytest.importorskip("numpy")
+
+
+def build(vectorized, seed=11, line_count=900):
+    return BarradeauBuilding(
+        path="IP/woven_maps.py",
+        line_count=line_count,
+        export_count=12,
+        position={"x": 40.0, "z": -25.0},
+        seed=seed,
+        vectorized=vectorized,
+    )
+
+
+def test_vectorized_matches_loop_layout():
+    loop = build(vectorized=False)
+    vectorized = build(vectorized=True)
+
+    expected = np.array([(p.x, p.y, p.z, p.opacity, p.size) for p in loop.particles])
+    particles = vectorized.particle_array
+
+    assert particles.shape == expected.shape
+    assert particles.dtype == np.float32
+    # Same segments and steps; only the +-0.04 jitter draws differ
+    assert np.abs(particles[:, :3] - expected[:, :3]).max() <= 0.08 + 1e-4
+    assert np.allclose(particles[:, 3:], expected[:, 3:], atol=1e-6)
+
+    expected_edges = np.array(
+        [(e.a["x"], e.a["y"], e.a["z"], e.b["x"], e.b["y"], e.b["z"]) for e in loop.edges]
+    )
+    assert np.allclose(vectorized.edge_array, expected_edges, atol=1e-4)
+
+
+def test_seed_makes_buildings_reproducible():
+    first, second = build(vectorized=True), build(vectorized=True)
+
+    assert np.array_equal(first.particle_array, second.particle_array)
+    assert not np.array_equal(first.particle_array, build(vectorized=True, seed=12).particle_array)
+    assert [p.x for p in build(False).particles] == [p.x for p in build(False).particles]
+
+
+def test_packed_building_json():
+    building = build(vectorized=True, line_count=120)
+
+    data = building.get_building_data().to_json()
+
+    assert data["particles"] == [] and data["edges"] == []
+    assert data["particleCount"] == len(building.particle_array)
+    assert data["edgeCount"] == len(building.edge_array)
+    assert data["particleData"]["stride"] == 5
+    decoded = np.frombuffer(base64.b64decode(data["particleData"]["data"]), dtype="<f4")
+    assert np.array_equal(decoded.reshape(-1, 5), building.particle_array)
+
+
+def test_vectorized_falls_back_without_numpy(monkeypatch):
+    monkeypatch.setattr(barradeau, "NUMPY_AVAILABLE", False)
+
+    building = build(vectorized=True)
+
+    assert building.particle_array is None
+    assert building.particles
+    assert "particleData" not in building.get_building_data().to_json()
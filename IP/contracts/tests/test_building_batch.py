@@ -0,0 +1,51 @@
+"""Tests for batch building generation with path-derived seeds."""
+
+import pytest
+
+from IP.barradeau_builder import BarradeauBuilding, generate_building_batch, path_seed
+from IP.woven_maps import CodeNode, GraphData, generate_barradeau_buildings
+
+np = pytest.importorskip("numpy")
+
+SPECS = [
+    ("IP/woven_maps.py", 4500, 30, "working", 10.0, 20.0),
+    ("IP/barradeau_builder.py", 600, 8, "broken", -5.0, 3.5),
+    ("orchestr8.py", 40, 1, "combat", 0.0, 0.0),
+]
+
+
+def test_batch_slices_match_single_buildings():
+    batch = generate_building_batch(SPECS, executor="serial")
+
+    assert len(batch) == 3
+    assert batch.particle_offsets[-1] == len(batch.particles)
+    for i, (path, lines, exports, status, x, z) in enumerate(SPECS):
+        single = BarradeauBuilding(
+            path, lines, exports, status, {"x": x, "z": z},
+            seed=path_seed(path), vectorized=True,
+        )
+        data = batch.building_data(i)
+        assert np.array_equal(data.particle_array, single.particle_array)
+        assert np.array_equal(data.edge_array, single.edge_array)
+        assert (data.path, data.status, data.height) == (path, status, single.height)
+
+
+def test_process_pool_output_is_identical_to_serial():
+    serial = generate_building_batch(SPECS, executor="serial")
+    pooled = generate_building_batch(SPECS, executor="process", max_workers=2)
+
+    assert np.array_equal(serial.particles, pooled.particles)
+    assert np.array_equal(serial.edges, pooled.edges)
+    assert np.array_equal(serial.particle_offsets, pooled.particle_offsets)
+
+
+def test_generated_buildings_are_stable_across_calls():
+    graph = GraphData(nodes=[CodeNode(path=spec[0], loc=spec[1], x=1.0, y=2.0) for spec in SPECS])
+
+    first = generate_barradeau_buildings(graph)
+    second = generate_barradeau_buildings(graph)
+
+    assert first == second
+    assert [b["path"] for b in first] == [spec[0] for spec in SPECS]
+    assert first[0]["position"] == {"x": 10.0, "z": 20.0}
+    assert all("particleData" in b for b in first)
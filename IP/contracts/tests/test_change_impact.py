@@ -0,0 +1,107 @@
+"""Tests for import-graph test impact selection."""
+
+import json
+import subprocess
+
+from IP.change_impact import main, run_impacted_tests, select_impacted_tests
+from IP.connection_verifier import build_connection_graph
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def make_project(root):
+    write_file(root / "pkg" / "__init__.py", "")
+    write_file(root / "pkg" / "models.py", "VALUE = 1\n")
+    write_file(root / "pkg" / "service.py", "import pkg.models\n")
+    write_file(root / "pkg" / "views.py", "VALUE = 3\n")
+    write_file(root / "tests" / "test_service.py", "from pkg.service import pkg\n\ndef test_ok():\n    assert pkg\n")
+    write_file(root / "tests" / "test_models.py", "from pkg.models import VALUE\n\ndef test_ok():\n    assert VALUE\n")
+    write_file(root / "tests" / "test_views.py", "from pkg.views import VALUE\n\ndef test_ok():\n    assert VALUE\n")
+    write_file(root / "tests" / "unit" / "conftest.py", "")
+    write_file(root / "app" / "__init__.py", "")
+    write_file(root / "app" / "routes.py", "VALUE = 4\n")
+    write_file(root / "tests" / "test_routes.py", "from app import routes\n")
+    write_file(root / "tests" / "unit" / "test_unit.py", "def test_ok():\n    pass\n")
+
+
+def test_selects_transitive_importers_only(tmp_path):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+
+    assert select_impacted_tests(graph, ["pkg/models.py"]).tests == [
+        "tests/test_models.py",
+        "tests/test_service.py",
+    ]
+    assert select_impacted_tests(graph, ["pkg/views.py"]).tests == ["tests/test_views.py"]
+    assert select_impacted_tests(graph, ["tests/test_views.py"]).tests == ["tests/test_views.py"]
+    # `from app import routes` is an edge to app/__init__.py
+    assert select_impacted_tests(graph, ["app/routes.py"]).tests == ["tests/test_routes.py"]
+
+
+def test_conftest_and_non_source_changes(tmp_path):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+
+    assert select_impacted_tests(graph, ["tests/unit/conftest.py"]).tests == ["tests/unit/test_unit.py"]
+
+    selection = select_impacted_tests(graph, ["pkg/views.py", "setup.cfg"])
+    assert selection.run_all
+    assert selection.untracked == ["setup.cfg"]
+    assert selection.pytest_targets() == []
+
+
+def test_deleted_module_selects_former_importers(tmp_path):
+    make_project(tmp_path)
+    (tmp_path / "pkg" / "models.py").unlink()
+    graph = build_connection_graph(str(tmp_path))
+
+    selection = select_impacted_tests(graph, ["pkg/models.py"])
+
+    assert selection.tests == ["tests/test_models.py", "tests/test_service.py"]
+    assert not selection.run_all
+
+
+def test_deleted_test_file_is_reported_untracked(tmp_path):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+
+    selection = select_impacted_tests(graph, ["tests/test_gone.py"])
+
+    assert selection.tests == []
+    assert selection.untracked == ["tests/test_gone.py"]
+    assert not selection.run_all
+
+
+def test_cli_selects_and_runs(tmp_path, capfd, monkeypatch):
+    make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    assert main(["pkg/views.py", "--json"]) == 0
+    payload = json.loads(capfd.readouterr().out)
+    assert payload["tests"] == ["tests/test_views.py"]
+    assert payload["runAll"] is False
+
+    selection = select_impacted_tests(build_connection_graph(str(tmp_path)), ["pkg/views.py"])
+    assert run_impacted_tests(str(tmp_path), selection, ["-q", "-p", "no:cacheprovider"]) == 0
+    assert "1 passed" in capfd.readouterr().out
+
+
+def test_cli_fails_when_git_fails(tmp_path, capfd, monkeypatch):
+    make_project(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+
+    # Not a checkout: nothing must be reported as passing
+    assert main(["--root", str(tmp_path), "--run"]) == 2
+    assert "failed" in capfd.readouterr().err
+
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "--allow-empty", "-m", "init"],
+        cwd=tmp_path,
+        check=True,
+    )
+    assert main(["--root", str(tmp_path), "--base", "no-such-ref", "--run"]) == 2
+    assert "no-such-ref" in capfd.readouterr().err
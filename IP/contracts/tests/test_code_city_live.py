@@ -0,0 +1,150 @@
+"""Tests for live Code City patches over the loopback channel."""
+
+import json
+import threading
+import time
+import urllib.request
+
+import pytest
+
+from IP.code_city_live import LiveCodeCity, live_city_for, register_live_city
+from IP.code_city_stream import CodeCityStreamServer, PatchLog
+from IP.health_checker import HealthCheckResult, ParsedError
+from IP.woven_maps import CodeNode, EdgeData, GraphData, build_graph_data
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def server():
+    try:
+        instance = CodeCityStreamServer()
+    except OSError as exc:
+        pytest.skip(f"loopback server unavailable: {exc}")
+    yield instance
+    instance.shutdown()
+
+
+def poll(city, since):
+    with urllib.request.urlopen(f"{city.patches_url}?since={since}", timeout=30) as response:
+        assert response.headers["Access-Control-Allow-Origin"] == "*"
+        return json.loads(response.read())
+
+
+def live_city(root, server, graph, health=None):
+    city = LiveCodeCity(str(root), graph, health)
+    city.attach(server, server.register(None))
+    return city
+
+
+def broken(file):
+    return HealthCheckResult(status="broken", errors=[ParsedError(file, 2, message="bad")])
+
+
+def test_health_changes_become_status_patches(tmp_path, server):
+    graph = GraphData(
+        nodes=[CodeNode("pkg/a.py"), CodeNode("pkg/b.py"), CodeNode("c.py", status="combat")],
+        edges=[EdgeData("pkg/a.py", "pkg/b.py", line_number=1)],
+    )
+    for path in ("pkg/a.py", "pkg/b.py", "c.py"):
+        write_file(tmp_path / path, "")
+    city = live_city(tmp_path, server, graph, {"pkg": broken("pkg/a.py")})
+    start = city.seq
+
+    pushed = city.update({"pkg": broken("pkg/b.py")}, combat_files=[])
+    reply = poll(city, start)
+
+    assert pushed == 3
+    assert reply["seq"] == start + 1
+    changes = {p["node"]["id"]: p["node"] for p in reply["patches"]}
+    assert changes == {
+        "pkg/a.py": {"id": "pkg/a.py", "status": "working", "healthErrors": []},
+        "pkg/b.py": {
+            "id": "pkg/b.py",
+            "status": "broken",
+            "healthErrors": [{"file": "pkg/b.py", "line": 2, "message": "bad"}],
+        },
+        "c.py": {"id": "c.py", "status": "working"},
+    }
+    # Nothing changed: an empty update pushes nothing
+    assert city.update({"pkg": broken("pkg/b.py")}, combat_files=[]) == 0
+    assert city.seq == start + 1
+
+
+def test_added_and_removed_files_patch_nodes_and_edges(tmp_path, server):
+    write_file(tmp_path / "pkg" / "a.py", "from pkg import b\n")
+    write_file(tmp_path / "pkg" / "b.py", "X = 1\n")
+    write_file(tmp_path / "pkg" / "__init__.py", "")
+    city = live_city(tmp_path, server, build_graph_data(str(tmp_path)))
+    start = city.seq
+
+    write_file(tmp_path / "pkg" / "c.py", "Y = 2\n")
+    (tmp_path / "pkg" / "b.py").unlink()
+    city.update({"pkg": HealthCheckResult(status="working")})
+    ops = [(p["op"], p.get("id") or p.get("node", {}).get("id")) for p in poll(city, start)["patches"]]
+
+    assert ("removeNode", "pkg/b.py") in ops
+    assert ("node", "pkg/c.py") in ops
+    added = next(p["node"] for p in poll(city, start)["patches"] if p.get("node", {}).get("id") == "pkg/c.py")
+    assert {"x", "y", "loc", "status"} <= set(added)
+
+
+def test_long_poll_wakes_on_push(tmp_path, server):
+    write_file(tmp_path / "a.py", "")
+    city = live_city(tmp_path, server, GraphData(nodes=[CodeNode("a.py")]))
+    replies = []
+    poller = threading.Thread(target=lambda: replies.append(poll(city, city.seq)))
+    started = time.monotonic()
+    poller.start()
+    time.sleep(0.2)
+
+    city.update({"a.py": broken("a.py")})
+    poller.join(timeout=10)
+
+    assert time.monotonic() - started < 5
+    assert [p["node"]["status"] for p in replies[0]["patches"]] == ["broken"]
+
+
+def test_evicted_session_reports_none(tmp_path, server):
+    write_file(tmp_path / "a.py", "")
+    city = live_city(tmp_path, server, GraphData(nodes=[CodeNode("a.py")]))
+    register_live_city(city)
+    assert live_city_for(str(tmp_path)) is city
+
+    for _ in range(10):
+        server.register(None)
+
+    assert live_city_for(str(tmp_path)) is None
+    assert city.update({"a.py": broken("a.py")}) is None
+
+
+def test_patch_log_resets_clients_that_fell_behind():
+    log = PatchLog(max_batches=2)
+    for n in range(4):
+        log.append([{"n": n}])
+
+    assert log.read(2) == {"seq": 4, "patches": [{"n": 2}, {"n": 3}]}
+    assert log.read(1) == {"seq": 4, "reset": True}
+    assert log.read(9) == {"seq": 4, "reset": True}
+    assert log.read(4, timeout=0.05) == {"seq": 4, "patches": []}
+
+
+def test_graph_endpoint_resyncs_clients_that_fell_behind(tmp_path, server):
+    for path in ("a.py", "b.py"):
+        write_file(tmp_path / path, "")
+    city = live_city(tmp_path, server, GraphData(nodes=[CodeNode("a.py"), CodeNode("b.py")]))
+    session = server.get_session(city.session_id)
+    for n in range(session.patches._batches.maxlen + 3):
+        city.update({"a.py": broken("a.py") if n % 2 else HealthCheckResult(status="working")})
+
+    assert poll(city, 0)["reset"] is True
+    with urllib.request.urlopen(city.graph_url, timeout=30) as response:
+        assert response.headers["Access-Control-Allow-Origin"] == "*"
+        snapshot = json.loads(response.read())
+
+    assert snapshot["seq"] == city.seq
+    assert {node["id"]: node["status"] for node in snapshot["nodes"]} == {"a.py": "working", "b.py": "working"}
+    assert poll(city, snapshot["seq"] - 1)["patches"]
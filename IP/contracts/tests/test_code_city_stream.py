@@ -0,0 +1,118 @@
+"""Tests for chunked Code City stream delivery."""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from IP.code_city_stream import CodeCityStreamServer, build_chunks, chunk_key
+
+
+def node(path):
+    return {"id": path, "path": path, "x": 0, "y": 0}
+
+
+def edge(source, target):
+    return {"source": source, "target": target}
+
+
+def test_chunk_key_uses_top_level_directory():
+    assert chunk_key("IP/plugins/06_maestro.py") == "IP"
+    assert chunk_key("./scripts/bench.py") == "scripts"
+    assert chunk_key(".github/ci.yml") == ".github"
+    assert chunk_key("orchestr8.py") == "."
+
+
+def test_chunks_group_by_directory_and_page():
+    graph = {
+        "nodes": [node("a/1.py"), node("b/1.py"), node("a/2.py"), node("a/3.py"), node("main.py")],
+        "edges": [],
+    }
+
+    chunks = build_chunks(graph, chunk_nodes=2)
+
+    assert [(c["key"], [n["id"] for n in c["nodes"]]) for c in chunks] == [
+        ("a", ["a/1.py", "a/2.py"]),
+        ("a", ["a/3.py"]),
+        ("b", ["b/1.py"]),
+        (".", ["main.py"]),
+    ]
+
+
+def test_edges_ship_with_the_later_endpoint_chunk():
+    graph = {
+        "nodes": [node("a/1.py"), node("b/1.py")],
+        "edges": [
+            edge("b/1.py", "a/1.py"),
+            edge("a/1.py", "b/1.py"),
+            edge("a/1.py", "missing_module"),
+        ],
+    }
+
+    chunks = build_chunks(graph, chunk_nodes=10)
+
+    assert chunks[0]["edges"] == [edge("a/1.py", "missing_module")]
+    assert chunks[1]["edges"] == [edge("b/1.py", "a/1.py"), edge("a/1.py", "b/1.py")]
+
+
+@pytest.fixture
+def server():
+    try:
+        instance = CodeCityStreamServer()
+    except OSError as exc:
+        pytest.skip(f"loopback server unavailable: {exc}")
+    yield instance
+    instance.shutdown()
+
+
+def fetch(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.read()
+
+
+def test_server_serves_shell_manifest_and_chunks(server):
+    graph = {"nodes": [node("a/1.py"), node("b/1.py")], "edges": [edge("a/1.py", "b/1.py")]}
+    url = server.publish("<html>shell</html>", "console.log(1);", build_chunks(graph))
+
+    assert fetch(url) == b"<html>shell</html>"
+    assert fetch(url + "woven_maps_3d.js") == b"console.log(1);"
+
+    manifest = json.loads(fetch(url + "manifest"))
+    assert (manifest["chunkCount"], manifest["nodeCount"], manifest["edgeCount"]) == (2, 2, 1)
+
+    chunk = json.loads(fetch(url + "chunk/1"))
+    assert chunk["key"] == "b"
+    assert chunk["edges"] == [edge("a/1.py", "b/1.py")]
+
+
+def test_unknown_session_and_chunk_return_404(server):
+    url = server.publish("shell", "", [])
+
+    for bad in (server.base_url + "/city/nope/", url + "chunk/0", url + "other"):
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            fetch(bad)
+        assert excinfo.value.code == 404
+
+
+def test_oversized_inline_city_streams_without_rebuilding(tmp_path, monkeypatch):
+    pytest.importorskip("marimo")
+    import IP.woven_maps as woven_maps
+
+    (tmp_path / "a.py").write_text("import b\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("X = 1\n", encoding="utf-8")
+    builds = []
+    original = woven_maps.build_from_connection_graph
+    monkeypatch.setattr(
+        woven_maps,
+        "build_from_connection_graph",
+        lambda *args, **kwargs: builds.append(1) or original(*args, **kwargs),
+    )
+    monkeypatch.setenv("ORCHESTR8_CODE_CITY_DELIVERY", "inline")
+
+    inline = woven_maps.create_code_city(str(tmp_path), max_inline_bytes=10**9)
+    streamed = woven_maps.create_code_city(str(tmp_path), max_inline_bytes=1000)
+
+    assert "srcdoc=" in inline.text
+    assert "srcdoc=" not in streamed.text and "/city/" in streamed.text
+    assert builds == [1, 1]
@@ -0,0 +1,151 @@
+"""Tests for ConnectionGraph.apply_changes() incremental updates."""
+
+from pathlib import Path
+
+import pytest
+
+from IP.connection_verifier import build_connection_graph
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def snapshot(graph):
+    nodes = {
+        node_id: (
+            node.status,
+            node.metrics.incoming_count,
+            node.metrics.outgoing_count,
+            node.metrics.connection_count,
+            node.metrics.issue_count,
+            node.metrics.in_cycle,
+            node.metrics.depth,
+            node.metrics.max_severity,
+        )
+        for node_id, node in graph.nodes.items()
+    }
+    edges = sorted(
+        (e.source, e.target, e.resolved, e.bidirectional, e.line_number)
+        for e in graph.edges
+    )
+    return nodes, edges
+
+
+def assert_matches_full_rebuild(graph, root):
+    fresh = build_connection_graph(str(root))
+    assert snapshot(graph) == snapshot(fresh)
+    for node_id, node in fresh.nodes.items():
+        assert graph.nodes[node_id].metrics.centrality == pytest.approx(
+            node.metrics.centrality, abs=1e-4
+        )
+
+
+def make_project(root: Path) -> None:
+    write_file(root / "main.py", "import a\nimport b\n")
+    write_file(root / "a.py", "import b\n")
+    write_file(root / "b.py", "VALUE = 1\n")
+    write_file(root / "lonely/x.py", "import lonely.y\n")
+    write_file(root / "lonely/y.py", "Y = 1\n")
+
+
+def test_changed_file_patches_edges_and_cycles(tmp_path):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+
+    write_file(tmp_path / "b.py", "import a\n")
+    affected = graph.apply_changes(changed=["b.py"])
+
+    assert affected == {"main.py", "a.py", "b.py"}
+    assert graph.nodes["a.py"].metrics.in_cycle
+    assert_matches_full_rebuild(graph, tmp_path)
+
+
+def test_deleted_file_breaks_importers(tmp_path):
+    make_project(tmp_path)
+    write_file(tmp_path / "web/app.js", "import { b } from './b';\n")
+    write_file(tmp_path / "web/b.js", "export const b = 1;\n")
+    graph = build_connection_graph(str(tmp_path))
+
+    (tmp_path / "web/b.js").unlink()
+    graph.apply_changes(deleted=["web/b.js"])
+
+    assert "web/b.js" not in graph.nodes
+    assert graph.nodes["web/app.js"].status == "error"
+    assert_matches_full_rebuild(graph, tmp_path)
+
+
+def test_added_file_resolves_previously_broken_import(tmp_path):
+    make_project(tmp_path)
+    write_file(tmp_path / "web/app.js", "import { h } from './helpers';\n")
+    graph = build_connection_graph(str(tmp_path))
+    assert graph.nodes["web/app.js"].status == "error"
+
+    write_file(tmp_path / "web/helpers.js", "export const h = 1;\n")
+    graph.apply_changes(added=["web/helpers.js"])
+
+    assert graph.nodes["web/app.js"].status == "normal"
+    assert graph.nodes["web/helpers.js"].metrics.incoming_count == 1
+    assert_matches_full_rebuild(graph, tmp_path)
+
+
+def test_added_python_module_shadows_external_import(tmp_path):
+    make_project(tmp_path)
+    write_file(tmp_path / "c.py", "import helpers\n")
+    graph = build_connection_graph(str(tmp_path))
+
+    write_file(tmp_path / "helpers.py", "H = 1\n")
+    graph.apply_changes(added=["helpers.py"])
+
+    assert graph.nodes["helpers.py"].metrics.incoming_count == 1
+    assert_matches_full_rebuild(graph, tmp_path)
+
+
+def test_untouched_component_is_not_recomputed(tmp_path):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+
+    write_file(tmp_path / "lonely/y.py", "import lonely.x\n")
+    affected = graph.apply_changes(changed=["lonely/y.py"])
+
+    assert affected == {"lonely/x.py", "lonely/y.py"}
+    assert_matches_full_rebuild(graph, tmp_path)
+
+
+def test_vanished_changed_file_is_treated_as_delete(tmp_path):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+
+    (tmp_path / "a.py").unlink()
+    graph.apply_changes(changed=["a.py"])
+
+    assert "a.py" not in graph.nodes
+    assert_matches_full_rebuild(graph, tmp_path)
+
+
+def test_delete_and_add_of_an_existing_file_follow_the_disk(tmp_path):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+
+    # Atomic save: the same batch reports b.py deleted and re-created
+    write_file(tmp_path / "b.py", "import a\n")
+    graph.apply_changes(deleted=["b.py"], added=["b.py"])
+
+    assert "b.py" in graph.nodes
+    assert graph.nodes["b.py"].metrics.in_cycle
+    assert_matches_full_rebuild(graph, tmp_path)
+
+    # Unknown to the graph but on disk: an add, whatever the event said
+    write_file(tmp_path / "c.py", "import b\n")
+    graph.apply_changes(deleted=["c.py"])
+
+    assert "c.py" in graph.nodes
+    assert_matches_full_rebuild(graph, tmp_path)
+
+
+def test_no_op_change_set(tmp_path):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+
+    assert graph.apply_changes(changed=["README.md"]) == set()
@@ -0,0 +1,85 @@
+"""Tests for ConnectionVerifier's directory index and resolution memo."""
+
+from pathlib import Path
+
+from IP.connection_verifier import ConnectionVerifier
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_repeated_specifiers_resolve_once_per_run(tmp_path):
+    write_file(tmp_path / "shared.py", "VALUE = 1\n")
+    for index in range(20):
+        write_file(tmp_path / f"pkg{index % 2}/mod{index}.py", "import shared\n")
+
+    verifier = ConnectionVerifier(str(tmp_path))
+    calls = []
+    original = verifier._resolve_python_import
+
+    def counting(import_path, source_file):
+        calls.append(import_path)
+        return original(import_path, source_file)
+
+    counting.__name__ = original.__name__
+    verifier._resolve_python_import = counting
+
+    results = verifier.verify_project()
+
+    assert calls == ["shared"]
+    assert all(
+        [imp.resolved_path for imp in results[f"pkg{i % 2}/mod{i}.py"].local_imports]
+        == ["shared.py"]
+        for i in range(20)
+    )
+
+
+def test_relative_imports_are_memoized_per_directory(tmp_path):
+    write_file(tmp_path / "a/util.js", "export const a = 1;\n")
+    write_file(tmp_path / "b/util.js", "export const b = 1;\n")
+    write_file(tmp_path / "a/main.js", "import { a } from './util';\n")
+    write_file(tmp_path / "b/main.js", "import { b } from './util';\n")
+
+    results = ConnectionVerifier(str(tmp_path)).verify_project()
+
+    assert results["a/main.js"].local_imports[0].resolved_path == "a/util.js"
+    assert results["b/main.js"].local_imports[0].resolved_path == "b/util.js"
+
+
+def test_each_directory_is_listed_at_most_once(tmp_path):
+    write_file(tmp_path / "web/lib.ts", "export const x = 1;\n")
+    for index in range(10):
+        write_file(
+            tmp_path / f"web/page{index}.tsx",
+            "import { x } from './lib';\nimport { y } from './missing';\n",
+        )
+
+    verifier = ConnectionVerifier(str(tmp_path))
+    verifier.verify_project()
+
+    listed_before = verifier._fs.listed
+    assert listed_before <= 3  # root, web/, web/missing probe parent
+    with verifier.resolution_run():
+        verifier.verify_file("web/page0.tsx")
+    assert verifier._fs.listed <= listed_before + 1
+
+
+def test_root_package_resolves_to_relative_path(tmp_path):
+    write_file(tmp_path / "pkg/__init__.py", "")
+    write_file(tmp_path / "main.py", "import pkg\n")
+
+    result = ConnectionVerifier(str(tmp_path)).verify_file("main.py")
+
+    assert result.local_imports[0].resolved_path == "pkg/__init__.py"
+
+
+def test_standalone_verify_file_sees_new_files(tmp_path):
+    write_file(tmp_path / "web/app.js", "import { h } from './helpers';\n")
+    verifier = ConnectionVerifier(str(tmp_path))
+    assert verifier.verify_file("web/app.js").broken_imports
+
+    write_file(tmp_path / "web/helpers.js", "export const h = 1;\n")
+
+    assert not verifier.verify_file("web/app.js").broken_imports
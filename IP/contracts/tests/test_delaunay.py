@@ -0,0 +1,93 @@
+"""Tests for the sweep-hull Delaunay triangulator."""
+
+import random
+
+from IP.barradeau_builder import BarradeauBuilding, Delaunay, Point2D
+
+
+def circumcircle(a, b, c):
+    (ax, ay), (bx, by), (cx, cy) = a, b, c
+    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    ux = ((ax**2 + ay**2) * (by - cy) + (bx**2 + by**2) * (cy - ay) + (cx**2 + cy**2) * (ay - by)) / d
+    uy = ((ax**2 + ay**2) * (cx - bx) + (bx**2 + by**2) * (ax - cx) + (cx**2 + cy**2) * (bx - ax)) / d
+    return ux, uy, (ax - ux) ** 2 + (ay - uy) ** 2
+
+
+def triangle_area(a, b, c):
+    return abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) / 2
+
+
+def hull_area(points):
+    """Monotone-chain convex hull area."""
+    pts = sorted(set(points))
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower, upper = [], []
+    for p in pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    for p in reversed(pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    hull = lower[:-1] + upper[:-1]
+    return abs(sum(hull[i][0] * hull[i - 1][1] - hull[i - 1][0] * hull[i][1] for i in range(len(hull)))) / 2
+
+
+def assert_delaunay(points):
+    triangles = Delaunay.triangulate_indices(points)
+
+    for a, b, c in triangles:
+        ux, uy, r = circumcircle(points[a], points[b], points[c])
+        for i, (px, py) in enumerate(points):
+            if i not in (a, b, c):
+                assert (px - ux) ** 2 + (py - uy) ** 2 >= r * (1 - 1e-9)
+
+    covered = sum(triangle_area(points[a], points[b], points[c]) for a, b, c in triangles)
+    assert abs(covered - hull_area(points)) < 1e-6 * max(1.0, covered)
+    return triangles
+
+
+def test_random_points_are_delaunay_and_cover_the_hull():
+    rng = random.Random(3)
+    points = [(rng.random() * 50, rng.random() * 50) for _ in range(300)]
+
+    triangles = assert_delaunay(points)
+
+    assert len(triangles) > 500
+
+
+def test_cocircular_grid_and_footprints():
+    assert_delaunay([(float(i), float(j)) for i in range(8) for j in range(8)])
+
+    for line_count in (40, 900, 9000):
+        building = BarradeauBuilding("a.py", line_count, 0, seed=line_count)
+        assert_delaunay([(p.x, p.y) for p in building.footprint_points])
+
+
+def test_degenerate_inputs_yield_no_triangles():
+    assert Delaunay.triangulate_indices([]) == []
+    assert Delaunay.triangulate_indices([(0, 0), (1, 1)]) == []
+    assert Delaunay.triangulate_indices([(0, 0), (1, 1), (2, 2), (3, 3)]) == []
+    assert Delaunay.triangulate_indices([(1, 1)] * 5) == []
+
+
+def test_duplicates_are_skipped():
+    points = [(0, 0), (1, 0), (0, 1), (1, 0), (1, 1)]
+
+    triangles = Delaunay.triangulate_indices(points)
+
+    assert len(triangles) == 2
+    assert 3 not in {i for tri in triangles for i in tri}
+
+
+def test_triangulate_wraps_points():
+    points = [Point2D(0, 0), Point2D(4, 0), Point2D(0, 3)]
+
+    (triangle,) = Delaunay.triangulate(points)
+
+    assert {id(triangle.p1), id(triangle.p2), id(triangle.p3)} == {id(p) for p in points}
+    assert len(Delaunay.triangulate_bowyer_watson(points)) == 1
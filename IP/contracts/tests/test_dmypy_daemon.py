@@ -0,0 +1,155 @@
+"""Tests for the supervised dmypy backend of HealthChecker."""
+
+import os
+import shutil
+import sys
+import time
+
+import pytest
+
+from IP.dmypy_daemon import DmypySupervisor, supervisor_for
+from IP.health_checker import CheckerType, HealthChecker
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="fake checkers are shell-free scripts")
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+# Fake dmypy client: logs each call; `check` fails like a dead daemon while
+# a "crash" marker exists next to the status file.
+FAKE_DMYPY = """\
+import os, sys
+status = sys.argv[2]
+command = sys.argv[3]
+with open(os.path.join(os.path.dirname(status), "calls.log"), "a") as log:
+    log.write(command + "\\n")
+crash = os.path.join(os.path.dirname(status), "crash")
+if command == "start":
+    open(status, "w").write("{}")
+    print("Daemon started")
+elif command in ("stop", "kill"):
+    sys.exit(0)
+elif command == "check":
+    if os.path.exists(crash) or not os.path.exists(status):
+        os.path.exists(crash) and os.remove(crash)
+        print("[Errno 111] Connection refused")
+        sys.exit(2)
+    print(sys.argv[4] + "/mod.py:1:5: error: Bad type  [assignment]")
+    sys.exit(1)
+"""
+
+FAKE_MYPY = """\
+import sys
+print(sys.argv[1] + "/mod.py:2:1: error: cold mypy  [misc]")
+sys.exit(1)
+"""
+
+
+def install(bin_dir, name, body):
+    script = bin_dir / name
+    write_file(script, f"#!{sys.executable}\n{body}")
+    script.chmod(0o755)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    root = tmp_path / "proj"
+    write_file(root / "pkg" / "mod.py", "x: int = 'a'\n")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    install(bin_dir, "dmypy", FAKE_DMYPY)
+    install(bin_dir, "mypy", FAKE_MYPY)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.delenv("ORCHESTR8_DMYPY", raising=False)
+    yield root
+    supervisor_for(str(root)).stop()
+
+
+def calls(root):
+    log = root / ".orchestr8" / "calls.log"
+    return log.read_text().split() if log.exists() else []
+
+
+def test_fiefdom_check_goes_through_daemon(project):
+    checker = HealthChecker(str(project), use_cache=False)
+
+    first = checker.check_fiefdom("pkg")
+    second = checker.check_fiefdom("pkg")
+
+    assert CheckerType.PYTHON_DMYPY in checker.get_available_checkers()
+    assert first.checker_used == second.checker_used == "dmypy"
+    assert [(e.line, e.error_code) for e in second.errors] == [(1, "assignment")]
+    # One start, then only incremental checks
+    assert calls(project) == ["start", "check", "check"]
+
+
+def test_crashed_daemon_is_restarted(project):
+    checker = HealthChecker(str(project), use_cache=False)
+    checker.check_fiefdom("pkg")
+    write_file(project / ".orchestr8" / "crash", "")
+
+    result = checker.check_fiefdom("pkg")
+
+    assert [e.error_code for e in result.errors] == ["assignment"]
+    assert supervisor_for(str(project)).restarts == 1
+    assert calls(project)[-4:] == ["check", "stop", "start", "check"]
+
+
+def test_config_change_restarts_daemon(project):
+    checker = HealthChecker(str(project), use_cache=False)
+    checker.check_fiefdom("pkg")
+    time.sleep(0.01)
+    write_file(project / "mypy.ini", "[mypy]\nstrict = True\n")
+
+    checker.check_all_fiefdoms(["pkg"])
+
+    assert calls(project) == ["start", "check", "stop", "start", "check"]
+
+
+def test_unusable_daemon_falls_back_to_cold_mypy(project, tmp_path):
+    install(tmp_path / "bin", "dmypy", "import sys\nsys.exit(2)\n")
+    checker = HealthChecker(str(project), use_cache=False)
+
+    result = checker.check_fiefdom("pkg")
+
+    assert [e.message for e in result.errors] == ["cold mypy"]
+
+
+def test_env_toggle_disables_daemon(project, monkeypatch):
+    monkeypatch.setenv("ORCHESTR8_DMYPY", "0")
+    checker = HealthChecker(str(project), use_cache=False)
+
+    result = checker.check_fiefdom("pkg")
+
+    assert result.checker_used == "mypy"
+    assert calls(project) == []
+
+
+def test_supervisor_is_shared_per_root(project):
+    assert supervisor_for(str(project)) is supervisor_for(str(project / "pkg" / ".."))
+    assert isinstance(supervisor_for(str(project)), DmypySupervisor)
+
+
+@pytest.mark.skipif(shutil.which("dmypy") is None, reason="mypy not installed")
+def test_real_daemon_rechecks_edits(tmp_path, monkeypatch):
+    monkeypatch.delenv("ORCHESTR8_DMYPY", raising=False)
+    root = tmp_path / "real"
+    write_file(root / "pkg" / "__init__.py", "")
+    write_file(root / "pkg" / "mod.py", "x: int = 1\n")
+    checker = HealthChecker(str(root), use_cache=False)
+    try:
+        assert checker.check_fiefdom("pkg").status == "working"
+
+        write_file(root / "pkg" / "mod.py", "x: int = 'a'\n")
+        result = checker.check_fiefdom("pkg")
+    finally:
+        checker.close()
+
+    assert result.checker_used.endswith("dmypy")
+    assert [(e.file, e.line, e.error_code) for e in result.errors] == [
+        (os.path.join("pkg", "mod.py"), 1, "assignment")
+    ]
+    assert not (root / ".orchestr8" / "dmypy.json").exists()
@@ -0,0 +1,125 @@
+"""Tests for executor_pool fan-out and deterministic Code City scans."""
+
+import functools
+import os
+
+import pytest
+
+from IP.executor_pool import (
+    ExecutorMode,
+    chunked,
+    iter_parallel_map,
+    parallel_map,
+    resolve_executor_mode,
+)
+from IP.woven_maps import collect_file_metrics, scan_codebase
+
+
+def square_chunk(offset, items):
+    return [item * item + offset for item in items]
+
+
+def test_resolve_executor_mode_by_size(monkeypatch):
+    monkeypatch.delenv("ORCHESTR8_EXECUTOR", raising=False)
+    monkeypatch.setattr("IP.executor_pool.default_worker_count", lambda: 8)
+
+    assert resolve_executor_mode(10) == ExecutorMode.SERIAL
+    assert resolve_executor_mode(1000) == ExecutorMode.THREAD
+    assert resolve_executor_mode(50_000) == ExecutorMode.PROCESS
+    assert resolve_executor_mode(50_000, "serial") == ExecutorMode.SERIAL
+    assert resolve_executor_mode(1000, cpu_bound=True) == ExecutorMode.PROCESS
+    assert resolve_executor_mode(10, cpu_bound=True) == ExecutorMode.SERIAL
+
+
+def test_resolve_executor_mode_env_override(monkeypatch):
+    monkeypatch.setenv("ORCHESTR8_EXECUTOR", "process")
+    assert resolve_executor_mode(3) == ExecutorMode.PROCESS
+
+    monkeypatch.setenv("ORCHESTR8_EXECUTOR", "bogus")
+    assert resolve_executor_mode(3) == ExecutorMode.SERIAL
+
+
+def test_chunked_preserves_order():
+    assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+
+@pytest.mark.parametrize("mode", ["serial", "thread", "process"])
+def test_parallel_map_preserves_input_order(mode):
+    items = list(range(257))
+    result = parallel_map(
+        functools.partial(square_chunk, 1), items, mode=mode, chunk_size=10
+    )
+    assert result == [i * i + 1 for i in items]
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_scan_codebase_is_deterministic_across_executors(tmp_path, mode):
+    for i in range(40):
+        module = tmp_path / f"pkg{i % 4}" / f"mod_{i}.py"
+        module.parent.mkdir(parents=True, exist_ok=True)
+        module.write_text("def f():\n    pass\n" * (i + 1), encoding="utf-8")
+
+    serial = scan_codebase(str(tmp_path), use_cache=False, executor="serial")
+    fanned = scan_codebase(str(tmp_path), use_cache=False, executor=mode)
+
+    assert [n.path for n in fanned] == [n.path for n in serial]
+    assert [(n.loc, n.export_count) for n in fanned] == [
+        (n.loc, n.export_count) for n in serial
+    ]
+
+
+def test_collect_file_metrics_matches_single_file_path(tmp_path):
+    (tmp_path / "a.py").write_text("def a():\n    pass\n", encoding="utf-8")
+    (tmp_path / "b.js").write_text("export const b = 1;\n", encoding="utf-8")
+
+    metrics = collect_file_metrics(
+        tmp_path, ["a.py", "b.js", "missing.py"], executor="thread"
+    )
+
+    assert metrics == {"a.py": (2, 1), "b.js": (1, 1), "missing.py": (0, 0)}
+
+
+@pytest.mark.parametrize("mode", ["serial", "thread", "process"])
+def test_iter_parallel_map_yields_every_chunk(mode):
+    items = list(range(95))
+    pairs = list(
+        iter_parallel_map(functools.partial(square_chunk, 0), items, mode=mode, chunk_size=10)
+    )
+
+    assert len(pairs) == 10
+    assert sorted(x for chunk, _ in pairs for x in chunk) == items
+    for chunk, results in pairs:
+        assert results == [x * x for x in chunk]
+
+
+def failing_chunk(calls, items):
+    calls.append(len(items))
+    raise RecursionError("deeply nested file")
+
+
+def exit_in_worker(parent_pid, items):
+    if os.getpid() != parent_pid:
+        os._exit(1)  # Kills the worker: the pool breaks
+    return [item * item for item in items]
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_worker_exceptions_propagate(mode):
+    calls = []
+    func = functools.partial(failing_chunk, calls)
+    with pytest.raises(RecursionError):
+        parallel_map(func, list(range(40)), mode=mode, chunk_size=10)
+    with pytest.raises(RecursionError):
+        list(iter_parallel_map(func, list(range(40)), mode=mode, chunk_size=10))
+    if mode == "thread":
+        # No silent serial rerun of the whole batch
+        assert 40 not in calls
+
+
+def test_broken_process_pool_falls_back_to_serial():
+    func = functools.partial(exit_in_worker, os.getpid())
+    items = list(range(40))
+
+    assert parallel_map(func, items, mode="process", chunk_size=10) == [x * x for x in items]
+    pairs = list(iter_parallel_map(func, items, mode="process", chunk_size=10))
+    assert sorted(x for chunk, _ in pairs for x in chunk) == items
@@ -0,0 +1,94 @@
+"""Tests for the columnar Code City graph encoding."""
+
+import json
+
+from IP.code_city_stream import _StreamSession, build_chunks
+from IP.graph_codec import COLUMNAR_FORMAT, decode_columnar, encode_columnar
+from IP.woven_maps import WOVEN_MAPS_TEMPLATE, CodeNode, EdgeData, GraphData
+
+
+def sample_graph():
+    return GraphData(
+        nodes=[
+            CodeNode(
+                path="IP/woven_maps.py",
+                status="broken",
+                loc=4500,
+                errors=["Unresolved import: ./missing"],
+                x=120.5,
+                y=64.25,
+                node_type="component",
+                centrality=0.5,
+                in_cycle=True,
+                depth=2,
+                incoming_count=3,
+                outgoing_count=70000,
+                export_count=12,
+                building_height=14.5,
+                footprint=38.0,
+            ),
+            CodeNode(path="orchestr8.py", node_type="entry", x=10.0, y=20.0),
+        ],
+        edges=[
+            EdgeData("orchestr8.py", "IP/woven_maps.py", line_number=12, bidirectional=True),
+            EdgeData("IP/woven_maps.py", "./missing", resolved=False, line_number=40),
+        ],
+    )
+
+
+def test_round_trip_matches_to_dict():
+    graph = sample_graph()
+
+    payload = json.loads(graph.to_json("columnar"))
+
+    assert payload["format"] == COLUMNAR_FORMAT
+    assert decode_columnar(payload) == graph.to_dict()
+
+
+def test_edges_index_a_shared_string_table():
+    payload = sample_graph().to_columnar()
+
+    # Node paths first, then endpoints that are not nodes
+    assert payload["strings"] == ["IP/woven_maps.py", "orchestr8.py", "./missing"]
+    assert "nodes" not in payload and "edges" not in payload
+
+
+def test_integer_columns_use_narrowest_type():
+    columns = sample_graph().to_columnar()["nodeColumns"]
+
+    assert columns["x"]["type"] == "f32"
+    assert columns["depth"]["type"] == "u8"
+    assert columns["loc"]["type"] == "u16"
+    assert columns["outgoingCount"]["type"] == "u32"
+    assert columns["status"]["values"] == ["broken", "working"]
+
+
+def test_payload_is_much_smaller_than_json():
+    nodes = [CodeNode(path=f"pkg{i % 40}/module_{i}.py", loc=i, x=i * 0.5, y=i * 0.25) for i in range(2000)]
+    edges = [EdgeData(nodes[i % 2000].path, nodes[(i * 7) % 2000].path, line_number=i % 300) for i in range(10000)]
+    graph = GraphData(nodes=nodes, edges=edges)
+
+    assert len(graph.to_json("columnar")) * 5 < len(graph.to_json())
+
+
+def test_stream_chunks_can_be_columnar():
+    graph = sample_graph().to_dict()
+    session = _StreamSession("shell", "", build_chunks(graph), columnar=True)
+
+    chunks = [decode_columnar(json.loads(body)) for body in session.chunks]
+
+    assert [node["id"] for chunk in chunks for node in chunk["nodes"]] == [
+        "IP/woven_maps.py",
+        "orchestr8.py",
+    ]
+    assert sum(len(chunk["edges"]) for chunk in chunks) == 2
+    assert json.loads(session.manifest)["nodeCount"] == 2
+
+
+def test_empty_graph_and_plain_payload_pass_through():
+    assert decode_columnar(encode_columnar({"nodes": [], "edges": []})) == {"nodes": [], "edges": []}
+    assert decode_columnar({"nodes": [1]}) == {"nodes": [1]}
+
+
+def test_template_decodes_the_same_format():
+    assert f"'{COLUMNAR_FORMAT}'" in WOVEN_MAPS_TEMPLATE
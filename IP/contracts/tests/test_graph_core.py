@@ -0,0 +1,103 @@
+"""Tests for the dependency-free CSR graph core."""
+
+import random
+import sys
+
+import pytest
+
+from IP.connection_verifier import ConnectionGraph, ConnectionVerifier
+from IP.graph_core import CSRGraph, bfs_depths, pagerank, strongly_connected_components
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def graph_of(edges, nodes=None):
+    ids = nodes or sorted({n for edge in edges for n in edge})
+    return CSRGraph.from_edges(ids, edges)
+
+
+def test_csr_dedupes_edges_and_drops_unknown_endpoints():
+    graph = CSRGraph.from_edges(["a", "b"], [("a", "b"), ("a", "b"), ("a", "zzz"), ("b", "a")])
+
+    assert graph.edge_count == 2
+    assert list(graph.successors(0)) == [1]
+    assert list(graph.reverse().successors(0)) == [1]
+    assert graph.in_degrees() == [1, 1]
+
+
+def test_tarjan_finds_cycles():
+    graph = graph_of([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("d", "e"), ("e", "d"), ("f", "a")])
+
+    components = {frozenset(graph.ids[i] for i in c) for c in strongly_connected_components(graph)}
+
+    assert components == {
+        frozenset("abc"),
+        frozenset("de"),
+        frozenset("f"),
+    }
+
+
+def test_tarjan_handles_deep_chains_without_recursion():
+    ids = [str(i) for i in range(20000)]
+    graph = CSRGraph.from_edges(ids, zip(ids, ids[1:] + ids[:1]))
+
+    assert [len(c) for c in strongly_connected_components(graph)] == [20000]
+
+
+def test_pagerank_closed_forms():
+    cycle = graph_of([("a", "b"), ("b", "c"), ("c", "a")])
+    assert pagerank(cycle) == pytest.approx([1 / 3] * 3)
+
+    # Two leaves both importing a dangling hub
+    star = graph_of([("a", "hub"), ("b", "hub")], nodes=["a", "b", "hub"])
+    leaf, _, hub = pagerank(star)
+    assert hub == pytest.approx(leaf * (1 + 2 * 0.85), rel=1e-5)
+    assert pagerank(CSRGraph.from_edges([], [])) == []
+
+
+def test_pagerank_matches_networkx():
+    nx = pytest.importorskip("networkx")
+    rng = random.Random(9)
+    ids = [f"m{i}" for i in range(300)]
+    edges = [(rng.choice(ids), rng.choice(ids)) for _ in range(900)]
+    reference = nx.DiGraph()
+    reference.add_nodes_from(ids)
+    reference.add_edges_from(edges)
+    try:
+        expected = nx.pagerank(reference)
+    except ImportError:
+        pytest.skip("networkx pagerank backend unavailable")
+
+    scores = pagerank(CSRGraph.from_edges(ids, edges))
+
+    assert scores == pytest.approx([expected[i] for i in ids], abs=1e-12)
+
+
+def test_multi_source_bfs_depths():
+    graph = graph_of([("a", "b"), ("b", "c"), ("x", "c"), ("c", "d")], nodes=["a", "b", "c", "d", "x", "lone"])
+
+    assert bfs_depths(graph, [0, 4]) == [0, 1, 1, 2, 0, -1]
+
+
+def test_connection_graph_metrics_without_networkx(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "networkx", None)  # import networkx -> ImportError
+    write_file(tmp_path / "main.py", "import service\n")
+    write_file(tmp_path / "service.py", "import models\n")
+    write_file(tmp_path / "models.py", "import service\n")
+
+    verifier = ConnectionVerifier(str(tmp_path))
+    graph = ConnectionGraph(verifier)
+    graph.build_from_results(verifier.verify_project())
+    cycles = graph.detect_cycles()
+    graph.calculate_centrality()
+    graph.calculate_depth()
+
+    assert [sorted(cycle) for cycle in cycles] == [["models.py", "service.py"]]
+    depths = {node_id: node.metrics.depth for node_id, node in graph.nodes.items()}
+    assert depths == {"main.py": 0, "service.py": 1, "models.py": 2}
+    centrality = {node_id: node.metrics.centrality for node_id, node in graph.nodes.items()}
+    assert sum(centrality.values()) == pytest.approx(1.0)
+    assert centrality["service.py"] > centrality["main.py"]
@@ -0,0 +1,150 @@
+"""Tests for the persistent ConnectionGraph snapshot."""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from IP.connection_verifier import ConnectionVerifier, build_connection_graph
+from IP.graph_snapshot import ConnectionGraphSession, GraphSnapshotStore, load_connection_graph
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def make_project(root: Path) -> None:
+    write_file(root / "main.py", "import a\nimport b\n")
+    write_file(root / "a.py", "import b\nimport requests\n")
+    write_file(root / "b.py", "import a\n")
+    write_file(root / "web/view.js", "import h from './helper';\nimport g from './gone';\n")
+    write_file(root / "web/helper.js", "export default 1;\n")
+
+
+@pytest.fixture
+def verified(monkeypatch):
+    """Record every file the verifier reads."""
+    seen = []
+    original = ConnectionVerifier.verify_file
+
+    def verify_file(self, file_path):
+        seen.append(file_path)
+        return original(self, file_path)
+
+    monkeypatch.setattr(ConnectionVerifier, "verify_file", verify_file)
+    return seen
+
+
+def test_snapshot_round_trips_graph(tmp_path):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+    store = GraphSnapshotStore(str(tmp_path))
+
+    assert store.save(graph)
+    loaded = GraphSnapshotStore(str(tmp_path)).load()
+
+    assert loaded.to_dict() == graph.to_dict()
+    assert loaded.results["a.py"].external_imports[0].target_module == "requests"
+    assert loaded._rank_scale == graph._rank_scale
+
+
+def test_warm_start_reverifies_nothing(tmp_path, verified):
+    make_project(tmp_path)
+    first = load_connection_graph(str(tmp_path))
+    assert (tmp_path / ".orchestr8" / "connection_graph.sqlite").is_file()
+    verified.clear()
+
+    os.utime(tmp_path / "a.py", ns=(1, 1))  # Stat moved, content identical
+    warm = load_connection_graph(str(tmp_path))
+
+    assert verified == []
+    assert warm.to_dict() == first.to_dict()
+    assert GraphSnapshotStore(str(tmp_path)).load() is not None
+
+
+def test_only_stale_files_are_reverified(tmp_path, verified):
+    make_project(tmp_path)
+    load_connection_graph(str(tmp_path))
+    verified.clear()
+
+    write_file(tmp_path / "b.py", "VALUE = 1\n")
+    write_file(tmp_path / "web/gone.js", "export default 2;\n")
+    (tmp_path / "web/helper.js").unlink()
+    warm = load_connection_graph(str(tmp_path))
+
+    assert "main.py" not in verified and "a.py" not in verified
+    assert {"b.py", "web/gone.js", "web/view.js"} <= set(verified)
+    fresh = build_connection_graph(str(tmp_path))
+    assert sorted(warm.nodes) == sorted(fresh.nodes)
+    key = lambda e: (e.source, e.target, e.resolved, e.bidirectional)  # noqa: E731
+    assert sorted(map(key, warm.edges)) == sorted(map(key, fresh.edges))
+    for node_id, node in fresh.nodes.items():
+        assert warm.nodes[node_id].metrics.depth == node.metrics.depth
+        assert warm.nodes[node_id].metrics.in_cycle == node.metrics.in_cycle
+
+    verified.clear()
+    load_connection_graph(str(tmp_path))
+    assert verified == []
+
+
+def test_edit_between_verification_and_save_is_not_trusted(tmp_path, verified):
+    make_project(tmp_path)
+    graph = build_connection_graph(str(tmp_path))
+    write_file(tmp_path / "b.py", "import main\n")  # Edited after b.py was verified
+    GraphSnapshotStore(str(tmp_path)).save(graph)
+    verified.clear()
+
+    warm = load_connection_graph(str(tmp_path))
+
+    assert verified == ["b.py"]
+    assert {e.target for e in warm.edges if e.source == "b.py"} == {"main.py"}
+
+
+def test_unusable_snapshots_trigger_rebuild(tmp_path, monkeypatch):
+    make_project(tmp_path)
+    graph = load_connection_graph(str(tmp_path))
+    path = tmp_path / ".orchestr8" / "connection_graph.sqlite"
+
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("UPDATE meta SET value = '0' WHERE key = 'version'")
+    conn.close()
+    assert GraphSnapshotStore(str(tmp_path)).load() is None
+    assert load_connection_graph(str(tmp_path)).to_dict() == graph.to_dict()
+
+    path.write_bytes(b"not a database")
+    assert GraphSnapshotStore(str(tmp_path)).load() is None
+    assert load_connection_graph(str(tmp_path)).to_dict() == graph.to_dict()
+
+    path.unlink()
+    monkeypatch.setenv("ORCHESTR8_GRAPH_SNAPSHOT", "0")
+    load_connection_graph(str(tmp_path))
+    assert not path.exists()
+
+
+def test_session_graph_applies_marked_changes_only(tmp_path, verified, monkeypatch):
+    make_project(tmp_path)
+    session = ConnectionGraphSession(str(tmp_path))
+    graph = session.graph()
+    index = graph.reachability()
+    verified.clear()
+    walks = []
+    monkeypatch.setattr(ConnectionVerifier, "project_files", lambda self, *a: walks.append(1) or [])
+
+    # Unmarked queries reuse the graph and its reachability index
+    assert session.graph() is graph
+    assert graph.reachability() is index
+    assert verified == []
+
+    write_file(tmp_path / "b.py", "X = 1\n")
+    write_file(tmp_path / "web/extra/new.js", "import h from '../helper';\n")
+    session.mark_changed("b.py")
+    session.mark_changed("web/extra")
+
+    assert session.graph() is graph
+    assert sorted(verified) == ["b.py", "web/extra/new.js"]
+    assert walks == []
+    assert not graph.reachability().can_reach("b.py", "a.py")
+    assert graph.reachability().can_reach("web/extra/new.js", "web/helper.js")
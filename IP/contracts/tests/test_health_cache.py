@@ -0,0 +1,177 @@
+"""Tests for the content-keyed HealthChecker result cache."""
+
+import os
+import sys
+
+import pytest
+
+import IP.health_checker as health_checker
+from IP.health_checker import HealthChecker, HealthCheckResult, ParsedError
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="fake checkers are shell-free scripts")
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+# Fake ruff: logs its targets, reports F401 on line 1 of every file whose
+# content contains "unused", and can be slowed down via a marker file.
+FAKE_RUFF = """\
+import os, sys, time
+root = os.getcwd()
+targets = [a for a in sys.argv[2:] if not a.startswith("--")]
+with open(os.path.join(os.path.dirname(sys.argv[0]), "ruff.log"), "a") as log:
+    log.write(" ".join(targets) + "\\n")
+if os.path.exists(os.path.join(root, "SLOW")):
+    time.sleep(30)
+for target in targets:
+    for dirpath, _, files in os.walk(target):
+        for name in sorted(files):
+            path = os.path.relpath(os.path.join(dirpath, name), root)
+            if name.endswith(".py") and "unused" in open(path).read():
+                print(f"{path}:1:1: F401 unused import")
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    root = tmp_path / "proj"
+    write_file(root / "alpha" / "a.py", "import unused\n")
+    write_file(root / "beta" / "b.py", "x = 1\n")
+    write_file(root / "alphabet" / "c.py", "import unused\n")
+    bin_dir = tmp_path / "bin"
+    write_file(bin_dir / "ruff", f"#!{sys.executable}\n{FAKE_RUFF}")
+    (bin_dir / "ruff").chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.delenv("ORCHESTR8_HEALTH_CACHE", raising=False)
+    return root
+
+
+def ruff_runs(root):
+    log = root.parent / "bin" / "ruff.log"
+    return log.read_text().splitlines() if log.exists() else []
+
+
+def test_unchanged_fiefdom_is_served_from_cache(project):
+    checker = HealthChecker(str(project))
+
+    first = checker.check_fiefdom("alpha")
+    second = checker.check_fiefdom("alpha")
+
+    assert ruff_runs(project) == ["alpha"]
+    assert second.to_dict() == first.to_dict()
+    assert checker.cache.hits == 1
+
+    write_file(project / "alpha" / "a.py", "x = 2\n")
+    third = checker.check_fiefdom("alpha")
+
+    assert ruff_runs(project) == ["alpha", "alpha"]
+    assert third.status == "working"
+
+
+def test_cache_persists_across_checkers(project):
+    HealthChecker(str(project)).check_fiefdom("alpha")
+
+    result = HealthChecker(str(project)).check_fiefdom("alpha")
+
+    assert ruff_runs(project) == ["alpha"]
+    assert [(e.file, e.error_code) for e in result.errors] == [("alpha/a.py", "F401")]
+
+
+def test_check_all_rechecks_only_dirty_fiefdoms(project):
+    checker = HealthChecker(str(project))
+    fiefdoms = ["alpha", "beta", "alphabet", "missing"]
+
+    first = checker.check_all_fiefdoms(fiefdoms)
+    write_file(project / "beta" / "b.py", "import unused\n")
+    second = checker.check_all_fiefdoms(fiefdoms)
+    third = checker.check_all_fiefdoms(fiefdoms)
+
+    assert ruff_runs(project) == ["alpha beta alphabet", "beta"]
+    # Prefix matching: alphabet/ errors are not alpha's
+    assert [e.file for e in first["alpha"].errors] == ["alpha/a.py"]
+    assert [e.file for e in first["alphabet"].errors] == ["alphabet/c.py"]
+    assert first["beta"].status == "working"
+    assert second["beta"].status == "broken"
+    assert list(third) == fiefdoms
+    assert {f: r.to_dict() for f, r in third.items()} == {f: r.to_dict() for f, r in second.items()}
+
+
+# Fake mypy: b/y.py calls f("s"), an error once a/x.py declares f(x: int)
+FAKE_MYPY = """\
+import os, sys
+targets = [a for a in sys.argv[1:] if not a.startswith("--")]
+if "b" in targets and "int" in open(os.path.join("a", "x.py")).read():
+    print('b/y.py:1:1: error: Argument 1 to "f" has incompatible type "str"  [arg-type]')
+"""
+
+
+def test_whole_program_checkers_see_changes_outside_the_fiefdom(project):
+    write_file(project / "a" / "x.py", "def f(x: str): ...\n")
+    write_file(project / "b" / "y.py", "from a.x import f\nf('s')\n")
+    mypy = project.parent / "bin" / "mypy"
+    write_file(mypy, f"#!{sys.executable}\n{FAKE_MYPY}")
+    mypy.chmod(0o755)
+    checker = HealthChecker(str(project))
+
+    assert checker.check_all_fiefdoms(["a", "b"])["b"].status == "working"
+    assert checker.check_fiefdom("b").status == "working"
+    write_file(project / "a" / "x.py", "def f(x: int): ...\n")
+
+    assert checker.check_all_fiefdoms(["a", "b"])["b"].status == "broken"
+    assert checker.check_fiefdom("b").status == "broken"
+
+
+def test_config_and_checker_changes_invalidate(project):
+    checker = HealthChecker(str(project))
+    checker.check_fiefdom("beta")
+
+    write_file(project / "pyproject.toml", "[tool.ruff]\nline-length = 80\n")
+    checker.check_fiefdom("beta")
+    # "Upgrade" ruff: same name, different executable
+    ruff = project.parent / "bin" / "ruff"
+    ruff.write_text(ruff.read_text() + "\n# 0.9.9\n")
+    checker.check_fiefdom("beta")
+    checker.check_fiefdom("beta")
+
+    assert ruff_runs(project) == ["beta", "beta", "beta"]
+
+
+def test_timeouts_are_not_cached(project, monkeypatch):
+    monkeypatch.setattr(health_checker, "RUFF_TIMEOUT", 0.3)
+    write_file(project / "SLOW", "")
+    checker = HealthChecker(str(project))
+
+    timed_out = checker.check_fiefdom("beta")
+    (project / "SLOW").unlink()
+    retried = checker.check_fiefdom("beta")
+
+    assert [e.file for e in timed_out.errors] == ["<timeout>"]
+    assert retried.status == "working"
+    assert len(ruff_runs(project)) == 2
+
+
+def test_cache_can_be_disabled(project, monkeypatch):
+    monkeypatch.setenv("ORCHESTR8_HEALTH_CACHE", "0")
+    checker = HealthChecker(str(project))
+
+    checker.check_fiefdom("alpha")
+    checker.check_fiefdom("alpha")
+
+    assert checker.cache is None
+    assert ruff_runs(project) == ["alpha", "alpha"]
+    assert not (project / ".orchestr8" / "health_cache.json").exists()
+
+
+def test_result_dict_round_trip():
+    result = HealthCheckResult(
+        status="broken",
+        errors=[ParsedError("a.py", 3, 4, "E1", "bad")],
+        warnings=[ParsedError("a.py", 5, severity="warning", message="meh")],
+        last_check="2026-01-01T00:00:00",
+        checker_used="ruff, mypy",
+    )
+
+    assert HealthCheckResult.from_dict(result.to_dict()) == result
@@ -0,0 +1,149 @@
+"""Tests for HealthChecker's concurrent asyncio checker pipeline."""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+import IP.health_checker as health_checker
+from IP.health_checker import HealthChecker
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="fake checkers are shell-free scripts")
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def fake_checker(bin_dir, name, output, delay=0.0, pid_file=None):
+    """Install an executable `name` on bin_dir that sleeps, then prints output."""
+    script = bin_dir / name
+    write_file(
+        script,
+        f"#!{sys.executable}\n"
+        "import os, sys, time\n"
+        f"pid_file = {str(pid_file) if pid_file else None!r}\n"
+        "if pid_file:\n"
+        "    open(pid_file, 'w').write(str(os.getpid()))\n"
+        f"time.sleep({delay!r})\n"
+        f"sys.stdout.write({output!r})\n",
+    )
+    script.chmod(0o755)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    root = tmp_path / "proj"
+    write_file(root / "pkg" / "mod.py", "x = 1\n")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", str(bin_dir))
+    return root, bin_dir
+
+
+RUFF_OUT = "pkg/mod.py:1:1: F401 unused import\npkg/mod.py:2:1: W291 trailing whitespace\n"
+MYPY_OUT = "pkg/mod.py:3:5: error: Bad type  [arg-type]\npkg/mod.py:3:5: note: see docs\n"
+
+
+def test_checkers_run_concurrently_and_merge_in_order(project):
+    root, bin_dir = project
+    fake_checker(bin_dir, "ruff", RUFF_OUT, delay=0.8)
+    fake_checker(bin_dir, "mypy", MYPY_OUT, delay=0.8)
+    checker = HealthChecker(str(root))
+
+    started = time.perf_counter()
+    result = checker.check_fiefdom("pkg")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.5  # Serial would be >= 1.6 s
+    assert result.status == "broken"
+    assert result.checker_used == "ruff, mypy"
+    assert [(e.error_code, e.line) for e in result.errors] == [("F401", 1), ("arg-type", 3)]
+    assert [w.error_code for w in result.warnings] == ["W291"]
+    assert result.raw_output == RUFF_OUT + "\n---\n" + MYPY_OUT
+
+
+def test_streaming_parse_matches_whole_output_parse(project):
+    root, bin_dir = project
+    fake_checker(bin_dir, "ruff", RUFF_OUT)
+    checker = HealthChecker(str(root))
+
+    streamed = asyncio.run(checker.run_checker_async(checker._ruff_command("pkg")))
+
+    assert (streamed.errors, streamed.warnings) == checker._parse_ruff_output(RUFF_OUT)
+
+
+def test_cancel_kills_running_checker(project, tmp_path):
+    root, bin_dir = project
+    pid_file = tmp_path / "mypy.pid"
+    fake_checker(bin_dir, "mypy", "", delay=30, pid_file=pid_file)
+    checker = HealthChecker(str(root))
+
+    async def supersede():
+        task = asyncio.ensure_future(checker.check_fiefdom_async("pkg"))
+        for _ in range(200):
+            await asyncio.sleep(0.02)
+            if pid_file.exists() and pid_file.read_text():
+                break
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    started = time.perf_counter()
+    asyncio.run(supersede())
+
+    assert time.perf_counter() - started < 10
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
+
+
+def test_timeout_reports_broken(project, monkeypatch):
+    root, bin_dir = project
+    fake_checker(bin_dir, "ruff", RUFF_OUT, delay=30)
+    monkeypatch.setattr(health_checker, "RUFF_TIMEOUT", 0.3)
+    checker = HealthChecker(str(root))
+
+    result = checker.check_fiefdom("pkg/mod.py")
+
+    assert result.status == "broken"
+    assert [e.message for e in result.errors] == ["ruff check timed out"]
+
+
+def test_sync_entry_point_works_inside_running_loop(project):
+    root, bin_dir = project
+    fake_checker(bin_dir, "ruff", RUFF_OUT)
+    checker = HealthChecker(str(root))
+
+    async def from_cell():
+        return checker.check_fiefdom("pkg")
+
+    result = asyncio.run(from_cell())
+
+    assert result.checker_used == "ruff"
+    assert result.error_count == 1
+
+
+def test_check_all_fiefdoms_filters_project_wide_run(project):
+    root, bin_dir = project
+    fake_checker(bin_dir, "ruff", RUFF_OUT + "other/x.py:1:1: E999 boom\n")
+    checker = HealthChecker(str(root))
+
+    results = checker.check_all_fiefdoms(["pkg", "other"])
+
+    assert [e.error_code for e in results["pkg"].errors] == ["F401"]
+    assert [e.error_code for e in results["other"].errors] == ["E999"]
+    assert results["pkg"].checker_used == "ruff"
+
+
+def test_no_external_checkers_falls_back_to_syntax_check(project):
+    root, _ = project
+    write_file(root / "pkg" / "bad.py", "def broken(:\n")
+    checker = HealthChecker(str(root))
+
+    result = checker.check_fiefdom("pkg")
+
+    assert result.checker_used == "py_compile"
+    assert [e.error_code for e in result.errors] == ["SyntaxError"]
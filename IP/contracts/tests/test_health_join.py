@@ -0,0 +1,88 @@
+"""Tests for joining HealthChecker results onto Code City nodes."""
+
+from IP.health_checker import HealthCheckResult, ParsedError
+from IP.woven_maps import CodeNode, build_from_health_results, normalize_health_path
+
+
+def broken(*errors):
+    return HealthCheckResult(
+        status="broken",
+        errors=[ParsedError(file, line, message=message) for file, line, message in errors],
+    )
+
+
+def statuses(nodes):
+    return {node.path: node.status for node in nodes}
+
+
+def test_errors_land_on_their_own_files():
+    nodes = [CodeNode("IP/a.py"), CodeNode("IP/b.py"), CodeNode("IP/plugins/c.py")]
+    results = {"IP": broken(("IP/a.py", 3, "bad"), ("./IP/plugins/c.py", 7, "worse"))}
+
+    build_from_health_results(nodes, results)
+
+    assert statuses(nodes) == {
+        "IP/a.py": "broken",
+        "IP/b.py": "working",
+        "IP/plugins/c.py": "broken",
+    }
+    assert nodes[0].health_errors == [{"file": "IP/a.py", "line": 3, "message": "bad"}]
+    assert nodes[2].health_errors == [{"file": "IP/plugins/c.py", "line": 7, "message": "worse"}]
+    assert nodes[1].health_errors == []
+
+
+def test_prefixes_match_whole_path_components():
+    nodes = [CodeNode("IP/a.py"), CodeNode("IPX/a.py"), CodeNode("lib/IP/a.py")]
+
+    build_from_health_results(nodes, {"IP/": broken(("<timeout>", 0, "timed out"))})
+
+    assert statuses(nodes) == {"IP/a.py": "broken", "IPX/a.py": "working", "lib/IP/a.py": "working"}
+
+
+def test_unplaceable_failures_cover_the_whole_fiefdom():
+    nodes = [CodeNode("pkg/a.py"), CodeNode("pkg/sub/b.py"), CodeNode("other/c.py"), CodeNode("setup.py")]
+    results = {
+        "pkg": HealthCheckResult(status="broken"),
+        "other": HealthCheckResult(status="working"),
+        "setup.py": {"status": "broken", "errors": [{"file": "gone.py", "line": 1, "message": "x"}]},
+    }
+
+    build_from_health_results(nodes, results)
+
+    assert statuses(nodes) == {
+        "pkg/a.py": "broken",
+        "pkg/sub/b.py": "broken",
+        "other/c.py": "working",
+        "setup.py": "broken",
+    }
+
+
+def test_nested_fiefdoms_do_not_duplicate_errors_and_keep_combat():
+    node = CodeNode("IP/plugins/p.py", status="combat")
+    error = ("IP/plugins/p.py", 1, "bad")
+
+    build_from_health_results([node], {"IP": broken(error), "IP/plugins": broken(error)})
+
+    assert node.status == "combat"
+    assert len(node.health_errors) == 1
+
+
+def test_error_list_is_capped_and_scales():
+    nodes = [CodeNode(f"d{i % 100}/m{i}.py") for i in range(20000)]
+    results = {
+        f"d{d}": broken(*[(f"d{d}/m{i}.py", n, "e") for i in range(d, 20000, 100) for n in range(2)])
+        for d in range(100)
+    }
+    results["d0"].errors.extend(ParsedError("d0/m0.py", n, message="more") for n in range(20))
+
+    build_from_health_results(nodes, results)
+
+    assert all(node.status == "broken" for node in nodes)
+    assert len(nodes[0].health_errors) == 10
+    assert len(nodes[1].health_errors) == 2
+
+
+def test_normalize_health_path():
+    assert normalize_health_path("./IP//a.py") == "IP/a.py"
+    assert normalize_health_path("IP\\plugins\\") == "IP/plugins"
+    assert normalize_health_path(".") == ""
@@ -0,0 +1,146 @@
+"""Tests for HealthWatcher's coalescing scheduler."""
+
+import asyncio
+import os
+import threading
+import time
+
+from IP.health_checker import HealthCheckResult
+from IP.health_watcher import HealthWatcher
+
+
+class RecordingChecker:
+    """Stand-in HealthChecker that records which fiefdoms were checked."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    async def check_fiefdom_async(self, fiefdom):
+        with self.lock:
+            self.calls.append(fiefdom)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            with self.lock:
+                self.running -= 1
+        return HealthCheckResult(status="working", checker_used="fake")
+
+    def close(self):
+        pass
+
+
+def make_watcher(tmp_path, delay=0.0):
+    results = []
+    watcher = HealthWatcher(str(tmp_path), results.append)
+    watcher.health_checker = RecordingChecker(delay)
+    return watcher, results
+
+
+def wait_idle(watcher, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if watcher.is_idle():
+            return
+        time.sleep(0.01)
+    raise AssertionError("watcher did not settle")
+
+
+def test_burst_is_coalesced_into_one_check_per_fiefdom(tmp_path):
+    watcher, results = make_watcher(tmp_path)
+    try:
+        for i in range(500):
+            watcher.notify(str(tmp_path / f"pkg{i % 5}" / f"mod{i}.py"))
+        watcher.notify(str(tmp_path / "setup.py"))
+        watcher.notify(str(tmp_path / "README.md"))  # Not a watched suffix
+        wait_idle(watcher)
+    finally:
+        watcher.stop_watching()
+
+    checked = watcher.health_checker.calls
+    assert sorted(checked) == ["pkg0", "pkg1", "pkg2", "pkg3", "pkg4", "setup.py"]
+    assert sorted(key for result in results for key in result) == sorted(checked)
+    # Only the scheduler thread was added, not one timer per event
+    assert threading.active_count() < 10
+
+
+def test_concurrent_checks_are_capped(tmp_path):
+    watcher, _ = make_watcher(tmp_path, delay=0.1)
+    watcher.MAX_CONCURRENT_CHECKS = 2
+    try:
+        for i in range(8):
+            watcher.notify(str(tmp_path / f"dir{i}" / "m.py"))
+        wait_idle(watcher)
+    finally:
+        watcher.stop_watching()
+
+    assert len(watcher.health_checker.calls) == 8
+    assert watcher.health_checker.max_running == 2
+
+
+def test_change_during_check_gets_a_follow_up(tmp_path):
+    watcher, _ = make_watcher(tmp_path, delay=0.3)
+    try:
+        watcher.notify(str(tmp_path / "pkg" / "a.py"))
+        deadline = time.monotonic() + 5
+        while not watcher.health_checker.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        watcher.notify(str(tmp_path / "pkg" / "b.py"))  # Check for pkg is running
+        wait_idle(watcher)
+    finally:
+        watcher.stop_watching()
+
+    assert watcher.health_checker.calls == ["pkg", "pkg"]
+    assert watcher.health_checker.max_running == 1
+
+
+def test_quiet_period_grows_with_burst_size(tmp_path):
+    watcher, _ = make_watcher(tmp_path)
+
+    watcher._burst_events = 1
+    lone = watcher._quiet_period()
+    watcher._burst_events = 200
+    burst = watcher._quiet_period()
+    watcher._burst_events = 100000
+
+    assert lone < burst < watcher._quiet_period() == watcher.MAX_DEBOUNCE_MS / 1000
+
+
+def test_moves_report_both_paths_and_outside_paths_are_ignored(tmp_path):
+    class Moved:
+        is_directory = False
+        src_path = str(tmp_path / "old" / "x.py")
+        dest_path = str(tmp_path / "new" / "x.py")
+
+    watcher, _ = make_watcher(tmp_path)
+    changes = []
+    watcher.add_change_listener(changes.append)
+    try:
+        watcher._on_file_change(Moved())
+        watcher.notify(os.path.join(os.path.dirname(str(tmp_path)), "elsewhere.py"))
+        wait_idle(watcher)
+    finally:
+        watcher.stop_watching()
+
+    assert sorted(watcher.health_checker.calls) == ["new", "old"]
+    assert sorted(changes) == [os.path.join("new", "x.py"), os.path.join("old", "x.py")]
+
+
+def test_stop_cancels_running_checks(tmp_path):
+    watcher, results = make_watcher(tmp_path, delay=30)
+    watcher.notify(str(tmp_path / "pkg" / "a.py"))
+    deadline = time.monotonic() + 5
+    while not watcher.health_checker.calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    watcher.stop_watching()
+
+    assert time.monotonic() - started < 5
+    assert results == []
+    assert watcher.is_idle()
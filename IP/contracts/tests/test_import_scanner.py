@@ -0,0 +1,122 @@
+"""Tests for the single-pass Python / JS import scanner."""
+
+import ast
+import sysconfig
+from pathlib import Path
+
+import IP
+from IP.import_scanner import extract_js_imports, extract_python_imports
+
+PYTHON_SOURCE = '''"""Module docstring.
+
+import not_a_module
+from fake import thing
+"""
+import os, sys as system
+from . import sibling
+from ..pkg.mod import (
+    first,
+    second,
+)
+from pkg \\
+    import third
+import collections.abc  # import commented_out
+
+NOTE = "import fake_in_string"
+TEMPLATE = \'\'\'
+from also_fake import x
+\'\'\'
+
+
+def lazy():
+    import json
+    try:
+        from IP.woven_maps import scan_codebase
+    except ImportError:
+        pass
+'''
+
+
+def ast_imports(source):
+    found = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            found.extend((alias.name, node.lineno) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            found.append(("." * node.level + (node.module or ""), node.lineno))
+    return sorted(found, key=lambda item: item[1])
+
+
+def test_python_scanner_matches_ast():
+    assert extract_python_imports(PYTHON_SOURCE) == ast_imports(PYTHON_SOURCE)
+
+
+def test_python_scanner_skips_strings_and_comments():
+    specifiers = [spec for spec, _ in extract_python_imports(PYTHON_SOURCE)]
+    assert specifiers == [
+        "os", "sys", ".", "..pkg.mod", "pkg", "collections.abc", "json", "IP.woven_maps"
+    ]
+
+
+def test_python_scanner_first_line_and_empty_strings():
+    source = "import a\nx = ''\nfrom b import c\n"
+    assert extract_python_imports(source) == [("a", 1), ("b", 3)]
+
+
+JS_SOURCE = """// import { fake } from './commented';
+/* require('./block-commented') */
+import React, { useState } from 'react';
+import {
+  helper,
+  other,
+} from './utils';
+import './side-effect.css';
+export { thing } from "./reexport";
+export * as ns from './namespace';
+import type { Shape } from '@/types';
+const message = "import x from './in-string'";
+const tpl = `require('./in-template')`;
+const lazy = () => import('./lazy');
+const legacy = require("./legacy");
+config.require('./not-a-require');
+"""
+
+
+def test_js_scanner_statement_forms():
+    assert extract_js_imports(JS_SOURCE) == [
+        ("react", 3),
+        ("./utils", 7),
+        ("./side-effect.css", 8),
+        ("./reexport", 9),
+        ("./namespace", 10),
+        ("@/types", 11),
+        ("./lazy", 14),
+        ("./legacy", 15),
+    ]
+
+
+def test_js_scanner_handles_unterminated_quotes_in_jsx_text():
+    source = "const a = <p>Don't stop</p>;\nimport b from './b';\n"
+    assert extract_js_imports(source) == [("./b", 2)]
+
+
+def test_backslash_newline_inside_strings():
+    source = '"""\\\nDoc.\n"""\nimport os\nx = "a\\\nb"; import sys\nif x: import json\n'
+    assert extract_python_imports(source) == ast_imports(source) == [("os", 4), ("sys", 6), ("json", 7)]
+
+    js = "const t = `a\\\nb`;\nimport x from './x';\n"
+    assert extract_js_imports(js) == [("./x", 3)]
+
+
+def test_python_scanner_matches_ast_on_stdlib_sample():
+    stdlib = Path(sysconfig.get_paths()["stdlib"])
+    checked = 0
+    for path in sorted(stdlib.glob("*.py")) + sorted(Path(IP.__file__).parent.rglob("*.py")):
+        try:
+            source = path.read_text(encoding="utf-8")
+            expected = ast_imports(source)
+        except (SyntaxError, UnicodeDecodeError, ValueError):
+            continue
+        assert sorted(extract_python_imports(source)) == sorted(expected), path
+        checked += 1
+    assert checked > 100
@@ -0,0 +1,150 @@
+"""Tests for the dependency-free inotify watcher backend."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from IP.health_watcher import HealthWatcher
+from IP.inotify_watcher import INOTIFY_AVAILABLE, InotifyWatcher
+
+pytestmark = pytest.mark.skipif(not INOTIFY_AVAILABLE, reason="inotify is Linux-only")
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+class Recorder:
+    """Collects (event_type, src_path, dest_path) tuples from the watcher thread."""
+
+    def __init__(self, root):
+        self.root = str(root)
+        self.events = []
+        self.lock = threading.Lock()
+
+    def __call__(self, event):
+        rel = lambda p: p and os.path.relpath(p, self.root)
+        with self.lock:
+            self.events.append((event.event_type, rel(event.src_path), rel(event.dest_path)))
+
+    def wait_for(self, expected, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.lock:
+                if expected in self.events:
+                    return
+            time.sleep(0.01)
+        raise AssertionError(f"{expected} not in {self.events}")
+
+
+@pytest.fixture
+def watch(tmp_path):
+    watchers = []
+
+    def start(root=tmp_path, **kwargs):
+        recorder = Recorder(root)
+        watcher = InotifyWatcher(str(root), recorder, **kwargs)
+        watcher.start()
+        watchers.append(watcher)
+        deadline = time.monotonic() + 5
+        while watcher.is_indexing() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return watcher, recorder
+
+    yield start
+    for watcher in watchers:
+        watcher.stop()
+
+
+def test_reports_modify_create_delete_and_move(tmp_path, watch):
+    write_file(tmp_path / "pkg" / "a.py", "x = 1\n")
+    _, events = watch()
+
+    write_file(tmp_path / "pkg" / "a.py", "x = 2\n")
+    events.wait_for(("modified", "pkg/a.py", None))
+    write_file(tmp_path / "pkg" / "b.py", "")
+    events.wait_for(("created", "pkg/b.py", None))
+    os.rename(tmp_path / "pkg" / "b.py", tmp_path / "pkg" / "c.py")
+    events.wait_for(("moved", "pkg/b.py", "pkg/c.py"))
+    os.remove(tmp_path / "pkg" / "c.py")
+    events.wait_for(("deleted", "pkg/c.py", None))
+
+
+def test_new_directories_are_watched_with_their_contents(tmp_path, watch):
+    _, events = watch()
+    staging = tmp_path.parent / (tmp_path.name + "-staging")
+    write_file(staging / "deep" / "m.py", "")
+
+    # A whole tree moved in: its existing files are reported, later edits too
+    os.rename(staging, tmp_path / "moved_in")
+    events.wait_for(("created", "moved_in/deep/m.py", None))
+    time.sleep(0.1)
+    write_file(tmp_path / "moved_in" / "deep" / "m.py", "y = 1\n")
+    events.wait_for(("modified", "moved_in/deep/m.py", None))
+
+    # Watches follow a renamed directory
+    os.rename(tmp_path / "moved_in", tmp_path / "renamed")
+    events.wait_for(("moved", "moved_in", "renamed"))
+    write_file(tmp_path / "renamed" / "deep" / "m.py", "y = 2\n")
+    events.wait_for(("modified", "renamed/deep/m.py", None))
+
+
+def test_skip_dirs_are_not_watched(tmp_path, watch):
+    write_file(tmp_path / "node_modules" / "lib" / "x.js", "")
+    write_file(tmp_path / "src" / "y.js", "")
+    watcher, events = watch()
+
+    write_file(tmp_path / "node_modules" / "lib" / "x.js", "1")
+    write_file(tmp_path / "src" / "y.js", "1")
+    events.wait_for(("modified", "src/y.js", None))
+
+    assert watcher.watch_count == 2  # root and src
+    assert not any("node_modules" in event[1] for event in events.events)
+
+
+def test_overflow_rescans_changed_entries_only(tmp_path, watch):
+    write_file(tmp_path / "old" / "stale.py", "")
+    write_file(tmp_path / "live" / "gone.py", "")
+    for path in ("old/stale.py", "old", "live/gone.py", "live", "."):
+        os.utime(tmp_path / path, ns=(0, 0))  # Long before the last clean read
+    watcher, events = watch()
+    watcher._synced_ns = time.time_ns()
+    # Events lost from here on
+    write_file(tmp_path / "live" / "new.py", "")
+
+    watcher._recover_from_overflow()
+
+    assert watcher.overflows == 1
+    changed = {event for event in events.events if event[0] in ("rescan", "modified")}
+    assert ("rescan", "live", None) in changed
+    assert ("modified", "live/new.py", None) in changed
+    assert not any(event[1].startswith("old") for event in changed)
+
+
+def test_health_watcher_uses_inotify_without_watchdog(tmp_path, monkeypatch):
+    monkeypatch.delenv("ORCHESTR8_INOTIFY", raising=False)
+    write_file(tmp_path / "pkg" / "a.py", "x = 1\n")
+    watcher = HealthWatcher(str(tmp_path), lambda result: None)
+    dirtied = []
+    monkeypatch.setattr(watcher, "_mark_dirty", lambda fiefdom, rel: dirtied.append(fiefdom))
+    watcher.start_watching()
+    try:
+        deadline = time.monotonic() + 5
+        while watcher._inotify.is_indexing() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        write_file(tmp_path / "pkg" / "a.py", "x = 2\n")
+        write_file(tmp_path / "__pycache__" / "a.py", "")
+        while "pkg" not in dirtied and time.monotonic() < deadline:
+            time.sleep(0.01)
+        os.remove(tmp_path / "pkg" / "a.py")
+        os.rmdir(tmp_path / "pkg")
+        while dirtied.count("pkg") < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop_watching()
+
+    # Modify, file delete, then the directory itself
+    assert dirtied == ["pkg", "pkg", "pkg"]
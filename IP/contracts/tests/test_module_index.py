@@ -0,0 +1,73 @@
+"""Tests for the fuzzy module-name index behind broken-import suggestions."""
+
+import os
+
+from IP.connection_verifier import ConnectionVerifier
+from IP.module_index import ModuleNameIndex
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def native(path):
+    return path.replace("/", os.sep)
+
+
+INDEX = ModuleNameIndex(
+    native(p)
+    for p in [
+        "IP/connection_verifier.py",
+        "IP/utils.py",
+        "tools/utils.py",
+        "IP/plugins/__init__.py",
+        "web/src/helpers.ts",
+        "web/src/stores/index.js",
+    ]
+)
+
+
+def test_exact_stem_prefers_matching_module_path():
+    suggestions = INDEX.suggest("tools.utils")
+
+    assert [s.path for s in suggestions] == [native("tools/utils.py"), native("IP/utils.py")]
+    assert suggestions[0].module == "tools.utils"
+    assert suggestions[0].score == 1.0
+
+
+def test_typos_rank_by_edit_distance():
+    (best, *_) = INDEX.suggest("IP.conection_verifer")
+
+    assert best.module == "IP.connection_verifier"
+    assert 0.8 < best.score < 1.0
+    assert INDEX.suggest("zzqqxx") == []
+
+
+def test_packages_and_js_specifiers():
+    assert INDEX.suggest("IP.plugin")[0].module == "IP.plugins"
+    assert INDEX.suggest("./stores")[0].path == native("web/src/stores/index.js")
+    assert INDEX.suggest("../helper.js", extensions={".ts"})[0].module == "web/src/helpers"
+    assert INDEX.suggest("helpers", extensions={".py"}) == []
+
+
+def test_summary_walks_project_once(tmp_path, monkeypatch):
+    write_file(tmp_path / "pkg" / "models.py", "x = 1\n")
+    write_file(tmp_path / "web" / "view.js", "import a from './modles';\nimport b from './helpr';\n")
+    write_file(tmp_path / "web" / "helper.ts", "export const a = 1;\n")
+    write_file(tmp_path / "web" / "models.js", "export default 1;\n")
+    verifier = ConnectionVerifier(str(tmp_path))
+    results = verifier.verify_project()
+
+    walks = []
+    real_walk = os.walk
+    monkeypatch.setattr(os, "walk", lambda *a, **k: walks.append(a) or real_walk(*a, **k))
+    summary = verifier.get_broken_imports_summary(results)
+
+    assert len(walks) == 1
+    assert [entry["suggestion"] for entry in summary] == [
+        f"Did you mean: {native('web/models.js')}?",
+        f"Did you mean: {native('web/helper.ts')}?",
+    ]
+    assert summary[0]["candidates"][0]["module"] == "web/models"
+    assert verifier._suggest_fix(results["web/view.js"].broken_imports[0]).startswith("Did you mean")
@@ -0,0 +1,151 @@
+"""Tests for the condensation/bitset reachability index."""
+
+import random
+from collections import deque
+
+import pytest
+
+import IP.reachability as reachability
+from IP.connection_verifier import build_connection_graph, dry_run_patchbay_rewire
+from IP.graph_core import CSRGraph
+from IP.reachability import ReachabilityIndex
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def random_graph(seed, n=120, m=260):
+    rng = random.Random(seed)
+    ids = [f"n{i}" for i in range(n)]
+    edges = {(rng.choice(ids), rng.choice(ids)) for _ in range(m)}
+    return ids, sorted(edges)
+
+
+def distances(adjacency, start):
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for child in adjacency.get(node, ()):
+            if child not in dist:
+                dist[child] = dist[node] + 1
+                queue.append(child)
+    return dist
+
+
+def adjacency_of(edges, reverse=False):
+    adjacency = {}
+    for a, b in edges:
+        if reverse:
+            a, b = b, a
+        adjacency.setdefault(a, []).append(b)
+    return adjacency
+
+
+@pytest.fixture(params=["bitsets", "bfs"])
+def index_mode(request, monkeypatch):
+    if request.param == "bfs":
+        monkeypatch.setattr(reachability, "CLOSURE_MAX_COMPONENTS", 0)
+    return request.param
+
+
+def test_queries_match_brute_force(index_mode):
+    ids, edges = random_graph(5)
+    index = ReachabilityIndex(CSRGraph.from_edges(ids, edges))
+    forward, backward = adjacency_of(edges), adjacency_of(edges, reverse=True)
+    assert (index.descendants is None) == (index_mode == "bfs")
+
+    for node in ids[:40]:
+        down = distances(forward, node)
+        up = distances(backward, node)
+        assert index.reaches(node) == set(down)
+        assert index.reached_by(node) == set(up)
+        assert index.reaches(node, max_depth=2) == {n for n, d in down.items() if d <= 2}
+        assert index.reached_by(node, max_depth=3) == {n for n, d in up.items() if d <= 3}
+        for other in ids[:20]:
+            assert index.can_reach(node, other) == (other in down)
+
+
+def test_path_edges_respect_depth(index_mode):
+    ids, edges = random_graph(8)
+    index = ReachabilityIndex(CSRGraph.from_edges(ids, edges))
+    forward, backward = adjacency_of(edges), adjacency_of(edges, reverse=True)
+
+    for source, target in [("n1", "n2"), ("n3", "n40"), ("n7", "n7"), ("n10", "n99")]:
+        from_source = distances(forward, source)
+        to_target = distances(backward, target)
+        for limit in (None, 3, 6):
+            expected = {
+                (u, v)
+                for u, v in edges
+                if u in from_source
+                and v in to_target
+                and (limit is None or from_source[u] + 1 + to_target[v] <= limit)
+            }
+            assert set(index.path_edges(source, target, max_depth=limit)) == expected
+
+
+def test_signal_path_matches_template_semantics():
+    ids, edges = random_graph(13, n=80, m=200)
+    index = ReachabilityIndex(CSRGraph.from_edges(ids, edges))
+    forward_adj, backward_adj = adjacency_of(edges), adjacency_of(edges, reverse=True)
+
+    for source, target in edges[:25]:
+        # Straight port of computeSignalPath from the Code City template
+        forward = {n for n, d in distances(forward_adj, source).items() if d <= 6}
+        backward = {n for n, d in distances(backward_adj, target).items() if d <= 6}
+        signal = {source, target} | (forward & backward)
+        expected_edges = {
+            (u, v) for u, v in edges
+            if u in forward and v in backward and u in signal and v in signal
+        } | {(source, target)}
+
+        nodes, path = index.signal_path(source, target)
+
+        assert nodes == signal
+        assert set(path) == expected_edges
+
+
+def test_connection_graph_index_tracks_changes(tmp_path):
+    write_file(tmp_path / "cli.py", "import service\n")
+    write_file(tmp_path / "service.py", "import models\n")
+    write_file(tmp_path / "models.py", "VALUE = 1\n")
+    graph = build_connection_graph(str(tmp_path))
+
+    assert graph.reachability().reaches("cli.py") == {"cli.py", "service.py", "models.py"}
+    assert graph.reachability() is graph.reachability()
+
+    write_file(tmp_path / "service.py", "VALUE = 2\n")
+    graph.apply_changes(changed=["service.py"])
+
+    assert graph.reachability().reaches("cli.py") == {"cli.py", "service.py"}
+
+
+def test_dry_run_reports_rewire_impact(tmp_path):
+    write_file(tmp_path / "cli.py", "import service\n")
+    write_file(tmp_path / "service.py", "import models\n")
+    write_file(tmp_path / "models.py", "VALUE = 1\n")
+    write_file(tmp_path / "helpers.py", "import cli\n")
+    graph = build_connection_graph(str(tmp_path))
+
+    result = dry_run_patchbay_rewire(
+        project_root=str(tmp_path),
+        source_file="service.py",
+        current_target="models.py",
+        proposed_target="helpers.py",
+        graph=graph,
+    )
+
+    assert result["canApply"] is True
+    assert result["impact"] == {
+        "dependentCount": 2,
+        "createsCycle": True,
+        "newlyReachableCount": 2,  # helpers.py, cli.py
+        "currentTargetInGraph": True,
+    }
+    assert any("import cycle" in warning for warning in result["warnings"])
+    assert dry_run_patchbay_rewire(
+        str(tmp_path), "service.py", "models.py", "helpers.py"
+    )["impact"] == {}
@@ -0,0 +1,103 @@
+"""Tests for the persistent woven_maps scan cache."""
+
+import os
+from pathlib import Path
+
+from IP.env_flags import env_flag
+from IP.scan_cache import ScanCache
+from IP.woven_maps import get_file_metrics, scan_codebase
+
+
+def write_file(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def by_path(nodes):
+    return {node.path: node for node in nodes}
+
+
+def test_warm_scan_matches_cold_scan(tmp_path):
+    write_file(tmp_path / "a.py", "def public():\n    pass\n\n# TODO: tidy\n")
+    write_file(tmp_path / "pkg/b.js", "export const x = 1;\nconsole.log(x);\n")
+
+    uncached = by_path(scan_codebase(str(tmp_path), use_cache=False))
+    cold = by_path(scan_codebase(str(tmp_path)))
+    warm = by_path(scan_codebase(str(tmp_path)))
+
+    assert (tmp_path / ".orchestr8" / "scan_cache.json").exists()
+    for path, node in uncached.items():
+        for fresh in (cold[path], warm[path]):
+            assert fresh.status == node.status
+            assert fresh.loc == node.loc
+            assert fresh.errors == node.errors
+            assert fresh.export_count == node.export_count
+            assert fresh.building_height == node.building_height
+            assert fresh.footprint == node.footprint
+
+
+def test_only_changed_files_are_reanalyzed(tmp_path):
+    write_file(tmp_path / "a.py", "def a():\n    pass\n")
+    write_file(tmp_path / "b.py", "def b():\n    pass\n")
+    scan_codebase(str(tmp_path))
+
+    write_file(tmp_path / "b.py", "def b():\n    pass\n\ndef c():\n    pass\n")
+    cache = ScanCache(str(tmp_path))
+    metrics = get_file_metrics(tmp_path, "a.py", cache=cache)
+    assert metrics == (2, 1)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    assert get_file_metrics(tmp_path, "b.py", cache=cache) == (5, 2)
+    assert cache.misses == 1
+
+
+def test_touched_but_unchanged_file_stays_cached(tmp_path):
+    target = tmp_path / "a.py"
+    write_file(target, "def a():\n    pass\n")
+    scan_codebase(str(tmp_path))
+
+    st = target.stat()
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    cache = ScanCache(str(tmp_path))
+    assert get_file_metrics(tmp_path, "a.py", cache=cache) == (2, 1)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_deleted_files_are_pruned(tmp_path):
+    write_file(tmp_path / "a.py", "A = 1\n")
+    write_file(tmp_path / "b.py", "B = 1\n")
+    scan_codebase(str(tmp_path))
+    assert len(ScanCache(str(tmp_path))) == 2
+
+    (tmp_path / "b.py").unlink()
+    scan_codebase(str(tmp_path))
+    assert len(ScanCache(str(tmp_path))) == 1
+
+
+def test_corrupt_cache_file_is_ignored(tmp_path):
+    write_file(tmp_path / "a.py", "def a():\n    pass\n")
+    write_file(tmp_path / ".orchestr8/scan_cache.json", "{not json")
+
+    nodes = scan_codebase(str(tmp_path))
+
+    assert [node.path for node in nodes] == ["a.py"]
+    assert len(ScanCache(str(tmp_path))) == 1
+
+
+def test_cache_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("ORCHESTR8_SCAN_CACHE", "0")
+    write_file(tmp_path / "a.py", "A = 1\n")
+
+    scan_codebase(str(tmp_path))
+
+    assert not (tmp_path / ".orchestr8").exists()
+
+
+def test_env_flag(monkeypatch):
+    monkeypatch.delenv("ORCHESTR8_TEST_FLAG", raising=False)
+    assert env_flag("ORCHESTR8_TEST_FLAG") is True
+    assert env_flag("ORCHESTR8_TEST_FLAG", default=False) is False
+    for value, expected in (("0", False), (" Off ", False), ("no", False), ("1", True), ("yes", True), ("", True)):
+        monkeypatch.setenv("ORCHESTR8_TEST_FLAG", value)
+        assert env_flag("ORCHESTR8_TEST_FLAG") is expected
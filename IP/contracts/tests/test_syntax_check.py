@@ -0,0 +1,58 @@
+"""Tests for the in-process batch Python syntax checker."""
+
+import pytest
+
+from IP.health_checker import HealthChecker, python_syntax_errors
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_reports_line_column_and_kind(tmp_path):
+    write_file(tmp_path / "ok.py", "x = '\\d'\n")  # SyntaxWarning only
+    write_file(tmp_path / "bad.py", "x = 1\ndef broken(:\n    pass\n")
+    write_file(tmp_path / "indent.py", "if True:\nprint(1)\n")
+
+    assert python_syntax_errors(str(tmp_path), "ok.py") == []
+    [bad] = python_syntax_errors(str(tmp_path), "bad.py")
+    assert (bad.file, bad.line, bad.column, bad.error_code) == ("bad.py", 2, 12, "SyntaxError")
+    assert bad.message.startswith("SyntaxError: ")
+    [indent] = python_syntax_errors(str(tmp_path), "indent.py")
+    assert indent.line == 2
+    assert indent.message.startswith("IndentationError: ")
+
+
+def test_catches_compile_stage_errors(tmp_path):
+    # Parses fine; only a full compile rejects it (as py_compile does)
+    write_file(tmp_path / "ret.py", "return 1\n")
+
+    [error] = python_syntax_errors(str(tmp_path), "ret.py")
+
+    assert "'return' outside function" in error.message
+
+
+def test_unreadable_and_null_byte_files(tmp_path):
+    (tmp_path / "nul.py").write_bytes(b"x = 1\x00\n")
+
+    assert python_syntax_errors(str(tmp_path), "missing.py")[0].line == 0
+    assert python_syntax_errors(str(tmp_path), "nul.py")[0].error_code == "SyntaxError"
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_batch_matches_per_file_in_order(tmp_path, executor):
+    paths = []
+    for i in range(40):
+        body = "def f(:\n" if i % 7 == 3 else f"value_{i} = {i}\n"
+        write_file(tmp_path / "pkg" / f"m{i}.py", body)
+        paths.append(f"pkg/m{i}.py")
+    checker = HealthChecker(str(tmp_path))
+
+    result = checker.check_python_syntax_batch(paths, executor=executor)
+
+    expected = [e for p in paths for e in checker.check_python_syntax(p).errors]
+    assert result.errors == expected
+    assert [e.file for e in result.errors] == [f"pkg/m{i}.py" for i in range(3, 40, 7)]
+    assert result.status == "broken"
+    assert result.checker_used == "py_compile"
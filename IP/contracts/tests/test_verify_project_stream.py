@@ -0,0 +1,76 @@
+"""Tests for streaming, pooled project verification."""
+
+import pytest
+
+from IP.connection_verifier import ConnectionVerifier, build_connection_graph
+
+
+def write_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def make_project(root, count):
+    for i in range(count):
+        write_file(root / f"pkg{i % 5}" / f"mod_{i}.py", f"import os\nfrom pkg0 import mod_{i % 3}\n")
+        write_file(root / "web" / f"view_{i}.js", "import helper from './helper';\nimport gone from './gone';\n")
+    write_file(root / "web" / "helper.js", "export default 1;\n")
+
+
+def summarize(results):
+    return {
+        path: (result.status, result.total_imports, [imp.import_statement for imp in result.broken_imports])
+        for path, result in results.items()
+    }
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_pooled_results_match_serial(tmp_path, mode):
+    make_project(tmp_path, 60)
+    verifier = ConnectionVerifier(str(tmp_path))
+
+    serial = verifier.verify_project(executor="serial")
+    pooled = verifier.verify_project(executor=mode)
+
+    assert list(pooled) == list(serial)
+    assert summarize(pooled) == summarize(serial)
+    assert serial["web/view_0.js"].broken_imports[0].import_statement == "./gone"
+
+
+def test_iter_verify_project_streams_with_progress(tmp_path):
+    make_project(tmp_path, 30)
+    verifier = ConnectionVerifier(str(tmp_path))
+    updates = []
+
+    stream = verifier.iter_verify_project(executor="thread", max_workers=2, progress=updates.append)
+    first = next(stream)
+    rest = list(stream)
+
+    assert len({first.file_path, *(r.file_path for r in rest)}) == 61
+    assert [u.completed for u in updates] == sorted(u.completed for u in updates)
+    assert updates[-1].completed == updates[-1].total == 61
+    assert updates[-1].fraction == 1.0
+    assert updates[-1].files_per_second > 0
+
+
+def test_serial_stream_reports_every_file(tmp_path):
+    make_project(tmp_path, 3)
+    updates = []
+
+    paths = [r.file_path for r in ConnectionVerifier(str(tmp_path)).iter_verify_project(progress=updates.append)]
+
+    assert [u.completed for u in updates] == list(range(1, len(paths) + 1))
+
+
+def test_file_cap_is_opt_in(tmp_path, monkeypatch):
+    make_project(tmp_path, 80)
+    verifier = ConnectionVerifier(str(tmp_path))
+
+    monkeypatch.delenv("ORCHESTR8_CONN_MAX_FILES", raising=False)
+    assert len(verifier.project_files()) == 161
+    assert len(build_connection_graph(str(tmp_path), executor="serial").nodes) == 161
+
+    monkeypatch.setenv("ORCHESTR8_CONN_MAX_FILES", "120")
+    assert len(verifier.project_files()) == 120
+    monkeypatch.setenv("ORCHESTR8_CONN_MAX_FILES", "5")
+    assert len(verifier.project_files()) == 100
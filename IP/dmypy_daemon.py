@@ -0,0 +1,163 @@
+# IP/dmypy_daemon.py
+"""
+dmypy Daemon - Supervised mypy daemon per project root.
+
+A cold `mypy <target>` re-analyses the whole import graph on every check.
+The mypy daemon keeps that state in memory, so `dmypy check` after a
+one-file edit only re-checks what the edit can affect (typically well under
+a second once warm).
+
+DmypySupervisor owns one daemon per project root:
+
+- ensure_running() starts it on first use (replacing any leftover daemon,
+  whose flags are unknown) and restarts it when a mypy config file changes
+- restart() is called by HealthChecker when a check fails in a way only a
+  dead daemon produces (connection refused, crashed server)
+- stop() shuts it down; an idle daemon also exits after DMYPY_IDLE_TIMEOUT
+
+Status file: <project_root>/.orchestr8/dmypy.json
+Disable with ORCHESTR8_DMYPY=0 (HealthChecker then runs plain mypy).
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from IP.env_flags import env_flag
+except ImportError:
+    # Fallback for standalone use
+    from env_flags import env_flag
+
+DMYPY_STATUS_FILENAME = "dmypy.json"
+
+# Server-side mypy flags, kept in line with HealthChecker.check_mypy
+DMYPY_FLAGS = ("--show-column-numbers", "--no-error-summary")
+
+# Seconds of inactivity before the daemon shuts itself down
+DMYPY_IDLE_TIMEOUT = 3600
+
+# Client calls that only talk to the daemon (start/stop/kill), in seconds
+DMYPY_CONTROL_TIMEOUT = 60
+
+# Files whose edits change the daemon's options
+MYPY_CONFIG_FILES = ("mypy.ini", ".mypy.ini", "pyproject.toml", "setup.cfg")
+
+
+def dmypy_enabled() -> bool:
+    """The daemon is used unless ORCHESTR8_DMYPY is set to a falsy value."""
+    return env_flag("ORCHESTR8_DMYPY")
+
+
+def dmypy_available() -> bool:
+    return dmypy_enabled() and shutil.which("dmypy") is not None
+
+
+class DmypySupervisor:
+    """Starts, restarts and stops the mypy daemon for one project root."""
+
+    def __init__(self, project_root: str, status_file: Optional[str] = None):
+        self.project_root = Path(project_root).resolve()
+        self.status_file = (
+            Path(status_file)
+            if status_file
+            else self.project_root / ".orchestr8" / DMYPY_STATUS_FILENAME
+        )
+        self.restarts = 0
+        self._lock = threading.Lock()
+        # Config the running daemon was started with; None = not started by us
+        self._started_config: Optional[Tuple] = None
+
+    def config_signature(self) -> Tuple:
+        """(name, mtime_ns, size) of each mypy config file present."""
+        signature = []
+        for name in MYPY_CONFIG_FILES:
+            try:
+                st = os.stat(self.project_root / name)
+            except OSError:
+                continue
+            signature.append((name, st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    def _client(self, *args: str) -> Optional[subprocess.CompletedProcess]:
+        try:
+            return subprocess.run(
+                ["dmypy", "--status-file", str(self.status_file), *args],
+                cwd=str(self.project_root),
+                capture_output=True,
+                text=True,
+                timeout=DMYPY_CONTROL_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+
+    def check_command(self, targets: List[str]) -> List[str]:
+        """argv for an incremental check of targets (files or directories)."""
+        return ["dmypy", "--status-file", str(self.status_file), "check", *targets]
+
+    def _discard_locked(self) -> None:
+        """Kill whatever daemon the status file points at and forget it."""
+        if self.status_file.exists():
+            stopped = self._client("stop")
+            if stopped is None or stopped.returncode != 0:
+                self._client("kill")
+            try:
+                self.status_file.unlink()
+            except OSError:
+                pass
+        self._started_config = None
+
+    def _start_locked(self) -> bool:
+        self._discard_locked()
+        try:
+            self.status_file.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return False
+        config = self.config_signature()
+        started = self._client(
+            "start", "--timeout", str(DMYPY_IDLE_TIMEOUT), "--", *DMYPY_FLAGS
+        )
+        if started is None or started.returncode != 0:
+            return False
+        self._started_config = config
+        return True
+
+    def ensure_running(self) -> bool:
+        """Start or refresh the daemon as needed; False if it cannot run."""
+        with self._lock:
+            if (
+                self._started_config is not None
+                and self._started_config == self.config_signature()
+                and self.status_file.exists()
+            ):
+                return True
+            if self._started_config is not None:
+                self.restarts += 1
+            return self._start_locked()
+
+    def restart(self) -> bool:
+        """Replace a daemon that stopped answering."""
+        with self._lock:
+            self.restarts += 1
+            return self._start_locked()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._discard_locked()
+
+
+_SUPERVISORS: Dict[Path, DmypySupervisor] = {}
+_SUPERVISORS_LOCK = threading.Lock()
+
+
+def supervisor_for(project_root: str) -> DmypySupervisor:
+    """Shared supervisor for project_root, so checkers never race two daemons."""
+    root = Path(project_root).resolve()
+    with _SUPERVISORS_LOCK:
+        supervisor = _SUPERVISORS.get(root)
+        if supervisor is None:
+            supervisor = _SUPERVISORS[root] = DmypySupervisor(str(root))
+        return supervisor
@@ -0,0 +1,19 @@
+# IP/env_flags.py
+"""
+Env Flags - ORCHESTR8_* on/off switches.
+
+    env_flag("ORCHESTR8_SCAN_CACHE")          # on unless 0/false/no/off
+    env_flag("ORCHESTR8_X", default=False)    # off unless set to anything else
+"""
+
+import os
+
+FALSY_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def env_flag(name: str, default: bool = True) -> bool:
+    """Value of a boolean env switch; unset or blank gives default."""
+    raw = os.getenv(name, "").strip().lower()
+    if not raw:
+        return default
+    return raw not in FALSY_VALUES
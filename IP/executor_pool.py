@@ -0,0 +1,229 @@
+# IP/executor_pool.py
+"""
+Executor Pool - Pluggable serial / thread / process fan-out for per-file work.
+
+Used by Code City scans to spread file analysis across cores. Work is split
+into chunks, each chunk is handed to a worker, and results are merged back in
+input order so callers get deterministic output regardless of scheduling.
+
+Mode selection (auto):
+- serial  : small batches, where pool start-up would dominate
+- thread  : medium batches (overlaps file I/O, cheap to start)
+- process : large batches (CPU-bound ast.parse / regex work scales with cores)
+
+Pure-compute batches (cpu_bound=True, e.g. building geometry) skip the
+thread tier: threads only help when workers wait on I/O.
+
+Callers that want results as they finish (progress bars, streaming views)
+use iter_parallel_map, which yields each chunk on completion instead.
+
+Override with ORCHESTR8_EXECUTOR=serial|thread|process|auto.
+"""
+
+import math
+import os
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from enum import Enum
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Auto-selection thresholds (item counts)
+THREAD_MIN_ITEMS = 256
+PROCESS_MIN_ITEMS = 2048
+
+# Chunks per worker - enough to balance uneven files without IPC overhead.
+CHUNKS_PER_WORKER = 4
+
+
+class ExecutorMode(Enum):
+    """How a batch of work is executed."""
+    SERIAL = "serial"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+def default_worker_count() -> int:
+    """Usable CPU count for this process."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, os.cpu_count() or 1)
+
+
+def resolve_executor_mode(
+    item_count: int,
+    mode: Union[ExecutorMode, str, None] = None,
+    cpu_bound: bool = False,
+) -> ExecutorMode:
+    """
+    Pick an executor mode for a batch.
+
+    Args:
+        item_count: Number of items in the batch
+        mode: Explicit mode (enum or name); None/"auto" consults
+            ORCHESTR8_EXECUTOR and then the size thresholds
+        cpu_bound: Auto-select process instead of thread for medium batches
+    """
+    if isinstance(mode, ExecutorMode):
+        return mode
+
+    requested = (mode or os.getenv("ORCHESTR8_EXECUTOR", "auto")).strip().lower()
+    if requested and requested != "auto":
+        try:
+            return ExecutorMode(requested)
+        except ValueError:
+            pass  # Unknown name - fall through to auto
+
+    if item_count < THREAD_MIN_ITEMS or default_worker_count() == 1:
+        return ExecutorMode.SERIAL
+    if item_count < PROCESS_MIN_ITEMS and not cpu_bound:
+        return ExecutorMode.THREAD
+    return ExecutorMode.PROCESS
+
+
+def chunked(items: Sequence[T], chunk_size: int) -> List[List[T]]:
+    """Split items into consecutive chunks of at most chunk_size."""
+    size = max(1, chunk_size)
+    return [list(items[i:i + size]) for i in range(0, len(items), size)]
+
+
+def _make_executor(mode: ExecutorMode, workers: int) -> Executor:
+    if mode == ExecutorMode.PROCESS:
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def _start_pool(mode: ExecutorMode, workers: int) -> Optional[Executor]:
+    """A pool for mode, or None where the platform cannot provide one."""
+    try:
+        return _make_executor(mode, workers)
+    except (OSError, NotImplementedError):
+        return None
+
+
+def _submit_all(
+    pool: Executor, chunk_func: Callable[[List[T]], List[R]], chunks: List[List[T]]
+) -> Dict[int, "Future[List[R]]"]:
+    """
+    Submit every chunk, keyed by chunk index; {} if workers cannot start.
+
+    Process workers are spawned on submit, so a sandbox that forbids them
+    fails here rather than in the executor constructor.
+    """
+    futures: Dict[int, "Future[List[R]]"] = {}
+    try:
+        for index, chunk in enumerate(chunks):
+            futures[index] = pool.submit(chunk_func, chunk)
+    except (OSError, NotImplementedError, BrokenExecutor):
+        pool.shutdown(wait=False, cancel_futures=True)
+        return {}
+    return futures
+
+
+def parallel_map(
+    chunk_func: Callable[[List[T]], List[R]],
+    items: Sequence[T],
+    mode: Union[ExecutorMode, str, None] = None,
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    cpu_bound: bool = False,
+) -> List[R]:
+    """
+    Apply chunk_func to chunks of items and return the flattened results.
+
+    chunk_func receives a list of items and must return one result per item.
+    For process mode it must be picklable (module-level function or a
+    functools.partial of one). Output order always matches input order.
+
+    If a process pool cannot be started (restricted sandbox, missing
+    semaphores) or breaks (a worker died), the batch falls back to serial
+    execution. Exceptions raised by chunk_func propagate.
+    """
+    if not items:
+        return []
+
+    resolved = resolve_executor_mode(len(items), mode, cpu_bound)
+    if resolved == ExecutorMode.SERIAL:
+        return list(chunk_func(list(items)))
+
+    workers = max_workers or default_worker_count()
+    size = chunk_size or max(
+        1, math.ceil(len(items) / (workers * CHUNKS_PER_WORKER))
+    )
+    chunks = chunked(items, size)
+
+    pool = _start_pool(resolved, min(workers, len(chunks)))
+    if pool is None:
+        return list(chunk_func(list(items)))
+    chunk_results: Optional[List[List[R]]] = None
+    with pool:
+        futures = _submit_all(pool, chunk_func, chunks)
+        if futures:
+            try:
+                chunk_results = [future.result() for future in futures.values()]
+            except BrokenExecutor:
+                pass  # A worker died; redo the batch here
+    if chunk_results is None:
+        return list(chunk_func(list(items)))
+
+    merged: List[R] = []
+    for result in chunk_results:
+        merged.extend(result)
+    return merged
+
+
+def iter_parallel_map(
+    chunk_func: Callable[[List[T]], List[R]],
+    items: Sequence[T],
+    mode: Union[ExecutorMode, str, None] = None,
+    chunk_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    cpu_bound: bool = False,
+) -> Iterator[Tuple[List[T], List[R]]]:
+    """
+    Like parallel_map, but yield (chunk, results) pairs as chunks complete.
+
+    Chunks arrive in completion order, not input order. Serial mode runs the
+    chunks one after another in this process, so consumers still see
+    incremental progress. If the pool breaks, chunks that have not been
+    yielded yet are finished serially.
+    """
+    if not items:
+        return
+
+    resolved = resolve_executor_mode(len(items), mode, cpu_bound)
+    workers = max_workers or default_worker_count()
+    size = chunk_size or max(
+        1, math.ceil(len(items) / (workers * CHUNKS_PER_WORKER))
+    )
+    chunks = chunked(items, size)
+
+    if resolved == ExecutorMode.SERIAL:
+        for chunk in chunks:
+            yield chunk, list(chunk_func(chunk))
+        return
+
+    pending = dict(enumerate(chunks))
+    pool = _start_pool(resolved, min(workers, len(chunks)))
+    if pool is not None:
+        with pool:
+            futures = _submit_all(pool, chunk_func, chunks)
+            indexes = {future: index for index, future in futures.items()}
+            try:
+                for future in as_completed(indexes):
+                    results = list(future.result())
+                    yield pending.pop(indexes[future]), results
+            except BrokenExecutor:
+                pass  # A worker died; finish the unyielded chunks here
+
+    for chunk in pending.values():
+        yield chunk, list(chunk_func(chunk))
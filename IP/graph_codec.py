@@ -0,0 +1,208 @@
+# IP/graph_codec.py
+"""
+Graph Codec - Columnar encoding for Code City graph payloads.
+
+GraphData.to_dict() emits one camelCase object per node and per edge, and
+every edge repeats its full source/target path strings. Once that JSON is
+HTML-escaped into an iframe srcdoc, each quote costs six bytes. The columnar
+form stores the same graph as:
+
+    strings   path table: node ids first, then edge endpoints that are not
+              nodes (unresolved imports)
+    nodes     typed columns (x, y, centrality, ... as base64 little-endian
+              Float32 / unsigned int buffers), enum columns (status,
+              nodeType) as codes into a small value list, sparse error lists
+    edges     source/target indices into the string table, line numbers,
+              flags (resolved, bidirectional)
+
+Every column is {"type": "f32"|"u8"|"u16"|"u32", "data": base64}; integer
+columns use the narrowest type that fits their maximum.
+
+The template decodes the buffers straight into typed arrays
+(decodeGraphPayload in woven_maps.py). decode_columnar() below is the Python
+mirror used by tests and tooling.
+
+Toggle with ORCHESTR8_CODE_CITY_ENCODING=json|columnar (default json).
+"""
+
+import base64
+import os
+import sys
+from array import array
+from typing import Any, Dict, List
+
+COLUMNAR_FORMAT = "orchestr8-columnar/1"
+
+# Column names match CodeNode.to_dict() keys
+FLOAT_COLUMNS = ("x", "y", "centrality", "buildingHeight", "footprint")
+INT_COLUMNS = ("loc", "depth", "incomingCount", "outgoingCount", "exportCount")
+ENUM_COLUMNS = (("status", "working"), ("nodeType", "file"))  # (name, default)
+SPARSE_COLUMNS = ("errors", "healthErrors")
+
+EDGE_RESOLVED = 1
+EDGE_BIDIRECTIONAL = 2
+
+# Typed-array name -> array typecode (fixed item sizes on this platform)
+_TYPECODES = {
+    "f32": "f",
+    "u8": "B",
+    "u16": "H",
+    "u32": "I" if array("I").itemsize == 4 else "L",
+}
+
+
+def graph_encoding() -> str:
+    """Graph payload encoding from ORCHESTR8_CODE_CITY_ENCODING: json (default) or columnar."""
+    mode = os.getenv("ORCHESTR8_CODE_CITY_ENCODING", "json").strip().lower()
+    return mode if mode in {"json", "columnar"} else "json"
+
+
+def _pack(kind: str, values) -> Dict[str, str]:
+    """{"type", "data"} column: base64 of a little-endian typed buffer."""
+    buffer = array(_TYPECODES[kind], values)
+    if sys.byteorder == "big":
+        buffer.byteswap()
+    return {"type": kind, "data": base64.b64encode(buffer.tobytes()).decode("ascii")}
+
+
+def _pack_uint(values: List[int]) -> Dict[str, str]:
+    """Pack non-negative ints in the narrowest of u8/u16/u32."""
+    top = max(values, default=0)
+    kind = "u8" if top < 1 << 8 else "u16" if top < 1 << 16 else "u32"
+    return _pack(kind, values)
+
+
+def _unpack(column: Dict[str, str]) -> array:
+    buffer = array(_TYPECODES[column["type"]])
+    buffer.frombytes(base64.b64decode(column["data"]))
+    if sys.byteorder == "big":
+        buffer.byteswap()
+    return buffer
+
+
+def encode_columnar(graph_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Encode GraphData.to_dict() output (or a stream chunk) column-wise.
+
+    Keys other than nodes/edges (config, chunk key) pass through unchanged.
+    """
+    nodes = graph_dict.get("nodes", [])
+    edges = graph_dict.get("edges", [])
+
+    strings: List[str] = [node["id"] for node in nodes]
+    index_of: Dict[str, int] = {path: i for i, path in enumerate(strings)}
+
+    def intern(path: str) -> int:
+        index = index_of.get(path)
+        if index is None:
+            index = index_of[path] = len(strings)
+            strings.append(path)
+        return index
+
+    node_columns: Dict[str, Any] = {}
+    for key in FLOAT_COLUMNS:
+        node_columns[key] = _pack("f32", [float(node.get(key) or 0.0) for node in nodes])
+    for key in INT_COLUMNS:
+        node_columns[key] = _pack_uint([max(0, int(node.get(key) or 0)) for node in nodes])
+    node_columns["inCycle"] = _pack("u8", [1 if node.get("inCycle") else 0 for node in nodes])
+
+    for key, default in ENUM_COLUMNS:
+        values: List[str] = []
+        code_of: Dict[str, int] = {}
+        codes = []
+        for node in nodes:
+            value = node.get(key) or default
+            code = code_of.get(value)
+            if code is None:
+                code = code_of[value] = len(values)
+                values.append(value)
+            codes.append(code)
+        node_columns[key] = {"values": values, "codes": _pack_uint(codes)}
+
+    for key in SPARSE_COLUMNS:
+        node_columns[key] = [[i, node[key]] for i, node in enumerate(nodes) if node.get(key)]
+
+    sources = [intern(edge["source"]) for edge in edges]
+    targets = [intern(edge["target"]) for edge in edges]
+    flags = [
+        (EDGE_RESOLVED if edge.get("resolved", True) else 0)
+        | (EDGE_BIDIRECTIONAL if edge.get("bidirectional") else 0)
+        for edge in edges
+    ]
+
+    payload = {k: v for k, v in graph_dict.items() if k not in ("nodes", "edges")}
+    payload.update(
+        {
+            "format": COLUMNAR_FORMAT,
+            "strings": strings,
+            "nodeCount": len(nodes),
+            "edgeCount": len(edges),
+            "nodeColumns": node_columns,
+            "edgeColumns": {
+                "source": _pack_uint(sources),
+                "target": _pack_uint(targets),
+                "lineNumber": _pack_uint(
+                    [max(0, int(edge.get("lineNumber") or 0)) for edge in edges]
+                ),
+                "flags": _pack("u8", flags),
+            },
+        }
+    )
+    return payload
+
+
+def decode_columnar(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of encode_columnar(): rebuild to_dict()-shaped nodes and edges."""
+    if payload.get("format") != COLUMNAR_FORMAT:
+        return payload
+
+    strings = payload["strings"]
+    count = payload["nodeCount"]
+    node_columns = payload["nodeColumns"]
+    edge_columns = payload["edgeColumns"]
+
+    columns: Dict[str, Any] = {}
+    for key in FLOAT_COLUMNS + INT_COLUMNS:
+        columns[key] = _unpack(node_columns[key])
+    in_cycle = _unpack(node_columns["inCycle"])
+    enums = {
+        key: (node_columns[key]["values"], _unpack(node_columns[key]["codes"]))
+        for key, _ in ENUM_COLUMNS
+    }
+    sparse = {key: dict((i, value) for i, value in node_columns[key]) for key in SPARSE_COLUMNS}
+
+    nodes = []
+    for i in range(count):
+        node: Dict[str, Any] = {"id": strings[i], "path": strings[i]}
+        for key, (values, codes) in enums.items():
+            node[key] = values[codes[i]]
+        for key, column in columns.items():
+            node[key] = column[i]
+        node["inCycle"] = bool(in_cycle[i])
+        for key in SPARSE_COLUMNS:
+            node[key] = sparse[key].get(i, [])
+        nodes.append(node)
+
+    sources = _unpack(edge_columns["source"])
+    targets = _unpack(edge_columns["target"])
+    lines = _unpack(edge_columns["lineNumber"])
+    flags = _unpack(edge_columns["flags"])
+    edges = [
+        {
+            "source": strings[sources[i]],
+            "target": strings[targets[i]],
+            "resolved": bool(flags[i] & EDGE_RESOLVED),
+            "bidirectional": bool(flags[i] & EDGE_BIDIRECTIONAL),
+            "lineNumber": lines[i],
+        }
+        for i in range(payload["edgeCount"])
+    ]
+
+    graph = {
+        k: v
+        for k, v in payload.items()
+        if k not in ("format", "strings", "nodeCount", "edgeCount", "nodeColumns", "edgeColumns")
+    }
+    graph["nodes"] = nodes
+    graph["edges"] = edges
+    return graph
@@ -0,0 +1,218 @@
+# IP/graph_core.py
+"""
+Graph Core - Dependency-free directed graph algorithms on CSR arrays.
+
+ConnectionGraph metrics used to come from a NetworkX DiGraph of string
+nodes (and silently dropped to zero when NetworkX was missing). CSRGraph
+maps node ids to ints once and stores adjacency as compressed sparse rows
+in stdlib `array`s:
+
+    offsets[i] .. offsets[i + 1]   slice of targets holding i's successors
+
+Algorithms work on those int arrays:
+
+- strongly_connected_components: iterative Tarjan, O(V + E)
+- pagerank: power iteration with the same update, dangling handling and
+  stopping rule as networkx.pagerank (alpha 0.85, tol 1e-6, 100 iterations)
+- bfs_depths: one multi-source BFS from all entry points, O(V + E)
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Signed 64-bit where available (node/edge indices, -1 = unset)
+_INDEX = "q"
+
+
+class CSRGraph:
+    """Directed graph with int-indexed nodes and CSR successor lists."""
+
+    __slots__ = ("ids", "index", "offsets", "targets")
+
+    def __init__(self, ids: List[str], offsets: array, targets: array):
+        self.ids = ids
+        self.index: Dict[str, int] = {node_id: i for i, node_id in enumerate(ids)}
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_edges(
+        cls, node_ids: Iterable[str], edges: Iterable[Tuple[str, str]]
+    ) -> "CSRGraph":
+        """
+        Build from node ids and (source, target) pairs.
+
+        Duplicate edges collapse to one and edges touching unknown nodes are
+        dropped, matching a DiGraph built from the same inputs.
+        """
+        ids = list(dict.fromkeys(node_ids))
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        successors: List[Dict[int, None]] = [{} for _ in ids]
+        for source, target in edges:
+            s = index.get(source)
+            t = index.get(target)
+            if s is not None and t is not None:
+                successors[s][t] = None
+
+        offsets = array(_INDEX, [0]) * (len(ids) + 1)
+        targets = array(_INDEX)
+        for i, row in enumerate(successors):
+            targets.extend(row)
+            offsets[i + 1] = len(targets)
+        return cls(ids, offsets, targets)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def successors(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def out_degrees(self) -> List[int]:
+        offsets = self.offsets
+        return [offsets[i + 1] - offsets[i] for i in range(len(self.ids))]
+
+    def in_degrees(self) -> List[int]:
+        degrees = [0] * len(self.ids)
+        for target in self.targets:
+            degrees[target] += 1
+        return degrees
+
+    def reverse(self) -> "CSRGraph":
+        """Graph with every edge flipped (CSR of predecessors)."""
+        n = len(self.ids)
+        counts = self.in_degrees()
+        offsets = array(_INDEX, [0]) * (n + 1)
+        for i in range(n):
+            offsets[i + 1] = offsets[i] + counts[i]
+        cursor = list(offsets[:n])
+        targets = array(_INDEX, [0]) * len(self.targets)
+        for source in range(n):
+            for k in range(self.offsets[source], self.offsets[source + 1]):
+                target = self.targets[k]
+                targets[cursor[target]] = source
+                cursor[target] += 1
+        return CSRGraph(self.ids, offsets, targets)
+
+
+def strongly_connected_components(graph: CSRGraph) -> List[List[int]]:
+    """Iterative Tarjan SCC; components come out in reverse topological order."""
+    n = len(graph)
+    offsets, targets = graph.offsets, graph.targets
+    index = [-1] * n
+    lowlink = [0] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for start in range(n):
+        if index[start] != -1:
+            continue
+        index[start] = lowlink[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack[start] = True
+        # Work stack of (node, next edge position)
+        work = [(start, offsets[start])]
+        while work:
+            node, edge = work[-1]
+            end = offsets[node + 1]
+            while edge < end:
+                child = targets[edge]
+                edge += 1
+                if index[child] == -1:
+                    work[-1] = (node, edge)
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, offsets[child]))
+                    break
+                if on_stack[child] and index[child] < lowlink[node]:
+                    lowlink[node] = index[child]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def pagerank(
+    graph: CSRGraph,
+    alpha: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1.0e-6,
+) -> Optional[List[float]]:
+    """
+    PageRank scores indexed like graph.ids (sum to 1).
+
+    Uniform teleport and uniform redistribution of dangling mass, stopping
+    when the L1 change drops below n * tol, exactly as networkx.pagerank
+    does. Returns None if max_iter is reached first (networkx raises).
+    """
+    n = len(graph)
+    if n == 0:
+        return []
+
+    out_degree = graph.out_degrees()
+    inverse_out = [1.0 / d if d else 0.0 for d in out_degree]
+    dangling = [i for i in range(n) if not out_degree[i]]
+    reverse = graph.reverse()
+    pred_offsets, preds = reverse.offsets, reverse.targets
+    spans = [(pred_offsets[v], pred_offsets[v + 1]) for v in range(n)]
+
+    x = [1.0 / n] * n
+    teleport = (1.0 - alpha) / n
+    for _ in range(max_iter):
+        share = [x[u] * inverse_out[u] for u in range(n)]
+        dangling_share = alpha * sum(x[u] for u in dangling) / n
+        base = teleport + dangling_share
+        x_next = [
+            base + alpha * sum(map(share.__getitem__, preds[lo:hi])) if hi > lo else base
+            for lo, hi in spans
+        ]
+        error = sum(abs(a - b) for a, b in zip(x_next, x))
+        x = x_next
+        if error < n * tol:
+            total = sum(x)
+            return [value / total for value in x]
+    return None
+
+
+def bfs_depths(graph: CSRGraph, sources: Sequence[int]) -> List[int]:
+    """Hop distance from the nearest source (sources are 0, unreachable -1)."""
+    offsets, targets = graph.offsets, graph.targets
+    depth = [-1] * len(graph)
+    frontier = []
+    for source in sources:
+        if depth[source] == -1:
+            depth[source] = 0
+            frontier.append(source)
+
+    level = 0
+    while frontier:
+        level += 1
+        next_frontier = []
+        for node in frontier:
+            for k in range(offsets[node], offsets[node + 1]):
+                child = targets[k]
+                if depth[child] == -1:
+                    depth[child] = level
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return depth
@@ -0,0 +1,450 @@
+# IP/graph_snapshot.py
+"""
+Graph Snapshot - Persistent ConnectionGraph store for warm Code City startup.
+
+A fully analysed ConnectionGraph (verification results, nodes with metrics,
+edges, PageRank scale) is written to a versioned SQLite file together with
+each file's stat and content hash as they were when it was verified. On the
+next session the snapshot is loaded, validated against the current tree
+and brought up to date with ConnectionGraph.apply_changes(), so only files
+that changed since the last session are re-verified:
+
+- stat match (mtime_ns + size): file is trusted without being read
+- stat mismatch, same content hash: trusted, stored stat refreshed
+- otherwise: changed; files missing from either side are added/deleted
+
+Snapshot file: <project_root>/.orchestr8/connection_graph.sqlite
+Disable with ORCHESTR8_GRAPH_SNAPSHOT=0.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    from IP.connection_verifier import (
+        DEFAULT_EXCLUDED_DIRS,
+        ConnectionGraph,
+        ConnectionMetrics,
+        ConnectionVerifier,
+        FileConnectionResult,
+        GraphEdge,
+        GraphNode,
+        ImportResult,
+        IssueSeverity,
+        NodeType,
+        build_connection_graph,
+    )
+    from IP.env_flags import env_flag
+    from IP.scan_cache import content_digest
+except ImportError:
+    # Fallback for standalone use
+    from connection_verifier import (
+        DEFAULT_EXCLUDED_DIRS,
+        ConnectionGraph,
+        ConnectionMetrics,
+        ConnectionVerifier,
+        FileConnectionResult,
+        GraphEdge,
+        GraphNode,
+        ImportResult,
+        IssueSeverity,
+        NodeType,
+        build_connection_graph,
+    )
+    from env_flags import env_flag
+    from scan_cache import content_digest
+
+# Bump when the schema or verifier/metric semantics change; older
+# snapshots are then ignored and rebuilt.
+GRAPH_SNAPSHOT_VERSION = 1
+GRAPH_SNAPSHOT_FILENAME = "connection_graph.sqlite"
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha TEXT NOT NULL,
+    result TEXT NOT NULL
+);
+CREATE TABLE nodes (
+    path TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    node_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    incoming_count INTEGER NOT NULL,
+    max_severity TEXT,
+    centrality REAL NOT NULL,
+    in_cycle INTEGER NOT NULL,
+    depth INTEGER NOT NULL
+);
+CREATE TABLE edges (
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    edge_type TEXT NOT NULL,
+    resolved INTEGER NOT NULL,
+    line_number INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    bidirectional INTEGER NOT NULL
+);
+"""
+
+# ImportResult fields after source_file, in declaration order (part of the
+# snapshot version)
+_IMPORT_FIELDS = (
+    "import_statement",
+    "target_module",
+    "resolved_path",
+    "is_resolved",
+    "is_stdlib",
+    "is_external",
+    "line_number",
+)
+
+
+def graph_snapshot_enabled() -> bool:
+    """Snapshots are on unless ORCHESTR8_GRAPH_SNAPSHOT is set to a falsy value."""
+    return env_flag("ORCHESTR8_GRAPH_SNAPSHOT")
+
+
+def _encode_result(result: FileConnectionResult) -> str:
+    def rows(imports: List[ImportResult]) -> List[list]:
+        return [[getattr(imp, name) for name in _IMPORT_FIELDS] for imp in imports]
+
+    return json.dumps(
+        [
+            result.total_imports,
+            result.resolved_imports,
+            result.status,
+            rows(result.broken_imports),
+            rows(result.external_imports),
+            rows(result.local_imports),
+        ],
+        separators=(",", ":"),
+    )
+
+
+def _decode_result(path: str, payload: str) -> FileConnectionResult:
+    total, resolved, status, broken, external, local = json.loads(payload)
+
+    def imports(rows: List[list]) -> List[ImportResult]:
+        # Positional: _IMPORT_FIELDS follows ImportResult's field order
+        return [ImportResult(path, *row) for row in rows]
+
+    return FileConnectionResult(
+        file_path=path,
+        total_imports=total,
+        resolved_imports=resolved,
+        broken_imports=imports(broken),
+        external_imports=imports(external),
+        local_imports=imports(local),
+        status=status,
+    )
+
+
+class GraphSnapshotStore:
+    """SQLite snapshot of one project's ConnectionGraph."""
+
+    def __init__(self, project_root: str, snapshot_path: Optional[str] = None):
+        self.project_root = Path(project_root).resolve()
+        self.snapshot_path = (
+            Path(snapshot_path)
+            if snapshot_path
+            else self.project_root / ".orchestr8" / GRAPH_SNAPSHOT_FILENAME
+        )
+        # path -> (mtime_ns, size, sha) as of the last load/save
+        self.signatures: Dict[str, Tuple[int, int, str]] = {}
+
+    def load(self, verifier: Optional[ConnectionVerifier] = None) -> Optional[ConnectionGraph]:
+        """
+        Rebuild the stored graph without touching source files.
+
+        Returns None when there is no snapshot, or it is corrupt, from another
+        version or for another project root.
+        """
+        if not self.snapshot_path.is_file():
+            return None
+        try:
+            conn = sqlite3.connect(f"{self.snapshot_path.as_uri()}?mode=ro", uri=True)
+        except sqlite3.Error:
+            return None
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+            if (
+                meta.get("version") != str(GRAPH_SNAPSHOT_VERSION)
+                or meta.get("project_root") != str(self.project_root)
+            ):
+                return None
+            files = conn.execute(
+                "SELECT path, mtime_ns, size, sha, result FROM files ORDER BY rowid"
+            ).fetchall()
+            nodes = conn.execute(
+                "SELECT path, label, node_type, status, incoming_count, max_severity,"
+                " centrality, in_cycle, depth FROM nodes"
+            ).fetchall()
+            edges = conn.execute(
+                "SELECT source, target, edge_type, resolved, line_number, weight, bidirectional"
+                " FROM edges ORDER BY rowid"
+            ).fetchall()
+        except sqlite3.Error:
+            return None
+        finally:
+            conn.close()
+
+        graph = ConnectionGraph(verifier or ConnectionVerifier(str(self.project_root)))
+        signatures = {}
+        try:
+            for path, mtime_ns, size, sha, payload in files:
+                graph.results[path] = _decode_result(path, payload)
+                signatures[path] = (mtime_ns, size, sha)
+
+            for (
+                path, label, node_type, status, incoming, severity, centrality, in_cycle, depth
+            ) in nodes:
+                result = graph.results[path]
+                outgoing = result.total_imports
+                graph.nodes[path] = GraphNode(
+                    id=path,
+                    label=label,
+                    file_path=path,
+                    node_type=NodeType(node_type),
+                    status=status,
+                    metrics=ConnectionMetrics(
+                        connection_count=incoming + outgoing,
+                        incoming_count=incoming,
+                        outgoing_count=outgoing,
+                        issue_count=len(result.broken_imports),
+                        max_severity=IssueSeverity(severity) if severity else None,
+                        centrality=centrality,
+                        in_cycle=bool(in_cycle),
+                        depth=depth,
+                    ),
+                )
+        except (KeyError, TypeError, ValueError):
+            return None
+        if len(graph.nodes) != len(graph.results):
+            return None
+        # Node order drives layout; keep the order files were verified in
+        graph.nodes = {path: graph.nodes[path] for path in graph.results}
+
+        graph.edges = [
+            GraphEdge(
+                source=source,
+                target=target,
+                edge_type=edge_type,
+                resolved=bool(resolved),
+                line_number=line_number,
+                weight=weight,
+                bidirectional=bool(bidirectional),
+            )
+            for source, target, edge_type, resolved, line_number, weight, bidirectional in edges
+        ]
+        rank_scale = meta.get("rank_scale")
+        graph._rank_scale = float(rank_scale) if rank_scale else None
+        graph._graph = graph._build_graph()
+        self.signatures = signatures
+        return graph
+
+    def _signature(self, path: str) -> Optional[Tuple[int, int, str]]:
+        """Current (mtime_ns, size, sha), reusing the stored hash on a stat match."""
+        full_path = os.path.join(self.project_root, path)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return None
+        known = self.signatures.get(path)
+        if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+            return known
+        try:
+            with open(full_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, content_digest(raw))
+
+    def stale_files(
+        self, graph: ConnectionGraph, current: List[str]
+    ) -> Tuple[Set[str], Set[str], Set[str]]:
+        """
+        Compare a loaded graph with the current file list.
+
+        Returns (changed, deleted, added). Files whose stat moved but whose
+        content hash did not are refreshed in place and not reported.
+        """
+        current_set = set(current)
+        known = set(graph.nodes)
+        changed = set()
+        for path in known & current_set:
+            stored = self.signatures.get(path)
+            fresh = self._signature(path)
+            if stored is None or fresh is None or fresh[2] != stored[2]:
+                changed.add(path)
+            elif fresh != stored:
+                self.signatures[path] = fresh
+        return changed, known - current_set, current_set - known
+
+    def save(self, graph: ConnectionGraph) -> bool:
+        """Write the graph atomically (temp file + rename). Returns success."""
+        rows = []
+        signatures = {}
+        for path, result in graph.results.items():
+            # The file as it was verified, not as it is now: an edit since
+            # then must not be recorded as matching these results
+            signature = result.signature or self.signatures.get(path) or self._signature(path)
+            if signature is None or path not in graph.nodes:
+                continue  # Vanished since verification - next load re-adds it
+            signatures[path] = signature
+            rows.append((path, *signature, _encode_result(result)))
+
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            if tmp_path.exists():
+                tmp_path.unlink()
+            conn = sqlite3.connect(str(tmp_path))
+            try:
+                with conn:
+                    conn.executescript(_SCHEMA)
+                    conn.executemany(
+                        "INSERT INTO meta VALUES (?, ?)",
+                        [
+                            ("version", str(GRAPH_SNAPSHOT_VERSION)),
+                            ("project_root", str(self.project_root)),
+                            ("rank_scale", repr(graph._rank_scale) if graph._rank_scale else ""),
+                        ],
+                    )
+                    conn.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?)", rows)
+                    conn.executemany(
+                        "INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (
+                                path,
+                                node.label,
+                                node.node_type.value,
+                                node.status,
+                                node.metrics.incoming_count,
+                                node.metrics.max_severity.value if node.metrics.max_severity else None,
+                                node.metrics.centrality,
+                                int(node.metrics.in_cycle),
+                                node.metrics.depth,
+                            )
+                            for path, node in graph.nodes.items()
+                            if path in signatures
+                        ],
+                    )
+                    conn.executemany(
+                        "INSERT INTO edges VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (
+                                edge.source,
+                                edge.target,
+                                edge.edge_type,
+                                int(edge.resolved),
+                                edge.line_number,
+                                edge.weight,
+                                int(edge.bidirectional),
+                            )
+                            for edge in graph.edges
+                            if edge.source in signatures
+                        ],
+                    )
+            finally:
+                conn.close()
+            os.replace(tmp_path, self.snapshot_path)
+        except (OSError, sqlite3.Error):
+            return False
+        self.signatures = signatures
+        return True
+
+
+def load_connection_graph(project_root: str, use_snapshot: Optional[bool] = None) -> ConnectionGraph:
+    """
+    Return an up-to-date ConnectionGraph, starting from the snapshot if any.
+
+    With a valid snapshot only files changed since it was written are
+    re-verified (via apply_changes); otherwise the graph is built from
+    scratch. Either way the snapshot is refreshed when something changed.
+    """
+    if use_snapshot is None:
+        use_snapshot = graph_snapshot_enabled()
+    if not use_snapshot:
+        return build_connection_graph(project_root)
+
+    store = GraphSnapshotStore(project_root)
+    verifier = ConnectionVerifier(project_root)
+    graph = store.load(verifier)
+    if graph is None:
+        graph = build_connection_graph(project_root)
+        store.save(graph)
+        return graph
+
+    previous = dict(store.signatures)
+    changed, deleted, added = store.stale_files(graph, verifier.project_files())
+    if changed or deleted or added:
+        graph.apply_changes(changed=changed, deleted=deleted, added=added)
+    if changed or deleted or added or store.signatures != previous:
+        store.save(graph)
+    return graph
+
+
+class ConnectionGraphSession:
+    """
+    One ConnectionGraph kept current for the lifetime of a UI session.
+
+    The graph is loaded once (see load_connection_graph) and then patched
+    with apply_changes() for the paths a file watcher reports through
+    mark_changed(), so repeated queries (patchbay dry-runs) reuse the graph
+    and its cached reachability index instead of walking the project.
+    """
+
+    def __init__(self, project_root: str, use_snapshot: Optional[bool] = None):
+        self.project_root = Path(project_root).resolve()
+        self._use_snapshot = use_snapshot
+        self._graph: Optional[ConnectionGraph] = None
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def mark_changed(self, rel_path: str) -> None:
+        """Record a changed file or directory (project-relative); thread-safe."""
+        with self._lock:
+            self._pending.add(rel_path.replace(os.sep, "/").strip("/"))
+
+    def graph(self, refresh: bool = False) -> ConnectionGraph:
+        """
+        The session graph with pending changes applied.
+
+        refresh=True re-syncs it against the whole tree (for when no watcher
+        is feeding mark_changed).
+        """
+        with self._lock:
+            if self._graph is None or refresh:
+                # Changes seen before the load are part of it
+                self._pending.clear()
+                self._graph = load_connection_graph(str(self.project_root), self._use_snapshot)
+            elif self._pending:
+                pending, self._pending = self._pending, set()
+                self._graph.apply_changes(changed=self._expand(pending))
+            return self._graph
+
+    def _expand(self, paths: Set[str]) -> Set[str]:
+        """Files behind changed paths: directories stand for every file under them."""
+        assert self._graph is not None
+        files: Set[str] = set()
+        for path in paths:
+            full = self.project_root / path
+            if path in self._graph.nodes or full.is_file():
+                files.add(path)
+                continue
+            # Directory (moved, deleted or rescanned): nodes it had plus files it has
+            prefix = path + "/"
+            files.update(node for node in self._graph.nodes if node.startswith(prefix))
+            for root, dirs, names in os.walk(full):
+                dirs[:] = [d for d in dirs if d not in DEFAULT_EXCLUDED_DIRS]
+                rel_root = Path(root).relative_to(self.project_root).as_posix()
+                files.update(f"{rel_root}/{name}" for name in names)
+        return files
@@ -0,0 +1,263 @@
+# IP/health_cache.py
+"""
+Health Cache - Persistent HealthChecker results keyed by fiefdom content.
+
+A fiefdom's cache key is a hash over:
+
+- every checked source file in it (path + content hash)
+- the checkers that would run, with their versions / executables
+- project config that changes checker output (pyproject.toml, mypy.ini,
+  tsconfig.json, ...)
+- for whole-program checkers (mypy, dmypy, tsc), a digest of every source
+  file in the project: a changed signature in an imported module changes
+  the errors reported inside the fiefdom
+
+An unchanged key returns the stored result without starting any checker;
+only dirty fiefdoms are re-checked. File hashes are memoized by stat
+(mtime_ns + size), so a clean lookup reads no file contents.
+
+Cache file: <project_root>/.orchestr8/health_cache.json
+Disable with ORCHESTR8_HEALTH_CACHE=0.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from IP.env_flags import env_flag
+    from IP.scan_cache import content_digest
+except ImportError:
+    # Fallback for standalone use
+    from env_flags import env_flag
+    from scan_cache import content_digest
+
+# Bump when HealthCheckResult serialization or key inputs change.
+HEALTH_CACHE_VERSION = 2
+HEALTH_CACHE_FILENAME = "health_cache.json"
+
+# Project files whose content changes what the checkers report
+CHECKER_CONFIG_FILES = (
+    "pyproject.toml",
+    "setup.cfg",
+    "mypy.ini",
+    ".mypy.ini",
+    "ruff.toml",
+    ".ruff.toml",
+    "tsconfig.json",
+    "package.json",
+    "node_modules/typescript/package.json",  # tsc version
+)
+
+# Checkers whose findings in one file depend on other files
+WHOLE_PROGRAM_CHECKERS = frozenset({"mypy", "dmypy", "typescript"})
+
+# Executables / Python distributions behind each checker name
+_CHECKER_TOOLS = {
+    "typescript": ("npm", None),
+    "ruff": ("ruff", "ruff"),
+    "mypy": ("mypy", "mypy"),
+    "dmypy": ("dmypy", "mypy"),
+}
+
+
+def health_cache_enabled() -> bool:
+    """Health cache is on unless ORCHESTR8_HEALTH_CACHE is set to a falsy value."""
+    return env_flag("ORCHESTR8_HEALTH_CACHE")
+
+
+def _distribution_version(name: str) -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        return ""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return ""
+
+
+def checker_fingerprint(checkers: Iterable[str]) -> str:
+    """
+    Version identity of the given checkers.
+
+    Python tools report their distribution version; every tool also
+    contributes its resolved executable's path and stat, which changes on
+    upgrade even for tools installed outside this environment.
+    """
+    parts = [f"python={sys.version_info[:3]}"]  # compile() semantics for py_compile
+    for name in sorted(set(checkers)):
+        executable, distribution = _CHECKER_TOOLS.get(name, (None, None))
+        identity = [name]
+        if distribution:
+            identity.append(_distribution_version(distribution))
+        path = shutil.which(executable) if executable else None
+        if path:
+            real = os.path.realpath(path)
+            try:
+                st = os.stat(real)
+                identity.append(f"{real}:{st.st_mtime_ns}:{st.st_size}")
+            except OSError:
+                identity.append(real)
+        parts.append("|".join(identity))
+    return "\n".join(parts)
+
+
+class HealthCache:
+    """On-disk fiefdom -> HealthCheckResult cache for one project root."""
+
+    def __init__(self, project_root: str, cache_path: Optional[str] = None):
+        self.project_root = Path(project_root).resolve()
+        self.cache_path = (
+            Path(cache_path)
+            if cache_path
+            else self.project_root / ".orchestr8" / HEALTH_CACHE_FILENAME
+        )
+        # relpath -> [mtime_ns, size, sha]
+        self._files: Dict[str, List[Any]] = {}
+        # entry name -> {"key": ..., "result": HealthCheckResult.to_dict()}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+        # Watcher threads and UI callers share one checker
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        """Load entries from disk once; a corrupt or foreign file is ignored."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(payload, dict)
+            and payload.get("version") == HEALTH_CACHE_VERSION
+            and isinstance(payload.get("files"), dict)
+            and isinstance(payload.get("results"), dict)
+        ):
+            self._files = payload["files"]
+            self._results = payload["results"]
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._results)
+
+    def file_digest(self, relpath: str) -> Optional[str]:
+        """Content hash of a project file, re-read only when its stat changed."""
+        with self._lock:
+            return self._file_digest(relpath)
+
+    def _file_digest(self, relpath: str) -> Optional[str]:
+        self._load()
+        full_path = os.path.join(self.project_root, relpath)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return None
+        known = self._files.get(relpath)
+        if known is not None and known[0] == st.st_mtime_ns and known[1] == st.st_size:
+            return known[2]
+        try:
+            with open(full_path, "rb") as f:
+                digest = content_digest(f.read())
+        except OSError:
+            return None
+        self._files[relpath] = [st.st_mtime_ns, st.st_size, digest]
+        self._dirty = True
+        return digest
+
+    def files_digest(self, source_files: Iterable[str]) -> str:
+        """One hash over the paths and contents of source_files."""
+        h = hashlib.blake2b(digest_size=16)
+        with self._lock:
+            for relpath in sorted(source_files):
+                h.update(f"{relpath}:{self._file_digest(relpath)}\n".encode())
+        return h.hexdigest()
+
+    def fiefdom_key(
+        self,
+        kind: str,
+        source_files: Iterable[str],
+        checkers: Iterable[str],
+        project_digest: str = "",
+    ) -> str:
+        """
+        Cache key for one fiefdom check (see module docstring).
+
+        project_digest (files_digest of every project source) is folded in
+        when a whole-program checker is among checkers.
+        """
+        checkers = list(checkers)
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{kind}\n{checker_fingerprint(checkers)}\n".encode())
+        if WHOLE_PROGRAM_CHECKERS.intersection(checkers):
+            h.update(f"project:{project_digest}\n".encode())
+        with self._lock:
+            for relpath in CHECKER_CONFIG_FILES:
+                digest = self._file_digest(relpath)
+                if digest:
+                    h.update(f"cfg:{relpath}:{digest}\n".encode())
+            for relpath in sorted(source_files):
+                h.update(f"{relpath}:{self._file_digest(relpath)}\n".encode())
+        return h.hexdigest()
+
+    def get(self, name: str, key: str) -> Optional[Dict[str, Any]]:
+        """Stored result dict when name was last checked under the same key."""
+        with self._lock:
+            self._load()
+            entry = self._results.get(name)
+            if entry is not None and entry.get("key") == key:
+                self.hits += 1
+                return entry["result"]
+            self.misses += 1
+            return None
+
+    def put(self, name: str, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._load()
+            self._results[name] = {"key": key, "result": result}
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Forget every stored result (file hashes stay valid)."""
+        with self._lock:
+            self._load()
+            if self._results:
+                self._results = {}
+                self._dirty = True
+
+    def save(self) -> None:
+        """Persist entries atomically if anything changed."""
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": HEALTH_CACHE_VERSION,
+                        "files": self._files,
+                        "results": self._results,
+                    },
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError:
+            pass
@@ -3,22 +3,70 @@
 Health Checker - Runs static analysis and type checking for code health status.
 Supports TypeScript (npm typecheck), Python (mypy, ruff, py_compile).
 Feeds into Blue status (broken) for Woven Maps Code City.
+
+check_fiefdom / check_all_fiefdoms launch every applicable external checker
+at once (asyncio subprocesses) and parse their output line by line as it
+streams, so a run takes about as long as the slowest checker rather than the
+sum of all of them. check_fiefdom_async is the awaitable form; cancelling it
+(e.g. when a newer file change supersedes the run) kills the checker
+processes it started.
 """
+import asyncio
+import os
+import signal
 import subprocess
 import shutil
 import re
-import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, Coroutine, List, Dict, Optional, Tuple, TypeVar, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
+
+try:
+    from IP.dmypy_daemon import DmypySupervisor, dmypy_available, supervisor_for
+    from IP.executor_pool import parallel_map
+    from IP.health_cache import WHOLE_PROGRAM_CHECKERS, HealthCache, health_cache_enabled
+except ImportError:
+    # Fallback for standalone use
+    from dmypy_daemon import DmypySupervisor, dmypy_available, supervisor_for
+    from executor_pool import parallel_map
+    from health_cache import WHOLE_PROGRAM_CHECKERS, HealthCache, health_cache_enabled
+
+T = TypeVar("T")
+
+# Wall-clock limits per checker run (seconds)
+TYPESCRIPT_TIMEOUT = 120
+RUFF_TIMEOUT = 120
+MYPY_TIMEOUT = 180
+
+# Longest single output line read from a checker (asyncio's default is 64 KiB)
+STREAM_LINE_LIMIT = 1 << 20
+
+TYPESCRIPT_SUFFIXES = {'.ts', '.tsx', '.js', '.jsx'}
+
+# Never part of a fiefdom's sources (vendored, generated or tool state)
+SKIPPED_DIRS = {
+    "node_modules", "__pycache__", ".git", ".venv", "venv",
+    ".mypy_cache", ".ruff_cache", ".orchestr8",
+}
+
+# Checker targets: one path, several paths, or None for the project root
+Targets = Union[str, List[str], None]
+
+# Checkers run in their own process group so a kill also reaches children
+# (npm -> tsc)
+_POSIX = os.name == "posix"
 
 
 class CheckerType(Enum):
     """Types of health checkers available."""
     TYPESCRIPT = "typescript"
     PYTHON_MYPY = "python_mypy"
+    PYTHON_DMYPY = "python_dmypy"
     PYTHON_RUFF = "python_ruff"
     PYTHON_COMPILE = "python_compile"
 
@@ -49,6 +97,7 @@ class HealthCheckResult:
     last_check: str = ""
     raw_output: str = ""
     checker_used: str = ""
+    exit_code: Optional[int] = None  # Checker process exit status, when one ran
     
     @property
     def error_count(self) -> int:
@@ -84,14 +133,127 @@ class HealthCheckResult:
             "checker_used": self.checker_used,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HealthCheckResult":
+        """Inverse of to_dict (raw_output is not carried over)."""
+        fields = ("file", "line", "column", "error_code", "message", "severity")
+        return cls(
+            status=data["status"],
+            errors=[ParsedError(**{k: e[k] for k in fields}) for e in data["errors"]],
+            warnings=[ParsedError(**{k: w[k] for k in fields}) for w in data["warnings"]],
+            last_check=data.get("last_check", ""),
+            checker_used=data.get("checker_used", ""),
+        )
+
+
+@dataclass
+class CheckerCommand:
+    """One external checker invocation for the async pipeline."""
+    name: str                                         # "typescript" | "ruff" | "mypy"
+    title: str                                        # Used in timeout messages
+    argv: List[str]
+    timeout: float
+    parse_line: Callable[[str], Optional[ParsedError]]
+    path_filter: Optional[str] = None                 # Keep only errors in files containing this
+    daemon: Optional[DmypySupervisor] = None          # Server the command talks to
+    fallback: Optional["CheckerCommand"] = None       # Run instead if the server is unusable
+
+
+def _daemon_failed(result: HealthCheckResult) -> bool:
+    """A daemon client exit that isn't a type-check verdict (dead/crashed server)."""
+    return (
+        result.exit_code is not None
+        and result.exit_code not in (0, 1)
+        and ": error:" not in result.raw_output  # mypy exits 2 on blocking errors too
+    )
+
+
+def _kill_process_tree(proc: "asyncio.subprocess.Process") -> None:
+    if proc.returncode is not None:
+        return
+    try:
+        if _POSIX:
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def run_blocking(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Inside a running event loop (marimo cells, async watchers) asyncio.run is
+    not allowed, so the coroutine gets a private loop on a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def python_syntax_errors(project_root: str, file_path: str) -> List[ParsedError]:
+    """
+    Compile one file to bytecode in-process, as py_compile would.
+
+    A full compile() (not just ast.parse) also catches errors raised after
+    parsing, e.g. `return` outside a function or misplaced `nonlocal`.
+    """
+    try:
+        with open(os.path.join(project_root, file_path), "rb") as f:
+            source = f.read()
+    except OSError as e:
+        return [ParsedError(file=file_path, line=0, message=str(e))]
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # SyntaxWarning is not a failure
+            compile(source, file_path, "exec", dont_inherit=True)
+    except SyntaxError as e:  # Includes IndentationError / TabError
+        return [ParsedError(
+            file=file_path,
+            line=e.lineno or 0,
+            column=e.offset or 0,
+            error_code="SyntaxError",
+            message=f"{type(e).__name__}: {e.msg}"
+        )]
+    except (ValueError, RecursionError, MemoryError) as e:
+        # Null bytes, pathologically nested expressions
+        return [ParsedError(
+            file=file_path,
+            line=0,
+            error_code="SyntaxError",
+            message=f"{type(e).__name__}: {e}"
+        )]
+    return []
+
+
+def _syntax_check_chunk(project_root: str, file_paths: List[str]) -> List[List[ParsedError]]:
+    """Executor-pool chunk worker: errors per file, in input order."""
+    return [python_syntax_errors(project_root, path) for path in file_paths]
+
 
 class HealthChecker:
     """Multi-language health checker for TypeScript and Python projects."""
     
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, use_cache: Optional[bool] = None):
+        """
+        Args:
+            project_root: Project directory checkers run in
+            use_cache: Reuse results for unchanged fiefdoms (default:
+                ORCHESTR8_HEALTH_CACHE, on)
+        """
         self.project_root = Path(project_root)
         self._available_checkers: Dict[CheckerType, bool] = {}
         self._detect_available_checkers()
+        if use_cache is None:
+            use_cache = health_cache_enabled()
+        self.cache: Optional[HealthCache] = (
+            HealthCache(str(self.project_root)) if use_cache else None
+        )
     
     def _detect_available_checkers(self):
         """Detect which checkers are available on the system."""
@@ -102,47 +264,75 @@ class HealthChecker:
         
         # Python checkers
         self._available_checkers[CheckerType.PYTHON_MYPY] = shutil.which("mypy") is not None
+        self._available_checkers[CheckerType.PYTHON_DMYPY] = dmypy_available()
         self._available_checkers[CheckerType.PYTHON_RUFF] = shutil.which("ruff") is not None
         self._available_checkers[CheckerType.PYTHON_COMPILE] = True  # Always available with Python
     
     def get_available_checkers(self) -> List[CheckerType]:
         """Return list of available checkers."""
         return [k for k, v in self._available_checkers.items() if v]
+
+    def _target_args(self, targets: Targets) -> List[str]:
+        if not targets:
+            return [str(self.project_root)]
+        return [targets] if isinstance(targets, str) else list(targets)
+
+    def _parse_lines(
+        self, output: str, parse_line: Callable[[str], Optional[ParsedError]]
+    ) -> Tuple[List[ParsedError], List[ParsedError]]:
+        """Run a per-line parser over checker output, splitting errors from warnings."""
+        errors = []
+        warnings = []
+        for line in output.splitlines():
+            parsed = parse_line(line)
+            if parsed is None:
+                continue
+            if parsed.severity == "error":
+                errors.append(parsed)
+            else:
+                warnings.append(parsed)
+        return errors, warnings
     
     # =========================================================================
     # TypeScript Checking
     # =========================================================================
     
+    # Pattern: file.ts(line,col): error TSxxxx: message
+    _TS_PATTERN = re.compile(
+        r'^(.+?)\((\d+),(\d+)\):\s+(error|warning)\s+(TS\d+):\s+(.+)$'
+    )
+
+    def _parse_typescript_line(self, line: str) -> Optional[ParsedError]:
+        """Parse one line of TypeScript compiler output (None if not a diagnostic)."""
+        match = self._TS_PATTERN.match(line)
+        if not match:
+            return None
+        return ParsedError(
+            file=match.group(1),
+            line=int(match.group(2)),
+            column=int(match.group(3)),
+            severity=match.group(4),
+            error_code=match.group(5),
+            message=match.group(6)
+        )
+
     def _parse_typescript_output(self, output: str) -> Tuple[List[ParsedError], List[ParsedError]]:
         """
         Parse TypeScript compiler output into structured errors.
         
         Format: src/file.ts(10,5): error TS2345: Argument of type...
         """
-        errors = []
-        warnings = []
-        
-        # Pattern: file.ts(line,col): error TSxxxx: message
-        ts_pattern = re.compile(
-            r'^(.+?)\((\d+),(\d+)\):\s+(error|warning)\s+(TS\d+):\s+(.+)$',
-            re.MULTILINE
+        return self._parse_lines(output, self._parse_typescript_line)
+
+    def _typescript_command(self, fiefdom_path: Optional[str] = None) -> CheckerCommand:
+        return CheckerCommand(
+            name="typescript",
+            title="TypeScript",
+            argv=["npm", "run", "typecheck"],
+            timeout=TYPESCRIPT_TIMEOUT,
+            parse_line=self._parse_typescript_line,
+            path_filter=fiefdom_path,
         )
-        
-        for match in ts_pattern.finditer(output):
-            parsed = ParsedError(
-                file=match.group(1),
-                line=int(match.group(2)),
-                column=int(match.group(3)),
-                severity=match.group(4),
-                error_code=match.group(5),
-                message=match.group(6)
-            )
-            if parsed.severity == "error":
-                errors.append(parsed)
-            else:
-                warnings.append(parsed)
-        
-        return errors, warnings
     
     def check_typescript(self, fiefdom_path: Optional[str] = None) -> HealthCheckResult:
         """
@@ -160,11 +350,11 @@ class HealthChecker:
         
         try:
             result = subprocess.run(
-                ["npm", "run", "typecheck"],
+                self._typescript_command().argv,
                 cwd=str(self.project_root),
                 capture_output=True,
                 text=True,
-                timeout=120,
+                timeout=TYPESCRIPT_TIMEOUT,
             )
             output = result.stdout + result.stderr
         except subprocess.TimeoutExpired:
@@ -201,40 +391,68 @@ class HealthChecker:
     # Python Checking - mypy
     # =========================================================================
     
+    # Pattern: file.py:line:col: severity: message [code]
+    _MYPY_PATTERN = re.compile(
+        r'^(.+?):(\d+)(?::(\d+))?:\s+(error|warning|note):\s+(.+?)(?:\s+\[([^\]]+)\])?$'
+    )
+
+    def _parse_mypy_line(self, line: str) -> Optional[ParsedError]:
+        """Parse one line of mypy output (None for notes and non-diagnostics)."""
+        match = self._MYPY_PATTERN.match(line)
+        if not match:
+            return None
+        severity = match.group(4)
+        if severity == "note":
+            return None  # Skip notes
+        return ParsedError(
+            file=match.group(1),
+            line=int(match.group(2)),
+            column=int(match.group(3)) if match.group(3) else 0,
+            severity=severity,
+            error_code=match.group(6) or "",
+            message=match.group(5)
+        )
+
     def _parse_mypy_output(self, output: str) -> Tuple[List[ParsedError], List[ParsedError]]:
         """
         Parse mypy output into structured errors.
         
         Format: file.py:10: error: Message [error-code]
         """
-        errors = []
-        warnings = []
-        
-        # Pattern: file.py:line:col: severity: message [code]
-        mypy_pattern = re.compile(
-            r'^(.+?):(\d+)(?::(\d+))?:\s+(error|warning|note):\s+(.+?)(?:\s+\[([^\]]+)\])?$',
-            re.MULTILINE
+        return self._parse_lines(output, self._parse_mypy_line)
+
+    def _mypy_command(self, targets: Targets = None) -> CheckerCommand:
+        return CheckerCommand(
+            name="mypy",
+            title="mypy",
+            argv=[
+                "mypy", *self._target_args(targets),
+                "--no-error-summary", "--show-column-numbers",
+            ],
+            timeout=MYPY_TIMEOUT,
+            parse_line=self._parse_mypy_line,
         )
-        
-        for match in mypy_pattern.finditer(output):
-            severity = match.group(4)
-            if severity == "note":
-                continue  # Skip notes
-            
-            parsed = ParsedError(
-                file=match.group(1),
-                line=int(match.group(2)),
-                column=int(match.group(3)) if match.group(3) else 0,
-                severity=severity,
-                error_code=match.group(6) or "",
-                message=match.group(5)
-            )
-            if severity == "error":
-                errors.append(parsed)
-            else:
-                warnings.append(parsed)
-        
-        return errors, warnings
+
+    def _type_check_command(self, targets: Targets = None) -> CheckerCommand:
+        """Incremental dmypy check when the daemon is available, else cold mypy."""
+        mypy = self._mypy_command(targets)
+        if not self._available_checkers.get(CheckerType.PYTHON_DMYPY):
+            return mypy
+        daemon = supervisor_for(str(self.project_root))
+        return CheckerCommand(
+            name="dmypy",
+            title="dmypy",
+            argv=daemon.check_command(self._target_args(targets)),
+            timeout=MYPY_TIMEOUT,
+            parse_line=self._parse_mypy_line,
+            daemon=daemon,
+            fallback=mypy,
+        )
+
+    def close(self) -> None:
+        """Stop the mypy daemon if this project has one running."""
+        if self._available_checkers.get(CheckerType.PYTHON_DMYPY):
+            supervisor_for(str(self.project_root)).stop()
     
     def check_mypy(self, target_path: Optional[str] = None) -> HealthCheckResult:
         """
@@ -250,15 +468,13 @@ class HealthChecker:
                 last_check=datetime.now().isoformat()
             )
         
-        target = target_path or str(self.project_root)
-        
         try:
             result = subprocess.run(
-                ["mypy", target, "--no-error-summary", "--show-column-numbers"],
+                self._mypy_command(target_path).argv,
                 cwd=str(self.project_root),
                 capture_output=True,
                 text=True,
-                timeout=180,
+                timeout=MYPY_TIMEOUT,
             )
             output = result.stdout + result.stderr
         except subprocess.TimeoutExpired:
@@ -290,40 +506,41 @@ class HealthChecker:
     # Python Checking - ruff
     # =========================================================================
     
+    # Pattern: file.py:line:col: CODE message
+    _RUFF_PATTERN = re.compile(r'^(.+?):(\d+):(\d+):\s+([A-Z]+\d+)\s+(.+)$')
+
+    def _parse_ruff_line(self, line: str) -> Optional[ParsedError]:
+        """Parse one line of ruff output (None if not a diagnostic)."""
+        match = self._RUFF_PATTERN.match(line)
+        if not match:
+            return None
+        code = match.group(4)
+        # W = warning, E = error, F = fatal
+        return ParsedError(
+            file=match.group(1),
+            line=int(match.group(2)),
+            column=int(match.group(3)),
+            severity="warning" if code.startswith("W") else "error",
+            error_code=code,
+            message=match.group(5)
+        )
+
     def _parse_ruff_output(self, output: str) -> Tuple[List[ParsedError], List[ParsedError]]:
         """
         Parse ruff output into structured errors.
         
         Format: file.py:10:5: E501 Line too long
         """
-        errors = []
-        warnings = []
-        
-        # Pattern: file.py:line:col: CODE message
-        ruff_pattern = re.compile(
-            r'^(.+?):(\d+):(\d+):\s+([A-Z]+\d+)\s+(.+)$',
-            re.MULTILINE
+        return self._parse_lines(output, self._parse_ruff_line)
+
+    def _ruff_command(self, targets: Targets = None) -> CheckerCommand:
+        return CheckerCommand(
+            name="ruff",
+            title="ruff",
+            argv=["ruff", "check", *self._target_args(targets), "--output-format=text"],
+            timeout=RUFF_TIMEOUT,
+            parse_line=self._parse_ruff_line,
         )
-        
-        for match in ruff_pattern.finditer(output):
-            code = match.group(4)
-            # W = warning, E = error, F = fatal
-            severity = "warning" if code.startswith("W") else "error"
-            
-            parsed = ParsedError(
-                file=match.group(1),
-                line=int(match.group(2)),
-                column=int(match.group(3)),
-                severity=severity,
-                error_code=code,
-                message=match.group(5)
-            )
-            if severity == "error":
-                errors.append(parsed)
-            else:
-                warnings.append(parsed)
-        
-        return errors, warnings
     
     def check_ruff(self, target_path: Optional[str] = None) -> HealthCheckResult:
         """
@@ -339,15 +556,13 @@ class HealthChecker:
                 last_check=datetime.now().isoformat()
             )
         
-        target = target_path or str(self.project_root)
-        
         try:
             result = subprocess.run(
-                ["ruff", "check", target, "--output-format=text"],
+                self._ruff_command(target_path).argv,
                 cwd=str(self.project_root),
                 capture_output=True,
                 text=True,
-                timeout=120,
+                timeout=RUFF_TIMEOUT,
             )
             output = result.stdout + result.stderr
         except subprocess.TimeoutExpired:
@@ -381,59 +596,40 @@ class HealthChecker:
     
     def check_python_syntax(self, file_path: str) -> HealthCheckResult:
         """
-        Check Python file syntax using py_compile.
-        Always available - uses Python's built-in compiler.
+        Check Python file syntax with the built-in compiler (in-process).
+        Always available - no interpreter start-up per file.
         
         Args:
             file_path: Path to Python file to check
         """
-        errors = []
-        full_path = self.project_root / file_path
-        
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "py_compile", str(full_path)],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            
-            if result.returncode != 0:
-                # Parse syntax error
-                output = result.stderr
-                # Format: File "path", line X
-                match = re.search(r'File "([^"]+)", line (\d+)', output)
-                if match:
-                    # Get the actual error message (usually on the last line)
-                    lines = output.strip().split('\n')
-                    message = lines[-1] if lines else "Syntax error"
-                    
-                    errors.append(ParsedError(
-                        file=match.group(1),
-                        line=int(match.group(2)),
-                        error_code="SyntaxError",
-                        message=message
-                    ))
-                else:
-                    errors.append(ParsedError(
-                        file=file_path,
-                        line=0,
-                        error_code="SyntaxError",
-                        message=output.strip()
-                    ))
-        except subprocess.TimeoutExpired:
-            errors.append(ParsedError(
-                file=file_path,
-                line=0,
-                message="Syntax check timed out"
-            ))
-        except Exception as e:
-            errors.append(ParsedError(
-                file=file_path,
-                line=0,
-                message=str(e)
-            ))
-        
+        errors = python_syntax_errors(str(self.project_root), file_path)
+        return HealthCheckResult(
+            status="broken" if errors else "working",
+            errors=errors,
+            last_check=datetime.now().isoformat(),
+            checker_used="py_compile"
+        )
+
+    def check_python_syntax_batch(
+        self,
+        file_paths: List[str],
+        executor: Optional[str] = None,
+    ) -> HealthCheckResult:
+        """
+        Syntax-check many Python files, fanned out through the executor pool.
+
+        Args:
+            file_paths: Paths relative to the project root
+            executor: serial | thread | process | auto (default: auto,
+                i.e. ORCHESTR8_EXECUTOR and batch size)
+        """
+        per_file = parallel_map(
+            partial(_syntax_check_chunk, str(self.project_root)),
+            file_paths,
+            mode=executor,
+            cpu_bound=True,
+        )
+        errors = [error for file_errors in per_file for error in file_errors]
         return HealthCheckResult(
             status="broken" if errors else "working",
             errors=errors,
@@ -442,92 +638,239 @@ class HealthChecker:
         )
     
     # =========================================================================
-    # Unified Check Interface
+    # Async Checker Pipeline
     # =========================================================================
-    
-    def check_fiefdom(self, fiefdom_path: str) -> HealthCheckResult:
+
+    async def run_checker_async(self, command: CheckerCommand) -> HealthCheckResult:
         """
-        Run appropriate health check for a fiefdom based on file type.
-        Auto-detects whether to use TypeScript or Python checkers.
-        
-        Args:
-            fiefdom_path: Relative path from project root
-            
-        Returns:
-            HealthCheckResult with combined errors from all applicable checkers
+        Run one external checker, parsing diagnostics as its output streams.
+
+        Cancelling the awaiting task kills the checker (and its children).
+        Daemon-backed commands make sure the server is up first, restart it
+        once if the check shows it died, and otherwise use command.fallback.
         """
+        daemon = command.daemon
+        if daemon is None:
+            return await self._exec_checker_async(command)
+
+        if await asyncio.to_thread(daemon.ensure_running):
+            result = await self._exec_checker_async(command)
+            if not _daemon_failed(result):
+                if result.exit_code is None:
+                    # Timed out: assume the server is wedged, start fresh next time
+                    await asyncio.to_thread(daemon.stop)
+                return result
+            if await asyncio.to_thread(daemon.restart):
+                result = await self._exec_checker_async(command)
+                if not _daemon_failed(result):
+                    return result
+        if command.fallback is None:
+            return HealthCheckResult(
+                status="working",
+                checker_used=f"{command.name} (daemon unavailable)",
+                last_check=datetime.now().isoformat()
+            )
+        return await self._exec_checker_async(command.fallback)
+
+    async def _exec_checker_async(self, command: CheckerCommand) -> HealthCheckResult:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command.argv,
+                cwd=str(self.project_root),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=STREAM_LINE_LIMIT,
+                start_new_session=_POSIX,
+            )
+        except FileNotFoundError:
+            return HealthCheckResult(
+                status="working",
+                checker_used=f"{command.name} (not found)",
+                last_check=datetime.now().isoformat()
+            )
+
+        errors: List[ParsedError] = []
+        warnings: List[ParsedError] = []
+        chunks: List[str] = []
+
+        async def consume() -> None:
+            async for raw in proc.stdout:
+                line = raw.decode("utf-8", errors="replace")
+                chunks.append(line)
+                parsed = command.parse_line(line.rstrip("\r\n"))
+                if parsed is None:
+                    continue
+                if command.path_filter and command.path_filter not in parsed.file:
+                    continue
+                if parsed.severity == "error":
+                    errors.append(parsed)
+                else:
+                    warnings.append(parsed)
+            await proc.wait()
+
+        try:
+            await asyncio.wait_for(consume(), command.timeout)
+        except asyncio.TimeoutError:
+            _kill_process_tree(proc)
+            await proc.wait()
+            return HealthCheckResult(
+                status="broken",
+                errors=[ParsedError(file="<timeout>", line=0,
+                                    message=f"{command.title} check timed out")],
+                checker_used=command.name,
+                last_check=datetime.now().isoformat()
+            )
+        except BaseException:
+            # Superseded (cancelled) or failed: don't leave the checker running
+            _kill_process_tree(proc)
+            await proc.wait()
+            raise
+
+        return HealthCheckResult(
+            status="broken" if errors else "working",
+            errors=errors,
+            warnings=warnings,
+            last_check=datetime.now().isoformat(),
+            raw_output="".join(chunks),
+            checker_used=command.name,
+            exit_code=proc.returncode
+        )
+
+    async def run_checkers_async(
+        self, commands: List[CheckerCommand]
+    ) -> List[HealthCheckResult]:
+        """Run checkers concurrently; results come back in command order."""
+        tasks = [asyncio.ensure_future(self.run_checker_async(c)) for c in commands]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # One checker failed or the run was cancelled: stop the rest too
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    # =========================================================================
+    # Unified Check Interface
+    # =========================================================================
+
+    def _has_type_checker(self) -> bool:
+        return bool(
+            self._available_checkers.get(CheckerType.PYTHON_MYPY)
+            or self._available_checkers.get(CheckerType.PYTHON_DMYPY)
+        )
+
+    def _scan_fiefdom(self, fiefdom_path: str) -> Tuple[List[str], List[str]]:
+        """(python_files, typescript_files) of a fiefdom, relative to the project root."""
         full_path = self.project_root / fiefdom_path
-        
-        # Determine file types in fiefdom
-        has_python = False
-        has_typescript = False
-        python_files = []
-        
+        python_files: List[str] = []
+        typescript_files: List[str] = []
+
         if full_path.is_file():
             ext = full_path.suffix.lower()
-            has_python = ext == '.py'
-            has_typescript = ext in {'.ts', '.tsx', '.js', '.jsx'}
-            if has_python:
+            if ext == '.py':
                 python_files.append(fiefdom_path)
-        else:
-            for f in full_path.rglob('*'):
-                if f.is_file():
-                    ext = f.suffix.lower()
-                    if ext == '.py':
-                        has_python = True
-                        python_files.append(str(f.relative_to(self.project_root)))
-                    elif ext in {'.ts', '.tsx', '.js', '.jsx'}:
-                        has_typescript = True
-        
+            elif ext in TYPESCRIPT_SUFFIXES:
+                typescript_files.append(fiefdom_path)
+            return python_files, typescript_files
+
+        root = str(self.project_root)
+        for dirpath, dirs, files in os.walk(full_path):
+            dirs[:] = [d for d in dirs if d not in SKIPPED_DIRS]
+            for name in files:
+                ext = os.path.splitext(name)[1].lower()
+                if ext == '.py':
+                    python_files.append(os.path.relpath(os.path.join(dirpath, name), root))
+                elif ext in TYPESCRIPT_SUFFIXES:
+                    typescript_files.append(os.path.relpath(os.path.join(dirpath, name), root))
+        return python_files, typescript_files
+
+    def _in_fiefdom(self, file_path: str, fiefdom_path: str) -> bool:
+        """Path-prefix match of a checker-reported file against a fiefdom."""
+        if os.path.isabs(file_path):
+            try:
+                file_path = os.path.relpath(file_path, self.project_root)
+            except ValueError:  # Other drive
+                return False
+        path = os.path.normpath(file_path)
+        prefix = os.path.normpath(fiefdom_path)
+        return prefix == "." or path == prefix or path.startswith(prefix + os.sep)
+
+    def _project_digest(self, checkers: List[str]) -> str:
+        """Digest of every project source, when a whole-program checker will run."""
+        if self.cache is None or not WHOLE_PROGRAM_CHECKERS.intersection(checkers):
+            return ""
+        python_files, typescript_files = self._scan_fiefdom(".")
+        return self.cache.files_digest(python_files + typescript_files)
+
+    def _remember(self, name: str, key: Optional[str], result: HealthCheckResult) -> None:
+        """Cache a fresh result unless a checker timed out (that's not a verdict)."""
+        if self.cache is None or key is None:
+            return
+        if any(e.file == "<timeout>" for e in result.errors):
+            return
+        self.cache.put(name, key, result.to_dict())
+        self.cache.save()
+
+    async def check_fiefdom_async(self, fiefdom_path: str) -> HealthCheckResult:
+        """
+        Awaitable check_fiefdom: applicable checkers run concurrently.
+
+        An unchanged fiefdom (same sources, checkers and config as the cached
+        run) returns the cached result without starting any checker.
+        Cancel the task to abandon a run (e.g. superseded by a newer change);
+        checker processes are killed rather than left to finish.
+        """
+        python_files, typescript_files = self._scan_fiefdom(fiefdom_path)
+        has_python = bool(python_files)
+
+        commands: List[CheckerCommand] = []
+        if typescript_files and self._available_checkers.get(CheckerType.TYPESCRIPT):
+            commands.append(self._typescript_command(fiefdom_path))
+        if has_python:
+            # Priority: ruff > mypy > py_compile
+            if self._available_checkers.get(CheckerType.PYTHON_RUFF):
+                commands.append(self._ruff_command(fiefdom_path))
+            if self._has_type_checker():
+                commands.append(self._type_check_command(fiefdom_path))
+        # Syntax check as fallback if no other Python checkers
+        syntax_fallback = has_python and not (
+            self._available_checkers.get(CheckerType.PYTHON_RUFF) or self._has_type_checker()
+        )
+
+        key = None
+        if self.cache is not None:
+            checkers = [c.name for c in commands] + (["py_compile"] if syntax_fallback else [])
+            key = self.cache.fiefdom_key(
+                "fiefdom",
+                python_files + typescript_files,
+                checkers,
+                self._project_digest(checkers),
+            )
+            cached = self.cache.get(f"fiefdom:{fiefdom_path}", key)
+            if cached is not None:
+                return HealthCheckResult.from_dict(cached)
+
         all_errors: List[ParsedError] = []
         all_warnings: List[ParsedError] = []
         checkers_used = []
         raw_outputs = []
-        
-        # Run TypeScript check if applicable
-        if has_typescript and self._available_checkers.get(CheckerType.TYPESCRIPT):
-            ts_result = self.check_typescript(fiefdom_path)
-            all_errors.extend(ts_result.errors)
-            all_warnings.extend(ts_result.warnings)
-            checkers_used.append("typescript")
-            if ts_result.raw_output:
-                raw_outputs.append(ts_result.raw_output)
-        
-        # Run Python checks if applicable
-        if has_python:
-            # Priority: ruff > mypy > py_compile
-            if self._available_checkers.get(CheckerType.PYTHON_RUFF):
-                ruff_result = self.check_ruff(fiefdom_path)
-                all_errors.extend(ruff_result.errors)
-                all_warnings.extend(ruff_result.warnings)
-                checkers_used.append("ruff")
-                if ruff_result.raw_output:
-                    raw_outputs.append(ruff_result.raw_output)
-            
-            if self._available_checkers.get(CheckerType.PYTHON_MYPY):
-                mypy_result = self.check_mypy(fiefdom_path)
-                all_errors.extend(mypy_result.errors)
-                all_warnings.extend(mypy_result.warnings)
-                checkers_used.append("mypy")
-                if mypy_result.raw_output:
-                    raw_outputs.append(mypy_result.raw_output)
-            
-            # Always do syntax check as fallback if no other Python checkers
-            if not (self._available_checkers.get(CheckerType.PYTHON_RUFF) or 
-                    self._available_checkers.get(CheckerType.PYTHON_MYPY)):
-                for py_file in python_files:
-                    syntax_result = self.check_python_syntax(py_file)
-                    all_errors.extend(syntax_result.errors)
-                    checkers_used.append("py_compile")
-        
-        # Fallback: if nothing ran, at least do syntax check on Python files
-        if not checkers_used and has_python:
-            for py_file in python_files:
-                syntax_result = self.check_python_syntax(py_file)
-                all_errors.extend(syntax_result.errors)
-            checkers_used.append("py_compile (fallback)")
-        
-        return HealthCheckResult(
+
+        for command, result in zip(commands, await self.run_checkers_async(commands)):
+            all_errors.extend(result.errors)
+            all_warnings.extend(result.warnings)
+            checkers_used.append(command.name)
+            if result.raw_output:
+                raw_outputs.append(result.raw_output)
+
+        if syntax_fallback:
+            syntax_result = await asyncio.to_thread(
+                self.check_python_syntax_batch, python_files
+            )
+            all_errors.extend(syntax_result.errors)
+            checkers_used.append("py_compile")
+
+        result = HealthCheckResult(
             status="broken" if all_errors else "working",
             errors=all_errors,
             warnings=all_warnings,
@@ -535,57 +878,95 @@ class HealthChecker:
             raw_output="\n---\n".join(raw_outputs),
             checker_used=", ".join(checkers_used) if checkers_used else "none"
         )
+        self._remember(f"fiefdom:{fiefdom_path}", key, result)
+        return result
+
+    def check_fiefdom(self, fiefdom_path: str) -> HealthCheckResult:
+        """
+        Run appropriate health check for a fiefdom based on file type.
+        Auto-detects whether to use TypeScript or Python checkers.
+        
+        Args:
+            fiefdom_path: Relative path from project root
+            
+        Returns:
+            HealthCheckResult with combined errors from all applicable checkers
+        """
+        return run_blocking(self.check_fiefdom_async(fiefdom_path))
     
     def check_all_fiefdoms(
         self, fiefdom_paths: List[str]
     ) -> Dict[str, HealthCheckResult]:
         """
         Run health check for multiple fiefdoms.
-        Optimizes by running project-wide checks once and filtering.
+
+        Fiefdoms whose cache key is unchanged are answered from the cache.
+        The rest are checked together: one concurrent run of each checker
+        over just those fiefdoms (tsc is always project-wide), then errors
+        are assigned by path prefix.
         """
-        results = {}
-        
-        # Run project-wide checks once
-        ts_result = None
-        ruff_result = None
-        mypy_result = None
-        
+        results: Dict[str, HealthCheckResult] = {}
+        keys: Dict[str, Optional[str]] = {}
+        checkers = []
         if self._available_checkers.get(CheckerType.TYPESCRIPT):
-            ts_result = self.check_typescript()
-        
+            checkers.append("typescript")
         if self._available_checkers.get(CheckerType.PYTHON_RUFF):
-            ruff_result = self.check_ruff()
-        
-        if self._available_checkers.get(CheckerType.PYTHON_MYPY):
-            mypy_result = self.check_mypy()
+            checkers.append("ruff")
+        if self._has_type_checker():
+            checkers.append(
+                "dmypy" if self._available_checkers.get(CheckerType.PYTHON_DMYPY) else "mypy"
+            )
+
+        dirty = []
+        project_digest = self._project_digest(checkers)
+        for fiefdom in fiefdom_paths:
+            keys[fiefdom] = None
+            if self.cache is not None:
+                python_files, typescript_files = self._scan_fiefdom(fiefdom)
+                keys[fiefdom] = self.cache.fiefdom_key(
+                    "all", python_files + typescript_files, checkers, project_digest
+                )
+                cached = self.cache.get(f"all:{fiefdom}", keys[fiefdom])
+                if cached is not None:
+                    results[fiefdom] = HealthCheckResult.from_dict(cached)
+                    continue
+            dirty.append(fiefdom)
+        if not dirty:
+            return results
+
+        # Check only the dirty fiefdoms that exist (missing ones have no errors)
+        targets = [f for f in dirty if (self.project_root / f).exists()]
+        commands: List[CheckerCommand] = []
+        if self._available_checkers.get(CheckerType.TYPESCRIPT):
+            commands.append(self._typescript_command())
+        if targets and self._available_checkers.get(CheckerType.PYTHON_RUFF):
+            commands.append(self._ruff_command(targets))
+        if targets and self._has_type_checker():
+            commands.append(self._type_check_command(targets))
+        project_results = run_blocking(self.run_checkers_async(commands))
+        timed_out = any(
+            e.file == "<timeout>" for result in project_results for e in result.errors
+        )
         
         # Filter results per fiefdom
-        for fiefdom in fiefdom_paths:
-            errors = []
-            warnings = []
-            checkers = []
-            
-            if ts_result:
-                errors.extend(ts_result.get_errors_for_file(fiefdom))
-                checkers.append("typescript")
-            
-            if ruff_result:
-                errors.extend(ruff_result.get_errors_for_file(fiefdom))
-                checkers.append("ruff")
-            
-            if mypy_result:
-                errors.extend(mypy_result.get_errors_for_file(fiefdom))
-                checkers.append("mypy")
-            
+        for fiefdom in dirty:
+            errors = [
+                e
+                for result in project_results
+                for e in result.errors
+                if self._in_fiefdom(e.file, fiefdom)
+            ]
             results[fiefdom] = HealthCheckResult(
                 status="broken" if errors else "working",
                 errors=errors,
-                warnings=warnings,
+                warnings=[],
                 last_check=datetime.now().isoformat(),
                 checker_used=", ".join(checkers)
             )
+            if not timed_out:
+                self._remember(f"all:{fiefdom}", keys[fiefdom], results[fiefdom])
         
-        return results
+        return {fiefdom: results[fiefdom] for fiefdom in fiefdom_paths}
 
 
 if __name__ == "__main__":
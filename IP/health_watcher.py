@@ -2,7 +2,7 @@
 Health Watcher - Real-time file change detection with debouncing.
 
 Provides two implementations:
-- HealthWatcher: Simple watchdog-based watcher with callback
+- HealthWatcher: Simple watcher with callback (inotify on Linux, else watchdog)
 - HealthWatcherManager: Marimo-integrated watcher with reactive state updates
 
 Data flow: File Change → Debounce → HealthChecker → State → Code City
@@ -11,10 +11,12 @@ Data flow: File Change → Debounce → HealthChecker → State → Code City
 __all__ = ["HealthWatcher", "HealthWatcherManager"]
 
 import asyncio
+import os
 import threading
+import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Callable, Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Set
 
 try:
     from watchdog.observers import Observer
@@ -28,103 +30,274 @@ except ImportError:
     HAS_WATCHDOG = False
 
 from IP.health_checker import HealthChecker, HealthCheckResult
+from IP.inotify_watcher import InotifyWatcher, inotify_enabled
+from IP.woven_maps import SKIP_DIRS
 
 
 class HealthWatcher:
     """
-    File watcher with 100ms debounce for triggering health checks.
+    File watcher that coalesces change bursts into per-fiefdom health checks.
 
-    Data flow: File Change → Debounce → HealthChecker → Callback → UI State
+    Data flow: File Change → Dirty set → Debounce → HealthChecker → Callback → UI State
+
+    Events only record the changed path in a dirty set grouped by fiefdom
+    (the file's directory). One scheduler thread waits for a quiet period
+    that grows with the size of the burst (bounded by MAX_BATCH_DELAY_MS),
+    then checks every dirty fiefdom once, at most MAX_CONCURRENT_CHECKS at a
+    time. Changes landing in a fiefdom while its check runs stay dirty and
+    are picked up by the next check, so no change is dropped and each one
+    is covered by exactly one check.
     """
 
-    DEBOUNCE_MS = 100  # 100ms debounce per CONTEXT.md
+    DEBOUNCE_MS = 100  # 100ms debounce per CONTEXT.md (quiet period for a lone edit)
+    MAX_DEBOUNCE_MS = 1000  # Quiet-period cap during bursts
+    BURST_MS_PER_EVENT = 2  # Quiet period grows with events in the burst
+    MAX_BATCH_DELAY_MS = 5000  # Dispatch even if events never stop
+    MAX_CONCURRENT_CHECKS = 2
+    WATCHED_SUFFIXES = (".py", ".ts", ".tsx", ".js", ".jsx")
 
     def __init__(self, project_root: str, callback: Callable[[Dict[str, Any]], None]):
         self.project_root = Path(project_root)
         self.callback = callback
         self.health_checker = HealthChecker(str(self.project_root))
         self._observer: Optional[Observer] = None
-        self._debounce_timer: Optional[threading.Timer] = None
-        self._pending_file: Optional[str] = None
+        self._inotify: Optional[InotifyWatcher] = None
         self._lock = threading.Lock()
+        # fiefdom -> changed paths not yet claimed by a check
+        self._dirty: Dict[str, Set[str]] = {}
+        # Fiefdoms with a check queued or running
+        self._scheduled: Set[str] = set()
+        self._burst_started = 0.0
+        self._burst_events = 0
+        self._last_event = 0.0
+        self._scheduler: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._change_listeners: List[Callable[[str], None]] = []
+        self.checks_run = 0
+
+    @property
+    def is_watching(self) -> bool:
+        return self._observer is not None or self._inotify is not None
+
+    def add_change_listener(self, listener: Callable[[str], None]) -> None:
+        """Also report each changed path (project-relative file or directory) to listener."""
+        self._change_listeners.append(listener)
+
+    def fiefdom_of(self, rel_path: str) -> str:
+        """Check unit for a changed file: its directory (root files stand alone)."""
+        parent = os.path.dirname(rel_path)
+        return parent if parent else rel_path
 
     def _on_file_change(self, event):
-        """Handle file change event with debouncing."""
+        """Record a watcher event (modify/create/delete/move/rescan) as dirty."""
+        dest_path = getattr(event, "dest_path", None)
         if event.is_directory:
+            # A directory that vanished, or whose listing changed unseen
+            # (inotify overflow), is its own fiefdom; plain directory
+            # "modified" events just echo file events inside it
+            if event.event_type in ("deleted", "moved", "rescan"):
+                self.notify_directory(str(event.src_path))
+                if dest_path:
+                    self.notify_directory(str(dest_path))
             return
+        self.notify(str(event.src_path))
+        if dest_path:
+            self.notify(str(dest_path))
 
-        file_path = str(event.src_path)
-        # Only watch .py, .ts, .tsx files
-        if not any(
-            file_path.endswith(ext) for ext in [".py", ".ts", ".tsx", ".js", ".jsx"]
-        ):
+    def _relative(self, path: str) -> Optional[str]:
+        """Project-relative path, or None if outside the project or skipped."""
+        try:
+            rel_path = os.path.relpath(path, self.project_root)
+        except ValueError:
+            return None
+        if rel_path.startswith(os.pardir) or rel_path == os.curdir:
+            return None
+        if any(part in SKIP_DIRS for part in rel_path.split(os.sep)[:-1]):
+            return None
+        return rel_path
+
+    def notify(self, file_path: str) -> None:
+        """Mark a changed file dirty; safe to call from any thread."""
+        if not file_path.endswith(self.WATCHED_SUFFIXES):
             return
-
+        rel_path = self._relative(file_path)
+        if rel_path is not None:
+            self._mark_dirty(self.fiefdom_of(rel_path), rel_path)
+
+    def notify_directory(self, dir_path: str) -> None:
+        """Mark the fiefdom of a whole directory dirty."""
+        rel_path = self._relative(dir_path)
+        if rel_path is not None and os.path.basename(rel_path) not in SKIP_DIRS:
+            self._mark_dirty(rel_path, rel_path)
+
+    def _mark_dirty(self, fiefdom: str, rel_path: str) -> None:
+        now = time.monotonic()
         with self._lock:
-            self._pending_file = file_path
-
-            # Cancel existing timer
-            if self._debounce_timer:
-                self._debounce_timer.cancel()
-
-            # Schedule new check after debounce period
-            self._debounce_timer = threading.Timer(
-                self.DEBOUNCE_MS / 1000.0, self._debounced_check
-            )
-            self._debounce_timer.start()
-
-    def _debounced_check(self):
-        """Execute health check after debounce period."""
-        with self._lock:
-            if not self._pending_file:
+            if self._stopping:
                 return
-            file_path = self._pending_file
-            self._pending_file = None
+            if self._burst_events == 0:
+                self._burst_started = now
+            self._burst_events += 1
+            self._last_event = now
+            self._dirty.setdefault(fiefdom, set()).add(rel_path)
+            loop = self._loop
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(
+                    target=self._run_scheduler, name="health-watcher", daemon=True
+                )
+                self._scheduler.start()
+        if loop is not None:
+            self._wake(loop)
+        for listener in self._change_listeners:
+            try:
+                listener(rel_path)
+            except Exception as e:
+                print(f"HealthWatcher listener error: {e}")
 
+    def _wake(self, loop: asyncio.AbstractEventLoop) -> None:
         try:
-            # Get relative path from project root
-            rel_path = str(Path(file_path).relative_to(self.project_root))
+            loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            pass  # Loop already closed (stopping)
 
-            # Run health check
-            result = self.health_checker.check_fiefdom(rel_path)
+    def is_idle(self) -> bool:
+        """True when no change is waiting for or undergoing a check."""
+        with self._lock:
+            return not self._dirty and not self._scheduled
+
+    def _quiet_period(self) -> float:
+        """Seconds without events before a burst is dispatched."""
+        ms = self.DEBOUNCE_MS + self.BURST_MS_PER_EVENT * self._burst_events
+        return min(ms, self.MAX_DEBOUNCE_MS) / 1000.0
 
-            # Invoke callback with result
-            self.callback({rel_path: result})
+    def _run_scheduler(self) -> None:
+        try:
+            asyncio.run(self._schedule())
         except Exception as e:
             # Log error but don't crash
             print(f"HealthWatcher error: {e}")
 
+    async def _schedule(self) -> None:
+        self._wakeup = asyncio.Event()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            if self._dirty:
+                self._wakeup.set()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHECKS)
+        tasks: Set[asyncio.Task] = set()
+
+        while not self._stopping:
+            with self._lock:
+                waiting = [f for f in self._dirty if f not in self._scheduled]
+                delay = None
+                if waiting:
+                    now = time.monotonic()
+                    delay = min(
+                        self._last_event + self._quiet_period(),
+                        self._burst_started + self.MAX_BATCH_DELAY_MS / 1000.0,
+                    ) - now
+                    if delay <= 0:
+                        # Dispatch the burst: one check per dirty fiefdom
+                        self._scheduled.update(waiting)
+                        self._burst_events = 0
+                        for fiefdom in waiting:
+                            task = asyncio.ensure_future(self._check(fiefdom, semaphore))
+                            tasks.add(task)
+                            task.add_done_callback(tasks.discard)
+                        continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+        for task in tasks:
+            task.cancel()  # Kills running checker processes
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _check(self, fiefdom: str, semaphore: asyncio.Semaphore) -> None:
+        try:
+            async with semaphore:
+                with self._lock:
+                    # Claim every path dirty so far, including those that
+                    # arrived while this check was queued
+                    self._dirty.pop(fiefdom, None)
+                try:
+                    result = await self.health_checker.check_fiefdom_async(fiefdom)
+                except Exception as e:
+                    print(f"HealthWatcher error: {e}")
+                    return
+                self.checks_run += 1
+                try:
+                    self.callback({fiefdom: result})
+                except Exception as e:
+                    print(f"HealthWatcher callback error: {e}")
+        finally:
+            with self._lock:
+                self._scheduled.discard(fiefdom)
+                if fiefdom in self._dirty:
+                    # Changed during the check: schedule a follow-up
+                    self._wakeup.set()
+
     def start_watching(self) -> None:
         """Start watching the project for file changes."""
+        if self._observer or self._inotify:
+            return  # Already watching
+
+        if inotify_enabled():
+            try:
+                self._inotify = InotifyWatcher(str(self.project_root), self._on_file_change)
+                self._inotify.start()
+                return
+            except OSError as e:
+                self._inotify = None
+                print(f"HealthWatcher: inotify unavailable ({e}), trying watchdog")
+
         if not HAS_WATCHDOG:
             print("HealthWatcher: watchdog not installed, file watching disabled")
             return
 
-        if self._observer:
-            return  # Already watching
-
         class Handler(FileSystemEventHandler):
             def __init__(self, watcher):
                 self.watcher = watcher
 
-            def on_modified(self, event):
-                self.watcher._on_file_change(event)
+            def on_any_event(self, event):
+                if event.event_type in ("modified", "created", "deleted", "moved"):
+                    self.watcher._on_file_change(event)
 
         self._observer = Observer()
         self._observer.schedule(Handler(self), str(self.project_root), recursive=True)
         self._observer.start()
 
     def stop_watching(self) -> None:
-        """Stop watching for file changes."""
-        if self._debounce_timer:
-            self._debounce_timer.cancel()
-            self._debounce_timer = None
-
+        """Stop watching for file changes and cancel in-flight checks."""
+        if self._inotify:
+            self._inotify.stop()
+            self._inotify = None
         if self._observer:
             self._observer.stop()
             self._observer.join()
             self._observer = None
 
+        with self._lock:
+            self._stopping = True
+            loop, scheduler = self._loop, self._scheduler
+        if loop is not None:
+            self._wake(loop)
+        if scheduler is not None:
+            scheduler.join(timeout=10)
+        with self._lock:
+            self._scheduler = None
+            self._loop = None
+            self._dirty.clear()
+            self._scheduled.clear()
+            self._burst_events = 0
+            self._stopping = False
+
+        self.health_checker.close()
+
 
 # =============================================================================
 # HealthWatcherManager - Marimo FileWatcherManager Integration
@@ -173,6 +346,10 @@ class HealthWatcherManager:
         # File watcher manager (Marimo)
         self._file_watcher = None
 
+        # Fallback watchers when Marimo's is unavailable
+        self._inotify_watchers: List[InotifyWatcher] = []
+        self._observer = None
+
     def _map_to_fiefdom(self, path: Path) -> str:
         """
         Map a file path to its parent fiefdom identifier.
@@ -243,7 +420,9 @@ class HealthWatcherManager:
             results = {}
             for fiefdom in pending_fiefdoms:
                 try:
-                    result = self._health_checker.check_fiefdom(fiefdom)
+                    # Awaited so a newer change cancelling this task also
+                    # kills the checkers still running for the old one
+                    result = await self._health_checker.check_fiefdom_async(fiefdom)
 
                     results[fiefdom] = {
                         "status": result.status,
@@ -316,11 +495,53 @@ class HealthWatcherManager:
                 pass
             self._file_watcher = None
 
+        for watcher in self._inotify_watchers:
+            watcher.stop()
+        self._inotify_watchers = []
+
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+        self._health_checker.close()
+
     def _start_polling_fallback(self) -> None:
         """
         Fallback polling implementation when Marimo's FileWatcherManager
         is not available.
+
+        Uses inotify on Linux (no dependency, no polling) and watchdog
+        elsewhere. Watcher threads hand events to the caller's event loop.
         """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = asyncio.get_event_loop()
+
+        if inotify_enabled():
+            def on_event(event):
+                paths = [event.src_path, event.dest_path]
+                for path in filter(None, paths):
+                    if not event.is_directory:
+                        loop.call_soon_threadsafe(
+                            lambda p=Path(path): loop.create_task(self._on_file_change(p))
+                        )
+
+            try:
+                for watch_path in self._watch_paths:
+                    full_path = self.project_root / watch_path
+                    if full_path.exists():
+                        watcher = InotifyWatcher(str(full_path), on_event)
+                        watcher.start()
+                        self._inotify_watchers.append(watcher)
+                return
+            except OSError as e:
+                for watcher in self._inotify_watchers:
+                    watcher.stop()
+                self._inotify_watchers = []
+                print(f"HealthWatcherManager: inotify unavailable ({e}), trying watchdog")
+
         if not HAS_WATCHDOG:
             print(
                 "HealthWatcherManager: watchdog not installed, file watching disabled"
@@ -334,9 +555,10 @@ class HealthWatcherManager:
             def on_modified(self, event):
                 if not event.is_directory:
                     try:
-                        loop = asyncio.get_event_loop()
-                        loop.create_task(
-                            self.manager._on_file_change(Path(event.src_path))
+                        loop.call_soon_threadsafe(
+                            lambda p=Path(event.src_path): loop.create_task(
+                                self.manager._on_file_change(p)
+                            )
                         )
                     except Exception:
                         pass
@@ -0,0 +1,193 @@
+# IP/import_scanner.py
+"""
+Import Scanner - Single-pass import extraction for Python and JS/TS sources.
+
+Replaces per-line regex loops with a keyword-driven scan:
+
+1. Find candidate keywords (`from`/`import` starting a Python statement;
+   `import`/`export`/`require` anywhere for JS/TS) with one fast regex.
+2. Lex strings and comments only up to each candidate, so keywords inside
+   docstrings, string literals and comments are ignored.
+3. Match the full statement at the candidate. Statements may span lines
+   (backslash continuations, `import {\\n a,\\n b\\n} from 'x'`).
+
+Files are only lexed as far as their last candidate, and the lexing runs
+inside the regex engine, so this is both more accurate and faster than the
+old line loop. Python output matches `ast` (Import/ImportFrom nodes) on
+valid sources; `ast.parse` itself is several times slower than either.
+
+Both extractors return [(specifier, line_number), ...] in source order.
+Python relative imports keep their dots ("from .. import x" -> "..").
+"""
+
+import re
+from typing import List, Tuple
+
+# --- Python -----------------------------------------------------------------
+
+# Statements start a line or follow `;` / a compound statement's `:`
+_PY_CANDIDATE = re.compile(r"[\n;:][ \t]*(?:from|import)[ \t\\]")
+
+# String/comment alternatives shared by the skip and literal patterns. The
+# single-quote forms refuse to start a triple quote so a triple-quoted string
+# cut off by endpos is never mistaken for an empty string.
+_PY_LITERALS = r"""
+      '''[^'\\]*(?:(?:\\[\s\S]|'(?!''))[^'\\]*)*'''
+    | \"\"\"[^"\\]*(?:(?:\\[\s\S]|"(?!""))[^"\\]*)*\"\"\"
+    | '(?!'')[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'
+    | "(?!"")[^"\\\n]*(?:\\[\s\S][^"\\\n]*)*"
+"""
+
+# Skips code, strings and comments up to endpos. Comments must see their
+# newline so one cut off by endpos stops the skip instead of ending on it.
+_PY_SKIP = re.compile(
+    r"(?:[^'\"\#]+|" + _PY_LITERALS + r"|\#[^\n]*(?=\n))*",
+    re.VERBOSE,
+)
+_PY_LITERAL = re.compile(_PY_LITERALS + r"|\#[^\n]*", re.VERBOSE)
+
+_PY_STATEMENT = re.compile(
+    r"""
+    [\n;:][ \t]*from[ \t]+(?P<module>\.+[\w.]*|[\w.]+)[ \t]*(?:\\\n[ \t]*)?import\b
+  | [\n;:][ \t]*import[ \t]+(?P<names>[^\n\#;]*(?:\\\n[^\n\#;]*)*)
+    """,
+    re.VERBOSE,
+)
+
+_PY_NAME = re.compile(r"[\w.]+$")
+
+# --- JavaScript / TypeScript ------------------------------------------------
+
+_JS_CANDIDATE = re.compile(r"import|export|require")
+
+_JS_LITERALS = r"""
+      '[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'
+    | "[^"\\\n]*(?:\\[\s\S][^"\\\n]*)*"
+    | `[^`\\]*(?:\\[\s\S][^`\\]*)*`
+    | /\*[^*]*\*+(?:[^/*][^*]*\*+)*/
+"""
+
+_JS_SKIP = re.compile(
+    r"(?:[^'\"`/]+|" + _JS_LITERALS + r"|//[^\n]*(?=\n)|/(?![/*]))*",
+    re.VERBOSE,
+)
+_JS_LITERAL = re.compile(_JS_LITERALS + r"|//[^\n]*", re.VERBOSE)
+
+_JS_STATEMENT = re.compile(
+    r"""
+    (?:import|export)\b[^'"`;()=]*?\bfrom\s*(?P<q1>['"])(?P<from_spec>[^'"\n]+)(?P=q1)
+  | import\s*(?P<q2>['"])(?P<bare_spec>[^'"\n]+)(?P=q2)
+  | (?:import|require)\s*\(\s*(?P<q3>['"`])(?P<call_spec>[^'"`\n$]+)(?P=q3)\s*\)
+    """,
+    re.VERBOSE,
+)
+
+_JS_SPEC_GROUPS = ("from_spec", "bare_spec", "call_spec")
+_JS_IDENT_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$"
+)
+
+
+def _skip_to(text: str, pos: int, target: int, skip: re.Pattern, literal: re.Pattern) -> int:
+    """
+    Lex from pos towards target, stepping over strings and comments.
+
+    Returns a position <= target when target is in code, or > target when
+    target sits inside a string/comment.
+    """
+    while pos < target:
+        pos = skip.match(text, pos, target).end()
+        if pos >= target:
+            break
+        # Stopped on a literal that runs past target (or is unterminated)
+        match = literal.match(text, pos)
+        pos = match.end() if match else pos + 1
+    return pos
+
+
+def extract_python_imports(source: str) -> List[Tuple[str, int]]:
+    """
+    Extract imported module specifiers from Python source.
+
+    `import a, b.c as d` yields "a" and "b.c"; `from .x import y` yields
+    ".x". Imports nested in functions/try blocks are included, imports inside
+    strings and comments are not.
+    """
+    text = "\n" + source  # Every statement then starts after a newline
+    imports: List[Tuple[str, int]] = []
+    pos = 0
+    line = 0
+    counted = 0
+
+    for candidate in _PY_CANDIDATE.finditer(text):
+        start = candidate.start()
+        if start < pos:
+            continue
+        pos = _skip_to(text, pos, start, _PY_SKIP, _PY_LITERAL)
+        if pos > start:
+            continue
+
+        match = _PY_STATEMENT.match(text, start)
+        if match is None:
+            continue
+
+        group_start = match.start(match.lastgroup)
+        line += text.count("\n", counted, group_start)
+        counted = group_start
+
+        if match.lastgroup == "module":
+            imports.append((match.group("module"), line))
+        else:
+            for part in match.group("names").replace("\\\n", " ").split(","):
+                name = part.split(" as ")[0].strip()
+                if _PY_NAME.match(name):
+                    imports.append((name, line))
+        pos = match.end()
+
+    return imports
+
+
+def extract_js_imports(source: str) -> List[Tuple[str, int]]:
+    """
+    Extract module specifiers from JavaScript/TypeScript source.
+
+    Handles `import ... from`, `export ... from`, side-effect imports,
+    dynamic `import()` and `require()`, including multi-line import
+    clauses. The reported line is the line holding the specifier.
+    """
+    imports: List[Tuple[str, int]] = []
+    pos = 0
+    line = 1
+    counted = 0
+    end = len(source)
+
+    for candidate in _JS_CANDIDATE.finditer(source):
+        start = candidate.start()
+        if start < pos:
+            continue
+        # Whole-word keyword, not a property access (obj.require)
+        if start and (source[start - 1] in _JS_IDENT_CHARS or source[start - 1] == "."):
+            continue
+        after = candidate.end()
+        if after < end and source[after] in _JS_IDENT_CHARS:
+            continue
+
+        pos = _skip_to(source, pos, start, _JS_SKIP, _JS_LITERAL)
+        if pos > start:
+            continue
+
+        match = _JS_STATEMENT.match(source, start)
+        if match is None:
+            pos = after
+            continue
+
+        for group in _JS_SPEC_GROUPS:
+            if match.group(group) is not None:
+                group_start = match.start(group)
+                line += source.count("\n", counted, group_start)
+                counted = group_start
+                imports.append((match.group(group), line))
+                break
+        pos = match.end()
+
+    return imports
@@ -0,0 +1,412 @@
+# IP/inotify_watcher.py
+"""
+Inotify Watcher - Dependency-free recursive file watching on Linux.
+
+Talks to the kernel's inotify API through ctypes (libc), so health watching
+works without watchdog or marimo. One thread blocks in poll() on the inotify
+descriptor (no CPU while idle) and turns kernel events into FileEvents:
+
+    modified   file closed after writing (IN_CLOSE_WRITE)
+    created    file created or moved in from outside the tree
+    deleted    file/directory deleted or moved out of the tree
+    moved      rename within the tree (src_path -> dest_path)
+    rescan     directory whose entries may have changed unseen (after overflow)
+
+Watches are added lazily: start() returns immediately and the watcher thread
+walks the tree breadth-first in small batches between event reads, so edits
+in already-watched directories are reported while a 100k-file tree is still
+being indexed. Directories in SKIP_DIRS are never watched. New directories
+are watched as they appear, and files already inside them are reported as
+created.
+
+If the kernel queue overflows (IN_Q_OVERFLOW), events were lost. Only stat
+calls are used to recover: files modified since the last clean read are
+reported as modified, and directories whose entries changed are reported as
+rescan (their listing changed, e.g. files deleted) and re-watched.
+
+Disable with ORCHESTR8_INOTIFY=0 (HealthWatcher then falls back to watchdog).
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from IP.env_flags import env_flag
+    from IP.woven_maps import SKIP_DIRS
+except ImportError:
+    # Fallback for standalone use
+    from env_flags import env_flag
+    from woven_maps import SKIP_DIRS
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_DELETE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW | IN_EXCL_UNLINK
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+READ_BUFFER_BYTES = 64 * 1024
+
+# Directories watched per step of the lazy initial walk
+WATCH_BATCH_DIRS = 256
+
+# Filesystem timestamp slack when deciding what changed during an overflow
+OVERFLOW_SLACK_NS = 2_000_000_000
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+INOTIFY_AVAILABLE = _libc is not None
+
+
+def inotify_enabled() -> bool:
+    """inotify is used unless ORCHESTR8_INOTIFY is set to a falsy value."""
+    return INOTIFY_AVAILABLE and env_flag("ORCHESTR8_INOTIFY")
+
+
+@dataclass
+class FileEvent:
+    """Watchdog-compatible change event (event_type, src_path, is_directory)."""
+    event_type: str  # "modified" | "created" | "deleted" | "moved" | "rescan"
+    src_path: str
+    is_directory: bool = False
+    dest_path: Optional[str] = None
+
+
+class InotifyWatcher:
+    """Recursive inotify watch of one directory tree (see module docstring)."""
+
+    def __init__(
+        self,
+        root: str,
+        callback: Callable[[FileEvent], None],
+        skip_dirs: Iterable[str] = SKIP_DIRS,
+    ):
+        if not INOTIFY_AVAILABLE:
+            raise OSError("inotify is not available on this platform")
+        self.root = os.path.abspath(root)
+        self.callback = callback
+        self.skip_dirs = frozenset(skip_dirs)
+        self._fd = -1
+        self._wake_r = self._wake_w = -1
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._wd_to_dir: Dict[int, str] = {}
+        self._dir_to_wd: Dict[str, int] = {}
+        # (directory, report files already inside it as created)
+        self._pending_dirs: Deque[Tuple[str, bool]] = deque()
+        # Last moment all events were known to be delivered (for overflow)
+        self._synced_ns = 0
+        self.watch_limit_reached = False
+        self.overflows = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Begin watching; the tree is indexed in the background."""
+        if self._thread is not None:
+            return
+        fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self._wake_r, self._wake_w = os.pipe()
+        self._stopping = False
+        self._synced_ns = time.time_ns()
+        self._pending_dirs.append((self.root, False))
+        self._thread = threading.Thread(
+            target=self._run, name="inotify-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release the inotify descriptor."""
+        if self._thread is None:
+            return
+        self._stopping = True
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+        self._thread.join(timeout=5)
+        self._thread = None
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fd = self._wake_r = self._wake_w = -1
+        self._wd_to_dir.clear()
+        self._dir_to_wd.clear()
+        self._pending_dirs.clear()
+
+    @property
+    def watch_count(self) -> int:
+        return len(self._wd_to_dir)
+
+    def is_indexing(self) -> bool:
+        """True while the lazy walk still has directories to watch."""
+        return bool(self._pending_dirs)
+
+    # ------------------------------------------------------------------
+    # Watch management
+    # ------------------------------------------------------------------
+
+    def _skipped(self, name: str) -> bool:
+        return name in self.skip_dirs
+
+    def _add_watch(self, directory: str) -> bool:
+        if self.watch_limit_reached:
+            return False
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                self.watch_limit_reached = True
+                print(
+                    "InotifyWatcher: fs.inotify.max_user_watches reached; "
+                    f"{directory} and later directories are not watched"
+                )
+            return False
+        old = self._wd_to_dir.get(wd)
+        if old is not None and old != directory:
+            self._dir_to_wd.pop(old, None)
+        self._wd_to_dir[wd] = directory
+        self._dir_to_wd[directory] = wd
+        return True
+
+    def _watch_pending(self, limit: int) -> None:
+        """Watch up to limit queued directories, queueing their subdirectories."""
+        for _ in range(min(limit, len(self._pending_dirs))):
+            # Dequeued only once handled, so is_indexing() never runs ahead
+            directory, report_files = self._pending_dirs[0]
+            try:
+                if directory in self._dir_to_wd or not self._add_watch(directory):
+                    continue
+                try:
+                    entries = list(os.scandir(directory))
+                except OSError:
+                    continue
+            finally:
+                self._pending_dirs.popleft()
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._skipped(entry.name):
+                            self._pending_dirs.append((entry.path, report_files))
+                    elif report_files:
+                        # Created before the watch existed
+                        self._emit(FileEvent("created", entry.path))
+                except OSError:
+                    continue
+
+    def _forget_tree(self, directory: str) -> None:
+        """Drop watches at or below a directory that left the tree."""
+        prefix = directory + os.sep
+        for path in [p for p in self._dir_to_wd if p == directory or p.startswith(prefix)]:
+            wd = self._dir_to_wd.pop(path)
+            self._wd_to_dir.pop(wd, None)
+            _libc.inotify_rm_watch(self._fd, wd)
+
+    def _rename_tree(self, old: str, new: str) -> None:
+        """Watches follow a moved directory's inode; only their paths change."""
+        prefix = old + os.sep
+        for path in [p for p in self._dir_to_wd if p == old or p.startswith(prefix)]:
+            wd = self._dir_to_wd.pop(path)
+            moved = new + path[len(old):]
+            self._dir_to_wd[moved] = wd
+            self._wd_to_dir[wd] = moved
+
+    # ------------------------------------------------------------------
+    # Event loop
+    # ------------------------------------------------------------------
+
+    def _emit(self, event: FileEvent) -> None:
+        try:
+            self.callback(event)
+        except Exception as e:
+            print(f"InotifyWatcher callback error: {e}")
+
+    def _run(self) -> None:
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        poller.register(self._wake_r, select.POLLIN)
+        while not self._stopping:
+            # Block indefinitely once indexed; otherwise just check for events
+            timeout = 0 if self._pending_dirs else None
+            try:
+                ready = poller.poll(timeout)
+            except InterruptedError:
+                continue
+            if self._stopping:
+                break
+            if any(fd == self._fd for fd, _ in ready):
+                self._read_events()
+            if self._pending_dirs:
+                self._watch_pending(WATCH_BATCH_DIRS)
+
+    def _read_events(self) -> None:
+        while True:
+            read_at = time.time_ns()
+            try:
+                data = os.read(self._fd, READ_BUFFER_BYTES)
+            except BlockingIOError:
+                return
+            except OSError:
+                return
+            if not data:
+                return
+            overflowed = self._dispatch(self._parse(data))
+            if overflowed:
+                self._recover_from_overflow()
+            else:
+                self._synced_ns = read_at
+
+    def _parse(self, data: bytes) -> List[Tuple[int, int, int, str]]:
+        events = []
+        offset = 0
+        header_size = _EVENT_HEADER.size
+        while offset + header_size <= len(data):
+            wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += header_size
+            raw_name = data[offset:offset + length].split(b"\0", 1)[0]
+            offset += length
+            events.append((wd, mask, cookie, os.fsdecode(raw_name)))
+        return events
+
+    def _dispatch(self, events: List[Tuple[int, int, int, str]]) -> bool:
+        """Translate one read's events; returns True on queue overflow."""
+        overflowed = False
+        # Rename halves arrive as MOVED_FROM/MOVED_TO pairs sharing a cookie
+        moved_from: Dict[int, Tuple[str, bool]] = {}
+        paired: Set[int] = set()
+        for wd, mask, cookie, name in events:
+            if mask & IN_MOVED_TO and cookie:
+                paired.add(cookie)
+
+        for wd, mask, cookie, name in events:
+            if mask & IN_Q_OVERFLOW:
+                overflowed = True
+                continue
+            if mask & IN_IGNORED:
+                directory = self._wd_to_dir.pop(wd, None)
+                if directory is not None and self._dir_to_wd.get(directory) == wd:
+                    del self._dir_to_wd[directory]
+                continue
+            directory = self._wd_to_dir.get(wd)
+            if directory is None:
+                continue
+            if not name:
+                if mask & IN_DELETE_SELF and directory == self.root:
+                    self._emit(FileEvent("deleted", directory, is_directory=True))
+                continue  # Other self-events are reported by the parent
+
+            path = os.path.join(directory, name)
+            is_dir = bool(mask & IN_ISDIR)
+            if is_dir and self._skipped(name):
+                continue
+
+            if mask & IN_CLOSE_WRITE:
+                self._emit(FileEvent("modified", path))
+            elif mask & IN_CREATE:
+                if is_dir:
+                    self._pending_dirs.append((path, True))
+                self._emit(FileEvent("created", path, is_directory=is_dir))
+            elif mask & IN_DELETE:
+                if is_dir:
+                    self._forget_tree(path)
+                self._emit(FileEvent("deleted", path, is_directory=is_dir))
+            elif mask & IN_MOVED_FROM:
+                if cookie in paired:
+                    moved_from[cookie] = (path, is_dir)
+                else:
+                    # Moved out of the watched tree
+                    if is_dir:
+                        self._forget_tree(path)
+                    self._emit(FileEvent("deleted", path, is_directory=is_dir))
+            elif mask & IN_MOVED_TO:
+                source = moved_from.pop(cookie, None)
+                if source is None:
+                    # Moved in from outside: new content, possibly a whole tree
+                    if is_dir:
+                        self._pending_dirs.append((path, True))
+                    self._emit(FileEvent("created", path, is_directory=is_dir))
+                else:
+                    if is_dir:
+                        self._rename_tree(source[0], path)
+                    self._emit(FileEvent("moved", source[0], is_directory=is_dir, dest_path=path))
+        return overflowed
+
+    def _recover_from_overflow(self) -> None:
+        """
+        Targeted rescan after lost events, using stat() only.
+
+        Files modified since the last clean read are reported as modified;
+        directories whose entry list changed since then are reported as
+        rescan (files may have been deleted there) and their new
+        subdirectories are watched.
+        """
+        self.overflows += 1
+        since = self._synced_ns - OVERFLOW_SLACK_NS
+        self._synced_ns = time.time_ns()
+        for directory in list(self._dir_to_wd):
+            try:
+                dir_changed = os.stat(directory).st_mtime_ns >= since
+                entries = list(os.scandir(directory))
+            except OSError:
+                self._forget_tree(directory)
+                self._emit(FileEvent("deleted", directory, is_directory=True))
+                continue
+            if dir_changed:
+                self._emit(FileEvent("rescan", directory, is_directory=True))
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._skipped(entry.name) and entry.path not in self._dir_to_wd:
+                            self._pending_dirs.append((entry.path, True))
+                    elif entry.stat(follow_symlinks=False).st_mtime_ns >= since:
+                        self._emit(FileEvent("modified", entry.path))
+                except OSError:
+                    continue
@@ -0,0 +1,244 @@
+# IP/module_index.py
+"""
+Module Index - Precomputed file-name lookup for broken-import suggestions.
+
+ConnectionVerifier._suggest_fix used to os.walk() the whole project for every
+broken import. ModuleNameIndex is built from one walk and answers each query
+from in-memory tables:
+
+    stems      lowercase file stem -> entries   (exact matches)
+    trigrams   padded stem trigram -> stem ids  (fuzzy candidates)
+
+Fuzzy candidates (only needed when exact stems don't fill the result) are
+the stems sharing the most trigrams with the query, re-ranked by
+bit-parallel Levenshtein distance. Results are memoized per query. Among equally close stems, paths
+whose module path matches more of the import (e.g. `pkg.utils` vs
+`other/utils.py`) rank first.
+"""
+
+import heapq
+import os
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+PYTHON_EXTENSIONS = frozenset({".py"})
+JS_EXTENSIONS = frozenset({".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx"})
+
+# Fuzzy matching limits
+MIN_SIMILARITY = 0.6     # 1 - distance / longer length
+TRIGRAM_CANDIDATES = 12  # Stems re-ranked by edit distance per query
+
+
+@dataclass(frozen=True)
+class ModuleEntry:
+    """One indexed source file."""
+    path: str                 # Project-relative, OS separators
+    module: str               # Dotted module path (.py) or extensionless path
+    parts: Tuple[str, ...]    # Lowercase module segments, for suffix matching
+    extension: str
+
+
+@dataclass(frozen=True)
+class ModuleSuggestion:
+    """Ranked "did you mean" candidate."""
+    path: str
+    module: str
+    score: float  # 1.0 = exact stem match
+
+
+def _module_parts(rel_path: str) -> Tuple[str, Tuple[str, ...]]:
+    path = Path(rel_path)
+    parts = list(path.with_suffix("").parts)
+    if path.suffix == ".py":
+        if parts and parts[-1] == "__init__" and len(parts) > 1:
+            parts.pop()
+        module = ".".join(parts)
+    else:
+        if parts and parts[-1] == "index" and len(parts) > 1:
+            parts.pop()
+        module = "/".join(parts)
+    return module, tuple(part.lower() for part in parts)
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """
+    Levenshtein distance with Myers/Hyyro bit-parallel rows.
+
+    Each column of the DP matrix is a pair of bit vectors over a (Python
+    ints), so the cost is O(len(b)) big-int operations instead of
+    O(len(a) * len(b)) interpreted cell updates.
+    """
+    if not a:
+        return len(b)
+    if not b:
+        return len(a)
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(a):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    mask = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    pv, mv, score = mask, 0, len(a)
+    for char in b:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+def _query_parts(target: str) -> Tuple[str, Tuple[str, ...]]:
+    """Split an import specifier into (stem, lowercase module segments)."""
+    spec = target.strip()
+    if "/" in spec or spec.startswith("."):
+        if "/" in spec:
+            pieces = [p for p in spec.split("/") if p not in ("", ".", "..")]
+        else:
+            pieces = [p for p in spec.split(".") if p]  # from .. import x
+        if pieces:
+            last = pieces[-1]
+            stem, ext = os.path.splitext(last)
+            pieces[-1] = stem if ext.lower() in JS_EXTENSIONS else last
+    else:
+        pieces = [p for p in spec.split(".") if p]
+    parts = tuple(p.lower() for p in pieces)
+    return (parts[-1] if parts else ""), parts
+
+
+class ModuleNameIndex:
+    """Stem, trigram and module-path lookup over a project's source files."""
+
+    def __init__(self, paths: Iterable[str]):
+        self.entries: List[ModuleEntry] = []
+        self._stems: Dict[str, List[ModuleEntry]] = {}
+        self._trigrams: Dict[str, List[str]] = {}
+        # Query results; the index is immutable, so entries never go stale
+        self._memo: Dict[tuple, List[ModuleSuggestion]] = {}
+
+        for rel_path in paths:
+            extension = Path(rel_path).suffix.lower()
+            module, parts = _module_parts(rel_path)
+            entry = ModuleEntry(rel_path, module, parts, extension)
+            self.entries.append(entry)
+            stem = Path(rel_path).stem.lower()
+            self._add(stem, entry)
+            if parts and parts[-1] != stem:
+                # Packages (__init__.py, index.js) are also found by directory name
+                self._add(parts[-1], entry)
+
+    def _add(self, stem: str, entry: ModuleEntry) -> None:
+        bucket = self._stems.get(stem)
+        if bucket is None:
+            bucket = self._stems[stem] = []
+            for gram in _trigrams(stem):
+                self._trigrams.setdefault(gram, []).append(stem)
+        bucket.append(entry)
+
+    @classmethod
+    def scan(
+        cls,
+        project_root: str,
+        exclude_dirs: Iterable[str] = (),
+        extensions: Iterable[str] = PYTHON_EXTENSIONS | JS_EXTENSIONS,
+    ) -> "ModuleNameIndex":
+        """Index every source file under project_root in one walk."""
+        root = Path(project_root)
+        excluded = set(exclude_dirs)
+        wanted = {ext.lower() for ext in extensions}
+        paths = []
+        for dirpath, dirs, files in os.walk(root):
+            dirs[:] = [d for d in dirs if d not in excluded]
+            for name in files:
+                if os.path.splitext(name)[1].lower() in wanted:
+                    paths.append(str((Path(dirpath) / name).relative_to(root)))
+        return cls(paths)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _similar_stems(self, stem: str) -> List[Tuple[str, float]]:
+        shared: Counter = Counter()
+        for gram in _trigrams(stem):
+            shared.update(self._trigrams.get(gram, ()))
+        shared.pop(stem, None)
+        ranked = heapq.nsmallest(
+            TRIGRAM_CANDIDATES, shared.items(), key=lambda item: (-item[1], item[0])
+        )
+
+        matches = []
+        for candidate, _ in ranked:
+            longest = max(len(stem), len(candidate))
+            limit = longest * (1 - MIN_SIMILARITY)
+            if abs(len(stem) - len(candidate)) > limit:
+                continue
+            distance = _edit_distance(stem, candidate)
+            if distance <= limit:
+                matches.append((candidate, 1 - distance / longest))
+        return matches
+
+    def suggest(
+        self,
+        target: str,
+        extensions: Optional[Iterable[str]] = None,
+        limit: int = 5,
+    ) -> List[ModuleSuggestion]:
+        """
+        Ranked candidates for an unresolved import specifier.
+
+        Args:
+            target: Import as written (`pkg.mod`, `./utils/helper`, `..models`)
+            extensions: Only suggest files with these extensions
+            limit: Maximum number of suggestions
+        """
+        stem, parts = _query_parts(target)
+        if not stem:
+            return []
+        wanted = frozenset(ext.lower() for ext in extensions) if extensions else None
+        key = (stem, parts, wanted, limit)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return list(cached)
+
+        scored: List[Tuple[float, int, int, str, ModuleEntry]] = []
+
+        def score(candidate: str, similarity: float) -> None:
+            for entry in self._stems[candidate]:
+                if wanted is not None and entry.extension not in wanted:
+                    continue
+                # Trailing module segments shared with the import, beyond the stem
+                overlap = 0
+                for mine, theirs in zip(reversed(entry.parts[:-1]), reversed(parts[:-1])):
+                    if mine != theirs:
+                        break
+                    overlap += 1
+                scored.append((-similarity, -overlap, len(entry.parts), entry.path, entry))
+
+        if stem in self._stems:
+            score(stem, 1.0)
+        if len(scored) < limit:
+            # Not enough exact hits - widen to near-miss spellings
+            for candidate, similarity in self._similar_stems(stem):
+                score(candidate, similarity)
+
+        scored.sort(key=lambda item: item[:4])
+        suggestions = [
+            ModuleSuggestion(entry.path, entry.module, round(-neg_similarity, 3))
+            for neg_similarity, _, _, _, entry in scored[:limit]
+        ]
+        self._memo[key] = suggestions
+        return list(suggestions)
@@ -96,13 +96,15 @@ except ImportError:
     HAS_ANTHROPIC = False
 
 # Import Woven Maps Code City visualization
-from IP.woven_maps import create_code_city, build_graph_data
+from IP.woven_maps import code_city_delivery, create_code_city, build_graph_data
+from IP.code_city_live import live_city_for
 
 # Import contract validation for node click events and building panel
 from IP.contracts.code_city_node_event import validate_code_city_node_event
 from IP.contracts.connection_action_event import validate_connection_action_event
 from IP.contracts.building_panel import validate_building_panel, BuildingPanel
 from IP.connection_verifier import dry_run_patchbay_rewire, apply_patchbay_rewire
+from IP.graph_snapshot import ConnectionGraphSession
 import json
 
 
@@ -267,12 +269,32 @@ def render(STATE_MANAGERS: dict) -> Any:
 
     def on_health_change(results: dict) -> None:
         """Callback when health check completes - merges into health state."""
-        current = get_health() or {}
+        health = get_health()
+        current = health if health is not None else {}
         current.update(results)
+
+        # A live Code City is patched in place; the state dicts are updated
+        # without their setters so the iframe (camera, animation) survives
+        live_city = live_city_for(str(project_root_path))
+        if health is not None and live_city is not None:
+            pushed = live_city.update(
+                current, combat_tracker.get_combat_files(), changed_fiefdoms=list(results)
+            )
+            if pushed is not None:
+                timestamp = datetime.now().strftime("%H:%M:%S")
+                get_logs().append(
+                    f"[{timestamp}] [Maestro] Health update: {len(results)} fiefdom(s) "
+                    f"checked, {pushed} live patch(es)"
+                )
+                return
+
         set_health(current)
-        log_action(f"Health update: {len(results)} file(s) checked")
+        log_action(f"Health update: {len(results)} fiefdom(s) checked")
 
     health_watcher = HealthWatcher(str(project_root_path), on_health_change)
+    # Patchbay dry-runs query one graph, kept current from watcher events
+    connection_graph_session = ConnectionGraphSession(str(project_root_path))
+    health_watcher.add_change_listener(connection_graph_session.mark_changed)
 
     def refresh_health() -> None:
         """Run HealthChecker on project root and update health state."""
@@ -634,6 +656,9 @@ def render(STATE_MANAGERS: dict) -> Any:
                     source_file=source,
                     current_target=target,
                     proposed_target=proposed,
+                    graph=connection_graph_session.graph(
+                        refresh=not health_watcher.is_watching
+                    ),
                 )
 
                 if dry_run.get("canApply"):
@@ -766,6 +791,7 @@ def render(STATE_MANAGERS: dict) -> Any:
             )
 
             if apply_result.get("applied"):
+                connection_graph_session.mark_changed(source)
                 log_action(
                     "Patchbay APPLY PASS: "
                     f"{source}:{apply_result.get('lineNumber', '?')} "
@@ -1505,11 +1531,23 @@ def render(STATE_MANAGERS: dict) -> Any:
                     health_data = {}
 
             # Create the Code City visualization with health data merged in.
-            # Guard oversized inline payloads before marimo serializes output.
+            # Oversized inline payloads switch to stream delivery (a single
+            # iframe src; graph chunks load progressively over loopback)
+            # before marimo serializes output.
             result = create_code_city(
-                root, width=850, height=500, health_results=health_data or None
+                root,
+                width=850,
+                height=500,
+                health_results=health_data or None,
+                max_inline_bytes=max_payload_bytes,
             )
             payload_size = _payload_size_bytes(result)
+            if code_city_delivery() != "stream" and "srcdoc=" not in getattr(result, "text", "srcdoc="):
+                log_action(
+                    "Code City payload too large inline; switched to stream delivery "
+                    f"(limit {max_payload_bytes} bytes)."
+                )
+
             if payload_size > max_payload_bytes:
                 ip_root = Path(root) / "IP"
                 if ip_root.is_dir() and str(ip_root) != str(root):
@@ -0,0 +1,218 @@
+# IP/reachability.py
+"""
+Reachability Index - Transitive "what does X reach" queries on a CSRGraph.
+
+The graph is collapsed into its condensation DAG (one vertex per strongly
+connected component, ids in Tarjan order, which is reverse topological).
+One pass over that order builds a descendant closure per component as a
+Python int bitset:
+
+    descendants[c] = bit(c) | OR(descendants[d] for d in successors(c))
+
+and the same over the reversed DAG for ancestors. Unbounded queries are then
+bit operations:
+
+- can_reach(a, b): one bit test
+- reaches / reached_by: decode one closure
+- path_edges(a, b): nodes in descendants(a) & ancestors(b), then only the
+  edges among them
+
+Depth-limited queries run a BFS, pruned to nodes that can still matter
+(e.g. a forward search towards b never enters a node that cannot reach b).
+Closures cost components^2 / 8 bytes; above CLOSURE_MAX_COMPONENTS the index
+answers everything by (pruning-free) BFS instead.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from IP.graph_core import CSRGraph, strongly_connected_components
+except ImportError:
+    # Fallback for standalone use
+    from graph_core import CSRGraph, strongly_connected_components
+
+# 20k components -> ~50 MB of closure bits per direction at worst
+CLOSURE_MAX_COMPONENTS = 20000
+
+
+def _bit_indices(bits: int) -> List[int]:
+    """Indices of set bits, lowest first."""
+    digits = bin(bits)[:1:-1]  # Little-endian digit string, "0b" dropped
+    indices = []
+    i = digits.find("1")
+    while i != -1:
+        indices.append(i)
+        i = digits.find("1", i + 1)
+    return indices
+
+
+class ReachabilityIndex:
+    """Precomputed reachability over a directed graph (see module docstring)."""
+
+    def __init__(self, graph: CSRGraph):
+        self.graph = graph
+        self.reverse_graph = graph.reverse()
+        components = strongly_connected_components(graph)
+        self.components = components
+        self.component_of = [0] * len(graph)
+        for c, members in enumerate(components):
+            for node in members:
+                self.component_of[node] = c
+
+        self.descendants: Optional[List[int]] = None
+        self.ancestors: Optional[List[int]] = None
+        if len(components) <= CLOSURE_MAX_COMPONENTS:
+            self.descendants = self._closure(graph)
+            self.ancestors = self._closure(self.reverse_graph)
+
+    @classmethod
+    def from_connection_graph(cls, connection_graph) -> "ReachabilityIndex":
+        """Index the resolved import edges of a ConnectionGraph."""
+        return cls(connection_graph._build_graph())
+
+    def _closure(self, graph: CSRGraph) -> List[int]:
+        """Per-component closure bitsets along graph's edge direction."""
+        offsets, targets = graph.offsets, graph.targets
+        component_of = self.component_of
+        count = len(self.components)
+        closure = [0] * count
+        # Tarjan order is reverse topological for the forward graph and
+        # topological for the reversed one; visit so successors come first.
+        order = range(count) if graph is self.graph else range(count - 1, -1, -1)
+        for c in order:
+            bits = 1 << c
+            seen = {c}
+            for node in self.components[c]:
+                for k in range(offsets[node], offsets[node + 1]):
+                    d = component_of[targets[k]]
+                    if d not in seen:
+                        seen.add(d)
+                        bits |= closure[d]
+            closure[c] = bits
+        return closure
+
+    def _index(self, node_id: str) -> int:
+        try:
+            return self.graph.index[node_id]
+        except KeyError:
+            raise KeyError(f"Unknown node: {node_id}") from None
+
+    def _members(self, component_bits: int) -> List[int]:
+        return [
+            node
+            for c in _bit_indices(component_bits)
+            for node in self.components[c]
+        ]
+
+    def _bfs(
+        self,
+        graph: CSRGraph,
+        start: int,
+        max_depth: Optional[int],
+        allowed: Optional[int] = None,
+    ) -> Dict[int, int]:
+        """Hop distances from start, optionally limited to allowed components."""
+        offsets, targets = graph.offsets, graph.targets
+        component_of = self.component_of
+        depth = {start: 0}
+        frontier = [start]
+        level = 0
+        while frontier and (max_depth is None or level < max_depth):
+            level += 1
+            next_frontier = []
+            for node in frontier:
+                for k in range(offsets[node], offsets[node + 1]):
+                    child = targets[k]
+                    if child in depth:
+                        continue
+                    if allowed is not None and not (allowed >> component_of[child]) & 1:
+                        continue
+                    depth[child] = level
+                    next_frontier.append(child)
+            frontier = next_frontier
+        return depth
+
+    def _ids(self, nodes: Iterable[int]) -> Set[str]:
+        ids = self.graph.ids
+        return {ids[node] for node in nodes}
+
+    def can_reach(self, source: str, target: str) -> bool:
+        """True if a (possibly empty) path leads from source to target."""
+        s, t = self._index(source), self._index(target)
+        if self.descendants is not None:
+            return bool((self.descendants[self.component_of[s]] >> self.component_of[t]) & 1)
+        return t in self._bfs(self.graph, s, None)
+
+    def reaches(self, node_id: str, max_depth: Optional[int] = None) -> Set[str]:
+        """Nodes reachable from node_id (including itself) within max_depth hops."""
+        start = self._index(node_id)
+        if max_depth is None and self.descendants is not None:
+            return self._ids(self._members(self.descendants[self.component_of[start]]))
+        return self._ids(self._bfs(self.graph, start, max_depth))
+
+    def reached_by(self, node_id: str, max_depth: Optional[int] = None) -> Set[str]:
+        """Nodes that reach node_id (including itself) within max_depth hops."""
+        start = self._index(node_id)
+        if max_depth is None and self.ancestors is not None:
+            return self._ids(self._members(self.ancestors[self.component_of[start]]))
+        return self._ids(self._bfs(self.reverse_graph, start, max_depth))
+
+    def _between(self, s: int, t: int) -> Optional[int]:
+        """Component bits lying on some s -> t path (None without closures)."""
+        if self.descendants is None:
+            return None
+        return self.descendants[self.component_of[s]] & self.ancestors[self.component_of[t]]
+
+    def path_edges(
+        self, source: str, target: str, max_depth: Optional[int] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Edges (u, v) on some source -> target path of at most max_depth hops.
+
+        An edge qualifies when dist(source, u) + 1 + dist(v, target) fits the
+        limit (any path, when max_depth is None).
+        """
+        s, t = self._index(source), self._index(target)
+        between = self._between(s, t)
+        if between == 0:
+            return []
+        forward = self._bfs(self.graph, s, max_depth, between)
+        backward = self._bfs(self.reverse_graph, t, max_depth, between)
+
+        offsets, targets, ids = self.graph.offsets, self.graph.targets, self.graph.ids
+        edges = []
+        for u, du in forward.items():
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                dv = backward.get(v)
+                if dv is not None and (max_depth is None or du + 1 + dv <= max_depth):
+                    edges.append((ids[u], ids[v]))
+        return edges
+
+    def signal_path(
+        self, source: str, target: str, max_depth: int = 6
+    ) -> Tuple[Set[str], List[Tuple[str, str]]]:
+        """
+        Code City signal path for a selected source -> target connection.
+
+        Same answer as the template's computeSignalPath: nodes within
+        max_depth hops downstream of source and upstream of target, plus
+        every edge between two such nodes.
+        """
+        s, t = self._index(source), self._index(target)
+        between = self._between(s, t)
+        forward = self._bfs(self.graph, s, max_depth, between)
+        backward = self._bfs(self.reverse_graph, t, max_depth, between)
+        inner = forward.keys() & backward.keys()
+        signal = inner | {s, t}
+
+        offsets, targets, ids = self.graph.offsets, self.graph.targets, self.graph.ids
+        edges = [
+            (ids[u], ids[targets[k]])
+            for u in inner
+            for k in range(offsets[u], offsets[u + 1])
+            if targets[k] in inner
+        ]
+        if (source, target) not in edges:
+            edges.append((source, target))
+        return self._ids(signal), edges
@@ -0,0 +1,174 @@
+# IP/scan_cache.py
+"""
+Scan Cache - Persistent per-file analysis cache for Woven Maps Code City scans.
+
+Entries are keyed by (path, mtime, size, content hash) and hold the CodeNode
+metrics produced by woven_maps.analyze_file() (loc, export_count, errors,
+status, building geometry). Lookups are two-tier:
+
+- stat match (mtime_ns + size): trusted outright, the file is not read
+- stat mismatch: the caller hashes the content; an identical hash keeps the
+  entry warm (git checkout, formatters that rewrite unchanged files)
+
+Only files that actually changed are re-analyzed.
+
+Cache file: <project_root>/.orchestr8/scan_cache.json
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    from IP.env_flags import env_flag
+except ImportError:
+    # Fallback for standalone use
+    from env_flags import env_flag
+
+# Bump when analyze_file() output changes so stale metrics are discarded.
+SCAN_CACHE_VERSION = 1
+SCAN_CACHE_FILENAME = "scan_cache.json"
+
+
+def content_digest(raw: bytes) -> str:
+    """Return a short, stable content hash for cache validation."""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def scan_cache_enabled() -> bool:
+    """Scan cache is on unless ORCHESTR8_SCAN_CACHE is set to a falsy value."""
+    return env_flag("ORCHESTR8_SCAN_CACHE")
+
+
+class ScanCache:
+    """On-disk metrics cache for one project root."""
+
+    def __init__(self, project_root: str, cache_path: Optional[str] = None):
+        self.project_root = Path(project_root).resolve()
+        self.cache_path = (
+            Path(cache_path)
+            if cache_path
+            else self.project_root / ".orchestr8" / SCAN_CACHE_FILENAME
+        )
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        """Load entries from disk once; a corrupt or foreign file is ignored."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(payload, dict)
+            and payload.get("version") == SCAN_CACHE_VERSION
+            and isinstance(payload.get("entries"), dict)
+        ):
+            self._entries = payload["entries"]
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._entries)
+
+    def get(self, relpath: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return cached metrics when mtime and size still match."""
+        self._load()
+        entry = self._entries.get(relpath)
+        if (
+            entry is not None
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+        ):
+            self.hits += 1
+            return entry["metrics"]
+        return None
+
+    def known_digest(self, relpath: str) -> Optional[str]:
+        """Content hash recorded for a file, if any."""
+        self._load()
+        entry = self._entries.get(relpath)
+        return entry.get("sha") if entry else None
+
+    def get_by_digest(
+        self, relpath: str, st: os.stat_result, digest: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return cached metrics when the content hash is unchanged.
+
+        Refreshes the stored stat so the next lookup is a cheap stat match.
+        """
+        self._load()
+        entry = self._entries.get(relpath)
+        if entry is None or entry.get("sha") != digest:
+            return None
+        entry["mtime_ns"] = st.st_mtime_ns
+        entry["size"] = st.st_size
+        self._dirty = True
+        self.hits += 1
+        return entry["metrics"]
+
+    def put(
+        self,
+        relpath: str,
+        st: os.stat_result,
+        digest: str,
+        metrics: Dict[str, Any],
+    ) -> None:
+        """Store freshly computed metrics for a file (counted as a miss)."""
+        self._load()
+        self.misses += 1
+        self._entries[relpath] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha": digest,
+            "metrics": metrics,
+        }
+        self._dirty = True
+
+    def prune(self, seen: Iterable[str]) -> int:
+        """
+        Drop entries for deleted files. Returns number removed.
+
+        Entries outside seen are only removed once their file is gone, so
+        scans with different extension/skip sets can share one cache.
+        """
+        self._load()
+        seen_set = set(seen)
+        stale = [
+            path
+            for path in self._entries
+            if path not in seen_set and not (self.project_root / path).exists()
+        ]
+        for path in stale:
+            del self._entries[path]
+        if stale:
+            self._dirty = True
+        return len(stale)
+
+    def save(self) -> None:
+        """Persist entries atomically if anything changed."""
+        if not self._dirty:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": SCAN_CACHE_VERSION, "entries": self._entries},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError:
+            # Read-only checkout: scanning still works, just without persistence.
+            pass
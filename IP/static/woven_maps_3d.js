@@ -274,6 +274,20 @@ class CodeCityScene {
         `;
     }
     
+    /**
+     * Decode a packed {type: 'f32', stride, data} block (base64 little-endian
+     * Float32 rows) into a flat Float32Array.
+     * 
+     * @param {Object} packed - particleData / edgeData from barradeau_builder.py
+     * @returns {Float32Array} Row-major values
+     */
+    decodePackedRows(packed) {
+        const binary = atob(packed.data);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+        return new Float32Array(bytes.buffer, 0, bytes.length / 4);
+    }
+    
     /**
      * Create a particle mesh from BuildingData.
      * 
@@ -282,23 +296,37 @@ class CodeCityScene {
      * @returns {THREE.Points} Particle mesh
      */
     createBuildingMesh(buildingData, useCustomShader = true) {
-        const particles = buildingData.particles;
-        const positions = new Float32Array(particles.length * 3);
-        const opacities = new Float32Array(particles.length);
-        const sizes = new Float32Array(particles.length);
+        const packed = buildingData.particleData ? this.decodePackedRows(buildingData.particleData) : null;
+        const particles = buildingData.particles || [];
+        const count = packed ? packed.length / 5 : particles.length;
+        const positions = new Float32Array(count * 3);
+        const opacities = new Float32Array(count);
+        const sizes = new Float32Array(count);
         
         const color = new THREE.Color(this.getStatusColor(buildingData.status));
         
-        for (let i = 0; i < particles.length; i++) {
-            const p = particles[i];
-            const i3 = i * 3;
-            
-            positions[i3] = p.x;
-            positions[i3 + 1] = p.y;
-            positions[i3 + 2] = p.z;
-            
-            opacities[i] = p.opacity !== undefined ? p.opacity : 1.0;
-            sizes[i] = p.size || (CONFIG_3D.PARTICLE_MIN_SIZE + Math.random() * 0.2);
+        if (packed) {
+            // Rows of [x, y, z, opacity, size] from barradeau_builder's NumPy path
+            for (let i = 0, row = 0; i < count; i++, row += 5) {
+                const i3 = i * 3;
+                positions[i3] = packed[row];
+                positions[i3 + 1] = packed[row + 1];
+                positions[i3 + 2] = packed[row + 2];
+                opacities[i] = packed[row + 3];
+                sizes[i] = packed[row + 4];
+            }
+        } else {
+            for (let i = 0; i < count; i++) {
+                const p = particles[i];
+                const i3 = i * 3;
+                
+                positions[i3] = p.x;
+                positions[i3 + 1] = p.y;
+                positions[i3 + 2] = p.z;
+                
+                opacities[i] = p.opacity !== undefined ? p.opacity : 1.0;
+                sizes[i] = p.size || (CONFIG_3D.PARTICLE_MIN_SIZE + Math.random() * 0.2);
+            }
         }
         
         const geometry = new THREE.BufferGeometry();
@@ -337,7 +365,7 @@ class CodeCityScene {
         mesh.userData = {
             path: buildingData.path,
             status: buildingData.status,
-            particleCount: particles.length,
+            particleCount: count,
             useCustomShader: useCustomShader
         };
         
@@ -351,12 +379,15 @@ class CodeCityScene {
      * @returns {THREE.LineSegments} Wireframe mesh
      */
     createBuildingLines(buildingData) {
-        const edges = buildingData.edges;
-        const positions = [];
-        
-        for (const edge of edges) {
-            positions.push(edge.a.x, edge.a.y, edge.a.z);
-            positions.push(edge.b.x, edge.b.y, edge.b.z);
+        // Packed edge rows [ax, ay, az, bx, by, bz] are already line-segment positions
+        let positions = buildingData.edgeData ? this.decodePackedRows(buildingData.edgeData) : null;
+        
+        if (!positions) {
+            positions = [];
+            for (const edge of buildingData.edges || []) {
+                positions.push(edge.a.x, edge.a.y, edge.a.z);
+                positions.push(edge.b.x, edge.b.y, edge.b.z);
+            }
         }
         
         const geometry = new THREE.BufferGeometry();
@@ -488,6 +519,27 @@ class CodeCityScene {
         this.buildings = [];
     }
     
+    /**
+     * Remove one building from the scene (live patches).
+     *
+     * @param {string} path - Building path
+     */
+    removeBuilding(path) {
+        const index = this.buildingMeshes.findIndex((meshGroup) => meshGroup.data.path === path);
+        if (index === -1) return;
+        const meshGroup = this.buildingMeshes[index];
+
+        this.scene.remove(meshGroup.particles);
+        this.scene.remove(meshGroup.lines);
+        meshGroup.particles.geometry.dispose();
+        meshGroup.particles.material.dispose();
+        meshGroup.lines.geometry.dispose();
+        meshGroup.lines.material.dispose();
+
+        this.buildingMeshes.splice(index, 1);
+        this.buildings = this.buildings.filter((data) => data !== meshGroup.data);
+    }
+
     /**
      * Load buildings from array of BuildingData.
      * 
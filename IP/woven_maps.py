@@ -18,14 +18,19 @@ import json
 import html
 import math
 import os
+import posixpath
 import re
 import ast
+import functools
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 
 from IP.contracts.status_merge_policy import merge_status
+from IP.executor_pool import ExecutorMode, parallel_map
+from IP.graph_codec import encode_columnar, graph_encoding
+from IP.scan_cache import ScanCache, content_digest, scan_cache_enabled
 
 # =============================================================================
 # COLOR CONSTANTS - EXACT, NO EXCEPTIONS
@@ -218,7 +223,13 @@ class GraphData:
             "config": self.config.to_dict(),
         }
 
-    def to_json(self) -> str:
+    def to_columnar(self) -> Dict[str, Any]:
+        """Columnar form of to_dict() (see IP/graph_codec.py)."""
+        return encode_columnar(self.to_dict())
+
+    def to_json(self, encoding: str = "json") -> str:
+        if encoding == "columnar":
+            return json.dumps(self.to_columnar(), separators=(",", ":"))
         return json.dumps(self.to_dict())
 
 
@@ -336,9 +347,18 @@ def estimate_export_count(filepath: Path, content: str) -> int:
     return 0
 
 
-def get_file_metrics(root: Path, relpath: str) -> tuple[int, int]:
+def get_file_metrics(
+    root: Path, relpath: str, cache: Optional[ScanCache] = None
+) -> tuple[int, int]:
     """Return (loc, export_count) for a file relative to project root."""
     filepath = root / relpath
+    if cache is not None:
+        try:
+            metrics = _cached_file_metrics(filepath, relpath, cache)
+        except OSError:
+            return 0, 0
+        return metrics["line_count"], metrics["export_count"]
+
     try:
         content = filepath.read_text(encoding="utf-8", errors="ignore")
     except Exception:
@@ -349,20 +369,60 @@ def get_file_metrics(root: Path, relpath: str) -> tuple[int, int]:
     return loc, export_count
 
 
+def collect_file_metrics(
+    root: Path,
+    relpaths: List[str],
+    cache: Optional[ScanCache] = None,
+    executor: Union[ExecutorMode, str, None] = None,
+) -> Dict[str, tuple[int, int]]:
+    """
+    Batch get_file_metrics(): {relpath: (loc, export_count)}.
+
+    Cache misses are analyzed through the executor pool.
+    """
+    unique = list(dict.fromkeys(relpaths))
+    records = _analyze_paths(Path(root), unique, cache, executor)
+    return {
+        relpath: (
+            (record["line_count"], record["export_count"])
+            if isinstance(record, dict)
+            else (0, 0)
+        )
+        for relpath, record in zip(unique, records)
+    }
+
+
+def open_scan_cache(root: str) -> Optional[ScanCache]:
+    """Return the project's ScanCache, or None when ORCHESTR8_SCAN_CACHE is off."""
+    if not scan_cache_enabled():
+        return None
+    return ScanCache(root)
+
+
 def scan_codebase(
     root: str,
     skip_dirs: Optional[set] = None,
     extensions: Optional[set] = None,
+    use_cache: bool = True,
+    executor: Union[ExecutorMode, str, None] = None,
 ) -> List[CodeNode]:
-    """Scan a codebase and return a list of CodeNodes."""
+    """
+    Scan a codebase and return a list of CodeNodes.
+
+    Unchanged files are served from the persistent scan cache
+    (.orchestr8/scan_cache.json); pass use_cache=False to force a full rescan.
+    Remaining files are analyzed through the executor pool (serial, thread or
+    process - auto-selected by file count unless executor is given). Output
+    order is the directory walk order either way.
+    """
     skip = skip_dirs or SKIP_DIRS
     exts = extensions or CODE_EXTENSIONS
-    nodes = []
 
     root_path = Path(root).resolve()
     if not root_path.exists():
-        return nodes
+        return []
 
+    relpaths = []
     for dirpath, dirnames, filenames in os.walk(root_path):
         dirnames[:] = [d for d in dirnames if d not in skip and not d.startswith(".")]
 
@@ -372,20 +432,21 @@ def scan_codebase(
                 continue
 
             filepath = Path(dirpath) / filename
-            relpath = str(filepath.relative_to(root_path))
+            relpaths.append(str(filepath.relative_to(root_path)))
 
-            try:
-                node = analyze_file(filepath, relpath)
-                nodes.append(node)
-            except Exception as e:
-                nodes.append(
-                    CodeNode(
-                        path=relpath,
-                        status="broken",
-                        loc=0,
-                        errors=[f"Read error: {str(e)}"],
-                    )
-                )
+    cache = open_scan_cache(str(root_path)) if use_cache else None
+    records = _analyze_paths(root_path, relpaths, cache, executor)
+
+    nodes = []
+    for relpath, record in zip(relpaths, records):
+        if isinstance(record, dict):
+            nodes.append(_node_from_metrics(relpath, record))
+        else:
+            nodes.append(CodeNode(path=relpath, status="broken", errors=[record]))
+
+    if cache is not None:
+        cache.prune(relpaths)
+        cache.save()
 
     return nodes
 
@@ -397,6 +458,166 @@ def analyze_file(filepath: Path, relpath: str) -> CodeNode:
     except Exception as e:
         return CodeNode(path=relpath, status="broken", errors=[str(e)])
 
+    return _analyze_content(filepath, relpath, content)
+
+
+def analyze_file_cached(filepath: Path, relpath: str, cache: ScanCache) -> CodeNode:
+    """analyze_file() backed by the scan cache; unchanged files are not re-parsed."""
+    try:
+        metrics = _cached_file_metrics(filepath, relpath, cache)
+    except OSError as e:
+        return CodeNode(path=relpath, status="broken", errors=[str(e)])
+
+    return _node_from_metrics(relpath, metrics)
+
+
+def _node_from_metrics(relpath: str, metrics: Dict[str, Any]) -> CodeNode:
+    """Rebuild a CodeNode from a cached/worker metrics record."""
+    return CodeNode(
+        path=relpath,
+        status=metrics["status"],
+        loc=metrics["loc"],
+        errors=list(metrics["errors"]),
+        export_count=metrics["export_count"],
+        building_height=metrics["building_height"],
+        footprint=metrics["footprint"],
+    )
+
+
+def _decode_source(raw: bytes) -> str:
+    """Decode file bytes exactly like read_text(encoding="utf-8", errors="ignore")."""
+    return raw.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_file_record(
+    filepath: Path, relpath: str, known_digest: Optional[str] = None
+) -> tuple[os.stat_result, str, Optional[Dict[str, Any]]]:
+    """
+    Read, hash and analyze one file: (stat, digest, metrics).
+
+    metrics is None when the content hash equals known_digest, i.e. the
+    cached metrics are still valid. Raises OSError if the file is unreadable.
+    """
+    st = filepath.stat()
+    raw = filepath.read_bytes()
+    digest = content_digest(raw)
+    if digest == known_digest:
+        return st, digest, None
+
+    content = _decode_source(raw)
+    node = _analyze_content(filepath, relpath, content)
+    metrics = {
+        "status": node.status,
+        "loc": node.loc,
+        "line_count": len(content.splitlines()),
+        "errors": node.errors,
+        "export_count": node.export_count,
+        "building_height": node.building_height,
+        "footprint": node.footprint,
+    }
+    return st, digest, metrics
+
+
+def _store_file_record(
+    cache: ScanCache,
+    relpath: str,
+    st: os.stat_result,
+    digest: str,
+    metrics: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Fold a _read_file_record() result into the cache and return metrics."""
+    if metrics is None:
+        return cache.get_by_digest(relpath, st, digest)
+    cache.put(relpath, st, digest, metrics)
+    return metrics
+
+
+def _cached_file_metrics(
+    filepath: Path, relpath: str, cache: ScanCache
+) -> Dict[str, Any]:
+    """
+    Return cached analysis metrics for a file, re-analyzing only on change.
+
+    Raises OSError if the file cannot be read.
+    """
+    metrics = cache.get(relpath, filepath.stat())
+    if metrics is not None:
+        return metrics
+
+    record = _read_file_record(filepath, relpath, cache.known_digest(relpath))
+    return _store_file_record(cache, relpath, *record)
+
+
+def _analyze_chunk(
+    root: str, items: List[tuple[str, Optional[str]]]
+) -> List[Any]:
+    """
+    Executor worker: analyze (relpath, known_digest) items under root.
+
+    Returns one (stat, digest, metrics) tuple per item, or an error string.
+    Module-level so process pools can pickle it.
+    """
+    root_path = Path(root)
+    results: List[Any] = []
+    for relpath, known_digest in items:
+        try:
+            results.append(_read_file_record(root_path / relpath, relpath, known_digest))
+        except Exception as e:
+            results.append(str(e))
+    return results
+
+
+def _analyze_paths(
+    root_path: Path,
+    relpaths: List[str],
+    cache: Optional[ScanCache],
+    executor: Union[ExecutorMode, str, None] = None,
+) -> List[Any]:
+    """
+    Analyze relpaths and return metrics dicts (or error strings) in input order.
+
+    Stat-level cache hits are answered in-process; everything else fans out
+    through parallel_map() and is merged back into the cache here.
+    """
+    records: List[Any] = [None] * len(relpaths)
+    pending: List[int] = []
+
+    for index, relpath in enumerate(relpaths):
+        if cache is not None:
+            try:
+                metrics = cache.get(relpath, (root_path / relpath).stat())
+            except OSError as e:
+                records[index] = str(e)
+                continue
+            if metrics is not None:
+                records[index] = metrics
+                continue
+        pending.append(index)
+
+    if not pending:
+        return records
+
+    items = [
+        (relpaths[i], cache.known_digest(relpaths[i]) if cache is not None else None)
+        for i in pending
+    ]
+    worker_results = parallel_map(
+        functools.partial(_analyze_chunk, str(root_path)), items, mode=executor
+    )
+
+    for index, result in zip(pending, worker_results):
+        if isinstance(result, str):
+            records[index] = result
+        elif cache is not None:
+            records[index] = _store_file_record(cache, relpaths[index], *result)
+        else:
+            records[index] = result[2]
+
+    return records
+
+
+def _analyze_content(filepath: Path, relpath: str, content: str) -> CodeNode:
+    """Compute CodeNode status and metrics from already-read file content."""
     lines = content.split("\n")
     loc = len(lines)
     export_count = estimate_export_count(filepath, content)
@@ -536,10 +757,17 @@ def build_from_connection_graph(
     height: int = 600,
     max_height: int = 250,
     wire_count: int = 15,
+    conn_graph=None,
 ) -> GraphData:
     """
     Build GraphData from ConnectionGraph with real import relationships.
 
+    Pass conn_graph to reuse a graph kept current via
+    ConnectionGraph.apply_changes() instead of re-verifying the project.
+    Otherwise the graph comes from the project's snapshot
+    (IP/graph_snapshot.py), re-verifying only files changed since the last
+    session.
+
     This provides:
     - Real import edges (not just Delaunay triangulation)
     - Node types (component, store, entry, test, etc.)
@@ -549,20 +777,28 @@ def build_from_connection_graph(
     """
     # Import here to avoid circular dependency
     try:
-        from IP.connection_verifier import build_connection_graph
+        from IP.graph_snapshot import load_connection_graph
     except ImportError:
         # Fallback for standalone use
-        from connection_verifier import build_connection_graph
+        from graph_snapshot import load_connection_graph
 
-    # Build the full connection graph with all analysis
-    conn_graph = build_connection_graph(project_root)
+    # Build (or warm-load) the full connection graph with all analysis
+    if conn_graph is None:
+        conn_graph = load_connection_graph(project_root)
     graph_dict = conn_graph.to_dict()
 
     # Convert ConnectionGraph nodes to CodeNodes
     nodes = []
     node_lookup = {}
     root_path = Path(project_root).resolve()
-    metrics_cache: Dict[str, tuple[int, int]] = {}
+    scan_cache = open_scan_cache(str(root_path))
+    metrics_cache = collect_file_metrics(
+        root_path,
+        [node_data["filePath"] for node_data in graph_dict["nodes"]],
+        cache=scan_cache,
+    )
+    if scan_cache is not None:
+        scan_cache.save()
 
     for node_data in graph_dict["nodes"]:
         metrics = node_data.get("metrics", {})
@@ -575,8 +811,6 @@ def build_from_connection_graph(
             status = "broken"
 
         file_path = node_data["filePath"]
-        if file_path not in metrics_cache:
-            metrics_cache[file_path] = get_file_metrics(root_path, file_path)
         loc, export_count = metrics_cache[file_path]
         building_height, footprint = compute_building_geometry(loc, export_count)
 
@@ -638,34 +872,124 @@ def build_from_connection_graph(
     return GraphData(nodes=nodes, edges=edges, config=config)
 
 
+# Structured health errors kept per node (tooltip/panel budget)
+MAX_NODE_HEALTH_ERRORS = 10
+
+
+def normalize_health_path(path: str) -> str:
+    """Canonical repo-relative form of a checker or fiefdom path ("IP/x.py")."""
+    path = str(path)
+    if not (
+        "\\" in path
+        or "//" in path
+        or "/." in path
+        or path.startswith(".")
+        or path.endswith("/")
+    ):
+        return path  # Already canonical (the common case)
+    normalized = posixpath.normpath(path.replace("\\", "/"))
+    return "" if normalized == "." else normalized
+
+
+def _health_field(result: Any, name: str, default: Any = None) -> Any:
+    """Read a HealthCheckResult attribute or the same key of its dict form."""
+    if isinstance(result, dict):
+        return result.get(name, default)
+    return getattr(result, name, default)
+
+
+class _FiefdomTrie:
+    """Path-component trie of fiefdom prefixes ("IP", "IP/plugins", "")."""
+
+    _VALUES = "\0values"  # Not a valid path component
+
+    def __init__(self) -> None:
+        self._root: Dict[str, Any] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._root)
+
+    def insert(self, path: str, value: Any) -> None:
+        node = self._root
+        for part in path.split("/") if path else ():
+            node = node.setdefault(part, {})
+        node.setdefault(self._VALUES, []).append(value)
+
+    def covering(self, path: str) -> List[Any]:
+        """Values of every fiefdom that is path or one of its ancestors."""
+        node = self._root
+        found = list(node.get(self._VALUES, ()))
+        for part in path.split("/"):
+            node = node.get(part)
+            if node is None:
+                break
+            found.extend(node.get(self._VALUES, ()))
+        return found
+
+
 def build_from_health_results(
     nodes: List[CodeNode], health_results: Dict[str, Any]
 ) -> List[CodeNode]:
     """
     Merge HealthChecker output into CodeNode objects.
 
-    Updates node status to 'broken' if health check fails,
-    and populates health_errors for tooltip display.
+    Errors are attributed to the node of the file they point at: that node
+    turns 'broken' and lists them in health_errors for tooltip display.
+    A failing fiefdom whose errors cannot all be placed on a node (a
+    timeout, a file outside the graph, a bare status) marks every node
+    under it instead, so the failure stays visible.
+
+    Fiefdoms are matched by path component ("IP" covers "IP/a.py", not
+    "IPX/a.py") through a prefix trie, and errors are bucketed by file in
+    one pass, so the join costs O(nodes + errors) rather than
+    O(nodes x fiefdoms).
 
     Args:
         nodes: List of CodeNode objects to update
-        health_results: Dict mapping file paths to HealthCheckResult
+        health_results: Dict mapping fiefdom paths to HealthCheckResult
+            (or its to_dict() form)
 
     Returns:
         Updated list of CodeNode objects
     """
-    for node in nodes:
-        for path, result in health_results.items():
-            if path in node.path or node.path.startswith(path.rstrip("/")):
-                # Use canonical merge_status — combat > broken > working
-                node.status = merge_status(node.status, result.status)
-
-                if hasattr(result, "errors") and result.errors:
-                    node.health_errors = [
-                        {"file": e.file, "line": e.line, "message": e.message}
-                        for e in result.errors[:10]
-                    ]
-                break
+    node_by_path = {normalize_health_path(node.path): node for node in nodes}
+    node_errors: Dict[str, List[Dict[str, Any]]] = {}
+    node_status: Dict[str, str] = {}
+    seen = set()
+    fiefdoms = _FiefdomTrie()
+
+    for fiefdom, result in health_results.items():
+        status = _health_field(result, "status", "working")
+        errors = _health_field(result, "errors") or []
+        unplaced = status != "working" and not errors
+        for error in errors:
+            file = normalize_health_path(_health_field(error, "file", ""))
+            if file not in node_by_path:
+                unplaced = True
+                continue
+            line = _health_field(error, "line", 0)
+            message = _health_field(error, "message", "")
+            previous = node_status.get(file)
+            node_status[file] = status if previous is None else merge_status(previous, status)
+            # Nested fiefdoms report the same error twice
+            if (file, line, message) in seen:
+                continue
+            seen.add((file, line, message))
+            bucket = node_errors.setdefault(file, [])
+            if len(bucket) < MAX_NODE_HEALTH_ERRORS:
+                bucket.append({"file": file, "line": line, "message": message})
+        if unplaced:
+            fiefdoms.insert(normalize_health_path(fiefdom), status)
+
+    for path, node in node_by_path.items():
+        statuses = fiefdoms.covering(path) if fiefdoms else []
+        if path in node_status:
+            statuses.append(node_status[path])
+        if statuses:
+            # Use canonical merge_status — combat > broken > working
+            node.status = merge_status(node.status, *statuses)
+        if path in node_errors:
+            node.health_errors = node_errors[path]
 
     return nodes
 
@@ -678,6 +1002,7 @@ def build_from_health_results(
 def generate_barradeau_buildings(
     graph_data: "GraphData",
     layout_scale: float = 10.0,
+    executor: Union[ExecutorMode, str, None] = None,
 ) -> List[Dict[str, Any]]:
     """
     Generate Barradeau-style 3D buildings from GraphData.
@@ -685,30 +1010,57 @@ def generate_barradeau_buildings(
     Args:
         graph_data: GraphData with nodes and layout
         layout_scale: Scale factor for positioning buildings in 3D space
+        executor: serial/thread/process/auto fan-out for batch generation
 
     Returns:
-        List of BuildingData dicts ready for JSON serialization
+        List of BuildingData dicts ready for JSON serialization. With NumPy
+        installed, buildings are generated as one batch (process pool for
+        large graphs) and particles/edges are packed into particleData/
+        edgeData Float32 rows instead of per-particle dicts.
     """
     try:
-        from IP.barradeau_builder import BarradeauBuilding
+        from IP.barradeau_builder import (
+            NUMPY_AVAILABLE,
+            BarradeauBuilding,
+            generate_building_batch,
+            path_seed,
+        )
     except ImportError:
-        from barradeau_builder import BarradeauBuilding
+        from barradeau_builder import (
+            NUMPY_AVAILABLE,
+            BarradeauBuilding,
+            generate_building_batch,
+            path_seed,
+        )
 
-    buildings = []
+    # Seeds come from the path: re-renders keep the same silhouettes
+    specs = [
+        (
+            node.path,
+            node.loc,
+            node.export_count,
+            node.status,
+            node.x * layout_scale,
+            node.y * layout_scale,
+        )
+        for node in graph_data.nodes
+    ]
 
-    for node in graph_data.nodes:
-        position = {"x": node.x * layout_scale, "z": node.y * layout_scale}
+    if NUMPY_AVAILABLE:
+        batch = generate_building_batch(specs, executor=executor)
+        return [batch.building_data(i).to_json() for i in range(len(batch))]
 
+    buildings = []
+    for path, line_count, export_count, status, x, z in specs:
         building = BarradeauBuilding(
-            path=node.path,
-            line_count=node.loc,
-            export_count=node.export_count,
-            status=node.status,
-            position=position,
+            path=path,
+            line_count=line_count,
+            export_count=export_count,
+            status=status,
+            position={"x": x, "z": z},
+            seed=path_seed(path),
         )
-
-        building_data = building.get_building_data().to_json()
-        buildings.append(building_data)
+        buildings.append(building.get_building_data().to_json())
 
     return buildings
 
@@ -716,6 +1068,7 @@ def generate_barradeau_buildings(
 def create_3d_code_city(
     graph_data: "GraphData",
     layout_scale: float = 10.0,
+    executor: Union[ExecutorMode, str, None] = None,
 ) -> Dict[str, Any]:
     """
     Create complete 3D Code City data package for frontend.
@@ -723,11 +1076,12 @@ def create_3d_code_city(
     Args:
         graph_data: GraphData with nodes and edges
         layout_scale: Scale factor for 3D positioning
+        executor: serial/thread/process/auto fan-out for building generation
 
     Returns:
         Dict with buildings array and metadata
     """
-    buildings = generate_barradeau_buildings(graph_data, layout_scale)
+    buildings = generate_barradeau_buildings(graph_data, layout_scale, executor)
 
     return {
         "buildings": buildings,
@@ -1289,8 +1643,82 @@ WOVEN_MAPS_TEMPLATE = """<!DOCTYPE html>
         // ================================================================
         // DATA & CONFIG
         // ================================================================
-        const GRAPH_DATA = __GRAPH_DATA__;
+        // Columnar payloads (IP/graph_codec.py) carry base64 typed columns
+        const GRAPH_TYPED_ARRAYS = { f32: Float32Array, u8: Uint8Array, u16: Uint16Array, u32: Uint32Array };
+
+        function decodeGraphColumn(column) {
+            const binary = atob(column.data);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+            const Typed = GRAPH_TYPED_ARRAYS[column.type];
+            return new Typed(bytes.buffer, 0, bytes.length / Typed.BYTES_PER_ELEMENT);
+        }
+
+        function decodeGraphPayload(payload) {
+            if (!payload || payload.format !== 'orchestr8-columnar/1') return payload;
+            const { strings, nodeCount, edgeCount, nodeColumns, edgeColumns } = payload;
+
+            const columns = {};
+            for (const key of ['x', 'y', 'centrality', 'buildingHeight', 'footprint',
+                               'loc', 'depth', 'incomingCount', 'outgoingCount', 'exportCount', 'inCycle']) {
+                columns[key] = decodeGraphColumn(nodeColumns[key]);
+            }
+            const statusCodes = decodeGraphColumn(nodeColumns.status.codes);
+            const typeCodes = decodeGraphColumn(nodeColumns.nodeType.codes);
+            const errors = new Map(nodeColumns.errors);
+            const healthErrors = new Map(nodeColumns.healthErrors);
+
+            const decodedNodes = new Array(nodeCount);
+            for (let i = 0; i < nodeCount; i++) {
+                decodedNodes[i] = {
+                    id: strings[i],
+                    path: strings[i],
+                    status: nodeColumns.status.values[statusCodes[i]],
+                    x: columns.x[i],
+                    y: columns.y[i],
+                    loc: columns.loc[i],
+                    errors: errors.get(i) || [],
+                    healthErrors: healthErrors.get(i) || [],
+                    nodeType: nodeColumns.nodeType.values[typeCodes[i]],
+                    centrality: columns.centrality[i],
+                    inCycle: columns.inCycle[i] === 1,
+                    depth: columns.depth[i],
+                    incomingCount: columns.incomingCount[i],
+                    outgoingCount: columns.outgoingCount[i],
+                    exportCount: columns.exportCount[i],
+                    buildingHeight: columns.buildingHeight[i],
+                    footprint: columns.footprint[i]
+                };
+            }
+
+            const source = decodeGraphColumn(edgeColumns.source);
+            const target = decodeGraphColumn(edgeColumns.target);
+            const lineNumber = decodeGraphColumn(edgeColumns.lineNumber);
+            const flags = decodeGraphColumn(edgeColumns.flags);
+            const decodedEdges = new Array(edgeCount);
+            for (let i = 0; i < edgeCount; i++) {
+                decodedEdges[i] = {
+                    source: strings[source[i]],
+                    target: strings[target[i]],
+                    resolved: (flags[i] & 1) !== 0,
+                    bidirectional: (flags[i] & 2) !== 0,
+                    lineNumber: lineNumber[i]
+                };
+            }
+
+            const decoded = Object.assign({}, payload, { nodes: decodedNodes, edges: decodedEdges, columns });
+            for (const key of ['format', 'strings', 'nodeCount', 'edgeCount', 'nodeColumns', 'edgeColumns']) {
+                delete decoded[key];
+            }
+            return decoded;
+        }
+
+        const GRAPH_DATA = decodeGraphPayload(__GRAPH_DATA__);
         window.BUILDING_DATA = __BUILDING_DATA__;
+        // Stream delivery: {manifest, chunkBase} URLs; nodes/edges arrive in chunks
+        const GRAPH_STREAM = __GRAPH_STREAM__;
+        // Live patches (IP/code_city_live.py): {patches: URL, seq} or null
+        const LIVE_CHANNEL = __LIVE_CHANNEL__;
         const BUILDING_STREAM_BPS = __BUILDING_STREAM_BPS__;
         const { nodes, edges = [], config } = GRAPH_DATA;
         const { width, height, maxHeight, wireCount, emergenceDuration = 2.0 } = config;
@@ -1429,7 +1857,7 @@ WOVEN_MAPS_TEMPLATE = """<!DOCTYPE html>
                     vx = (Math.random() - 0.5) * 2;
                     vy = -8 - Math.random() * 4;
                 }
-                particles.push(new Particle(px, py, warpColor, 'emergence'));
+                particles.spawn(px, py, warpColor, PARTICLE_EMERGENCE);
             }
 
             if (progress >= 1) {
@@ -1899,12 +2327,27 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         });
         const outgoingNeighbors = {};
         const incomingNeighbors = {};
-        edges.forEach((edge) => {
+        const outgoingEdges = {};  // source id -> edge objects (signal path scan)
+        function indexEdge(edge) {
             if (!outgoingNeighbors[edge.source]) outgoingNeighbors[edge.source] = [];
             if (!incomingNeighbors[edge.target]) incomingNeighbors[edge.target] = [];
+            if (!outgoingEdges[edge.source]) outgoingEdges[edge.source] = [];
             outgoingNeighbors[edge.source].push(edge.target);
             incomingNeighbors[edge.target].push(edge.source);
-        });
+            outgoingEdges[edge.source].push(edge);
+        }
+        edges.forEach(indexEdge);
+
+        function removeOnce(list, value) {
+            if (!list) return;
+            const i = list.indexOf(value);
+            if (i !== -1) list.splice(i, 1);
+        }
+        function unindexEdge(edge) {
+            removeOnce(outgoingNeighbors[edge.source], edge.target);
+            removeOnce(incomingNeighbors[edge.target], edge.source);
+            removeOnce(outgoingEdges[edge.source], edge);
+        }
 
         function edgeKey(edge) {
             return `${edge.source}->${edge.target}:${edge.lineNumber || 0}`;
@@ -2225,66 +2668,64 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         }
 
         function generate3DBuildingData() {
-            const buildings = [];
+            return nodes.map(buildingDataForNode);
+        }
+
+        function buildingDataForNode(node) {
             const scale = 0.05;
+            const particles = [];
+            const edges = [];
             
-            for (const node of nodes) {
-                const particles = [];
-                const edges = [];
-                
-                const footprint = Math.max(1, (node.footprint || 2) * scale);
-                const height = Math.max(1, (node.buildingHeight || 5) * scale);
-                const centerX = (node.x - config.width / 2) * scale;
-                const centerZ = (node.y - config.height / 2) * scale;
+            const footprint = Math.max(1, (node.footprint || 2) * scale);
+            const height = Math.max(1, (node.buildingHeight || 5) * scale);
+            const centerX = (node.x - config.width / 2) * scale;
+            const centerZ = (node.y - config.height / 2) * scale;
+            
+            const layers = 8;
+            const particlesPerLayer = Math.max(4, Math.floor(footprint * 8));
+            
+            for (let layer = 0; layer < layers; layer++) {
+                const y = (layer / layers) * height;
+                const layerRadius = footprint * (1 - layer * 0.03);
+                const layerOpacity = 0.5 + (layer / layers) * 0.5;
                 
-                const layers = 8;
-                const particlesPerLayer = Math.max(4, Math.floor(footprint * 8));
+                for (let i = 0; i < particlesPerLayer; i++) {
+                    const angle = (i / particlesPerLayer) * Math.PI * 2;
+                    const variance = 0.85 + Math.random() * 0.3;
+                    const r = layerRadius * variance;
+                    
+                    particles.push({
+                        x: centerX + Math.cos(angle) * r,
+                        y: y,
+                        z: centerZ + Math.sin(angle) * r,
+                        opacity: layerOpacity,
+                        size: 0.3 + Math.random() * 0.2
+                    });
+                }
                 
-                for (let layer = 0; layer < layers; layer++) {
-                    const y = (layer / layers) * height;
-                    const layerRadius = footprint * (1 - layer * 0.03);
-                    const layerOpacity = 0.5 + (layer / layers) * 0.5;
+                if (layer < layers - 1) {
+                    const nextY = ((layer + 1) / layers) * height;
+                    const nextRadius = footprint * (1 - (layer + 1) * 0.03);
                     
-                    for (let i = 0; i < particlesPerLayer; i++) {
-                        const angle = (i / particlesPerLayer) * Math.PI * 2;
-                        const variance = 0.85 + Math.random() * 0.3;
-                        const r = layerRadius * variance;
+                    for (let i = 0; i < 4; i++) {
+                        const angle = (i / 4) * Math.PI * 2;
+                        const r1 = layerRadius * 0.9;
+                        const r2 = nextRadius * 0.9;
                         
-                        particles.push({
-                            x: centerX + Math.cos(angle) * r,
-                            y: y,
-                            z: centerZ + Math.sin(angle) * r,
-                            opacity: layerOpacity,
-                            size: 0.3 + Math.random() * 0.2
+                        edges.push({
+                            a: { x: centerX + Math.cos(angle) * r1, y: y, z: centerZ + Math.sin(angle) * r1 },
+                            b: { x: centerX + Math.cos(angle) * r2, y: nextY, z: centerZ + Math.sin(angle) * r2 }
                         });
                     }
-                    
-                    if (layer < layers - 1) {
-                        const nextY = ((layer + 1) / layers) * height;
-                        const nextRadius = footprint * (1 - (layer + 1) * 0.03);
-                        
-                        for (let i = 0; i < 4; i++) {
-                            const angle = (i / 4) * Math.PI * 2;
-                            const r1 = layerRadius * 0.9;
-                            const r2 = nextRadius * 0.9;
-                            
-                            edges.push({
-                                a: { x: centerX + Math.cos(angle) * r1, y: y, z: centerZ + Math.sin(angle) * r1 },
-                                b: { x: centerX + Math.cos(angle) * r2, y: nextY, z: centerZ + Math.sin(angle) * r2 }
-                            });
-                        }
-                    }
                 }
-                
-                buildings.push({
-                    path: node.path,
-                    status: node.status,
-                    particles: particles,
-                    edges: edges
-                });
             }
             
-            return buildings;
+            return {
+                path: node.path,
+                status: node.status,
+                particles: particles,
+                edges: edges
+            };
         }
 
         function normalizeBuildingArray(payload) {
@@ -2492,20 +2933,22 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         }
 
         function bfsReach(startNodeId, adjacencyMap, maxDepth = 6) {
+            // Level-by-level BFS: no queue.shift(), which is O(n) per pop
             const reached = new Set([startNodeId]);
-            const queue = [{ id: startNodeId, depth: 0 }];
-
-            while (queue.length > 0) {
-                const current = queue.shift();
-                if (!current || current.depth >= maxDepth) continue;
-
-                const neighbors = adjacencyMap[current.id] || [];
-                for (const nextId of neighbors) {
-                    if (!reached.has(nextId) && nodeById[nextId]) {
-                        reached.add(nextId);
-                        queue.push({ id: nextId, depth: current.depth + 1 });
+            let frontier = [startNodeId];
+
+            for (let depth = 0; depth < maxDepth && frontier.length > 0; depth++) {
+                const next = [];
+                for (const id of frontier) {
+                    const neighbors = adjacencyMap[id] || [];
+                    for (const nextId of neighbors) {
+                        if (!reached.has(nextId) && nodeById[nextId]) {
+                            reached.add(nextId);
+                            next.push(nextId);
+                        }
                     }
                 }
+                frontier = next;
             }
             return reached;
         }
@@ -2519,13 +2962,16 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
                 if (backward.has(id)) signalNodes.add(id);
             });
 
+            // Only edges leaving signal nodes can qualify - no full edge scan
             const signalEdges = new Set();
-            for (const e of edges) {
-                if (forward.has(e.source) && backward.has(e.target) &&
-                    signalNodes.has(e.source) && signalNodes.has(e.target)) {
-                    signalEdges.add(edgeKey(e));
+            signalNodes.forEach((id) => {
+                if (!forward.has(id)) return;
+                for (const e of outgoingEdges[id] || []) {
+                    if (backward.has(e.target) && signalNodes.has(e.target)) {
+                        signalEdges.add(edgeKey(e));
+                    }
                 }
-            }
+            });
             signalEdges.add(edgeKey(edge));
 
             return { signalNodes, signalEdges };
@@ -2809,7 +3255,8 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         }
 
         function clearParticles() {
-            particles.length = 0;
+            particles.clear();
+            nodeParticleCounts.clear();
             if (backendState.gpuEnabled && backendState.gpuField) {
                 backendState.gpuField.clear();
             }
@@ -3101,18 +3548,23 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         }
 
         // Stats
-        const workingCount = nodes.filter(n => n.status === 'working').length;
-        const brokenCount = nodes.filter(n => n.status === 'broken').length;
-        const combatCount = nodes.filter(n => n.status === 'combat').length;
-        const cycleCount = nodes.filter(n => n.inCycle).length;
-        const edgeCount = edges ? edges.length : 0;
+        function graphCountsHtml() {
+            const workingCount = nodes.filter(n => n.status === 'working').length;
+            const brokenCount = nodes.filter(n => n.status === 'broken').length;
+            const combatCount = nodes.filter(n => n.status === 'combat').length;
+            const cycleCount = nodes.filter(n => n.inCycle).length;
+            const edgeCount = edges ? edges.length : 0;
+            return `
+                <span class="working">${workingCount} working</span>
+                <span class="broken">${brokenCount} broken</span>
+                ${combatCount ? `<span class="combat">${combatCount} combat</span>` : ''}
+                ${cycleCount ? `<span style="color: #ff4444;">${cycleCount} in cycles</span>` : ''}
+                <span>${nodes.length} files</span>
+                ${edgeCount ? `<span style="color: #666;">${edgeCount} imports</span>` : ''}
+            `;
+        }
         stats.innerHTML = `
-            <span class="working">${workingCount} working</span>
-            <span class="broken">${brokenCount} broken</span>
-            ${combatCount ? `<span class="combat">${combatCount} combat</span>` : ''}
-            ${cycleCount ? `<span style="color: #ff4444;">${cycleCount} in cycles</span>` : ''}
-            <span>${nodes.length} files</span>
-            ${edgeCount ? `<span style="color: #666;">${edgeCount} imports</span>` : ''}
+            <span id="graphCounts" style="display: contents;">${graphCountsHtml()}</span>
             <span style="color: #555;">CPU cap ${PERF.particleCpuCap.toLocaleString()}</span>
             <span style="color: #444;">GPU target ${PERF.particleGpuTargetCap.toLocaleString()}</span>
             <span id="backendMode" style="color:#888;">CPU Canvas</span>
@@ -3165,19 +3617,22 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         const emerged = () => currentPhase === PHASES.READY;
 
         // Store original positions, start from chaos
-        const nodeStates = nodes.map(n => ({
-            targetX: n.x,
-            targetY: n.y,
-            // Start positions: scattered from center with chaos
-            currentX: width / 2 + (Math.random() - 0.5) * width * 0.8,
-            currentY: height / 2 + (Math.random() - 0.5) * height * 0.8,
-            currentAlpha: 0,
-            targetAlpha: 1,
-            // Emergence timing: stagger based on distance from center
-            delay: Math.sqrt(Math.pow(n.x - width/2, 2) + Math.pow(n.y - height/2, 2)) / (width/2) * 0.3,
-            // Entry offset for wave field
-            entryOffset: Math.random() * 4
-        }));
+        function createNodeState(n) {
+            return {
+                targetX: n.x,
+                targetY: n.y,
+                // Start positions: scattered from center with chaos
+                currentX: width / 2 + (Math.random() - 0.5) * width * 0.8,
+                currentY: height / 2 + (Math.random() - 0.5) * height * 0.8,
+                currentAlpha: 0,
+                targetAlpha: 1,
+                // Emergence timing: stagger based on distance from center
+                delay: Math.sqrt(Math.pow(n.x - width/2, 2) + Math.pow(n.y - height/2, 2)) / (width/2) * 0.3,
+                // Entry offset for wave field
+                entryOffset: Math.random() * 4
+            };
+        }
+        const nodeStates = nodes.map(createNodeState);
 
         // Wave field calculation - smooth mathematical landscape morphing
         function calcWaveDisplacement(x, y, elapsed) {
@@ -3205,7 +3660,120 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         // ================================================================
         // ENHANCED PARTICLE SYSTEM - Curl-like Motion
         // ================================================================
-        const particles = [];
+        // Struct-of-arrays pool: one slot per live particle in [0, count),
+        // free slots in [count, capacity). Spawning takes the first free
+        // slot and a dead particle is swap-removed with the last live one,
+        // so the frame loop allocates nothing and never shifts arrays.
+        const PARTICLE_EMERGENCE = 0;
+        const PARTICLE_ERROR = 1;
+        const PARTICLE_FLOAT_FIELDS = ['x', 'y', 'vx', 'vy', 'size', 'alpha', 'life', 'initialAlpha', 'initialLife'];
+
+        class ParticlePool {
+            constructor(capacity) {
+                this.capacity = capacity;
+                this.count = 0;
+                this.palette = [];
+                this.allocated = 0;
+                this.grow(Math.min(capacity, 4096));
+            }
+
+            // Typed arrays double up to capacity (a handful of copies per session)
+            grow(minSlots) {
+                const slots = Math.min(this.capacity, Math.max(minSlots, this.allocated * 2));
+                if (slots <= this.allocated) return false;
+                for (const field of PARTICLE_FLOAT_FIELDS) {
+                    const next = new Float32Array(slots);
+                    if (this[field]) next.set(this[field]);
+                    this[field] = next;
+                }
+                const kind = new Uint8Array(slots);
+                const color = new Uint8Array(slots);
+                if (this.kind) {
+                    kind.set(this.kind);
+                    color.set(this.color);
+                }
+                this.kind = kind;
+                this.color = color;
+                this.nodeId = this.nodeId || [];
+                this.nodeId.length = slots;
+                this.allocated = slots;
+                return true;
+            }
+
+            colorIndex(color) {
+                let index = this.palette.indexOf(color);
+                if (index === -1) {
+                    index = this.palette.length;
+                    this.palette.push(color);
+                }
+                return index;
+            }
+
+            spawn(x, y, color, kind, severity = 'normal') {
+                if (this.count >= this.allocated && !this.grow(this.count + 1)) return -1;
+                const i = this.count++;
+                this.x[i] = x;
+                this.y[i] = y;
+                this.kind[i] = kind;
+                this.color[i] = this.colorIndex(color);
+                this.nodeId[i] = null;
+
+                if (kind === PARTICLE_EMERGENCE) {
+                    // Emergence particles: swirl toward target
+                    this.vx[i] = (Math.random() - 0.5) * 2;
+                    this.vy[i] = (Math.random() - 0.5) * 2;
+                    this.size[i] = 1 + Math.random() * 1.5;
+                    this.alpha[i] = 0.5 + Math.random() * 0.3;
+                    this.life[i] = 60 + Math.random() * 40;
+                } else {
+                    // Error particles: RISE ONLY, fade linearly — no horizontal motion, no breathing
+                    // Severity affects speed and height
+                    if (severity === 'critical' || severity === 'error') {
+                        this.vy[i] = -0.3 - Math.random() * 0.3;  // Faster rise
+                        this.size[i] = 1.5 + Math.random() * 2.5;  // Larger
+                        this.life[i] = 250 + Math.random() * 150;  // Live longer (rise higher)
+                    } else if (severity === 'warning') {
+                        this.vy[i] = -0.1 - Math.random() * 0.15;  // Slower rise
+                        this.size[i] = 0.8 + Math.random() * 1.2;  // Smaller
+                        this.life[i] = 150 + Math.random() * 100;  // Shorter lifetime
+                    } else {
+                        // Normal/default severity
+                        this.vy[i] = -0.15 - Math.random() * 0.25;
+                        this.size[i] = 1 + Math.random() * 2;
+                        this.life[i] = 200 + Math.random() * 150;
+                    }
+
+                    // Small horizontal spread at spawn only — no ongoing oscillation
+                    this.vx[i] = (Math.random() - 0.5) * 0.08;
+
+                    this.alpha[i] = 0.4 + Math.random() * 0.4;
+                    this.initialAlpha[i] = this.alpha[i];
+                    this.initialLife[i] = this.life[i];
+                }
+                return i;
+            }
+
+            // Move the last live particle into slot i
+            removeAt(i) {
+                const last = --this.count;
+                if (i !== last) {
+                    for (const field of PARTICLE_FLOAT_FIELDS) {
+                        this[field][i] = this[field][last];
+                    }
+                    this.kind[i] = this.kind[last];
+                    this.color[i] = this.color[last];
+                    this.nodeId[i] = this.nodeId[last];
+                }
+                this.nodeId[last] = null;
+            }
+
+            clear() {
+                this.nodeId.fill(null, 0, this.count);
+                this.count = 0;
+            }
+        }
+
+        const particles = new ParticlePool(PERF.particleCpuCap);
         let frameEmergenceSpawnBudget = PERF.emergenceFrameSpawnCap;
         let frameErrorSpawnBudget = PERF.errorFrameSpawnCap;
         let runtimeEdgeStride = Math.max(1, PERF.edgeStride);
@@ -3216,18 +3784,18 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         }
 
         function getParticlePressure() {
-            return Math.max(0, (particles.length - PERF.particleCpuCap) / PERF.particleCpuCap);
+            return Math.max(0, (particles.count - PERF.particleCpuCap) / PERF.particleCpuCap);
         }
 
         function allocateSpawn(requested, channel = 'emergence') {
-            if (requested <= 0 || particles.length >= PERF.particleCpuCap) return 0;
+            if (requested <= 0 || particles.count >= PERF.particleCpuCap) return 0;
 
             const budgetRef = channel === 'error' ? frameErrorSpawnBudget : frameEmergenceSpawnBudget;
             if (budgetRef <= 0) return 0;
 
             const pressure = getParticlePressure();
             const pressureScale = Math.max(0.05, 1 - pressure * 0.8);
-            const capLeft = Math.max(0, PERF.particleCpuCap - particles.length);
+            const capLeft = Math.max(0, PERF.particleCpuCap - particles.count);
             const allowance = Math.max(
                 0,
                 Math.floor(Math.min(requested, budgetRef, capLeft) * pressureScale)
@@ -3242,102 +3810,61 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
             return allowance;
         }
 
-        class Particle {
-            constructor(x, y, color, type = 'error', severity = 'normal') {
-                this.x = x;
-                this.y = y;
-                this.type = type;
-                this.color = color;
-                this.severity = severity;
-
-                if (type === 'emergence') {
-                    // Emergence particles: swirl toward target
-                    this.vx = (Math.random() - 0.5) * 2;
-                    this.vy = (Math.random() - 0.5) * 2;
-                    this.size = 1 + Math.random() * 1.5;
-                    this.alpha = 0.5 + Math.random() * 0.3;
-                    this.life = 60 + Math.random() * 40;
-                    this.friction = 0.98;
+        // Update, draw and cull every live particle (newest first)
+        function updateAndDrawParticles(ctx) {
+            const pool = particles;
+            const { x, y, vx, vy, size, alpha, life, initialAlpha, initialLife, kind, color } = pool;
+            const TWO_PI = Math.PI * 2;
+            let currentColor = -1;
+
+            for (let i = pool.count - 1; i >= 0; i--) {
+                if (kind[i] === PARTICLE_EMERGENCE) {
+                    x[i] += vx[i];
+                    y[i] += vy[i];
+                    vx[i] *= 0.98;
+                    vy[i] *= 0.98;
+                    life[i]--;
+                    alpha[i] = Math.max(0, alpha[i] - 0.008);
                 } else {
-                    // Error particles: RISE ONLY, fade linearly — no horizontal motion, no breathing
-                    // Severity affects speed and height
-                    if (severity === 'critical' || severity === 'error') {
-                        this.vy = -0.3 - Math.random() * 0.3;  // Faster rise
-                        this.size = 1.5 + Math.random() * 2.5;  // Larger
-                        this.life = 250 + Math.random() * 150;  // Live longer (rise higher)
-                    } else if (severity === 'warning') {
-                        this.vy = -0.1 - Math.random() * 0.15;  // Slower rise
-                        this.size = 0.8 + Math.random() * 1.2;  // Smaller
-                        this.life = 150 + Math.random() * 100;  // Shorter lifetime
-                    } else {
-                        // Normal/default severity
-                        this.vy = -0.15 - Math.random() * 0.25;
-                        this.size = 1 + Math.random() * 2;
-                        this.life = 200 + Math.random() * 150;
-                    }
-
-                    // Small horizontal spread at spawn only — no ongoing oscillation
-                    this.vx = (Math.random() - 0.5) * 0.08;
-                    this.vxDecay = 0.95;  // Horizontal motion dies quickly
-
-                    this.alpha = 0.4 + Math.random() * 0.4;
-                    this.initialAlpha = this.alpha;
-                    this.initialLife = this.life;
-                }
-
-                // Track source node for per-node particle cap
-                this.nodeId = null;
-            }
-
-            update(time) {
-                if (this.type === 'emergence') {
-                    this.x += this.vx;
-                    this.y += this.vy;
-                    this.vx *= this.friction;
-                    this.vy *= this.friction;
-                    this.life--;
-                    this.alpha = Math.max(0, this.alpha - 0.008);
-                } else {
-                    // RISE/FADE ONLY — no curl, no breathing, no horizontal oscillation
-                    // Decay horizontal velocity to zero
-                    this.vx *= this.vxDecay;
-
-                    this.x += this.vx;
-                    this.y += this.vy;  // Only vertical movement persists
-
-                    this.life--;
-
+                    // RISE/FADE ONLY — decay horizontal velocity to zero
+                    vx[i] *= 0.95;
+                    x[i] += vx[i];
+                    y[i] += vy[i];  // Only vertical movement persists
+                    life[i]--;
                     // Linear fade based on remaining life
-                    const lifeFraction = this.life / this.initialLife;
-                    this.alpha = this.initialAlpha * lifeFraction;
-
+                    alpha[i] = initialAlpha[i] * (life[i] / initialLife[i]);
                     // Size shrinks slightly as particle rises
-                    this.size = Math.max(0.3, this.size - 0.002);
+                    size[i] = Math.max(0.3, size[i] - 0.002);
                 }
-            }
 
-            draw(ctx) {
-                ctx.globalAlpha = this.alpha;
-                ctx.fillStyle = this.color;
+                ctx.globalAlpha = alpha[i];
+                if (color[i] !== currentColor) {
+                    currentColor = color[i];
+                    ctx.fillStyle = pool.palette[currentColor];
+                }
                 ctx.beginPath();
-                ctx.arc(this.x, this.y, this.size, 0, Math.PI * 2);
+                ctx.arc(x[i], y[i], size[i], 0, TWO_PI);
                 ctx.fill();
-            }
 
-            isDead() {
-                return this.life <= 0 || this.alpha <= 0;
+                if (life[i] <= 0 || alpha[i] <= 0) {
+                    // Decrement per-node counter for error particles
+                    if (kind[i] === PARTICLE_ERROR && pool.nodeId[i]) {
+                        decrementNodeParticles(pool.nodeId[i]);
+                    }
+                    pool.removeAt(i);
+                }
             }
         }
 
         function spawnEmergenceParticles(x, y, count = 5) {
             const allowance = allocateSpawn(count, 'emergence');
             for (let i = 0; i < allowance; i++) {
-                particles.push(new Particle(
+                particles.spawn(
                     x + (Math.random() - 0.5) * 20,
                     y + (Math.random() - 0.5) * 20,
                     COLORS.teal,
-                    'emergence'
-                ));
+                    PARTICLE_EMERGENCE
+                );
             }
         }
 
@@ -3392,15 +3919,15 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
                     severity = randomError.severity || 'normal';
                 }
 
-                const particle = new Particle(
+                const slot = particles.spawn(
                     node.x + (Math.random() - 0.5) * 12,
                     node.y + (Math.random() - 0.5) * 4,
                     particleColor,
-                    'error',
+                    PARTICLE_ERROR,
                     severity
                 );
-                particle.nodeId = nodeId;
-                particles.push(particle);
+                if (slot === -1) break;
+                particles.nodeId[slot] = nodeId;
                 incrementNodeParticles(nodeId);
             }
         }
@@ -3413,23 +3940,28 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         }
 
         let delaunayEdges = [];
-        if (nodes.length >= 3) {
-            const points = nodes.map(n => [n.x, n.y]);
-            const delaunay = d3.Delaunay.from(points);
-            const triangles = delaunay.triangles;
-
-            for (let i = 0; i < triangles.length; i += 3) {
-                const [i0, i1, i2] = [triangles[i], triangles[i+1], triangles[i+2]];
-                const [p0, p1, p2] = [nodes[i0], nodes[i1], nodes[i2]];
-                if (p0 && p1 && p2) {
-                    delaunayEdges.push(
-                        { length: distance(p0, p1), i0, i1 },
-                        { length: distance(p1, p2), i0: i1, i1: i2 },
-                        { length: distance(p2, p0), i0: i2, i1: i0 }
-                    );
+        function rebuildDelaunayEdges() {
+            const rebuilt = [];
+            if (nodes.length >= 3) {
+                const points = nodes.map(n => [n.x, n.y]);
+                const delaunay = d3.Delaunay.from(points);
+                const triangles = delaunay.triangles;
+
+                for (let i = 0; i < triangles.length; i += 3) {
+                    const [i0, i1, i2] = [triangles[i], triangles[i+1], triangles[i+2]];
+                    const [p0, p1, p2] = [nodes[i0], nodes[i1], nodes[i2]];
+                    if (p0 && p1 && p2) {
+                        rebuilt.push(
+                            { length: distance(p0, p1), i0, i1 },
+                            { length: distance(p1, p2), i0: i1, i1: i2 },
+                            { length: distance(p2, p0), i0: i2, i1: i0 }
+                        );
+                    }
                 }
             }
+            delaunayEdges = rebuilt;
         }
+        rebuildDelaunayEdges();
 
         // ================================================================
         // RENDERING
@@ -3756,17 +4288,7 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
             }
 
             // Update and draw particles
-            for (let i = particles.length - 1; i >= 0; i--) {
-                particles[i].update(time);
-                particles[i].draw(ctx);
-                if (particles[i].isDead()) {
-                    // Decrement per-node counter for error particles
-                    if (particles[i].type === 'error' && particles[i].nodeId) {
-                        decrementNodeParticles(particles[i].nodeId);
-                    }
-                    particles.splice(i, 1);
-                }
-            }
+            updateAndDrawParticles(ctx);
 
             // Spawn error particles (only after emerged)
             if (currentPhase === PHASES.READY) {
@@ -3783,7 +4305,7 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
 
             if (backendModeEl) backendModeEl.textContent = backendState.mode;
             if (backendParticlesEl) {
-                backendParticlesEl.textContent = particles.length.toLocaleString() + ' cpu particles';
+                backendParticlesEl.textContent = particles.count.toLocaleString() + ' cpu particles';
             }
 
             requestAnimationFrame(render);
@@ -4004,6 +4526,233 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
             }
         });
 
+        // ================================================================
+        // STREAMED GRAPH CHUNKS
+        // ================================================================
+        function appendGraphChunk(chunk) {
+            chunk = decodeGraphPayload(chunk);
+            const newNodes = (chunk && chunk.nodes) || [];
+            const newEdges = (chunk && chunk.edges) || [];
+
+            for (const n of newNodes) {
+                if (nodeById[n.id]) continue;
+                nodeIndexById[n.id] = nodes.length;
+                nodeById[n.id] = n;
+                nodes.push(n);
+                nodeStates.push(createNodeState(n));
+                if (currentPhase === PHASES.READY) {
+                    spawnEmergenceParticles(n.x, n.y, 3);
+                }
+            }
+            for (const edge of newEdges) {
+                edges.push(edge);
+                indexEdge(edge);
+            }
+
+            if (newNodes.length) rebuildDelaunayEdges();
+            const countsEl = document.getElementById('graphCounts');
+            if (countsEl) countsEl.innerHTML = graphCountsHtml();
+        }
+
+        async function loadGraphStream(stream) {
+            const manifest = await (await fetch(stream.manifest)).json();
+            for (let i = 0; i < manifest.chunkCount; i++) {
+                const chunk = await (await fetch(stream.chunkBase + i)).json();
+                appendGraphChunk(chunk);
+                phaseEl.textContent = `streaming ${nodes.length}/${manifest.nodeCount} files`;
+                // Yield a frame so each chunk renders before the next lands
+                await new Promise((resolve) => requestAnimationFrame(resolve));
+            }
+            if (window.codeCity3D) {
+                // 3D was opened mid-stream: rebuild buildings for the full graph
+                const buildingArray = generate3DBuildingData();
+                window.BUILDING_DATA = {
+                    buildings: buildingArray,
+                    metadata: { source: 'client-generated', generatedAt: new Date().toISOString() }
+                };
+                streamLoad3DBuildings(window.codeCity3D, buildingArray, BUILDING_STREAM_BPS)
+                    .catch((streamError) => console.error('[3D] Stream load error:', streamError));
+            }
+            console.log('Woven Maps stream complete:', nodes.length, 'nodes,', edges.length, 'edges');
+        }
+
+        // ================================================================
+        // LIVE PATCHES
+        // ================================================================
+        function removeGraphItems(nodeIds, edgeKeys) {
+            // Compact nodes/nodeStates in one pass and re-point the index
+            if (nodeIds.size) {
+                let write = 0;
+                for (let read = 0; read < nodes.length; read++) {
+                    const n = nodes[read];
+                    if (nodeIds.has(n.id)) {
+                        delete nodeById[n.id];
+                        delete nodeIndexById[n.id];
+                        continue;
+                    }
+                    nodes[write] = n;
+                    nodeStates[write] = nodeStates[read];
+                    nodeIndexById[n.id] = write;
+                    write++;
+                }
+                nodes.length = write;
+                nodeStates.length = write;
+                if (focusedNodeId && nodeIds.has(focusedNodeId)) focusedNodeId = null;
+            }
+
+            // Drop removed edges and edges that lost an endpoint
+            const dropped = [];
+            let write = 0;
+            for (const edge of edges) {
+                if (edgeKeys.has(edgeKey(edge)) || nodeIds.has(edge.source) || nodeIds.has(edge.target)) {
+                    dropped.push(edge);
+                    continue;
+                }
+                edges[write++] = edge;
+            }
+            edges.length = write;
+            dropped.forEach(unindexEdge);
+            if (selectedConnection && dropped.includes(selectedConnection)) {
+                clearSelectedConnection();
+            }
+        }
+
+        function applyLivePatches(patches) {
+            const removedNodes = new Set();
+            const removedEdges = new Set();
+            const recolored = [];
+            const rebuilt = [];
+            let moved = false;
+
+            for (const patch of patches) {
+                if (patch.op === 'node') {
+                    const data = patch.node;
+                    // Re-added after a removal earlier in this run: update instead
+                    removedNodes.delete(data.id);
+                    const existing = nodeById[data.id];
+                    if (!existing) {
+                        nodeIndexById[data.id] = nodes.length;
+                        nodeById[data.id] = data;
+                        nodes.push(data);
+                        nodeStates.push(createNodeState(data));
+                        if (currentPhase === PHASES.READY) spawnEmergenceParticles(data.x, data.y, 3);
+                        rebuilt.push(data);
+                        moved = true;
+                        continue;
+                    }
+                    Object.assign(existing, data);
+                    if ('x' in data || 'y' in data) {
+                        const state = nodeStates[nodeIndexById[data.id]];
+                        state.targetX = state.currentX = existing.x;
+                        state.targetY = state.currentY = existing.y;
+                        rebuilt.push(existing);
+                        moved = true;
+                    } else if ('buildingHeight' in data || 'footprint' in data) {
+                        rebuilt.push(existing);
+                    } else if ('status' in data) {
+                        recolored.push(existing);
+                    }
+                } else if (patch.op === 'removeNode') {
+                    removedNodes.add(patch.id);
+                } else if (patch.op === 'edge') {
+                    const key = edgeKey(patch.edge);
+                    if (removedEdges.delete(key)) {
+                        const existing = (outgoingEdges[patch.edge.source] || []).find((e) => edgeKey(e) === key);
+                        if (existing) {
+                            Object.assign(existing, patch.edge);
+                            continue;
+                        }
+                    }
+                    edges.push(patch.edge);
+                    indexEdge(patch.edge);
+                } else if (patch.op === 'removeEdge') {
+                    removedEdges.add(edgeKey(patch.edge));
+                }
+            }
+
+            if (removedNodes.size || removedEdges.size) removeGraphItems(removedNodes, removedEdges);
+            if (moved || removedNodes.size) rebuildDelaunayEdges();
+
+            const scene = window.codeCity3D;
+            if (scene) {
+                for (const node of recolored) scene.updateBuildingStatus(node.path, node.status);
+                for (const id of removedNodes) scene.removeBuilding(id);
+                for (const node of rebuilt) {
+                    scene.removeBuilding(node.path);
+                    scene.addBuilding(buildingDataForNode(node), true);
+                }
+            }
+
+            const countsEl = document.getElementById('graphCounts');
+            if (countsEl) countsEl.innerHTML = graphCountsHtml();
+        }
+
+        // Patches that turn the current graph into a full snapshot
+        function resyncPatches(snapshot) {
+            const patches = [];
+            const current = new Set(edges.map(edgeKey));
+            const wanted = new Set(snapshot.edges.map(edgeKey));
+            for (const edge of edges) {
+                if (!wanted.has(edgeKey(edge))) patches.push({ op: 'removeEdge', edge });
+            }
+            const keep = new Set(snapshot.nodes.map((node) => node.id));
+            for (const node of nodes) {
+                if (!keep.has(node.id)) patches.push({ op: 'removeNode', id: node.id });
+            }
+            for (const data of snapshot.nodes) {
+                const existing = nodeById[data.id];
+                if (!existing) {
+                    patches.push({ op: 'node', node: data });
+                    continue;
+                }
+                const changed = { id: data.id };
+                let any = false;
+                for (const key in data) {
+                    if (JSON.stringify(existing[key]) !== JSON.stringify(data[key])) {
+                        changed[key] = data[key];
+                        any = true;
+                    }
+                }
+                if (any) patches.push({ op: 'node', node: changed });
+            }
+            for (const edge of snapshot.edges) {
+                if (!current.has(edgeKey(edge))) patches.push({ op: 'edge', edge });
+            }
+            return patches;
+        }
+
+        async function pollLivePatches(channel) {
+            let seq = channel.seq;
+            while (true) {
+                let reply;
+                try {
+                    const response = await fetch(`${channel.patches}?since=${seq}`, { cache: 'no-store' });
+                    // Session evicted: a newer render has replaced this city
+                    if (response.status === 404) return;
+                    reply = await response.json();
+                } catch (err) {
+                    await new Promise((resolve) => setTimeout(resolve, 2000));
+                    continue;
+                }
+                if (reply.reset) {
+                    // Fell behind the retained batches: replace the graph
+                    try {
+                        const response = await fetch(channel.graph, { cache: 'no-store' });
+                        if (response.status === 404) return;
+                        const snapshot = await response.json();
+                        applyLivePatches(resyncPatches(snapshot));
+                        seq = snapshot.seq;
+                    } catch (err) {
+                        await new Promise((resolve) => setTimeout(resolve, 2000));
+                    }
+                    continue;
+                } else if (reply.patches.length) {
+                    applyLivePatches(reply.patches);
+                }
+                seq = reply.seq;
+            }
+        }
+
         // ================================================================
         // START
         // ================================================================
@@ -4012,6 +4761,16 @@ fn fs_main(in: VSOut) -> @location(0) vec4<f32> {
         updateConnectionPanel();
         initParticleBackend();
         requestAnimationFrame(render);
+        const graphLoaded = GRAPH_STREAM
+            ? loadGraphStream(GRAPH_STREAM).catch((err) => {
+                console.error('[woven_maps] Graph stream failed:', err);
+                phaseEl.textContent = 'stream failed';
+            })
+            : Promise.resolve();
+        if (LIVE_CHANNEL) {
+            // Patches are relative to the full graph: start once it is loaded
+            graphLoaded.then(() => pollLivePatches(LIVE_CHANNEL));
+        }
         console.log('Woven Maps Enhanced initialized:', nodes.length, 'nodes');
     </script>
 
@@ -4045,6 +4804,8 @@ def create_code_city(
     max_height: int = 200,
     wire_count: int = 10,
     health_results: Optional[Dict[str, Any]] = None,
+    delivery: Optional[str] = None,
+    max_inline_bytes: Optional[int] = None,
 ) -> Any:
     """Create a Woven Maps Code City visualization for Marimo.
 
@@ -4057,6 +4818,21 @@ def create_code_city(
         health_results: Optional dict mapping file/fiefdom paths to
             HealthCheckResult objects. When provided, node statuses are
             merged using the canonical combat > broken > working policy.
+        delivery: "inline" embeds everything in an iframe srcdoc; "stream"
+            serves a static shell plus directory-chunked graph data from a
+            loopback server (see IP/code_city_stream.py) so large repos render
+            progressively. Defaults to ORCHESTR8_CODE_CITY_DELIVERY.
+        max_inline_bytes: When set, an inline render whose output would
+            exceed this many bytes switches to stream delivery, reusing the
+            graph it already built.
+
+    Either delivery ships graph data as plain JSON or, with
+    ORCHESTR8_CODE_CITY_ENCODING=columnar, as typed columns
+    (IP/graph_codec.py).
+
+    Unless ORCHESTR8_CODE_CITY_LIVE=0, the rendered city also polls a
+    loopback patch channel; live_city_for(root) (IP/code_city_live.py)
+    then updates statuses, errors and files in place without a re-render.
     """
     try:
         import marimo as mo
@@ -4085,6 +4861,24 @@ def create_code_city(
     if not graph_data.nodes:
         return mo.md(f"**No code files found in project.**\n\nScanned: `{root}`")
 
+    # Mirror of the city as rendered (statuses before the health merge), so
+    # later health updates can be pushed to the page as patches
+    live_city = None
+    from IP.code_city_live import LiveCodeCity, code_city_live_enabled, register_live_city
+
+    if code_city_live_enabled():
+        live_city = LiveCodeCity(
+            root,
+            graph_data,
+            health_results,
+            build_options={
+                "width": width,
+                "height": height,
+                "max_height": max_height,
+                "wire_count": wire_count,
+            },
+        )
+
     # Merge health check results into node statuses (combat > broken > working)
     if health_results:
         graph_data.nodes = build_from_health_results(graph_data.nodes, health_results)
@@ -4141,26 +4935,105 @@ def create_code_city(
         js_3d_path.read_text(encoding="utf-8") if js_3d_path.exists() else ""
     )
 
-    iframe_html = (
-        WOVEN_MAPS_TEMPLATE.replace("__GRAPH_DATA__", graph_data.to_json())
-        .replace("__BUILDING_DATA__", building_data_json)
-        .replace("__BUILDING_STREAM_BPS__", str(stream_bps))
-        .replace("__CAMERA_STATE__", camera_state_json)
-        .replace(
-            "__PATCHBAY_APPLY_ENABLED__", "true" if patchbay_apply_enabled else "false"
+    def render_template(
+        graph_json: str, graph_stream_json: str, script_tag: str, live_json: str = "null"
+    ) -> str:
+        return (
+            WOVEN_MAPS_TEMPLATE.replace("__GRAPH_DATA__", graph_json)
+            .replace("__GRAPH_STREAM__", graph_stream_json)
+            .replace("__LIVE_CHANNEL__", live_json)
+            .replace("__BUILDING_DATA__", building_data_json)
+            .replace("__BUILDING_STREAM_BPS__", str(stream_bps))
+            .replace("__CAMERA_STATE__", camera_state_json)
+            .replace(
+                "__PATCHBAY_APPLY_ENABLED__", "true" if patchbay_apply_enabled else "false"
+            )
+            .replace("<script>__WOVEN_MAPS_3D_JS__</script>", script_tag)
         )
-        .replace("__WOVEN_MAPS_3D_JS__", js_3d_content)
-    )
-    escaped = html.escape(iframe_html)
 
-    return mo.Html(f'''
+    encoding = graph_encoding()
+
+    from IP.code_city_stream import build_chunks, get_stream_server, stream_chunk_nodes
+
+    def live_channel_json(server, session_id: str) -> str:
+        if live_city is None:
+            return "null"
+        live_city.attach(server, session_id)
+        register_live_city(live_city)
+        return json.dumps(
+            {"patches": live_city.patches_url, "graph": live_city.graph_url, "seq": live_city.seq}
+        )
+
+    def stream_frame() -> Optional[str]:
+        # Tiny output: the shell and graph chunks are served over loopback.
+        try:
+            server = get_stream_server()
+            chunks = build_chunks(graph_data.to_dict(), stream_chunk_nodes())
+            # Register first: the shell embeds its own patch channel URL
+            session_id = server.register(
+                None, js_3d_content, chunks, columnar=encoding == "columnar"
+            )
+            shell_html = render_template(
+                json.dumps(
+                    {"nodes": [], "edges": [], "config": graph_data.config.to_dict()}
+                ),
+                json.dumps({"manifest": "manifest", "chunkBase": "chunk/"}),
+                '<script src="woven_maps_3d.js"></script>',
+                live_channel_json(server, session_id),
+            )
+            server.set_shell(session_id, shell_html)
+            url = server.session_url(session_id)
+            return _code_city_frame(f'src="{html.escape(url)}"', width, height)
+        except OSError:
+            return None  # Loopback server unavailable - fall back to inline delivery
+
+    if (delivery or code_city_delivery()) == "stream":
+        frame = stream_frame()
+        if frame is not None:
+            return mo.Html(frame)
+
+    # The channel is filled in once the payload is known to fit inline
+    iframe_html = render_template(
+        graph_data.to_json(encoding),
+        "null",
+        f"<script>{js_3d_content}</script>",
+        "__LIVE_CHANNEL__",
+    )
+    frame = _code_city_frame(f'srcdoc="{html.escape(iframe_html)}"', width, height)
+    if max_inline_bytes is not None and len(frame.encode("utf-8")) > max_inline_bytes:
+        streamed = stream_frame()
+        if streamed is not None:
+            return mo.Html(streamed)
+
+    live_json = "null"
+    if live_city is not None:
+        try:
+            server = get_stream_server()
+            live_json = live_channel_json(server, server.register(None))
+        except OSError:
+            pass  # No loopback server: health updates re-render instead
+
+    # Last occurrence: graph JSON (earlier in the page) may contain anything
+    head, _, tail = frame.rpartition("__LIVE_CHANNEL__")
+    return mo.Html(head + html.escape(live_json) + tail)
+
+
+def code_city_delivery() -> str:
+    """Code City delivery mode from ORCHESTR8_CODE_CITY_DELIVERY: inline (default) or stream."""
+    mode = os.getenv("ORCHESTR8_CODE_CITY_DELIVERY", "inline").strip().lower()
+    return mode if mode in {"inline", "stream"} else "inline"
+
+
+def _code_city_frame(source_attr: str, width: int, height: int) -> str:
+    """Wrap the Code City iframe (srcdoc= or src= attribute) in its container."""
+    return f'''
         <div style="
             background: #0A0A0B;
             border-radius: 8px;
             overflow: hidden;
         ">
             <iframe
-                srcdoc="{escaped}"
+                {source_attr}
                 width="{width}"
                 height="{height}"
                 style="border: none; display: block;"
@@ -4168,7 +5041,7 @@ def create_code_city(
                 allow="microphone"
             ></iframe>
         </div>
-    ''')
+    '''
 
 
 # =============================================================================
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Bowyer-Watson vs sweep-hull Delaunay triangulation benchmark.
+
+Usage:
+    python scripts/bench_delaunay.py                  # footprints + random point sets
+    python scripts/bench_delaunay.py --sizes 100 1000 5000
+    python scripts/bench_delaunay.py --baseline-max 1000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from IP.barradeau_builder import BarradeauBuilding, Delaunay, Point2D  # noqa: E402
+
+
+def best_of(repeat: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, points, baseline_max: int, repeat: int) -> None:
+    pairs = [(p.x, p.y) for p in points]
+    sweep = best_of(repeat, Delaunay.triangulate_indices, pairs)
+    triangles = len(Delaunay.triangulate_indices(pairs))
+    line = f"{label:<22} {len(points):>6} pts  sweep-hull {sweep * 1000:9.2f} ms ({triangles} tris)"
+    if len(points) <= baseline_max:
+        baseline = best_of(repeat, Delaunay.triangulate_bowyer_watson, points)
+        line += f"  bowyer-watson {baseline * 1000:10.2f} ms  {baseline / sweep:7.1f}x"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000, 10000])
+    parser.add_argument(
+        "--baseline-max", type=int, default=2000, help="Skip Bowyer-Watson above this size"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions")
+    args = parser.parse_args()
+
+    print("Building footprints:")
+    for line_count in (100, 900, 2800, 9000, 30000):
+        building = BarradeauBuilding("bench.py", line_count, 0, seed=line_count)
+        report(f"  {line_count} lines", building.footprint_points, args.baseline_max, args.repeat)
+
+    print("Uniform random points:")
+    rng = random.Random(42)
+    for size in args.sizes:
+        points = [Point2D(rng.random() * 100, rng.random() * 100) for _ in range(size)]
+        report(f"  n={size}", points, args.baseline_max, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
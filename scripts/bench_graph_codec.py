@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+JSON vs columnar Code City graph payload size and encode time.
+
+Usage:
+    python scripts/bench_graph_codec.py                     # synthetic 10k nodes / 50k edges
+    python scripts/bench_graph_codec.py --nodes 2000 --edges 8000
+    python scripts/bench_graph_codec.py --root /path/to/project
+"""
+
+import argparse
+import html
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from IP.woven_maps import (  # noqa: E402
+    CodeNode,
+    EdgeData,
+    GraphData,
+    build_from_connection_graph,
+)
+
+
+def synthetic_graph(node_count: int, edge_count: int, seed: int = 7) -> GraphData:
+    rng = random.Random(seed)
+    dirs = [f"pkg{i}/sub{j}" for i in range(40) for j in range(12)]
+    nodes = [
+        CodeNode(
+            path=f"{rng.choice(dirs)}/module_{i}.py",
+            loc=rng.randint(1, 2000),
+            x=rng.random() * 800,
+            y=rng.random() * 600,
+            centrality=rng.random(),
+            incoming_count=rng.randint(0, 40),
+            outgoing_count=rng.randint(0, 40),
+        )
+        for i in range(node_count)
+    ]
+    edges = [
+        EdgeData(rng.choice(nodes).path, rng.choice(nodes).path, line_number=rng.randint(1, 400))
+        for _ in range(edge_count)
+    ]
+    return GraphData(nodes=nodes, edges=edges)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", help="Encode this project's graph instead of a synthetic one")
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--edges", type=int, default=50_000)
+    args = parser.parse_args()
+
+    if args.root:
+        graph = build_from_connection_graph(str(Path(args.root).resolve()))
+    else:
+        graph = synthetic_graph(args.nodes, args.edges)
+    print(f"Graph: {len(graph.nodes)} nodes, {len(graph.edges)} edges")
+
+    plain, plain_time = timed(graph.to_json)
+    columnar, columnar_time = timed(lambda: graph.to_json("columnar"))
+    plain_srcdoc = len(html.escape(plain))
+    columnar_srcdoc = len(html.escape(columnar))
+
+    print(f"  json    : {len(plain) / 1024:9.0f} KB  srcdoc {plain_srcdoc / 1024:9.0f} KB  "
+          f"{plain_time * 1000:7.1f} ms")
+    print(f"  columnar: {len(columnar) / 1024:9.0f} KB  srcdoc {columnar_srcdoc / 1024:9.0f} KB  "
+          f"{columnar_time * 1000:7.1f} ms")
+    print(f"  shrink  : {len(plain) / len(columnar):9.1f}x        "
+          f"{plain_srcdoc / columnar_srcdoc:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
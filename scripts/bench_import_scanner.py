@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Legacy per-line regex vs single-pass scanner import extraction benchmark.
+
+Usage:
+    python scripts/bench_import_scanner.py                 # this repository
+    python scripts/bench_import_scanner.py --root /path/to/project
+    python scripts/bench_import_scanner.py --repeat 10
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from IP.connection_verifier import ConnectionVerifier  # noqa: E402
+from IP.import_scanner import extract_js_imports, extract_python_imports  # noqa: E402
+
+SKIP_DIRS = {"node_modules", ".git", "__pycache__", ".venv", "venv", "dist", "build"}
+PY_EXTENSIONS = {".py"}
+JS_EXTENSIONS = {".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx"}
+
+
+def load_corpus(root: Path):
+    """Return ([python sources], [js/ts sources]) under root."""
+    python_sources, js_sources = [], []
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            suffix = Path(name).suffix.lower()
+            if suffix not in PY_EXTENSIONS | JS_EXTENSIONS:
+                continue
+            try:
+                text = (Path(dirpath) / name).read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            (python_sources if suffix in PY_EXTENSIONS else js_sources).append(text)
+    return python_sources, js_sources
+
+
+def best_of(repeat: int, func, sources) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for source in sources:
+            func(source)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, sources, legacy, scanner, repeat: int) -> None:
+    if not sources:
+        print(f"{label}: no files")
+        return
+    legacy_time = best_of(repeat, legacy, sources)
+    scanner_time = best_of(repeat, scanner, sources)
+    legacy_count = sum(len(legacy(source)) for source in sources)
+    scanner_count = sum(len(scanner(source)) for source in sources)
+    size_kb = sum(len(source) for source in sources) // 1024
+    print(f"{label}: {len(sources)} files, {size_kb} KB")
+    print(f"  legacy : {legacy_time * 1000:8.1f} ms  ({legacy_count} imports)")
+    print(f"  scanner: {scanner_time * 1000:8.1f} ms  ({scanner_count} imports)")
+    print(f"  speedup: {legacy_time / scanner_time:8.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", default=str(PROJECT_ROOT), help="Corpus root")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions")
+    args = parser.parse_args()
+
+    root = Path(args.root).resolve()
+    python_sources, js_sources = load_corpus(root)
+    verifier = ConnectionVerifier(str(root))
+
+    def legacy_python(source):
+        return verifier._extract_imports_with_lines(source, verifier.python_patterns)
+
+    def legacy_js(source):
+        return verifier._extract_imports_with_lines(source, verifier.js_patterns)
+
+    print(f"Root: {root}")
+    report("Python", python_sources, legacy_python, extract_python_imports, args.repeat)
+    report("JS/TS", js_sources, legacy_js, extract_js_imports, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+InotifyWatcher indexing time, event latency and idle CPU on a large tree.
+
+Usage:
+    python scripts/bench_inotify_watcher.py                  # synthetic 100k-file tree
+    python scripts/bench_inotify_watcher.py --files 20000
+    python scripts/bench_inotify_watcher.py --root /path/to/project
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from IP.inotify_watcher import INOTIFY_AVAILABLE, InotifyWatcher  # noqa: E402
+
+
+def build_corpus(root: Path, file_count: int) -> None:
+    """Synthetic tree: 100 files per directory, 20 directories per package."""
+    for index in range(file_count):
+        directory = root / f"pkg_{index // 2000:03d}" / f"sub_{index // 100:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"mod_{index}.py").write_text(f"VALUE = {index}\n")
+    # Pruned by SKIP_DIRS: must not cost watches
+    (root / "node_modules" / "dep").mkdir(parents=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", help="Existing project root to watch")
+    parser.add_argument("--files", type=int, default=100_000, help="Synthetic file count")
+    parser.add_argument("--edits", type=int, default=200, help="Timed edits")
+    parser.add_argument("--idle", type=float, default=3.0, help="Idle seconds measured")
+    args = parser.parse_args()
+
+    if not INOTIFY_AVAILABLE:
+        print("inotify not available on this platform")
+        return
+
+    tmp_dir = None
+    if args.root:
+        root = Path(args.root).resolve()
+    else:
+        tmp_dir = tempfile.mkdtemp(prefix="orchestr8-inotify-bench-")
+        root = Path(tmp_dir)
+        build_corpus(root, args.files)
+
+    seen = {}
+    arrived = threading.Condition()
+
+    def on_event(event):
+        with arrived:
+            seen[event.src_path] = time.perf_counter()
+            arrived.notify_all()
+
+    watcher = InotifyWatcher(str(root), on_event)
+    try:
+        start = time.perf_counter()
+        watcher.start()
+        started = time.perf_counter() - start
+        while watcher.is_indexing():
+            time.sleep(0.001)
+        indexed = time.perf_counter() - start
+        print(
+            f"Root: {root}\n"
+            f"start() returned in {started * 1000:.1f} ms, "
+            f"{watcher.watch_count} directories watched in {indexed * 1000:.0f} ms"
+        )
+
+        targets = []
+        for dirpath, dirs, files in os.walk(root):
+            dirs[:] = [d for d in dirs if d not in watcher.skip_dirs]
+            targets.extend(os.path.join(dirpath, f) for f in files if f.endswith(".py"))
+            if len(targets) >= args.edits:
+                break
+        latencies = []
+        for path in targets[:args.edits]:
+            written = time.perf_counter()
+            with open(path, "a") as handle:
+                handle.write("\n")
+            with arrived:
+                arrived.wait_for(lambda: seen.get(path, 0) >= written, timeout=5)
+            latencies.append((seen.get(path, written) - written) * 1000)
+        if latencies:
+            print(
+                f"event latency over {len(latencies)} edits: "
+                f"median {statistics.median(latencies):.3f} ms, max {max(latencies):.3f} ms"
+            )
+
+        cpu_before = time.process_time()
+        time.sleep(args.idle)
+        idle_cpu = time.process_time() - cpu_before
+        print(f"idle CPU: {idle_cpu * 1000:.1f} ms over {args.idle:.0f} s")
+    finally:
+        watcher.stop()
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+CPU particle path benchmark: struct-of-arrays pool vs per-particle objects.
+
+Extracts ParticlePool and updateAndDrawParticles from WOVEN_MAPS_TEMPLATE and
+runs them under node against a copy of the previous Particle-object/splice
+loop. Both keep the population at the CPU cap by respawning what died each
+frame; drawing goes to a no-op 2D context so only the particle code is timed.
+
+Usage:
+    python scripts/bench_particle_pool.py                 # 180k particles, 300 frames
+    python scripts/bench_particle_pool.py --cap 50000 --frames 600
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from IP.woven_maps import WOVEN_MAPS_TEMPLATE  # noqa: E402
+
+POOL_START = "const PARTICLE_EMERGENCE = 0;"
+POOL_END = "function spawnEmergenceParticles("
+
+BASELINE_JS = """
+class Particle {
+    constructor(x, y, color, type = 'error', severity = 'normal') {
+        this.x = x; this.y = y; this.type = type; this.color = color; this.severity = severity;
+        if (type === 'emergence') {
+            this.vx = (Math.random() - 0.5) * 2;
+            this.vy = (Math.random() - 0.5) * 2;
+            this.size = 1 + Math.random() * 1.5;
+            this.alpha = 0.5 + Math.random() * 0.3;
+            this.life = 60 + Math.random() * 40;
+            this.friction = 0.98;
+        } else {
+            this.vy = -0.15 - Math.random() * 0.25;
+            this.size = 1 + Math.random() * 2;
+            this.life = 200 + Math.random() * 150;
+            this.vx = (Math.random() - 0.5) * 0.08;
+            this.vxDecay = 0.95;
+            this.alpha = 0.4 + Math.random() * 0.4;
+            this.initialAlpha = this.alpha;
+            this.initialLife = this.life;
+        }
+        this.nodeId = null;
+    }
+    update(time) {
+        if (this.type === 'emergence') {
+            this.x += this.vx; this.y += this.vy;
+            this.vx *= this.friction; this.vy *= this.friction;
+            this.life--;
+            this.alpha = Math.max(0, this.alpha - 0.008);
+        } else {
+            this.vx *= this.vxDecay;
+            this.x += this.vx; this.y += this.vy;
+            this.life--;
+            this.alpha = this.initialAlpha * (this.life / this.initialLife);
+            this.size = Math.max(0.3, this.size - 0.002);
+        }
+    }
+    draw(ctx) {
+        ctx.globalAlpha = this.alpha;
+        ctx.fillStyle = this.color;
+        ctx.beginPath();
+        ctx.arc(this.x, this.y, this.size, 0, Math.PI * 2);
+        ctx.fill();
+    }
+    isDead() { return this.life <= 0 || this.alpha <= 0; }
+}
+const baseline = [];
+function baselineFrame(ctx) {
+    for (let i = baseline.length - 1; i >= 0; i--) {
+        baseline[i].update(0);
+        baseline[i].draw(ctx);
+        if (baseline[i].isDead()) {
+            if (baseline[i].type === 'error' && baseline[i].nodeId) decrementNodeParticles(baseline[i].nodeId);
+            baseline.splice(i, 1);
+        }
+    }
+}
+function baselineSpawn(n, kind) {
+    for (let i = 0; i < n; i++) {
+        const p = new Particle(Math.random() * 1000, Math.random() * 800,
+            kind ? COLORS.broken : COLORS.teal, kind ? 'error' : 'emergence');
+        if (kind) p.nodeId = 'n' + (i % 50);
+        baseline.push(p);
+    }
+}
+"""
+
+HARNESS_JS = """
+const CAP = %(cap)d, FRAMES = %(frames)d;
+const PERF = { particleCpuCap: CAP, emergenceFrameSpawnCap: CAP, errorFrameSpawnCap: CAP, edgeStride: 1 };
+const COLORS = { teal: '#1fbdea', broken: '#ff4444' };
+function decrementNodeParticles(nodeId) {}
+const ctx = { globalAlpha: 1, fillStyle: '', beginPath() {}, arc() {}, fill() {} };
+%(pool)s
+%(baseline)s
+function poolSpawn(n, kind) {
+    for (let i = 0; i < n; i++) {
+        const slot = particles.spawn(Math.random() * 1000, Math.random() * 800,
+            kind ? COLORS.broken : COLORS.teal, kind ? PARTICLE_ERROR : PARTICLE_EMERGENCE);
+        if (kind && slot !== -1) particles.nodeId[slot] = 'n' + (i %% 50);
+    }
+}
+function run(frame, spawn, count) {
+    const times = [];
+    spawn(CAP >> 1, 0); spawn(CAP - (CAP >> 1), 1);
+    for (let f = 0; f < FRAMES; f++) {
+        const start = process.hrtime.bigint();
+        const missing = CAP - count();
+        spawn(missing >> 1, 0); spawn(missing - (missing >> 1), 1);
+        frame(ctx);
+        times.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+    times.sort((a, b) => a - b);
+    const at = q => times[Math.min(times.length - 1, Math.floor(q * times.length))];
+    return { median: at(0.5), p95: at(0.95), max: times[times.length - 1], live: count() };
+}
+const result = {
+    baseline: run(baselineFrame, baselineSpawn, () => baseline.length),
+    pool: run(updateAndDrawParticles, poolSpawn, () => particles.count),
+};
+console.log(JSON.stringify(result));
+"""
+
+
+def pool_source() -> str:
+    start = WOVEN_MAPS_TEMPLATE.index(POOL_START)
+    end = WOVEN_MAPS_TEMPLATE.index(POOL_END, start)
+    return WOVEN_MAPS_TEMPLATE[start:end]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cap", type=int, default=180_000, help="Particle population (PERF.particleCpuCap)")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    node = shutil.which("node")
+    if node is None:
+        sys.exit("node is required to run the template's JavaScript")
+
+    script = HARNESS_JS % {
+        "cap": args.cap,
+        "frames": args.frames,
+        "pool": pool_source(),
+        "baseline": BASELINE_JS,
+    }
+    with tempfile.NamedTemporaryFile("w", suffix=".js", delete=False) as handle:
+        handle.write(script)
+    try:
+        output = subprocess.run([node, handle.name], check=True, capture_output=True, text=True).stdout
+    finally:
+        Path(handle.name).unlink()
+
+    result = json.loads(output)
+    print(f"{args.cap:,} particles, {args.frames} frames (ms per frame)")
+    for label in ("baseline", "pool"):
+        row = result[label]
+        print(
+            f"  {label:<9} median {row['median']:7.2f}  p95 {row['p95']:7.2f}  "
+            f"max {row['max']:7.2f}  live {row['live']:,}"
+        )
+    base, pool = result["baseline"], result["pool"]
+    print(f"  speedup   median {base['median'] / pool['median']:5.1f}x  p95 {base['p95'] / pool['p95']:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Cold-vs-warm benchmark for the woven_maps scan cache.
+
+Usage:
+    python scripts/bench_scan_cache.py               # synthetic 5000-file tree
+    python scripts/bench_scan_cache.py --files 20000
+    python scripts/bench_scan_cache.py --root /path/to/project
+    python scripts/bench_scan_cache.py --executors   # uncached serial/thread/process
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from IP.executor_pool import ExecutorMode, default_worker_count  # noqa: E402
+from IP.scan_cache import SCAN_CACHE_FILENAME  # noqa: E402
+from IP.woven_maps import scan_codebase  # noqa: E402
+
+PY_TEMPLATE = '''"""Synthetic module {index}."""
+
+import os
+
+
+class Widget{index}:
+    def render(self):
+        return os.getcwd()
+
+
+def helper_{index}(value):
+    # TODO: replace placeholder
+    return value * {index}
+'''
+
+JS_TEMPLATE = """import {{ helper }} from './shared';
+
+export function widget{index}() {{
+    return helper({index});
+}}
+
+export const VALUE_{index} = {index};
+"""
+
+
+def build_corpus(root: Path, file_count: int) -> None:
+    """Write a synthetic tree of Python and JS files, 100 files per directory."""
+    for index in range(file_count):
+        directory = root / f"pkg_{index // 100:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        if index % 3 == 0:
+            (directory / f"mod_{index}.js").write_text(JS_TEMPLATE.format(index=index))
+        else:
+            (directory / f"mod_{index}.py").write_text(PY_TEMPLATE.format(index=index))
+
+
+def timed_scan(root: Path, use_cache: bool, executor: str = None) -> float:
+    start = time.perf_counter()
+    scan_codebase(str(root), use_cache=use_cache, executor=executor)
+    return time.perf_counter() - start
+
+
+def compare_executors(root: Path, repeat: int) -> None:
+    """Uncached scan wall time per executor mode."""
+    print(f"Workers available: {default_worker_count()}")
+    baseline = None
+    for mode in ExecutorMode:
+        elapsed = min(timed_scan(root, False, mode.value) for _ in range(repeat))
+        baseline = baseline or elapsed
+        print(f"{mode.value:>8}: {elapsed * 1000:9.1f} ms ({baseline / elapsed:4.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", help="Existing project root to scan")
+    parser.add_argument("--files", type=int, default=5000, help="Synthetic file count")
+    parser.add_argument("--repeat", type=int, default=3, help="Warm scan repetitions")
+    parser.add_argument(
+        "--executors", action="store_true", help="Compare executor modes instead"
+    )
+    args = parser.parse_args()
+
+    tmp_dir = None
+    if args.root:
+        root = Path(args.root).resolve()
+    else:
+        tmp_dir = tempfile.mkdtemp(prefix="orchestr8-scan-bench-")
+        root = Path(tmp_dir)
+        build_corpus(root, args.files)
+
+    cache_file = root / ".orchestr8" / SCAN_CACHE_FILENAME
+    try:
+        if args.executors:
+            compare_executors(root, args.repeat)
+            return
+
+        if cache_file.exists():
+            cache_file.unlink()
+
+        uncached = timed_scan(root, use_cache=False)
+        cold = timed_scan(root, use_cache=True)
+        warm = min(timed_scan(root, use_cache=True) for _ in range(args.repeat))
+
+        print(f"Root: {root}")
+        print(f"No cache:   {uncached * 1000:9.1f} ms")
+        print(f"Cold cache: {cold * 1000:9.1f} ms (populates {cache_file.name})")
+        print(f"Warm cache: {warm * 1000:9.1f} ms")
+        print(f"Speedup:    {uncached / warm:9.1f}x")
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+In-process batch syntax check vs one py_compile subprocess per file.
+
+Usage:
+    python scripts/bench_syntax_check.py                  # synthetic 3000-file tree
+    python scripts/bench_syntax_check.py --files 10000
+    python scripts/bench_syntax_check.py --root /path/to/project
+    python scripts/bench_syntax_check.py --baseline-max 50
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from IP.executor_pool import ExecutorMode, default_worker_count  # noqa: E402
+from IP.health_checker import HealthChecker  # noqa: E402
+
+PY_TEMPLATE = '''"""Synthetic module {index}."""
+
+import os
+
+
+class Widget{index}:
+    def render(self, items):
+        total = 0
+        for item in items:
+            if item % 2:
+                total += item * {index}
+        return os.path.join(str(total), "widget")
+
+
+def helper_{index}(value):
+    return [value * n for n in range({index} % 17 + 1)]
+'''
+
+
+def build_corpus(root: Path, file_count: int) -> None:
+    """Synthetic Python tree, 100 files per directory, every 50th file broken."""
+    for index in range(file_count):
+        directory = root / f"pkg_{index // 100:04d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        body = PY_TEMPLATE.format(index=index)
+        if index % 50 == 49:
+            body += "\ndef broken(:\n    pass\n"
+        (directory / f"mod_{index}.py").write_text(body)
+
+
+def python_files(root: Path) -> list:
+    paths = []
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+        paths.extend(
+            os.path.relpath(os.path.join(dirpath, name), root)
+            for name in files
+            if name.endswith(".py")
+        )
+    return sorted(paths)
+
+
+def subprocess_check(root: Path, paths: list) -> int:
+    """The old path: one `python -m py_compile` per file."""
+    failures = 0
+    for path in paths:
+        result = subprocess.run(
+            [sys.executable, "-m", "py_compile", str(root / path)],
+            capture_output=True,
+        )
+        failures += result.returncode != 0
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", help="Existing project root to check")
+    parser.add_argument("--files", type=int, default=3000, help="Synthetic file count")
+    parser.add_argument(
+        "--baseline-max", type=int, default=100,
+        help="Files timed on the subprocess path (rate is extrapolated)",
+    )
+    args = parser.parse_args()
+
+    tmp_dir = None
+    if args.root:
+        root = Path(args.root).resolve()
+    else:
+        tmp_dir = tempfile.mkdtemp(prefix="orchestr8-syntax-bench-")
+        root = Path(tmp_dir)
+        build_corpus(root, args.files)
+
+    try:
+        paths = python_files(root)
+        checker = HealthChecker(str(root))
+        print(f"Root: {root} ({len(paths)} Python files, {default_worker_count()} workers)")
+
+        for mode in ExecutorMode:
+            start = time.perf_counter()
+            result = checker.check_python_syntax_batch(paths, executor=mode.value)
+            elapsed = time.perf_counter() - start
+            print(
+                f"in-process {mode.value:>8}: {elapsed * 1000:9.1f} ms "
+                f"{len(paths) / elapsed:9.0f} files/s  ({result.error_count} errors)"
+            )
+
+        sample = paths[:args.baseline_max]
+        start = time.perf_counter()
+        subprocess_check(root, sample)
+        elapsed = time.perf_counter() - start
+        rate = len(sample) / elapsed
+        print(
+            f"subprocess py_compile: {elapsed * 1000:9.1f} ms for {len(sample)} files "
+            f"{rate:9.0f} files/s  (~{len(paths) / rate:.1f} s for all)"
+        )
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()